@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""Fail when CLI entrypoint startup exceeds its import-time budget.
+
+Budgets live in config/ci/import_time_budgets.json. Each entrypoint is measured
+``repeats`` times in a fresh interpreter and the median is compared against its
+budget:
+
+- ``kind=import``: wall time of ``importlib.import_module(target)`` inside the
+  child process (interpreter startup excluded). ``forbidden_modules`` must not
+  appear in ``sys.modules`` afterwards (e.g. ``src.core`` must not pull pandas).
+- ``kind=command``: wall time of the whole process (``{python}`` in ``argv`` is
+  replaced by the current interpreter). Exit codes listed in
+  ``unavailable_exit_codes`` mark the entrypoint as unavailable (e.g. the
+  ``scripts/pt`` launcher without a bootstrapped ``.venv``) instead of failing;
+  ``--require-all`` turns those into failures.
+
+Exit codes: 0 = within budget, 1 = budget/forbidden-import violation,
+2 = invalid config.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_CONFIG = REPO_ROOT / "config" / "ci" / "import_time_budgets.json"
+SCHEMA_VERSION = "import_time_budgets_v1"
+
+_IMPORT_PROBE = """
+import importlib, json, sys, time
+t0 = time.perf_counter()
+importlib.import_module(sys.argv[1])
+elapsed = time.perf_counter() - t0
+loaded = [m for m in json.loads(sys.argv[2]) if m in sys.modules]
+print(json.dumps({"seconds": elapsed, "loaded_forbidden": loaded}))
+"""
+
+
+class BudgetConfigError(ValueError):
+    """Invalid import-time budget config."""
+
+
+@dataclass(frozen=True)
+class EntrypointBudget:
+    name: str
+    kind: str
+    budget_seconds: float
+    target: str = ""
+    argv: tuple[str, ...] = ()
+    forbidden_modules: tuple[str, ...] = ()
+    unavailable_exit_codes: tuple[int, ...] = ()
+
+
+@dataclass
+class BudgetResult:
+    name: str
+    kind: str
+    budget_seconds: float
+    median_seconds: Optional[float]
+    samples: list[float] = field(default_factory=list)
+    loaded_forbidden: list[str] = field(default_factory=list)
+    status: str = "PASS"
+    reason: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return self.status in {"PASS", "UNAVAILABLE"}
+
+
+def load_budgets(path: Path) -> tuple[int, list[EntrypointBudget]]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        raise BudgetConfigError(f"cannot read budget config {path}: {exc}") from exc
+    if payload.get("schema_version") != SCHEMA_VERSION:
+        raise BudgetConfigError(f"unexpected schema_version: {payload.get('schema_version')!r}")
+    repeats = int(payload.get("repeats", 5))
+    if repeats < 1:
+        raise BudgetConfigError("repeats must be >= 1")
+    budgets: list[EntrypointBudget] = []
+    seen: set[str] = set()
+    for raw in payload.get("entrypoints", []):
+        name = str(raw.get("name", ""))
+        kind = raw.get("kind")
+        if not name or name in seen:
+            raise BudgetConfigError(f"missing or duplicate entrypoint name: {name!r}")
+        seen.add(name)
+        if kind not in {"import", "command"}:
+            raise BudgetConfigError(f"{name}: kind must be 'import' or 'command'")
+        budget = float(raw.get("budget_seconds", 0))
+        if budget <= 0:
+            raise BudgetConfigError(f"{name}: budget_seconds must be > 0")
+        entry = EntrypointBudget(
+            name=name,
+            kind=kind,
+            budget_seconds=budget,
+            target=str(raw.get("target", "")),
+            argv=tuple(str(a) for a in raw.get("argv", ())),
+            forbidden_modules=tuple(raw.get("forbidden_modules", ())),
+            unavailable_exit_codes=tuple(int(c) for c in raw.get("unavailable_exit_codes", ())),
+        )
+        if kind == "import" and not entry.target:
+            raise BudgetConfigError(f"{name}: import entrypoints need a target")
+        if kind == "command" and not entry.argv:
+            raise BudgetConfigError(f"{name}: command entrypoints need argv")
+        budgets.append(entry)
+    return repeats, budgets
+
+
+def _measure_import(entry: EntrypointBudget, python: str, cwd: Path) -> tuple[float, list[str]]:
+    proc = subprocess.run(
+        [python, "-c", _IMPORT_PROBE, entry.target, json.dumps(list(entry.forbidden_modules))],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import of {entry.target} failed: {proc.stderr.strip()[-500:]}")
+    report = json.loads(proc.stdout.strip().splitlines()[-1])
+    return float(report["seconds"]), list(report["loaded_forbidden"])
+
+
+def _measure_command(entry: EntrypointBudget, python: str, cwd: Path) -> tuple[float, int, str]:
+    argv = [python if a == "{python}" else a for a in entry.argv]
+    t0 = time.perf_counter()
+    proc = subprocess.run(argv, cwd=cwd, capture_output=True, text=True, check=False)
+    return time.perf_counter() - t0, proc.returncode, proc.stderr.strip()[-500:]
+
+
+def evaluate(
+    entry: EntrypointBudget, samples: Sequence[float], loaded_forbidden: Sequence[str] = ()
+) -> BudgetResult:
+    """Compare the median of ``samples`` against the entrypoint budget."""
+    median = statistics.median(samples)
+    result = BudgetResult(
+        name=entry.name,
+        kind=entry.kind,
+        budget_seconds=entry.budget_seconds,
+        median_seconds=median,
+        samples=[round(s, 6) for s in samples],
+        loaded_forbidden=sorted(set(loaded_forbidden)),
+    )
+    if result.loaded_forbidden:
+        result.status = "FAIL"
+        result.reason = f"forbidden modules imported: {', '.join(result.loaded_forbidden)}"
+    elif median > entry.budget_seconds:
+        result.status = "FAIL"
+        result.reason = f"median {median:.3f}s exceeds budget {entry.budget_seconds:.3f}s"
+    return result
+
+
+def measure(
+    entry: EntrypointBudget,
+    *,
+    repeats: int,
+    python: str = sys.executable,
+    cwd: Path = REPO_ROOT,
+) -> BudgetResult:
+    samples: list[float] = []
+    forbidden: list[str] = []
+    for _ in range(repeats):
+        if entry.kind == "import":
+            try:
+                seconds, loaded = _measure_import(entry, python, cwd)
+            except RuntimeError as exc:
+                return BudgetResult(
+                    entry.name,
+                    entry.kind,
+                    entry.budget_seconds,
+                    None,
+                    status="FAIL",
+                    reason=str(exc),
+                )
+            forbidden.extend(loaded)
+        else:
+            seconds, code, stderr = _measure_command(entry, python, cwd)
+            if code in entry.unavailable_exit_codes:
+                return BudgetResult(
+                    entry.name,
+                    entry.kind,
+                    entry.budget_seconds,
+                    None,
+                    status="UNAVAILABLE",
+                    reason=f"exit {code}: {stderr.splitlines()[0] if stderr else ''}",
+                )
+            if code != 0:
+                return BudgetResult(
+                    entry.name,
+                    entry.kind,
+                    entry.budget_seconds,
+                    None,
+                    status="FAIL",
+                    reason=f"exit {code}: {stderr}",
+                )
+        samples.append(seconds)
+    return evaluate(entry, samples, forbidden)
+
+
+def _format_row(result: BudgetResult) -> str:
+    median = "-" if result.median_seconds is None else f"{result.median_seconds:.3f}s"
+    line = f"{result.status:<11} {median:>9} / {result.budget_seconds:.3f}s  {result.name}"
+    return f"{line}  ({result.reason})" if result.reason else line
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--config", type=Path, default=DEFAULT_CONFIG)
+    parser.add_argument("--repeats", type=int, default=None, help="Override config repeats")
+    parser.add_argument(
+        "--only", action="append", default=[], help="Measure only this entrypoint (repeatable)"
+    )
+    parser.add_argument("--json-out", type=Path, default=None, help="Write JSON report here")
+    parser.add_argument(
+        "--require-all",
+        action="store_true",
+        help="Treat unavailable entrypoints (e.g. missing .venv for scripts/pt) as failures",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        repeats, budgets = load_budgets(args.config)
+    except BudgetConfigError as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 2
+    if args.only:
+        unknown = set(args.only) - {b.name for b in budgets}
+        if unknown:
+            print(f"ERROR: unknown entrypoints: {sorted(unknown)}", file=sys.stderr)
+            return 2
+        budgets = [b for b in budgets if b.name in args.only]
+    repeats = args.repeats or repeats
+
+    results = [measure(entry, repeats=repeats) for entry in budgets]
+    for result in results:
+        print(_format_row(result))
+    failed = [r for r in results if not r.ok or (args.require_all and r.status == "UNAVAILABLE")]
+
+    if args.json_out is not None:
+        report: dict[str, Any] = {
+            "schema_version": "import_time_budget_report_v1",
+            "python": sys.version.split()[0],
+            "repeats": repeats,
+            "ok": not failed,
+            "results": [asdict(r) for r in results],
+        }
+        args.json_out.parent.mkdir(parents=True, exist_ok=True)
+        args.json_out.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+
+    if failed:
+        print(f"FAIL: {len(failed)} entrypoint(s) over budget", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
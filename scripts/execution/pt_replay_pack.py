@@ -22,6 +22,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from src.execution.replay_pack.builder import build_replay_pack
 from src.execution.replay_pack.loader import load_replay_pack
 from src.execution.replay_pack.runner import replay_bundle
+from src.execution.replay_pack.streaming import replay_bundle_streaming
 from src.execution.replay_pack.validator import validate_replay_pack
 from src.execution.replay_pack.hashing import parse_sha256sums_text, sha256_file
 from src.execution.replay_pack.contract import (
@@ -333,6 +334,21 @@ def _cmd_inspect(args: argparse.Namespace) -> int:
 
 def _cmd_replay(args: argparse.Namespace) -> int:
     try:
+        if args.workers is not None or args.checkpoint is not None:
+            if args.resolve_datarefs is not None:
+                _eprint("--workers/--checkpoint cannot be combined with --resolve-datarefs")
+                return EXIT_CONTRACT
+            return int(
+                replay_bundle_streaming(
+                    args.bundle,
+                    check_outputs=args.check_outputs,
+                    ledger_backend=args.ledger_backend,
+                    workers=int(args.workers or 1),
+                    checkpoint_path=args.checkpoint,
+                    checkpoint_every=int(args.checkpoint_every),
+                    resume=args.resume,
+                )
+            )
         return int(
             replay_bundle(
                 args.bundle,
@@ -340,6 +356,7 @@ def _cmd_replay(args: argparse.Namespace) -> int:
                 resolve_datarefs=args.resolve_datarefs,
                 cache_root=args.cache_root,
                 datarefs_generated_at_utc=args.generated_at_utc,
+                ledger_backend=args.ledger_backend,
             )
         )
     except ReplayMismatchError as e:
@@ -438,6 +455,7 @@ def _cmd_compare(args: argparse.Namespace) -> int:
             cache_root=args.cache_root,
             generated_at_utc=args.generated_at_utc,
             out_path=args.out,
+            ledger_backend=args.ledger_backend,
         )
         return int(code)
     except Exception as e:
@@ -505,6 +523,32 @@ def main(argv: list[str] | None = None) -> int:
         default=None,
         help="override generated_at_utc for the datarefs report (for deterministic tests)",
     )
+    p_rep.add_argument(
+        "--ledger-backend",
+        default="decimal",
+        choices=["decimal", "fixed_point", "cross_check"],
+        help="ledger accounting backend (fixed_point: scaled-int fast path; cross_check: run both)",
+    )
+    p_rep.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="stream events and shard instruments across N worker processes (large bundles)",
+    )
+    p_rep.add_argument(
+        "--checkpoint",
+        default=None,
+        help="streaming checkpoint file (requires --ledger-backend fixed_point)",
+    )
+    p_rep.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=100_000,
+        help="write a streaming checkpoint every N events",
+    )
+    p_rep.add_argument(
+        "--resume", action="store_true", help="resume streaming replay from --checkpoint"
+    )
     p_rep.set_defaults(func=_cmd_replay)
 
     p_res = sub.add_parser("resolve-datarefs", help="Resolve market_data_refs offline")
@@ -562,6 +606,12 @@ def main(argv: list[str] | None = None) -> int:
         default=None,
         help="write compare report to this path (default: meta/compare_report.json inside bundle)",
     )
+    p_cmp.add_argument(
+        "--ledger-backend",
+        default="decimal",
+        choices=["decimal", "fixed_point", "cross_check"],
+        help="ledger accounting backend for the (streamed) replay",
+    )
     p_cmp.set_defaults(func=_cmd_compare)
 
     ns = parser.parse_args(argv)
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Rebuild Execution Run Index
+
+Re-indexes an execution_pipeline events JSONL file and writes the run index
+sidecar (``<filename>.runidx.json``) used by JsonlExecutionRunStore.
+
+Usage:
+    python scripts/execution/rebuild_execution_run_index.py
+    python scripts/execution/rebuild_execution_run_index.py --root logs/execution \
+        --filename execution_pipeline_events_v0.jsonl
+
+Design:
+- Read-only on the JSONL (only the sidecar index is written)
+- Not required for correctness: stores catch up / rebuild the index on read
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.execution_pipeline.store import JsonlExecutionRunStore
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Rebuild the execution_pipeline run index.")
+    ap.add_argument("--root", default="logs/execution")
+    ap.add_argument("--filename", default="execution_pipeline_events_v0.jsonl")
+    args = ap.parse_args()
+
+    store = JsonlExecutionRunStore(root=Path(args.root), filename=args.filename)
+    index = store.rebuild_index()
+    if index is None:
+        print(f"No events file at {store.path}", file=sys.stderr)
+        return 1
+
+    print(f"Indexed {len(index.runs)} run(s), {index.indexed_bytes} bytes -> {store.index_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -50,6 +50,7 @@ from src.reporting.experiment_report import (
     find_best_params,
 )
 from src.reporting.base import Report, ReportSection
+from src.reporting.figure_pipeline import FigurePipeline
 from src.reporting.sweep_visualization import generate_default_sweep_plots
 from src.reporting.correlation_matrix_report import correlation_matrix_report
 
@@ -134,6 +135,23 @@ def build_parser() -> argparse.ArgumentParser:
         default="metric_sharpe_ratio",
         help="Metrik für Plots (default: metric_sharpe_ratio)",
     )
+    parser.add_argument(
+        "--plot-workers",
+        type=int,
+        default=1,
+        help="Prozesse für das Rendern der Plots (default: 1, seriell)",
+    )
+    parser.add_argument(
+        "--figure-cache-dir",
+        type=str,
+        default=None,
+        help="Content-addressed Cache für Plots; unveränderte Plots werden kopiert statt neu gerendert",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Plots mit unverändertem Digest (Manifest .figure_digests.json) nicht neu schreiben",
+    )
     parser.add_argument(
         "--correlation-method",
         type=str,
@@ -546,6 +564,11 @@ def run_from_args(args: argparse.Namespace) -> int:
                 param_candidates=param_cols[:3] if param_cols else None,  # Erste 3 Parameter
                 metric_primary=args.plot_metric,
                 metric_fallback=args.sort_metric,
+                figure_pipeline=FigurePipeline(
+                    cache_dir=args.figure_cache_dir,
+                    max_workers=args.plot_workers,
+                    incremental=args.incremental,
+                ),
             )
 
             # Füge Visualisierungen zum Report hinzu
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Peak_Trade Sweep Plots Batch Generator
+======================================
+
+Rendert die Standardplots mehrerer Strategy-Sweeps in einem gemeinsamen
+Durchlauf der FigurePipeline (Prozess-Pool über Sweep-Grenzen hinweg,
+Content-Cache, optional inkrementell).
+
+Verwendung:
+    # Plots mehrerer Sweeps (neueste Ergebnis-Datei je Sweep)
+    python scripts/generate_sweep_plots_batch.py \\
+        --sweep-name rsi_reversion_basic breakout_basic ma_crossover_basic \\
+        --plot-workers 8 --figure-cache-dir .cache/figures
+
+    # Plots aus Ergebnis-Dateien (Sweep-Name = Dateiname ohne Endung)
+    python scripts/generate_sweep_plots_batch.py --input reports/experiments/a.csv b.parquet
+
+    # Nur Plots geänderter Sweeps neu schreiben
+    python scripts/generate_sweep_plots_batch.py --sweep-name rsi_reversion_basic --incremental
+
+Output:
+    - reports/sweeps/images/{sweep_name}/*.png
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+import pandas as pd
+
+# Projekt-Root zum Path hinzufügen
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from scripts.generate_strategy_sweep_report import (
+    find_sweep_results,
+    normalize_column_names,
+    setup_logging,
+)
+from src.reporting.experiment_report import load_experiment_results
+from src.reporting.figure_pipeline import FigurePipeline
+from src.reporting.sweep_visualization import generate_sweep_plots_batch
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Erstellt den ArgumentParser für Batch-Plots."""
+    parser = argparse.ArgumentParser(
+        description="Peak_Trade Sweep Plots Batch Generator",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+
+    input_group = parser.add_mutually_exclusive_group(required=True)
+    input_group.add_argument(
+        "--sweep-name",
+        "-s",
+        type=str,
+        nargs="+",
+        help="Namen der Sweeps (sucht jeweils die neueste Ergebnis-Datei)",
+    )
+    input_group.add_argument(
+        "--input",
+        "-i",
+        type=str,
+        nargs="+",
+        help="Pfade zu Ergebnis-Dateien (CSV oder Parquet)",
+    )
+
+    parser.add_argument(
+        "--output-dir",
+        "-o",
+        type=str,
+        default="reports/sweeps/images",
+        help="Basis-Verzeichnis; je Sweep ein Unterverzeichnis (default: reports/sweeps/images)",
+    )
+    parser.add_argument(
+        "--plot-metric",
+        type=str,
+        default="metric_sharpe_ratio",
+        help="Metrik für Plots (default: metric_sharpe_ratio)",
+    )
+    parser.add_argument(
+        "--fallback-metric",
+        type=str,
+        default="metric_total_return",
+        help="Metrik, falls --plot-metric fehlt (default: metric_total_return)",
+    )
+    parser.add_argument(
+        "--plot-workers",
+        type=int,
+        default=1,
+        help="Prozesse für das Rendern der Plots (default: 1, seriell)",
+    )
+    parser.add_argument(
+        "--figure-cache-dir",
+        type=str,
+        default=None,
+        help="Content-addressed Cache für Plots; unveränderte Plots werden kopiert statt neu gerendert",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Plots mit unverändertem Digest (Manifest .figure_digests.json) nicht neu schreiben",
+    )
+    parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="Verbose Output",
+    )
+
+    return parser
+
+
+def _load_sweeps(args: argparse.Namespace) -> Optional[Dict[str, pd.DataFrame]]:
+    """Sweep-Name -> normalisierte Ergebnisse; None, wenn eine Quelle fehlt."""
+    if args.input:
+        sources = {Path(p).stem: Path(p) for p in args.input}
+    else:
+        sources = {name: find_sweep_results(name) for name in args.sweep_name}
+
+    sweeps: Dict[str, pd.DataFrame] = {}
+    for name, path in sources.items():
+        if path is None or not path.exists():
+            print(f"Fehler: Keine Ergebnisse gefunden für Sweep '{name}'")
+            return None
+        try:
+            sweeps[name] = normalize_column_names(load_experiment_results(path))
+        except Exception as e:
+            print(f"Fehler beim Laden von {path}: {e}")
+            return None
+    return sweeps
+
+
+def run_from_args(args: argparse.Namespace) -> int:
+    """Rendert die Plots aller angegebenen Sweeps.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        Exit code (0 = success, 1 = error)
+    """
+    setup_logging(args.verbose)
+    logger = logging.getLogger(__name__)
+
+    sweeps = _load_sweeps(args)
+    if sweeps is None:
+        return 1
+
+    pipeline = FigurePipeline(
+        cache_dir=args.figure_cache_dir,
+        max_workers=args.plot_workers,
+        incremental=args.incremental,
+    )
+    plots = generate_sweep_plots_batch(
+        sweeps,
+        Path(args.output_dir),
+        metric_primary=args.plot_metric,
+        metric_fallback=args.fallback_metric,
+        figure_pipeline=pipeline,
+    )
+
+    for name, sweep_plots in plots.items():
+        print(f"{name}: {len(sweep_plots)} Plots")
+    logger.info(f"Figure-Status: {dict(pipeline.stats)}")
+    return 1 if pipeline.stats.get("failed") else 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Haupt-Entry-Point."""
+    parser = build_parser()
+    args = parser.parse_args(None if argv is None else list(argv))
+    return run_from_args(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
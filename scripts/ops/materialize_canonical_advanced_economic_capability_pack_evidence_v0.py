@@ -311,6 +311,7 @@ def materialize_bundle(output_dir: Path) -> int:
             offline_market_volume=1_000_000.0,
         ),
         source_refs=[str(PR5177_IMPL), str(PR5177_CLOSEOUT)],
+        columnar_artifacts=True,
     )
 
     preflight = "\n".join(
@@ -471,7 +472,7 @@ def materialize_bundle(output_dir: Path) -> int:
     _write_json(output_dir / "sample_cost_frontier.json", adv["COST_FRONTIER.json"])
     _write_json(output_dir / "sample_edge_decay.json", adv["EDGE_DECAY.json"])
     _write_json(output_dir / "sample_liquidity_stress.json", adv["LIQUIDITY_STRESS.json"])
-    listing = "\n".join(sorted(name for name in bundle.artifact_payloads()))
+    listing = "\n".join(bundle.artifact_names())
     (output_dir / "sample_bundle_listing.txt").write_text(listing + "\n", encoding="utf-8")
 
     ok_pre, _ = verify_manifest_sha256(output_dir)
@@ -328,6 +328,7 @@ def materialize_bundle(
         render_canonical_report=True,
         economic_verdict_status=verdict_status,
         economic_verdict_source_refs=["economic_viability_evidence_v1.json"],
+        columnar_artifacts=True,
     )
 
     (output_dir / "sample_observability_snapshot.json").write_text(
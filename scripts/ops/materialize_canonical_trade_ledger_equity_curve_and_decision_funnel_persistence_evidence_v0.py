@@ -142,6 +142,7 @@ def materialize_bundle(
             str(REGISTRY_FOUNDATION),
             str(DISCOVERY_DIR),
         ],
+        columnar_artifacts=True,
     )
     write_observability_bundle_v0(bundle, output_dir)
 
@@ -268,22 +269,23 @@ def materialize_bundle(
         json.dumps(bundle.snapshot_payload, indent=2, ensure_ascii=False) + "\n",
         encoding="utf-8",
     )
+    equity_curve_csv = bundle.artifact_text("EQUITY_CURVE.csv")
     (output_dir / "sample_trade_ledger.jsonl").write_text(
-        bundle.trade_ledger_jsonl, encoding="utf-8"
+        bundle.artifact_text("TRADE_LEDGER.jsonl"), encoding="utf-8"
     )
-    (output_dir / "sample_equity_curve.csv").write_text(bundle.equity_curve_csv, encoding="utf-8")
+    (output_dir / "sample_equity_curve.csv").write_text(equity_curve_csv, encoding="utf-8")
     if bundle.drawdown_not_applicable_payload is not None:
         _write_json(
             output_dir / "not_applicable_reason.json", bundle.drawdown_not_applicable_payload
         )
     else:
         (output_dir / "sample_drawdown_curve.csv").write_text(
-            bundle.drawdown_curve_csv, encoding="utf-8"
+            bundle.artifact_text("DRAWDOWN_CURVE.csv"), encoding="utf-8"
         )
     _write_json(output_dir / "sample_decision_funnel.json", bundle.decision_funnel_payload)
     _write_json(output_dir / "sample_data_quality.json", bundle.data_quality_payload)
     (output_dir / "sample_bundle_listing.txt").write_text(
-        "\n".join(sorted(bundle.artifact_payloads())) + "\n",
+        "\n".join(bundle.artifact_names()) + "\n",
         encoding="utf-8",
     )
 
@@ -315,7 +317,7 @@ def materialize_bundle(
             f"GROSS_PNL_RECONCILIATION_PASS={bundle.reconciliation_payload['gross_pnl_reconciliation_pass']}",
             f"NET_PNL_RECONCILIATION_PASS={bundle.reconciliation_payload['net_pnl_reconciliation_pass']}",
             f"TOTAL_COST_RECONCILIATION_PASS={bundle.reconciliation_payload['total_cost_reconciliation_pass']}",
-            f"EQUITY_CURVE_POINT_COUNT={len(bundle.equity_curve_csv.splitlines()) - 1}",
+            f"EQUITY_CURVE_POINT_COUNT={len(equity_curve_csv.splitlines()) - 1}",
             f"EQUITY_CURVE_FINAL_VALUE={bundle.reconciliation_payload.get('equity_reconciliation_pass')}",
             f"FINAL_EQUITY={inputs.initial_equity}",
             f"EQUITY_RECONCILIATION_PASS={bundle.reconciliation_payload['equity_reconciliation_pass']}",
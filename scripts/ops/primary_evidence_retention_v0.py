@@ -22,11 +22,11 @@ COMPLETION_BLOCKED_UNTIL_RETENTION_VERIFIED=true
 
 from __future__ import annotations
 
-import hashlib
 import json
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
+from src.core.manifest_hashing import hash_files, write_sha256_manifest
 from src.ops.wallclock_session_evidence_v0 import (
     WALLCLOCK_EVIDENCE_FILENAME,
     evaluate_wallclock_evidence_fields,
@@ -137,36 +137,50 @@ def require_durable_archive_root(path: Path) -> tuple[bool, str]:
 
 def write_manifest_sha256(root: Path) -> None:
     """Write MANIFEST.sha256 over all files under root (excluding the manifest itself)."""
-    lines: list[str] = []
-    for path in sorted(p for p in root.rglob("*") if p.is_file()):
-        if path.name == MANIFEST_FILENAME:
-            continue
-        rel = path.relative_to(root).as_posix()
-        digest = hashlib.sha256(path.read_bytes()).hexdigest()
-        lines.append(f"{digest}  {rel}")
-    manifest = root / MANIFEST_FILENAME
-    manifest.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
+    write_sha256_manifest(root, manifest_name=MANIFEST_FILENAME)
+
+
+_MANIFEST_VERIFY_OBSERVERS: list[Callable[[Path], None]] = []
+
+
+def add_manifest_verify_observer(observer: Callable[[Path], None]) -> None:
+    """Register a callback invoked with ``root`` before each MANIFEST.sha256 verification."""
+    if observer not in _MANIFEST_VERIFY_OBSERVERS:
+        _MANIFEST_VERIFY_OBSERVERS.append(observer)
 
 
 def verify_manifest_sha256(root: Path) -> tuple[bool, str]:
     """Verify MANIFEST.sha256 against files under root. Fail closed on any mismatch."""
+    for observer in _MANIFEST_VERIFY_OBSERVERS:
+        observer(root)
     manifest = root / MANIFEST_FILENAME
     if not manifest.is_file():
         return False, "MANIFEST.sha256 missing"
+    # Structural checks first (in line order), then hash every entry before the
+    # first structural failure in one batch; the reported failure stays the first
+    # one in manifest order.
+    entries: list[tuple[str, str]] = []
+    failure = ""
     for raw in manifest.read_text(encoding="utf-8").splitlines():
         line = raw.strip()
         if not line:
             continue
         parts = line.split(None, 1)
         if len(parts) != 2:
-            return False, f"invalid manifest line: {line!r}"
+            failure = f"invalid manifest line: {line!r}"
+            break
         digest, rel = parts
-        path = root / rel
-        if not path.is_file():
-            return False, f"missing manifest entry: {rel}"
-        actual = hashlib.sha256(path.read_bytes()).hexdigest()
-        if actual != digest:
+        if not (root / rel).is_file():
+            failure = f"missing manifest entry: {rel}"
+            break
+        entries.append((digest, rel))
+
+    actual = hash_files([root / rel for _, rel in entries], return_exceptions=True)
+    for digest, rel in entries:
+        if actual[root / rel] != digest:
             return False, f"checksum mismatch: {rel}"
+    if failure:
+        return False, failure
     return True, ""
 
 
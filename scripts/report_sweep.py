@@ -16,6 +16,9 @@ Usage:
     # Report automatisch im Browser öffnen
     python scripts/report_sweep.py --sweep-name ma_opt_v1 --open
 
+    # Charts aus einem Figure-Cache übernehmen statt neu zu rendern
+    python scripts/report_sweep.py --sweep-name ma_opt_v1 --figure-cache-dir .cache/figures
+
     # Nur Text-Summary ohne HTML
     python scripts/report_sweep.py --sweep-name ma_opt_v1 --text-only
 """
@@ -39,6 +42,7 @@ from src.analytics.explorer import (
     SweepOverview,
     RankedExperiment,
 )
+from src.reporting.figure_pipeline import FigurePipeline
 from src.reporting.html_reports import HtmlReportBuilder
 
 
@@ -218,6 +222,11 @@ Beispiele:
         action="store_true",
         help="Report ohne Charts generieren",
     )
+    parser.add_argument(
+        "--figure-cache-dir",
+        default=None,
+        help="Content-addressed Cache für Charts; unveränderte Charts werden kopiert statt neu gerendert",
+    )
 
     return parser
 
@@ -286,7 +295,8 @@ def main(argv: Optional[List[str]] = None) -> int:
     print("Generiere HTML-Report...")
 
     output_dir = Path(args.out_dir)
-    builder = HtmlReportBuilder(output_dir=output_dir)
+    pipeline = FigurePipeline(cache_dir=args.figure_cache_dir)
+    builder = HtmlReportBuilder(output_dir=output_dir, figure_pipeline=pipeline)
 
     try:
         report_path = builder.build_sweep_report(
@@ -294,6 +304,7 @@ def main(argv: Optional[List[str]] = None) -> int:
             overview.best_runs,
             metric=args.metric,
         )
+        pipeline.run(raise_on_error=True)
         print(f"\nReport generiert: {report_path}")
         print(f"  Verzeichnis: {report_path.parent}")
 
@@ -43,53 +43,13 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Callable, Dict, Optional
 
-import pandas as pd
-import numpy as np
-
 # Projekt-Root zum Path hinzufügen
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from src.core.peak_config import PeakConfig, load_config
-from src.core.position_sizing import build_position_sizer_from_config
-from src.core.risk import build_risk_manager_from_config
-from src.backtest.engine import BacktestEngine
-from src.backtest.strategy_signal_binding_v1 import (
-    LEGACY_NON_AUTHORITATIVE,
-    RUN_BACKTEST_PATH_CLASSIFICATION,
-    declare_legacy_raw_signal_research_path_v1,
-)
-from src.backtest.cost_config_v0 import (
-    resolve_effective_backtest_cost_config,
-    BacktestCostConfigError,
-)
-
-# C11: explicit classic script classification for static contracts.
-PATH_CLASSIFICATION = RUN_BACKTEST_PATH_CLASSIFICATION
-LEGACY_NON_AUTHORITATIVE_PATH = LEGACY_NON_AUTHORITATIVE
-SYSTEM_ECONOMIC_EVIDENCE_BLOCKED = True
-LEGACY_NON_AUTHORITATIVE_FLAG = True
-from src.backtest.stats import compute_backtest_stats, validate_for_live_trading
-from src.data import DataNormalizer, CsvLoader, KrakenCsvLoader
-from src.core.experiments import log_backtest_result
-from src.strategies import STRATEGY_REGISTRY, load_strategy
-from src.strategies.registry import (
-    get_available_strategy_keys,
-    get_strategy_spec,
-)
-from src.experiments.evidence_chain import (
-    ensure_run_dir,
-    write_config_snapshot,
-    write_stats_json,
-    write_equity_csv,
-    write_trades_parquet_optional,
-    write_report_snippet_md,
-    get_optional_tracker,
-)
-
 
-def parse_args() -> argparse.Namespace:
-    """CLI-Argumente parsen."""
+def build_parser() -> argparse.ArgumentParser:
+    """CLI-Parser (nur argparse, damit ``--help`` ohne Backtest-Stack auskommt)."""
     parser = argparse.ArgumentParser(
         description=(
             "Peak_Trade Backtest Runner — offline Backtest und Evidence-Kette.\n\n"
@@ -211,7 +171,57 @@ Beispiele:
         help="Expliziter Non-Economic-Modus mit 0 Kosten (keine Profitabilitätsbehauptung)",
     )
 
-    return parser.parse_args()
+    return parser
+
+
+if __name__ == "__main__" and {"-h", "--help"} & set(sys.argv[1:]):
+    # --help beantworten, bevor pandas, Engine und Strategie-Registry geladen werden.
+    build_parser().parse_args()
+
+import pandas as pd
+import numpy as np
+
+from src.core.peak_config import PeakConfig, load_config
+from src.core.position_sizing import build_position_sizer_from_config
+from src.core.risk import build_risk_manager_from_config
+from src.backtest.engine import BacktestEngine
+from src.backtest.strategy_signal_binding_v1 import (
+    LEGACY_NON_AUTHORITATIVE,
+    RUN_BACKTEST_PATH_CLASSIFICATION,
+    declare_legacy_raw_signal_research_path_v1,
+)
+from src.backtest.cost_config_v0 import (
+    resolve_effective_backtest_cost_config,
+    BacktestCostConfigError,
+)
+
+# C11: explicit classic script classification for static contracts.
+PATH_CLASSIFICATION = RUN_BACKTEST_PATH_CLASSIFICATION
+LEGACY_NON_AUTHORITATIVE_PATH = LEGACY_NON_AUTHORITATIVE
+SYSTEM_ECONOMIC_EVIDENCE_BLOCKED = True
+LEGACY_NON_AUTHORITATIVE_FLAG = True
+from src.backtest.stats import compute_backtest_stats, validate_for_live_trading
+from src.data import DataNormalizer, CsvLoader, KrakenCsvLoader
+from src.core.experiments import log_backtest_result
+from src.strategies import STRATEGY_REGISTRY, load_strategy
+from src.strategies.registry import (
+    get_available_strategy_keys,
+    get_strategy_spec,
+)
+from src.experiments.evidence_chain import (
+    ensure_run_dir,
+    write_config_snapshot,
+    write_stats_json,
+    write_equity_csv,
+    write_trades_parquet_optional,
+    write_report_snippet_md,
+    get_optional_tracker,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    """CLI-Argumente parsen."""
+    return build_parser().parse_args()
 
 
 def _validate_strategy_registry_gates(key: str, cfg: PeakConfig) -> None:
@@ -166,6 +166,12 @@ Beispiele:
         default=None,
         help="Filtere Strategien nach Marktregime",
     )
+    portfolio_group.add_argument(
+        "--max-workers",
+        type=int,
+        default=None,
+        help="Worker-Prozesse für Komponenten-Backtests (Default: portfolio.max_workers)",
+    )
 
     # === Output-Parameter ===
     output_group = parser.add_argument_group("Output-Parameter")
@@ -336,6 +342,7 @@ def run_backtest(
         portfolio_name=args.portfolio,
         strategy_filter=strategy_filter,
         regime_filter=regime_filter,
+        max_workers=args.max_workers,
     )
 
     logger.info("✅ Backtest abgeschlossen!")
@@ -35,12 +35,124 @@ import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import pandas as pd
-
 # Projekt-Root zum Python-Path hinzufügen
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+
+def build_parser() -> argparse.ArgumentParser:
+    """CLI-Parser (nur argparse, damit ``--help`` ohne Backtest-Stack auskommt)."""
+    parser = argparse.ArgumentParser(
+        description="Peak_Trade: Strategy Parameter Sweep Runner",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+    # Mit TOML-Grid
+    python scripts/run_sweep.py --strategy ma_crossover --symbol BTC/EUR \\
+        --grid config/sweeps/ma_crossover.toml --tag optimization
+
+    # Mit JSON-Grid
+    python scripts/run_sweep.py --strategy ma_crossover --symbol BTC/EUR \\
+        --grid '{"short_window":[5,10,20],"long_window":[50,100]}' --tag quick-test
+
+    # Dry-Run
+    python scripts/run_sweep.py --strategy ma_crossover --symbol BTC/EUR \\
+        --grid config/sweeps/ma_crossover.toml --dry-run
+        """,
+    )
+
+    parser.add_argument(
+        "--config",
+        type=str,
+        default="config/config.toml",
+        help="Pfad zur Basis-Config (Default: config/config.toml)",
+    )
+
+    parser.add_argument(
+        "--strategy",
+        type=str,
+        required=True,
+        help="Strategie-Key aus der Registry (z.B. ma_crossover, rsi_reversion)",
+    )
+
+    parser.add_argument(
+        "--symbol",
+        type=str,
+        default="BTC/EUR",
+        help="Symbol für den Backtest (Default: BTC/EUR)",
+    )
+
+    parser.add_argument(
+        "--timeframe",
+        type=str,
+        default="1h",
+        help="Timeframe für OHLCV-Daten (Default: 1h)",
+    )
+
+    parser.add_argument(
+        "--grid",
+        type=str,
+        required=True,
+        help="Parameter-Grid: Pfad zu TOML-Datei oder JSON-String",
+    )
+
+    parser.add_argument(
+        "--data-file",
+        type=str,
+        default=None,
+        help="Pfad zur CSV-Datei mit OHLCV-Daten (optional, sonst Dummy-Daten)",
+    )
+
+    parser.add_argument(
+        "--bars",
+        type=int,
+        default=500,
+        help="Anzahl Bars für Dummy-Daten (Default: 500)",
+    )
+
+    parser.add_argument(
+        "--max-runs",
+        type=int,
+        default=None,
+        help="Maximale Anzahl der Kombinationen (optional)",
+    )
+
+    parser.add_argument(
+        "--sweep-name",
+        type=str,
+        default=None,
+        help="Name für den Sweep (optional, für Gruppierung)",
+    )
+
+    parser.add_argument(
+        "--tag",
+        type=str,
+        default=None,
+        help="Optionaler Tag für Registry-Logging",
+    )
+
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Nur Kombinationen anzeigen, keine Backtests ausführen",
+    )
+
+    parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="Ausführliche Ausgabe",
+    )
+
+    return parser
+
+
+if __name__ == "__main__" and {"-h", "--help"} & set(sys.argv[1:]):
+    # --help beantworten, bevor pandas, Engine und Strategie-Registry geladen werden.
+    build_parser().parse_args()
+
+import pandas as pd
+
 from scripts.run_backtest import (
     _validate_strategy_registry_gates,
     load_ohlcv_data,
@@ -190,109 +302,7 @@ def _apply_effective_params_to_strategy(
 
 def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     """Parst CLI-Argumente."""
-    parser = argparse.ArgumentParser(
-        description="Peak_Trade: Strategy Parameter Sweep Runner",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-    # Mit TOML-Grid
-    python scripts/run_sweep.py --strategy ma_crossover --symbol BTC/EUR \\
-        --grid config/sweeps/ma_crossover.toml --tag optimization
-
-    # Mit JSON-Grid
-    python scripts/run_sweep.py --strategy ma_crossover --symbol BTC/EUR \\
-        --grid '{"short_window":[5,10,20],"long_window":[50,100]}' --tag quick-test
-
-    # Dry-Run
-    python scripts/run_sweep.py --strategy ma_crossover --symbol BTC/EUR \\
-        --grid config/sweeps/ma_crossover.toml --dry-run
-        """,
-    )
-
-    parser.add_argument(
-        "--config",
-        type=str,
-        default="config/config.toml",
-        help="Pfad zur Basis-Config (Default: config/config.toml)",
-    )
-
-    parser.add_argument(
-        "--strategy",
-        type=str,
-        required=True,
-        help="Strategie-Key aus der Registry (z.B. ma_crossover, rsi_reversion)",
-    )
-
-    parser.add_argument(
-        "--symbol",
-        type=str,
-        default="BTC/EUR",
-        help="Symbol für den Backtest (Default: BTC/EUR)",
-    )
-
-    parser.add_argument(
-        "--timeframe",
-        type=str,
-        default="1h",
-        help="Timeframe für OHLCV-Daten (Default: 1h)",
-    )
-
-    parser.add_argument(
-        "--grid",
-        type=str,
-        required=True,
-        help="Parameter-Grid: Pfad zu TOML-Datei oder JSON-String",
-    )
-
-    parser.add_argument(
-        "--data-file",
-        type=str,
-        default=None,
-        help="Pfad zur CSV-Datei mit OHLCV-Daten (optional, sonst Dummy-Daten)",
-    )
-
-    parser.add_argument(
-        "--bars",
-        type=int,
-        default=500,
-        help="Anzahl Bars für Dummy-Daten (Default: 500)",
-    )
-
-    parser.add_argument(
-        "--max-runs",
-        type=int,
-        default=None,
-        help="Maximale Anzahl der Kombinationen (optional)",
-    )
-
-    parser.add_argument(
-        "--sweep-name",
-        type=str,
-        default=None,
-        help="Name für den Sweep (optional, für Gruppierung)",
-    )
-
-    parser.add_argument(
-        "--tag",
-        type=str,
-        default=None,
-        help="Optionaler Tag für Registry-Logging",
-    )
-
-    parser.add_argument(
-        "--dry-run",
-        action="store_true",
-        help="Nur Kombinationen anzeigen, keine Backtests ausführen",
-    )
-
-    parser.add_argument(
-        "--verbose",
-        "-v",
-        action="store_true",
-        help="Ausführliche Ausgabe",
-    )
-
-    return parser.parse_args(argv)
+    return build_parser().parse_args(argv)
 
 
 def expand_parameter_grid(grid: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
@@ -63,11 +63,10 @@ from src.backtest.trade_ledger_equity_curve_persistence_v0 import (
     CanonicalObservabilityBundleV0,
     DrawdownCurveStatus,
     EquityCurvePersistenceV0,
+    iter_curve_csv_chunks_v0,
     materialize_drawdown_curve_v0,
-    materialize_equity_curve_rows_v0,
+    materialize_equity_curve_columns_v0,
     materialize_trade_ledger_rows_v0,
-    serialize_drawdown_curve_csv,
-    serialize_equity_curve_csv,
     serialize_trade_ledger_jsonl,
     validate_drawdown_reconciliation_v0,
     validate_equity_final_value_reconciliation_v0,
@@ -969,8 +968,14 @@ def materialize_observability_bundle_v1(
     economic_verdict_status: str | None = None,
     economic_verdict_source_refs: Sequence[str] | None = None,
     render_canonical_report: bool = False,
+    columnar_artifacts: bool = False,
 ) -> tuple[CanonicalObservabilityBundleV0, MaterializationSummaryV1]:
-    """Materialize snapshot plus deterministic offline observability bundle artifacts."""
+    """Materialize snapshot plus deterministic offline observability bundle artifacts.
+
+    ``columnar_artifacts=True`` keeps trade ledger rows and equity/drawdown columns on the
+    bundle instead of pre-rendered JSONL/CSV text (the text fields are ``None``; read them via
+    ``bundle.artifact_text`` / ``iter_artifact_text``); digest and written files are identical.
+    """
     resolved_registry = registry or get_canonical_metric_registry_v1()
     snapshot, summary = materialize_snapshot_from_backtest_stats_v1(
         inputs,
@@ -1058,26 +1063,30 @@ def materialize_observability_bundle_v1(
         run_id=inputs.run_id,
         strategy_ref=inputs.strategy_ref,
     )
-    trade_ledger_jsonl = serialize_trade_ledger_jsonl(trade_rows)
+    trade_ledger_jsonl = None if columnar_artifacts else serialize_trade_ledger_jsonl(trade_rows)
 
     equity_series = (
         inputs.equity_curve if inputs.equity_curve is not None else pd.Series(dtype=float)
     )
-    equity_rows = materialize_equity_curve_rows_v0(equity_series)
-    equity_curve_csv = serialize_equity_curve_csv(equity_rows)
+    equity_columns = materialize_equity_curve_columns_v0(equity_series)
+    equity_curve_csv = (
+        None if columnar_artifacts else "".join(iter_curve_csv_chunks_v0(equity_columns))
+    )
     equity_persistence = EquityCurvePersistenceV0(
         owner=TRADE_LEDGER_OWNER,
-        point_count=len(equity_rows),
-        final_value=float(equity_rows[-1]["equity"]) if equity_rows else 0.0,
-        rows=equity_rows,
+        point_count=equity_columns.point_count,
+        final_value=equity_columns.final_value,
+        rows=(),
+        columns=equity_columns,
     )
 
     drawdown = materialize_drawdown_curve_v0(
         equity_curve=equity_series,
         drawdown_curve=inputs.drawdown_curve,
+        columnar=True,
     )
     drawdown_not_applicable_payload: Optional[dict[str, Any]] = None
-    drawdown_curve_csv = ""
+    drawdown_curve_csv: Optional[str] = ""
     if drawdown.status is DrawdownCurveStatus.SOURCE_MISSING and drawdown.point_count == 0:
         drawdown_not_applicable_payload = {
             "status": drawdown.status.value,
@@ -1085,7 +1094,10 @@ def materialize_observability_bundle_v1(
             "owner": drawdown.owner,
         }
     else:
-        drawdown_curve_csv = serialize_drawdown_curve_csv(drawdown.rows)
+        if drawdown.columns is not None:
+            drawdown_curve_csv = (
+                None if columnar_artifacts else "".join(iter_curve_csv_chunks_v0(drawdown.columns))
+            )
         if equity_series is not None and not equity_series.empty:
             validate_drawdown_reconciliation_v0(equity_curve=equity_series, drawdown=drawdown)
 
@@ -1125,7 +1137,7 @@ def materialize_observability_bundle_v1(
         snapshot_net_pnl=snapshot_net_pnl,
         snapshot_total_cost=snapshot_total_cost,
     )
-    if equity_rows:
+    if equity_columns.point_count:
         validate_equity_final_value_reconciliation_v0(
             equity_curve=equity_persistence,
             final_equity=final_equity,
@@ -1188,6 +1200,9 @@ def materialize_observability_bundle_v1(
         reconciliation_payload=reconciliation_payload,
         final_report=final_report,
         advanced_capability_payloads=advanced_payloads,
+        trade_ledger_rows=trade_rows if columnar_artifacts else None,
+        equity_curve_columns=equity_columns if columnar_artifacts else None,
+        drawdown_curve_columns=drawdown.columns if columnar_artifacts else None,
     )
 
     if render_canonical_report:
@@ -13,7 +13,7 @@ Features:
 import math
 import pandas as pd
 import numpy as np
-from typing import Any, Callable, Dict, List, Mapping, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 import logging
@@ -46,6 +46,16 @@ from ..risk import (
 )
 from .result import BacktestResult
 from .portfolio_resolver import resolve_portfolio_cfg
+from .portfolio_components import (
+    ComponentFailure,
+    ComponentResultCache,
+    PortfolioComponentRunner,
+)
+from .portfolio_matrix_sim import (
+    PortfolioSimulation,
+    align_portfolio_inputs,
+    simulate_portfolio_matrix,
+)
 from . import stats as stats_mod
 from .cost_config_v0 import (
     EffectiveBacktestCostConfigV0,
@@ -66,6 +76,9 @@ from ..orders.base import OrderRequest, OrderExecutionResult, OrderFill
 from ..orders.paper import PaperMarketContext, PaperOrderExecutor
 from ..execution.pipeline import ExecutionPipeline, ExecutionPipelineConfig, SignalEvent
 
+if TYPE_CHECKING:
+    from ..features.offline_feature_store_v1 import FeatureStoreBindingV1
+
 logger = logging.getLogger(__name__)
 
 LEGACY_PATH_COST_APPLICATION = False
@@ -255,6 +268,7 @@ class BacktestEngine:
         use_execution_pipeline: bool = True,
         log_executions: bool = False,
         tracker: Optional[object] = None,
+        feature_store_binding: Optional["FeatureStoreBindingV1"] = None,
         # Backward-compatibility alias
         use_order_layer: Optional[bool] = None,
     ):
@@ -273,11 +287,15 @@ class BacktestEngine:
                            _execution_logs gespeichert. Default: False
             tracker: Optional Objekt mit ``log_params`` / ``log_metrics`` (z. B. NoopTracker);
                      Fehler beim Tracking werden unterdrückt, damit Ergebnisse unverändert bleiben.
+            feature_store_binding: Optional Offline-Feature-Store-Binding; run_realistic()
+                     joint die gespeicherten Features (point-in-time) vor der Signal-
+                     Generierung an den DataFrame. Default: None (keine Feature-Spalten)
             use_order_layer: DEPRECATED - Alias fuer use_execution_pipeline (backward compat)
         """
         self.config = get_config()
 
         self.tracker = tracker
+        self.feature_store_binding = feature_store_binding
         # Risk-Layer initialisieren
         self.position_sizer = position_sizer or PositionSizer(PositionSizerConfig())
         self.risk_limits = risk_limits or RiskLimits(RiskLimitsConfig())
@@ -548,6 +566,9 @@ class BacktestEngine:
         """
         Realistischer Backtest mit vollständigem Risk-Management.
 
+        Mit feature_store_binding werden die Store-Features vorab per As-of-Join
+        (nur neue Bars werden materialisiert) an df angehaengt.
+
         Workflow (Legacy, use_execution_pipeline=False):
         1. Signale generieren via strategy_signal_fn
         2. Bar-für-Bar durchlaufen
@@ -566,7 +587,7 @@ class BacktestEngine:
             df: OHLCV-DataFrame (DatetimeIndex, Spalten: open, high, low, close, volume)
             strategy_signal_fn: Funktion(df, params) -> pd.Series mit Signalen (1=Buy, -1=Sell, 0=Hold)
             strategy_params: Parameter-Dict für Strategie (inkl. stop_pct)
-            symbol: Trading-Symbol (default: "BTC/EUR") - nur bei ExecutionPipeline verwendet
+            symbol: Trading-Symbol (default: "BTC/EUR") - fuer ExecutionPipeline und Feature-Store-Join
             fee_bps: Fees in Basispunkten — None = aus versionierter Config binden (fail-closed)
             slippage_bps: Slippage in Basispunkten — None = aus versionierter Config binden
             cost_config: Voraufgelöste Cost-Config (optional)
@@ -605,6 +626,9 @@ class BacktestEngine:
         bound_fee_bps = effective_cost.taker_fee_bps
         bound_slippage_bps = effective_cost.entry_slippage_bps
 
+        if self.feature_store_binding is not None:
+            df = self.feature_store_binding.join(df, symbol=symbol)
+
         self._safe_tracker_log_params(
             strategy_params,
             symbol=symbol,
@@ -1591,6 +1615,8 @@ def run_portfolio_from_config(
     risk_manager: Optional[BaseRiskManager] = None,
     *,
     system_economic_evidence_requested: bool = False,
+    max_workers: Optional[int] = None,
+    component_cache: Optional[ComponentResultCache] = None,
 ) -> PortfolioResult:
     """
     Führt Portfolio-Backtest mit mehreren Strategien aus.
@@ -1615,6 +1641,9 @@ def run_portfolio_from_config(
         regime_filter: Optional Marktregime-Filter ("trending", "ranging", "any")
         position_sizer: Optional custom PositionSizer für alle Strategien
         risk_limits: Optional custom RiskLimits für alle Strategien
+        max_workers: Worker-Prozesse für die Komponenten-Backtests
+            (default: portfolio.max_workers, sonst 1 = sequentiell)
+        component_cache: Optionaler ComponentResultCache für wiederholte Läufe
 
     Returns:
         PortfolioResult mit kombinierter Equity und Individual-Results
@@ -1686,6 +1715,21 @@ def run_portfolio_from_config(
     total_capital = portfolio_cfg.get("total_capital", cfg["backtest"]["initial_cash"])
     allocation_method = portfolio_cfg.get("allocation_method", "equal")
 
+    # Final run: do NOT pre-scale per-strategy initial_cash by weights.
+    # Single weighting point is applied in _combine_equity_curves().
+    components = PortfolioComponentRunner(
+        cfg=cfg,
+        total_capital=float(total_capital),
+        max_workers=max_workers
+        if max_workers is not None
+        else int(portfolio_cfg.get("max_workers", 1)),
+        cache=component_cache,
+        position_sizer=position_sizer,
+        risk_limits=risk_limits,
+        core_position_sizer=core_position_sizer,
+        risk_manager=risk_manager,
+    )
+
     if allocation_method in ("risk_parity", "sharpe_weighted"):
         # Two-pass allocation:
         # 1) preview backtests on a fixed initial slice -> estimate returns
@@ -1705,6 +1749,7 @@ def run_portfolio_from_config(
             risk_limits=risk_limits,
             core_position_sizer=core_position_sizer,
             risk_manager=risk_manager,
+            components=components,
         )
 
         allocation = _calculate_allocation_from_preview_returns(
@@ -1723,37 +1768,18 @@ def run_portfolio_from_config(
 
     logger.info(f"Capital Allocation ({allocation_method}): {allocation}")
 
-    # 5. Backtests für jede Strategie ausführen
+    # 5. Backtests für jede Strategie ausführen (ggf. parallel / aus Cache)
     strategy_results: Dict[str, BacktestResult] = {}
 
-    for strategy_name in strategies:
-        # Final run: do NOT pre-scale per-strategy initial_cash by weights.
-        # Single weighting point is applied in _combine_equity_curves().
-        initial_capital = float(total_capital)
-
-        # Backtest mit angepasstem Initial Capital (temporär überschreiben)
-        original_cash = cfg["backtest"]["initial_cash"]
-        cfg["backtest"]["initial_cash"] = initial_capital
-
-        try:
-            result = run_single_strategy_from_registry(
-                df=df,
-                strategy_name=strategy_name,
-                position_sizer=position_sizer,
-                risk_limits=risk_limits,
-                core_position_sizer=core_position_sizer,
-                risk_manager=risk_manager,
-            )
-            strategy_results[strategy_name] = result
-        except Exception as e:
-            logger.error(f"Fehler beim Backtest von '{strategy_name}': {e}")
+    for strategy_name, outcome in components.run(df, strategies).items():
+        if isinstance(outcome, ComponentFailure):
+            logger.error(f"Fehler beim Backtest von '{strategy_name}': {outcome.message}")
             # Bei Fehler: Dummy-Result mit 0 Equity
             strategy_results[strategy_name] = _create_dummy_result(
-                strategy_name, df, initial_capital
+                strategy_name, df, float(total_capital)
             )
-        finally:
-            # Initial Cash zurücksetzen
-            cfg["backtest"]["initial_cash"] = original_cash
+        else:
+            strategy_results[strategy_name] = outcome
 
     # 6. Equity-Curves kombinieren
     combined_equity = _combine_equity_curves(
@@ -1980,11 +2006,15 @@ def _preview_strategy_returns_for_allocation(
     risk_limits: Optional[RiskLimits],
     core_position_sizer: Optional[BasePositionSizer],
     risk_manager: Optional[BaseRiskManager],
+    components: Optional[PortfolioComponentRunner] = None,
 ) -> pd.DataFrame:
     """
     Two-pass allocation preview:
     run short preview backtests per strategy on the first N bars to estimate returns.
 
+    ``components`` is the runner shared with the final run (pool, result reuse,
+    cache); a sequential runner is created when omitted.
+
     Failure modes are explicit (no silent fallbacks).
     """
     if estimation_bars < 3:
@@ -2004,29 +2034,26 @@ def _preview_strategy_returns_for_allocation(
     if df_preview.empty:
         raise ValueError("Allocation preview slice is empty")
 
+    if components is None:
+        components = PortfolioComponentRunner(
+            cfg=cfg,
+            total_capital=float(total_capital),
+            position_sizer=position_sizer,
+            risk_limits=risk_limits,
+            core_position_sizer=core_position_sizer,
+            risk_manager=risk_manager,
+        )
+
     returns_by_strategy: Dict[str, pd.Series] = {}
 
-    for strategy_name in strategies:
-        original_cash = cfg["backtest"]["initial_cash"]
-        cfg["backtest"]["initial_cash"] = float(total_capital)
-        try:
-            result = run_single_strategy_from_registry(
-                df=df_preview,
-                strategy_name=strategy_name,
-                position_sizer=position_sizer,
-                risk_limits=risk_limits,
-                core_position_sizer=core_position_sizer,
-                risk_manager=risk_manager,
-            )
-        except Exception as e:
+    for strategy_name, outcome in components.run(df_preview, strategies).items():
+        if isinstance(outcome, ComponentFailure):
             raise ValueError(
-                f"Allocation preview backtest failed for '{strategy_name}': {e}"
-            ) from e
-        finally:
-            cfg["backtest"]["initial_cash"] = original_cash
+                f"Allocation preview backtest failed for '{strategy_name}': {outcome.message}"
+            ) from outcome.error
 
         returns_by_strategy[strategy_name] = _equity_to_preview_returns(
-            result.equity_curve, strategy_name=strategy_name
+            outcome.equity_curve, strategy_name=strategy_name
         )
 
     # Align to common index and drop any rows with missing returns.
@@ -2312,6 +2339,7 @@ def run_portfolio_strategy_backtest(
     fee_bps: float = 0.0,
     slippage_bps: float = 0.0,
     rebalance_interval: int = 1,
+    simulator: str = "matrix",
 ) -> PortfolioStrategyResult:
     """
     Führt Portfolio-Backtest mit Portfolio-Strategy-Layer aus (Phase 26).
@@ -2323,8 +2351,8 @@ def run_portfolio_strategy_backtest(
 
     Workflow:
     1. Für jedes Symbol: Signale generieren
-    2. Portfolio-Kontext aufbauen
-    3. Portfolio-Strategie: Zielgewichte berechnen
+    2. Preise/Signale einmalig zu (bars × symbols)-Matrizen ausrichten
+    3. Portfolio-Strategie: Zielgewichte berechnen (vektorisiert, falls möglich)
     4. Positionen anpassen (Rebalancing)
     5. PnL und Equity tracken
 
@@ -2337,6 +2365,8 @@ def run_portfolio_strategy_backtest(
         fee_bps: Gebühren in Basispunkten
         slippage_bps: Slippage in Basispunkten
         rebalance_interval: Rebalancing alle N Bars
+        simulator: "matrix" (Default, siehe `portfolio_matrix_sim`) oder "loop"
+            (Referenz-Schleife Bar-für-Bar; identische Ergebnisse, langsam)
 
     Returns:
         PortfolioStrategyResult mit kombinierten Ergebnissen
@@ -2365,11 +2395,15 @@ def run_portfolio_strategy_backtest(
     """
     from ..portfolio import (
         PortfolioConfig,
-        PortfolioContext,
         make_portfolio_strategy,
     )
     from ..core.peak_config import load_config
 
+    if simulator not in ("matrix", "loop"):
+        raise ValueError(f"Unbekannter simulator: '{simulator}' (erlaubt: 'matrix', 'loop')")
+    if rebalance_interval < 1:
+        raise ValueError(f"rebalance_interval muss >= 1 sein, ist: {rebalance_interval}")
+
     # 1. Portfolio-Config laden
     if portfolio_config is None:
         try:
@@ -2411,7 +2445,142 @@ def run_portfolio_strategy_backtest(
         signals = strategy_signal_fn(df_aligned, strategy_params)
         signals_dict[symbol] = signals.loc[common_index]
 
-    # 5. Backtest-Loop initialisieren
+    # 5. Simulation
+    sim_kwargs = dict(
+        initial_capital=initial_capital,
+        fee_bps=fee_bps,
+        slippage_bps=slippage_bps,
+        rebalance_interval=rebalance_interval,
+    )
+    if simulator == "loop":
+        sim = _simulate_portfolio_loop(
+            data_dict,
+            signals_dict,
+            common_index,
+            portfolio_strategy,
+            portfolio_config,
+            **sim_kwargs,
+        )
+    else:
+        inputs = align_portfolio_inputs(data_dict, signals_dict, common_index)
+        weight_matrix = portfolio_strategy.generate_target_weight_matrix(
+            inputs.symbols, inputs.closes
+        )
+        if weight_matrix is not None:
+            sim = simulate_portfolio_matrix(inputs, weight_matrix=weight_matrix, **sim_kwargs)
+        else:
+            logger.debug(
+                f"{portfolio_strategy.name}: keine Gewichtsmatrix, Zielgewichte Bar-für-Bar"
+            )
+            sim = simulate_portfolio_matrix(
+                inputs,
+                weights_fn=_portfolio_weights_fn(inputs, portfolio_strategy, portfolio_config),
+                **sim_kwargs,
+            )
+
+    # 6. Ergebnisse aufbereiten
+    equity_series = sim.equity
+    all_trades = sim.trades
+
+    # Trades als DataFrames
+    trades_per_symbol = {
+        s: pd.DataFrame(all_trades[s]) if all_trades[s] else pd.DataFrame() for s in symbols
+    }
+
+    # Portfolio-Stats berechnen
+    portfolio_stats = stats_mod.compute_basic_stats(equity_series)
+    portfolio_stats["sharpe"] = compute_sharpe_ratio(equity_series)
+    portfolio_stats["total_trades"] = sum(len(t) for t in all_trades.values())
+    portfolio_stats["num_symbols"] = len(symbols)
+    portfolio_stats["rebalance_interval"] = rebalance_interval
+
+    # Win-Rate berechnen
+    all_pnls = []
+    for trades in all_trades.values():
+        all_pnls.extend([t["pnl"] for t in trades])
+
+    if all_pnls:
+        wins = sum(1 for p in all_pnls if p > 0)
+        portfolio_stats["win_rate"] = wins / len(all_pnls)
+    else:
+        portfolio_stats["win_rate"] = 0.0
+
+    logger.info(
+        f"Portfolio-Strategy-Backtest abgeschlossen: "
+        f"Return={portfolio_stats['total_return']:.2%}, "
+        f"Sharpe={portfolio_stats['sharpe']:.2f}, "
+        f"Trades={portfolio_stats['total_trades']}"
+    )
+
+    return PortfolioStrategyResult(
+        combined_equity=equity_series,
+        symbol_equities=sim.symbol_equities,
+        target_weights_history=sim.target_weights,
+        actual_weights_history=sim.actual_weights,
+        portfolio_stats=portfolio_stats,
+        trades_per_symbol=trades_per_symbol,
+        portfolio_strategy_name=portfolio_config.name,
+        metadata={
+            "symbols": symbols,
+            "initial_capital": initial_capital,
+            "fee_bps": fee_bps,
+            "slippage_bps": slippage_bps,
+            "portfolio_config": portfolio_config.to_dict(),
+        },
+    )
+
+
+def _portfolio_returns_history(
+    closes: pd.DataFrame, bar_idx: int, portfolio_config: Any
+) -> Optional[pd.DataFrame]:
+    """Returns-Historie bis inkl. bar_idx für Vol-Target (sonst None)."""
+    if bar_idx >= portfolio_config.vol_lookback and portfolio_config.name == "vol_target":
+        window = closes.iloc[: bar_idx + 1]
+        return pd.DataFrame({s: window[s].pct_change().dropna() for s in closes.columns})
+    return None
+
+
+def _portfolio_weights_fn(
+    inputs: Any, portfolio_strategy: Any, portfolio_config: Any
+) -> Callable[[int, np.ndarray, float], Dict[str, float]]:
+    """Bar-für-Bar-Zielgewichte für Strategien ohne Gewichtsmatrix (Matrix-Simulator)."""
+    from ..portfolio import PortfolioContext
+
+    symbols = inputs.symbols
+    closes = pd.DataFrame(inputs.closes, index=inputs.index, columns=symbols)
+
+    def weights_fn(bar_idx: int, positions: np.ndarray, equity: float) -> Dict[str, float]:
+        context = PortfolioContext(
+            timestamp=inputs.index[bar_idx],
+            symbols=symbols,
+            prices=dict(zip(symbols, inputs.closes[bar_idx].tolist())),
+            current_positions=dict(zip(symbols, positions.tolist())),
+            strategy_signals=dict(zip(symbols, inputs.signals[bar_idx].tolist())),
+            returns_history=_portfolio_returns_history(closes, bar_idx, portfolio_config),
+            equity=equity,
+        )
+        return portfolio_strategy.generate_target_weights(context)
+
+    return weights_fn
+
+
+def _simulate_portfolio_loop(
+    data_dict: Dict[str, pd.DataFrame],
+    signals_dict: Dict[str, pd.Series],
+    common_index: pd.Index,
+    portfolio_strategy: Any,
+    portfolio_config: Any,
+    initial_capital: float,
+    fee_bps: float,
+    slippage_bps: float,
+    rebalance_interval: int,
+) -> PortfolioSimulation:
+    """Referenz-Simulation Bar-für-Bar (Dict-Lookups je Bar und Symbol)."""
+    from ..portfolio import PortfolioContext
+
+    symbols = list(data_dict.keys())
+
+    # Backtest-Loop initialisieren
     equity = initial_capital
     cash = initial_capital
     positions: Dict[str, float] = {s: 0.0 for s in symbols}  # Stückzahl
@@ -2427,7 +2596,7 @@ def run_portfolio_strategy_backtest(
     entry_prices: Dict[str, float] = {}
     entry_times: Dict[str, pd.Timestamp] = {}
 
-    # 6. Bar-für-Bar-Loop
+    # Bar-für-Bar-Loop
     prev_target_weights: Dict[str, float] = {}
 
     for bar_idx, timestamp in enumerate(common_index):
@@ -2536,7 +2705,7 @@ def run_portfolio_strategy_backtest(
 
         prev_target_weights = target_weights.copy()
 
-    # 7. Offene Positionen am Ende schließen
+    # Offene Positionen am Ende schließen
     last_timestamp = common_index[-1]
     for symbol in symbols:
         if positions[symbol] > 0 and symbol in entry_prices:
@@ -2559,7 +2728,6 @@ def run_portfolio_strategy_backtest(
                 }
             )
 
-    # 8. Ergebnisse aufbereiten
     equity_series = pd.Series(equity_curve, index=[common_index[0]] + list(common_index))
 
     # Symbol Equities als Series
@@ -2568,55 +2736,12 @@ def run_portfolio_strategy_backtest(
         for s in symbols
     }
 
-    # Weights als DataFrames
-    target_weights_df = pd.DataFrame(target_weights_list, index=common_index)
-    actual_weights_df = pd.DataFrame(actual_weights_list, index=common_index)
-
-    # Trades als DataFrames
-    trades_per_symbol = {
-        s: pd.DataFrame(all_trades[s]) if all_trades[s] else pd.DataFrame() for s in symbols
-    }
-
-    # Portfolio-Stats berechnen
-    portfolio_stats = stats_mod.compute_basic_stats(equity_series)
-    portfolio_stats["sharpe"] = compute_sharpe_ratio(equity_series)
-    portfolio_stats["total_trades"] = sum(len(t) for t in all_trades.values())
-    portfolio_stats["num_symbols"] = len(symbols)
-    portfolio_stats["rebalance_interval"] = rebalance_interval
-
-    # Win-Rate berechnen
-    all_pnls = []
-    for trades in all_trades.values():
-        all_pnls.extend([t["pnl"] for t in trades])
-
-    if all_pnls:
-        wins = sum(1 for p in all_pnls if p > 0)
-        portfolio_stats["win_rate"] = wins / len(all_pnls)
-    else:
-        portfolio_stats["win_rate"] = 0.0
-
-    logger.info(
-        f"Portfolio-Strategy-Backtest abgeschlossen: "
-        f"Return={portfolio_stats['total_return']:.2%}, "
-        f"Sharpe={portfolio_stats['sharpe']:.2f}, "
-        f"Trades={portfolio_stats['total_trades']}"
-    )
-
-    return PortfolioStrategyResult(
-        combined_equity=equity_series,
+    return PortfolioSimulation(
+        equity=equity_series,
         symbol_equities=symbol_equities,
-        target_weights_history=target_weights_df,
-        actual_weights_history=actual_weights_df,
-        portfolio_stats=portfolio_stats,
-        trades_per_symbol=trades_per_symbol,
-        portfolio_strategy_name=portfolio_config.name,
-        metadata={
-            "symbols": symbols,
-            "initial_capital": initial_capital,
-            "fee_bps": fee_bps,
-            "slippage_bps": slippage_bps,
-            "portfolio_config": portfolio_config.to_dict(),
-        },
+        target_weights=pd.DataFrame(target_weights_list, index=common_index),
+        actual_weights=pd.DataFrame(actual_weights_list, index=common_index),
+        trades=all_trades,
     )
 
 
@@ -16,8 +16,9 @@ from dataclasses import dataclass, field, fields, replace
 from datetime import timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Mapping, Optional, Sequence
+from typing import Any, Callable, Iterator, Mapping, Optional, Sequence
 
+import numpy as np
 import pandas as pd
 
 from src.backtest.admissible_versioned_futures_dataset_v1 import (
@@ -533,9 +534,51 @@ def build_mv2_research_risk_limits_v1(cfg: Mapping[str, Any]) -> RiskLimits:
     return RiskLimits(RiskLimitsConfig(max_position_pct=max_position_pct))
 
 
+def _canonical_json(payload: Any) -> str:
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+
+
 def _stable_digest(payload: Mapping[str, Any]) -> str:
-    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
-    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    return hashlib.sha256(_canonical_json(payload).encode("utf-8")).hexdigest()
+
+
+class _StableDigestTemplateV1:
+    """
+    ``_stable_digest`` for payloads with fixed keys and mostly run-invariant values.
+
+    The canonical JSON of the invariant values is rendered once; per call only the
+    variable values are serialized and spliced in key order, so the digest is
+    byte-identical to ``_stable_digest({**invariant, **values})``.
+    """
+
+    def __init__(self, invariant: Mapping[str, Any], variable_keys: Sequence[str]) -> None:
+        overlap = set(invariant) & set(variable_keys)
+        if overlap:
+            raise ValueError(f"digest_template_key_overlap:{sorted(overlap)}")
+        self.invariant = dict(invariant)
+        self.variable_keys = tuple(variable_keys)
+        self._literals: list[str] = []
+        self._slots: list[str] = []
+        pending = "{"
+        for position, key in enumerate(sorted([*self.invariant, *self.variable_keys])):
+            pending += ("," if position else "") + _canonical_json(key) + ":"
+            if key in self.invariant:
+                pending += _canonical_json(self.invariant[key])
+            else:
+                self._literals.append(pending)
+                self._slots.append(key)
+                pending = ""
+        self._tail = pending + "}"
+
+    def digest(self, **values: Any) -> str:
+        if set(values) != set(self.variable_keys):
+            raise ValueError(f"digest_template_values_mismatch:{sorted(values)}")
+        parts: list[str] = []
+        for literal, key in zip(self._literals, self._slots):
+            parts.append(literal)
+            parts.append(_canonical_json(values[key]))
+        parts.append(self._tail)
+        return hashlib.sha256("".join(parts).encode("utf-8")).hexdigest()
 
 
 def _default_component_versions() -> dict[str, str]:
@@ -650,6 +693,86 @@ def _resolve_warmup_status(bar: pd.Series) -> WarmupStatus:
     return WarmupStatus.WARMUP_COMPLETE
 
 
+_WARMUP_REQUIRED_STATUS_VALUES_V1 = ("warmup_required", "warmup_in_progress", "in_progress")
+
+
+class _BarRowViewV1:
+    """Read-only bar row (``name``, ``index``, ``[]``, ``get``) over pre-extracted values."""
+
+    __slots__ = ("name", "index", "_positions", "_values")
+
+    def __init__(
+        self,
+        name: Any,
+        index: pd.Index,
+        positions: Mapping[Any, int],
+        values: np.ndarray,
+    ) -> None:
+        self.name = name
+        self.index = index
+        self._positions = positions
+        self._values = values
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._values[self._positions[key]]
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        position = self._positions.get(key)
+        return default if position is None else self._values[position]
+
+
+class _MV2BarColumnsV1:
+    """
+    Columnar bar access for the MV2 replay loop.
+
+    Bar values are extracted once (``DataFrame.to_numpy``, the same interleaving
+    ``iterrows`` uses), so row views yield the same element objects as the
+    ``pd.Series`` rows of ``iterrows`` without building a Series per bar.
+    Frames with duplicate column labels fall back to ``iterrows``.
+    """
+
+    def __init__(self, bars: pd.DataFrame) -> None:
+        self.bars = bars
+        self.columns = bars.columns
+        self.columnar = bool(bars.columns.is_unique)
+        self.positions = {column: j for j, column in enumerate(bars.columns)}
+        self.values = bars.to_numpy() if self.columnar else None
+
+    def rows(self) -> Iterator[Any]:
+        if not self.columnar:
+            for _, row in self.bars.iterrows():
+                yield row
+            return
+        for name, values in zip(self.bars.index, self.values):
+            yield _BarRowViewV1(name, self.columns, self.positions, values)
+
+    def warmup_statuses(self) -> list[WarmupStatus]:
+        """Vectorized ``_resolve_warmup_status`` for every bar (same precedence)."""
+        if not self.columnar:
+            return [_resolve_warmup_status(row) for _, row in self.bars.iterrows()]
+        n = len(self.bars)
+        # 0 = complete, 1 = required, 2 = invalid
+        codes = np.zeros(n, dtype=np.int8)
+        resolved = np.zeros(n, dtype=bool)
+        if "warmup_status" in self.positions:
+            raw = self.values[:, self.positions["warmup_status"]].astype(str)
+            lowered = np.char.lower(raw) if n else raw
+            required = np.isin(lowered, _WARMUP_REQUIRED_STATUS_VALUES_V1)
+            invalid = lowered == "warmup_invalid"
+            codes[required] = 1
+            codes[invalid] = 2
+            resolved = required | invalid | (lowered == "warmup_complete")
+        if "warmup_complete" in self.positions:
+            complete = self.values[:, self.positions["warmup_complete"]].astype(bool)
+            codes[~resolved & ~complete] = 1
+        by_code = (
+            WarmupStatus.WARMUP_COMPLETE,
+            WarmupStatus.WARMUP_REQUIRED,
+            WarmupStatus.WARMUP_INVALID,
+        )
+        return [by_code[code] for code in codes.tolist()]
+
+
 def _resolve_volatility_estimate_for_economic_research_wiring_v1(
     bar: pd.Series,
     *,
@@ -2488,7 +2611,7 @@ def run_mv2_research_backtest_wiring_v1(
     def _emit_observational_bar_hook(
         *,
         trading_epoch: int,
-        bar_row: pd.Series,
+        bar_row: pd.Series | _BarRowViewV1,
         warmup_status_value: str,
         warmup_skipped: bool,
         context_obj: CanonicalMarketContextV1,
@@ -2562,15 +2685,29 @@ def run_mv2_research_backtest_wiring_v1(
             decision_authority_reached=decision_authority_reached,
         )
 
+    bar_columns = _MV2BarColumnsV1(bars)
+    bar_warmup_statuses = bar_columns.warmup_statuses()
+    # Invariant parts of the per-epoch input digest are serialized once per run.
+    epoch_digest_keys = ("context_digest", "epoch", "l1_observation_status", "observed_l1_used")
+    epoch_digest_invariant = {
+        "registry_input_digest": snapshot.input_digest,
+        "cost_digest": effective_cost.config_digest,
+        "profile_binding": effective_profile.to_dict(),
+    }
+    epoch_input_digest = _StableDigestTemplateV1(epoch_digest_invariant, epoch_digest_keys)
+    warmup_skip_input_digest = _StableDigestTemplateV1(
+        {
+            **epoch_digest_invariant,
+            "warmup_skip_reason": ECONOMIC_RESEARCH_WARMUP_REQUIRED_SKIP_REASON,
+        },
+        epoch_digest_keys,
+    )
     if economic_research_profile:
         _fail_closed(
-            not any(
-                _resolve_warmup_status(row) is WarmupStatus.WARMUP_COMPLETE
-                for _, row in bars.iterrows()
-            ),
+            not any(status is WarmupStatus.WARMUP_COMPLETE for status in bar_warmup_statuses),
             ECONOMIC_RESEARCH_NO_WARMUP_COMPLETE_BAR_REASON,
         )
-    for i, (_, row) in enumerate(bars.iterrows()):
+    for i, row in enumerate(bar_columns.rows()):
         if sequence_state is None:
             sequence_state = build_initial_mv2_integrated_replay_bar_sequence_state_v1(
                 trading_epoch=i,
@@ -2584,7 +2721,7 @@ def run_mv2_research_backtest_wiring_v1(
                 sequence_state,
                 feedback,
             )
-        bar_warmup_status = _resolve_warmup_status(row)
+        bar_warmup_status = bar_warmup_statuses[i]
         if economic_research_profile:
             if bar_warmup_status is WarmupStatus.WARMUP_INVALID:
                 _fail_closed(True, ECONOMIC_RESEARCH_WARMUP_INVALID_BLOCK_REASON)
@@ -2597,17 +2734,11 @@ def run_mv2_research_backtest_wiring_v1(
                         research_execution_cost=research_execution_cost,
                     )
                 )
-                input_digest = _stable_digest(
-                    {
-                        "context_digest": context.input_digest,
-                        "epoch": i,
-                        "registry_input_digest": snapshot.input_digest,
-                        "cost_digest": effective_cost.config_digest,
-                        "profile_binding": effective_profile.to_dict(),
-                        "l1_observation_status": l1_status.value,
-                        "observed_l1_used": observed_l1_used,
-                        "warmup_skip_reason": ECONOMIC_RESEARCH_WARMUP_REQUIRED_SKIP_REASON,
-                    }
+                input_digest = warmup_skip_input_digest.digest(
+                    context_digest=context.input_digest,
+                    epoch=i,
+                    l1_observation_status=l1_status.value,
+                    observed_l1_used=observed_l1_used,
                 )
                 skip_evidence = _build_economic_research_warmup_required_skip_evidence_v1(
                     replay_id=replay_id,
@@ -2678,16 +2809,11 @@ def run_mv2_research_backtest_wiring_v1(
             profile_binding=effective_profile,
             research_execution_cost=research_execution_cost,
         )
-        input_digest = _stable_digest(
-            {
-                "context_digest": context.input_digest,
-                "epoch": i,
-                "registry_input_digest": snapshot.input_digest,
-                "cost_digest": effective_cost.config_digest,
-                "profile_binding": effective_profile.to_dict(),
-                "l1_observation_status": l1_status.value,
-                "observed_l1_used": observed_l1_used,
-            }
+        input_digest = epoch_input_digest.digest(
+            context_digest=context.input_digest,
+            epoch=i,
+            l1_observation_status=l1_status.value,
+            observed_l1_used=observed_l1_used,
         )
         try:
             agreement_material = normalize_strategy_signal_to_suitability_agreement_material_v1(
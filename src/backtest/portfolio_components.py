@@ -0,0 +1,329 @@
+"""
+Komponenten-Backtests für run_portfolio_from_config
+===================================================
+
+Führt die Einzel-Backtests (``run_single_strategy_from_registry``) eines
+Multi-Strategy-Portfolios aus:
+
+- optional parallel auf einem Prozess-Pool; die Marktdaten werden einmal pro
+  Worker übergeben (Pool-Initializer, bei ``fork`` ohne Kopie) und nur gelesen
+- Ergebnisse mit identischem Schlüssel werden innerhalb eines Portfolio-Laufs
+  wiederverwendet (Allocation-Preview und finaler Lauf teilen sich Ergebnisse)
+- optionaler Cache über mehrere Portfolio-Läufe hinweg
+  (`ComponentResultCache`), Schlüssel aus Strategie, Parametern,
+  Daten-Fingerprint und Engine-Config (inkl. Kosten-Config und Startkapital)
+
+Parallelisierung und Caching greifen nur ohne benutzerdefinierte
+Sizer-/Risk-Objekte: diese sind zustandsbehaftet und werden zwischen den
+Komponenten geteilt, daher laufen solche Portfolios sequentiell wie bisher.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Union
+
+import pandas as pd
+
+from .result import BacktestResult
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ComponentFailure:
+    """Fehlgeschlagener Komponenten-Backtest (Meldung wie ``str(exc)``)."""
+
+    message: str
+    error: Optional[BaseException] = None
+
+
+ComponentOutcome = Union[BacktestResult, ComponentFailure]
+
+
+class ComponentResultCache:
+    """
+    LRU-Cache für Komponenten-Ergebnisse über mehrere Portfolio-Läufe.
+
+    Gespeichert und ausgegeben werden Kopien, damit Aufrufer die gecachten
+    Ergebnisse nicht verändern können.
+
+    Example:
+        >>> cache = ComponentResultCache()
+        >>> run_portfolio_from_config(df, component_cache=cache)
+        >>> run_portfolio_from_config(df, component_cache=cache)  # aus dem Cache
+    """
+
+    def __init__(self, max_entries: int = 128) -> None:
+        if max_entries < 1:
+            raise ValueError(f"max_entries muss >= 1 sein, ist: {max_entries}")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, BacktestResult]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[BacktestResult]:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return copy.deepcopy(result)
+
+    def put(self, key: str, result: BacktestResult) -> None:
+        stored = copy.deepcopy(result)
+        with self._lock:
+            self._entries[key] = stored
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def data_fingerprint(df: pd.DataFrame) -> str:
+    """SHA256 über Spalten, Dtypes, Index und Werte eines DataFrames."""
+    digest = hashlib.sha256()
+    header = [[str(c) for c in df.columns], [str(t) for t in df.dtypes], str(df.index.dtype)]
+    digest.update(json.dumps(header).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _canonical_digest(payload: Any) -> str:
+    text = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=repr)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def component_cache_key(
+    *,
+    strategy_name: str,
+    params: Mapping[str, Any],
+    data_fp: str,
+    config_fp: str,
+) -> str:
+    """Cache-Schlüssel (strategy, params, data fingerprint, engine/cost config)."""
+    return _canonical_digest(
+        {
+            "strategy": strategy_name,
+            "params": dict(params),
+            "data": data_fp,
+            "config": config_fp,
+        }
+    )
+
+
+# ---------------------------------------------------------------------------
+# Worker (Prozess-Pool)
+# ---------------------------------------------------------------------------
+
+_WORKER_DF: Optional[pd.DataFrame] = None
+
+
+def _init_component_worker(df: pd.DataFrame) -> None:
+    global _WORKER_DF
+    _WORKER_DF = df
+
+
+def _run_component_in_worker(strategy_name: str, initial_cash: Optional[float]) -> ComponentOutcome:
+    from . import engine
+
+    config = engine.get_config() if initial_cash is not None else None
+    original_cash = config["backtest"]["initial_cash"] if config is not None else None
+    if config is not None:
+        config["backtest"]["initial_cash"] = initial_cash
+    try:
+        return engine.run_single_strategy_from_registry(
+            df=_WORKER_DF,
+            strategy_name=strategy_name,
+            position_sizer=None,
+            risk_limits=None,
+            core_position_sizer=None,
+            risk_manager=None,
+        )
+    except Exception as e:
+        return ComponentFailure(message=str(e))
+    finally:
+        if config is not None:
+            config["backtest"]["initial_cash"] = original_cash
+
+
+class PortfolioComponentRunner:
+    """
+    Führt Komponenten-Backtests eines Portfolio-Laufs aus (sequentiell oder parallel).
+
+    ``cfg["backtest"]["initial_cash"]`` wird wie bisher pro Aufruf temporär auf
+    ``total_capital`` gesetzt; Worker-Prozesse übernehmen das, wenn ``cfg`` die
+    Engine-Config (``get_config()``) ist.
+
+    Args:
+        cfg: Portfolio-Config-Dict (wie an run_portfolio_from_config übergeben)
+        total_capital: Startkapital jeder Komponente
+        max_workers: Anzahl Worker-Prozesse (<= 1: sequentiell im Prozess)
+        cache: Optionaler Cache über mehrere Portfolio-Läufe
+        position_sizer, risk_limits, core_position_sizer, risk_manager:
+            Optionale Overrides (deaktivieren Parallelisierung und Caching)
+    """
+
+    def __init__(
+        self,
+        *,
+        cfg: Dict[str, Any],
+        total_capital: float,
+        max_workers: int = 1,
+        cache: Optional[ComponentResultCache] = None,
+        position_sizer: Any = None,
+        risk_limits: Any = None,
+        core_position_sizer: Any = None,
+        risk_manager: Any = None,
+    ) -> None:
+        self.cfg = cfg
+        self.total_capital = float(total_capital)
+        self.max_workers = max(1, int(max_workers))
+        self.cache = cache
+        self._run_kwargs = {
+            "position_sizer": position_sizer,
+            "risk_limits": risk_limits,
+            "core_position_sizer": core_position_sizer,
+            "risk_manager": risk_manager,
+        }
+        self.shareable = all(v is None for v in self._run_kwargs.values())
+        self._memo: Dict[str, BacktestResult] = {}
+        self._config_fp: Optional[str] = None
+
+    def run(self, df: pd.DataFrame, strategies: List[str]) -> Dict[str, ComponentOutcome]:
+        """
+        Backtests für alle Strategien auf ``df`` (Reihenfolge wie ``strategies``).
+
+        Returns:
+            Dict[strategy -> BacktestResult | ComponentFailure]
+        """
+        keys = self._cache_keys(df, strategies)
+        outcomes: Dict[str, ComponentOutcome] = {}
+        pending: List[str] = []
+        for name in strategies:
+            reused = self._lookup(keys[name])
+            if reused is not None:
+                logger.debug(f"Komponente '{name}' wiederverwendet (Cache)")
+                outcomes[name] = reused
+            else:
+                pending.append(name)
+
+        workers = min(self.max_workers, len(pending), os.cpu_count() or 1)
+        if self.shareable and workers > 1:
+            outcomes.update(self._run_pool(df, pending, workers))
+        else:
+            for name in pending:
+                outcomes[name] = self._run_local(df, name)
+
+        for name in pending:
+            outcome = outcomes[name]
+            key = keys[name]
+            if key is not None and isinstance(outcome, BacktestResult):
+                self._memo[key] = outcome
+                if self.cache is not None:
+                    self.cache.put(key, outcome)
+        return {name: outcomes[name] for name in strategies}
+
+    def _lookup(self, key: Optional[str]) -> Optional[BacktestResult]:
+        if key is None:
+            return None
+        if key in self._memo:
+            return self._memo[key]
+        if self.cache is not None:
+            result = self.cache.get(key)
+            if result is not None:
+                self._memo[key] = result
+            return result
+        return None
+
+    def _engine_initial_cash(self) -> Optional[float]:
+        """Startkapital, das die Engine sieht (None: Engine-Config bleibt unverändert)."""
+        from . import engine
+
+        return self.total_capital if self.cfg is engine.get_config() else None
+
+    def _cache_keys(self, df: pd.DataFrame, strategies: List[str]) -> Dict[str, Optional[str]]:
+        keys: Dict[str, Optional[str]] = {name: None for name in strategies}
+        if not self.shareable:
+            return keys
+        from . import engine
+
+        try:
+            if self._config_fp is None:
+                engine_cfg = copy.deepcopy(engine.get_config())
+                cash = self._engine_initial_cash()
+                if cash is not None:
+                    engine_cfg["backtest"]["initial_cash"] = cash
+                self._config_fp = _canonical_digest(engine_cfg)
+            data_fp = data_fingerprint(df)
+        except Exception as e:  # Fingerprint nicht bestimmbar -> ohne Cache
+            logger.debug(f"Komponenten-Cache deaktiviert: {e}")
+            return keys
+
+        for name in strategies:
+            try:
+                params = engine.get_strategy_config(name).to_dict()
+            except Exception:
+                continue  # unbekannte Strategie: Fehler entsteht beim Backtest selbst
+            keys[name] = component_cache_key(
+                strategy_name=name, params=params, data_fp=data_fp, config_fp=self._config_fp
+            )
+        return keys
+
+    def _run_local(self, df: pd.DataFrame, strategy_name: str) -> ComponentOutcome:
+        from . import engine
+
+        original_cash = self.cfg["backtest"]["initial_cash"]
+        self.cfg["backtest"]["initial_cash"] = self.total_capital
+        try:
+            return engine.run_single_strategy_from_registry(
+                df=df, strategy_name=strategy_name, **self._run_kwargs
+            )
+        except Exception as e:
+            return ComponentFailure(message=str(e), error=e)
+        finally:
+            self.cfg["backtest"]["initial_cash"] = original_cash
+
+    def _run_pool(
+        self, df: pd.DataFrame, strategies: List[str], workers: int
+    ) -> Dict[str, ComponentOutcome]:
+        logger.info(
+            f"Komponenten-Backtests parallel: {len(strategies)} Strategien, {workers} Worker"
+        )
+        initial_cash = self._engine_initial_cash()
+        outcomes: Dict[str, ComponentOutcome] = {}
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_component_worker, initargs=(df,)
+        ) as pool:
+            futures = {
+                name: pool.submit(_run_component_in_worker, name, initial_cash)
+                for name in strategies
+            }
+            for name, future in futures.items():
+                try:
+                    outcomes[name] = future.result()
+                except Exception as e:  # Transportfehler (Pickling, Worker-Abbruch)
+                    logger.warning(
+                        f"Komponente '{name}' im Worker fehlgeschlagen ({e}), lokal wiederholt"
+                    )
+                    outcomes[name] = self._run_local(df, name)
+        return outcomes
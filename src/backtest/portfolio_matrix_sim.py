@@ -0,0 +1,340 @@
+"""
+Matrix-Simulator für den Portfolio-Strategy-Layer (Phase 26)
+============================================================
+
+Vektorisierte Variante der Bar-Schleife von `run_portfolio_strategy_backtest`:
+
+- Preise und Signale werden einmalig zu (bars × symbols)-Arrays ausgerichtet
+  (keine ``.loc``-Lookups pro Bar und Symbol).
+- Zielgewichte kommen als Matrix aus
+  `BasePortfolioStrategy.generate_target_weight_matrix`; zustandsabhängige
+  Strategien werden weiterhin Bar-für-Bar über einen Callback ausgewertet.
+- Zwischen zwei Rebalancing-Bars sind Positionen und Cash konstant, daher wird
+  Mark-to-Market blockweise berechnet.
+- Rebalancing (Deltas, Fees, Slippage, Cash-Verlauf) läuft als Array-Kernel;
+  nur Bars, in denen ein Kauf am Cash scheitert, werden sequentiell abgearbeitet.
+
+Alle Summen werden in derselben Reihenfolge gebildet wie in der Referenz-
+Schleife (Cash zuerst, dann Symbole in Reihenfolge), die Ergebnisse sind
+dadurch bitgleich.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Mindest-Trade-Größe (Stückzahl) wie in der Referenz-Schleife
+MIN_TRADE_SIZE = 0.0001
+
+# Callback für zustandsabhängige Portfolio-Strategien:
+# (bar_idx, positions, equity) -> Dict[symbol -> weight]
+WeightsFn = Callable[[int, np.ndarray, float], Dict[str, float]]
+
+
+@dataclass
+class PortfolioMatrixInputs:
+    """
+    Einmalig ausgerichtete Eingangsdaten.
+
+    Attributes:
+        index: Gemeinsamer Zeitindex (bars)
+        symbols: Symbole (Spaltenreihenfolge)
+        closes: Schlusskurse (bars × symbols, float64)
+        signals: Strategie-Signale (bars × symbols, float64)
+    """
+
+    index: pd.Index
+    symbols: List[str]
+    closes: np.ndarray
+    signals: np.ndarray
+
+
+@dataclass
+class PortfolioSimulation:
+    """
+    Rohergebnis einer Portfolio-Simulation (Referenz-Schleife oder Matrix).
+
+    Attributes:
+        equity: Portfolio-Equity (Startwert + ein Wert pro Bar)
+        symbol_equities: Positionswert pro Symbol (0.0 + ein Wert pro Bar)
+        target_weights: Zielgewichte pro Bar
+        actual_weights: Tatsächliche Gewichte pro Bar (vor Rebalancing)
+        trades: Abgeschlossene Trades pro Symbol
+    """
+
+    equity: pd.Series
+    symbol_equities: Dict[str, pd.Series]
+    target_weights: pd.DataFrame
+    actual_weights: pd.DataFrame
+    trades: Dict[str, List[Dict[str, Any]]]
+
+
+def align_portfolio_inputs(
+    data_dict: Dict[str, pd.DataFrame],
+    signals_dict: Dict[str, pd.Series],
+    common_index: pd.Index,
+) -> PortfolioMatrixInputs:
+    """
+    Richtet Schlusskurse und Signale einmalig auf den gemeinsamen Index aus.
+
+    Args:
+        data_dict: Dict[symbol -> OHLCV-DataFrame]
+        signals_dict: Dict[symbol -> Signal-Series] (bereits auf common_index)
+        common_index: Gemeinsamer Zeitindex
+
+    Returns:
+        PortfolioMatrixInputs
+    """
+    symbols = list(data_dict.keys())
+    closes = np.column_stack(
+        [data_dict[s].loc[common_index, "close"].to_numpy(dtype=float) for s in symbols]
+    )
+    signals = np.column_stack(
+        [signals_dict[s].loc[common_index].to_numpy(dtype=float) for s in symbols]
+    )
+    return PortfolioMatrixInputs(
+        index=common_index, symbols=symbols, closes=closes, signals=signals
+    )
+
+
+def _sequential_total(start: float, values: np.ndarray) -> np.ndarray:
+    """Laufende Summe ``start + v0 + v1 + ...`` (links-assoziativ, letzte Achse)."""
+    head = np.full(values.shape[:-1] + (1,), start)
+    return np.cumsum(np.concatenate((head, values), axis=-1), axis=-1)
+
+
+def _first_appearance_order(weights: np.ndarray) -> List[int]:
+    """Spaltenreihenfolge, die ``pd.DataFrame(list_of_dicts)`` erzeugen würde."""
+    present = ~np.isnan(weights)
+    has_any = present.any(axis=0)
+    first_row = np.where(has_any, present.argmax(axis=0), len(weights))
+    order = sorted(range(weights.shape[1]), key=lambda j: (first_row[j], j))
+    return [j for j in order if has_any[j]]
+
+
+class _TradeBook:
+    """Entry-Tracking und Trade-Records pro Symbol (nur bei Ereignissen aktiv)."""
+
+    def __init__(self, symbols: Sequence[str], timestamps: List[Any]) -> None:
+        self.timestamps = timestamps
+        self.entry_price: Dict[int, float] = {}
+        self.entry_bar: Dict[int, int] = {}
+        self.trades: Dict[str, List[Dict[str, Any]]] = {s: [] for s in symbols}
+        self.symbols = list(symbols)
+
+    def open(self, j: int, bar: int, price: float) -> None:
+        self.entry_price[j] = price
+        self.entry_bar[j] = bar
+
+    def close(self, j: int, bar: int, price: float, size: float, end_of_data: bool) -> None:
+        entry_price = self.entry_price.pop(j)
+        entry_bar = self.entry_bar.pop(j)
+        pnl = (price - entry_price) * size
+        trade = {
+            "entry_time": self.timestamps[entry_bar],
+            "entry_price": entry_price,
+            "exit_time": self.timestamps[bar],
+            "exit_price": price,
+            "size": size,
+            "pnl": pnl,
+            "pnl_pct": (pnl / (entry_price * size)) * 100 if entry_price else 0,
+        }
+        if end_of_data:
+            trade["exit_reason"] = "end_of_data"
+        self.trades[self.symbols[j]].append(trade)
+
+
+def _rebalance(
+    bar: int,
+    price: np.ndarray,
+    target: np.ndarray,
+    positions: np.ndarray,
+    cash: float,
+    equity: float,
+    fee_bps: float,
+    slippage_bps: float,
+    book: _TradeBook,
+) -> float:
+    """
+    Passt ``positions`` (in-place) an die Zielgewichte an und gibt neues Cash zurück.
+
+    Symbole werden in Spaltenreihenfolge abgearbeitet; ein Kauf wird nur
+    ausgeführt, wenn ``cost <= cash`` zum Zeitpunkt dieses Symbols gilt.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        target_position = np.where(price > 0, equity * target / price, 0.0)
+    delta = target_position - positions
+    abs_delta = np.abs(delta)
+    trade = abs_delta > MIN_TRADE_SIZE
+    if not trade.any():
+        return cash
+
+    fee = abs_delta * price * fee_bps / 10000
+    buy = trade & (delta > 0)
+    sell = trade & ~buy
+    cost = delta * price * (1 + slippage_bps / 10000) + fee
+    proceeds = abs_delta * price * (1 - slippage_bps / 10000) - fee
+    flows = np.where(buy, -cost, np.where(sell, proceeds, 0.0))
+    cash_path = _sequential_total(cash, flows)
+
+    if np.all(cost[buy] <= cash_path[:-1][buy]):
+        executed = trade
+        cash = float(cash_path[-1])
+    else:
+        # Cash-Engpass: Käufe hängen von vorherigen Symbolen ab -> sequentiell
+        executed = np.zeros_like(trade)
+        for j in np.flatnonzero(trade).tolist():
+            if buy[j]:
+                if cost[j] <= cash:
+                    executed[j] = True
+                    cash -= float(cost[j])
+            else:
+                executed[j] = True
+                cash += float(proceeds[j])
+
+    previous = positions.copy()
+    positions[executed] += delta[executed]
+
+    for j in np.flatnonzero(executed & buy & (previous <= 0)).tolist():
+        book.open(j, bar, float(price[j]))
+    closing = executed & sell & (positions <= 0)
+    for j in np.flatnonzero(closing).tolist():
+        if j in book.entry_price:
+            book.close(j, bar, float(price[j]), abs(float(previous[j])), end_of_data=False)
+    return cash
+
+
+def simulate_portfolio_matrix(
+    inputs: PortfolioMatrixInputs,
+    *,
+    initial_capital: float,
+    fee_bps: float,
+    slippage_bps: float,
+    rebalance_interval: int,
+    weight_matrix: Optional[Tuple[List[str], np.ndarray]] = None,
+    weights_fn: Optional[WeightsFn] = None,
+) -> PortfolioSimulation:
+    """
+    Simuliert den Portfolio-Backtest auf ausgerichteten Arrays.
+
+    Genau eine Gewichtsquelle muss gesetzt sein: ``weight_matrix`` (aus
+    `generate_target_weight_matrix`) oder ``weights_fn`` (Bar-für-Bar).
+
+    Args:
+        inputs: Ausgerichtete Preise/Signale
+        initial_capital: Startkapital
+        fee_bps: Gebühren in Basispunkten
+        slippage_bps: Slippage in Basispunkten
+        rebalance_interval: Rebalancing alle N Bars (>= 1)
+        weight_matrix: (Spalten, Gewichte bars × Spalten, NaN = kein Gewicht)
+        weights_fn: Callback (bar_idx, positions, equity) -> Zielgewichte
+
+    Returns:
+        PortfolioSimulation
+    """
+    if (weight_matrix is None) == (weights_fn is None):
+        raise ValueError("Genau eine Gewichtsquelle (weight_matrix oder weights_fn) erwartet")
+
+    symbols = inputs.symbols
+    closes = inputs.closes
+    n_bars, n_symbols = closes.shape
+    timestamps = list(inputs.index)
+    column_of = {s: j for j, s in enumerate(symbols)}
+
+    positions = np.zeros(n_symbols)
+    cash = float(initial_capital)
+    position_values = np.empty((n_bars, n_symbols))
+    equity = np.empty(n_bars)
+    book = _TradeBook(symbols, timestamps)
+
+    if weight_matrix is not None:
+        weight_columns, weights = weight_matrix
+        targets = np.zeros((n_bars, n_symbols))
+        for k, symbol in enumerate(weight_columns):
+            if symbol in column_of:
+                targets[:, column_of[symbol]] = np.nan_to_num(weights[:, k], nan=0.0)
+        previous = np.vstack((np.full((1, weights.shape[1]), np.nan), weights[:-1]))
+        changed = ((weights != previous) & ~(np.isnan(weights) & np.isnan(previous))).any(axis=1)
+        rebalance = (np.arange(n_bars) % rebalance_interval == 0) | changed
+        event_bars = np.flatnonzero(rebalance).tolist()
+        target_records: Optional[List[Dict[str, float]]] = None
+    else:
+        targets = np.zeros((n_bars, n_symbols))
+        event_bars = list(range(n_bars))
+        target_records = []
+        prev_target: Dict[str, float] = {}
+
+    start = 0
+    for bar in event_bars:
+        # Mark-to-Market für alle Bars seit dem letzten Rebalancing (inkl. diesem)
+        block = closes[start : bar + 1] * positions
+        position_values[start : bar + 1] = block
+        equity[start : bar + 1] = _sequential_total(cash, block)[:, -1]
+        start = bar + 1
+        bar_equity = float(equity[bar])
+
+        if weights_fn is not None:
+            target_weights = weights_fn(bar, positions.copy(), bar_equity)
+            target_records.append(target_weights)
+            targets[bar] = [target_weights.get(s, 0.0) for s in symbols]
+            should_rebalance = bar % rebalance_interval == 0
+            weights_changed = target_weights != prev_target
+            prev_target = target_weights.copy()
+            if not (should_rebalance or weights_changed):
+                continue
+
+        cash = _rebalance(
+            bar,
+            closes[bar],
+            targets[bar],
+            positions,
+            cash,
+            bar_equity,
+            fee_bps,
+            slippage_bps,
+            book,
+        )
+
+    if start < n_bars:
+        block = closes[start:] * positions
+        position_values[start:] = block
+        equity[start:] = _sequential_total(cash, block)[:, -1]
+
+    # Offene Positionen am Ende schließen
+    last_bar = n_bars - 1
+    for j in np.flatnonzero(positions > 0).tolist():
+        if j in book.entry_price:
+            size = float(positions[j])
+            book.close(j, last_bar, float(closes[last_bar, j]), size, end_of_data=True)
+
+    index = inputs.index
+    curve_index = [index[0]] + list(index)
+    equity_series = pd.Series(np.concatenate(([initial_capital], equity)), index=curve_index)
+    symbol_equities = {
+        s: pd.Series(np.concatenate(([0.0], position_values[:, j])), index=curve_index)
+        for j, s in enumerate(symbols)
+    }
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        actual = np.where(equity[:, None] > 0, position_values / equity[:, None], 0.0)
+    actual_weights = pd.DataFrame(actual, index=index, columns=symbols)
+
+    if target_records is not None:
+        target_weights_df = pd.DataFrame(target_records, index=index)
+    else:
+        order = _first_appearance_order(weights)
+        target_weights_df = pd.DataFrame(
+            weights[:, order], index=index, columns=[weight_columns[k] for k in order]
+        )
+
+    return PortfolioSimulation(
+        equity=equity_series,
+        symbol_equities=symbol_equities,
+        target_weights=target_weights_df,
+        actual_weights=actual_weights,
+        trades=book.trades,
+    )
@@ -2,6 +2,10 @@
 
 Reuses engine trade records and stats/equity owners. No new formula owners, runtime rewire,
 or economic evaluation semantics.
+
+Equity/drawdown curves can be held as columns (``CurveColumnsV0``) instead of per-point row
+dicts; artifacts are then streamed in chunks (CSV byte-identical to the row serializers,
+optional Parquet export) and hashed while writing.
 """
 
 from __future__ import annotations
@@ -15,8 +19,9 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Mapping, Optional, Sequence
+from typing import Any, BinaryIO, Iterable, Iterator, Mapping, Optional, Sequence
 
+import numpy as np
 import pandas as pd
 
 from src.backtest.economic_observability_snapshot_v1 import (
@@ -32,6 +37,9 @@ TRADE_RECORD_SOURCE = "backtest.engine:Trade"
 
 RECONCILIATION_TOLERANCE = 1e-9
 
+# Rows per streamed CSV/JSONL chunk and per Parquet row group.
+DEFAULT_STREAM_CHUNK_ROWS = 65_536
+
 CANONICAL_TRADE_LEDGER_FIELDS: tuple[str, ...] = (
     "trade_id",
     "instrument_id",
@@ -120,12 +128,37 @@ class TradeLedgerReconciliationV0:
     reason_codes: tuple[str, ...] = ()
 
 
+@dataclass(frozen=True)
+class CurveColumnsV0:
+    """Curve as columns: ISO timestamps (object array) and float64 values."""
+
+    value_field: str
+    timestamps: np.ndarray
+    values: np.ndarray
+
+    @property
+    def point_count(self) -> int:
+        return int(self.values.shape[0])
+
+    @property
+    def final_value(self) -> float:
+        return float(self.values[-1]) if self.point_count else 0.0
+
+    def rows(self) -> tuple[dict[str, Any], ...]:
+        """Row-dict view (same shape as the ``materialize_*_rows`` output)."""
+        return tuple(
+            {"timestamp": timestamp, self.value_field: value}
+            for timestamp, value in zip(self.timestamps.tolist(), self.values.tolist())
+        )
+
+
 @dataclass(frozen=True)
 class EquityCurvePersistenceV0:
     owner: str
     point_count: int
     final_value: float
     rows: tuple[dict[str, Any], ...]
+    columns: Optional[CurveColumnsV0] = None
 
 
 @dataclass(frozen=True)
@@ -135,6 +168,15 @@ class DrawdownCurvePersistenceV0:
     reason_codes: tuple[str, ...]
     point_count: int
     rows: tuple[dict[str, Any], ...]
+    columns: Optional[CurveColumnsV0] = None
+
+
+@dataclass(frozen=True)
+class StreamedArtifactV0:
+    path: Path
+    sha256: str
+    byte_count: int
+    row_count: int
 
 
 @dataclass(frozen=True)
@@ -344,6 +386,29 @@ def materialize_equity_curve_rows_v0(
     return tuple(rows)
 
 
+def _iso_timestamp_column(index: pd.Index) -> np.ndarray:
+    return np.array([_iso_timestamp(timestamp) for timestamp in index], dtype=object)
+
+
+def materialize_curve_columns_v0(series: pd.Series, *, value_field: str) -> CurveColumnsV0:
+    """Columns with the same timestamps/values as the row materializers, without row dicts."""
+    if series is None or series.empty:
+        return CurveColumnsV0(
+            value_field=value_field,
+            timestamps=np.empty(0, dtype=object),
+            values=np.empty(0, dtype=np.float64),
+        )
+    return CurveColumnsV0(
+        value_field=value_field,
+        timestamps=_iso_timestamp_column(series.index),
+        values=series.to_numpy(dtype=np.float64, copy=True),
+    )
+
+
+def materialize_equity_curve_columns_v0(equity_curve: pd.Series) -> CurveColumnsV0:
+    return materialize_curve_columns_v0(equity_curve, value_field="equity")
+
+
 def _reconstruct_drawdown_from_equity(equity_curve: pd.Series) -> pd.Series:
     running_max = equity_curve.cummax()
     return equity_curve - running_max
@@ -353,7 +418,9 @@ def materialize_drawdown_curve_v0(
     *,
     equity_curve: pd.Series,
     drawdown_curve: Optional[pd.Series] = None,
+    columnar: bool = False,
 ) -> DrawdownCurvePersistenceV0:
+    """Drawdown persistence; ``columnar=True`` keeps ``columns`` and leaves ``rows`` empty."""
     if equity_curve is None or equity_curve.empty:
         return DrawdownCurvePersistenceV0(
             owner=DRAWDOWN_CURVE_OWNER,
@@ -380,6 +447,17 @@ def materialize_drawdown_curve_v0(
         reason_codes = ("DRAWDOWN_RECONSTRUCTED_FROM_EQUITY_CURVE",)
         series = _reconstruct_drawdown_from_equity(equity_curve)
 
+    if columnar:
+        columns = materialize_curve_columns_v0(series, value_field="drawdown")
+        return DrawdownCurvePersistenceV0(
+            owner=DRAWDOWN_CURVE_OWNER,
+            status=DrawdownCurveStatus(status.value),
+            reason_codes=reason_codes,
+            point_count=columns.point_count,
+            rows=(),
+            columns=columns,
+        )
+
     rows: list[dict[str, Any]] = []
     for timestamp, drawdown in series.items():
         rows.append(
@@ -493,14 +571,25 @@ def validate_drawdown_reconciliation_v0(
     if drawdown.point_count != len(equity_curve):
         raise PersistenceContractError("drawdown_point_count_mismatch")
     if drawdown.status is DrawdownCurveStatus.RECONSTRUCTED:
-        expected = _reconstruct_drawdown_from_equity(equity_curve)
-        for idx, timestamp in enumerate(equity_curve.index):
-            expected_value = float(expected.iloc[idx])
-            actual_value = float(drawdown.rows[idx]["drawdown"])
-            if abs(expected_value - actual_value) > tolerance:
-                raise PersistenceContractError("drawdown_reconstruction_mismatch")
-            if _iso_timestamp(timestamp) != drawdown.rows[idx]["timestamp"]:
-                raise PersistenceContractError("drawdown_timestamp_mismatch")
+        columns = drawdown.columns
+        if columns is None:
+            columns = CurveColumnsV0(
+                value_field="drawdown",
+                timestamps=np.array([row["timestamp"] for row in drawdown.rows], dtype=object),
+                values=np.array([row["drawdown"] for row in drawdown.rows], dtype=np.float64),
+            )
+        expected = _reconstruct_drawdown_from_equity(equity_curve).to_numpy(dtype=np.float64)
+        value_mismatch = np.flatnonzero(np.abs(expected - columns.values) > tolerance)
+        timestamp_mismatch = np.flatnonzero(
+            _iso_timestamp_column(equity_curve.index) != columns.timestamps
+        )
+        # Same precedence as a per-point scan: first index wins, value before timestamp.
+        first_value = value_mismatch[0] if value_mismatch.size else len(expected)
+        first_timestamp = timestamp_mismatch[0] if timestamp_mismatch.size else len(expected)
+        if first_value < len(expected) and first_value <= first_timestamp:
+            raise PersistenceContractError("drawdown_reconstruction_mismatch")
+        if first_timestamp < len(expected):
+            raise PersistenceContractError("drawdown_timestamp_mismatch")
     return True
 
 
@@ -527,6 +616,129 @@ def serialize_drawdown_curve_csv(rows: Sequence[Mapping[str, Any]]) -> str:
     return buffer.getvalue()
 
 
+def iter_trade_ledger_jsonl_chunks_v0(
+    rows: Sequence[TradeLedgerRowV0], *, chunk_rows: int = DEFAULT_STREAM_CHUNK_ROWS
+) -> Iterator[str]:
+    """Chunks whose concatenation equals ``serialize_trade_ledger_jsonl(rows)``."""
+    for start in range(0, len(rows), chunk_rows):
+        yield "".join(
+            serialize_canonical_json(row.to_dict()) + "\n"
+            for row in rows[start : start + chunk_rows]
+        )
+
+
+def iter_curve_csv_chunks_v0(
+    columns: CurveColumnsV0, *, chunk_rows: int = DEFAULT_STREAM_CHUNK_ROWS
+) -> Iterator[str]:
+    """Chunks whose concatenation equals ``serialize_{equity,drawdown}_curve_csv`` of the rows."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(["timestamp", columns.value_field])
+    for start in range(0, columns.point_count, chunk_rows):
+        stop = start + chunk_rows
+        writer.writerows(
+            zip(columns.timestamps[start:stop].tolist(), columns.values[start:stop].tolist())
+        )
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def write_text_chunks_v0(
+    path: Path, chunks: Iterable[str], *, row_count: int = 0
+) -> StreamedArtifactV0:
+    """Write UTF-8 text chunk by chunk and hash the bytes while writing."""
+    digest = hashlib.sha256()
+    byte_count = 0
+    with path.open("wb") as handle:
+        for chunk in chunks:
+            data = chunk.encode("utf-8")
+            digest.update(data)
+            handle.write(data)
+            byte_count += len(data)
+    return StreamedArtifactV0(
+        path=path, sha256=digest.hexdigest(), byte_count=byte_count, row_count=row_count
+    )
+
+
+class _HashingWriterV0:
+    """Binary file wrapper hashing everything written (for Parquet writers)."""
+
+    def __init__(self, handle: BinaryIO) -> None:
+        self._handle = handle
+        self.digest = hashlib.sha256()
+        self.byte_count = 0
+        self.closed = False
+
+    def write(self, data: bytes) -> int:
+        view = memoryview(data)
+        self.digest.update(view)
+        self.byte_count += view.nbytes
+        return self._handle.write(view)
+
+    def tell(self) -> int:
+        return self.byte_count
+
+    def flush(self) -> None:
+        self._handle.flush()
+
+    def close(self) -> None:
+        self.closed = True
+
+    def writable(self) -> bool:
+        return True
+
+
+def write_curve_parquet_v0(
+    path: Path,
+    columns: CurveColumnsV0,
+    *,
+    row_group_rows: int = DEFAULT_STREAM_CHUNK_ROWS,
+) -> StreamedArtifactV0:
+    """Optional columnar export (pyarrow); row groups are written and hashed incrementally."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:  # pragma: no cover - pyarrow is a core dependency
+        raise PersistenceContractError("parquet_export_requires_pyarrow") from exc
+
+    schema = pa.schema([("timestamp", pa.string()), (columns.value_field, pa.float64())])
+    with path.open("wb") as handle:
+        sink = _HashingWriterV0(handle)
+        with pq.ParquetWriter(sink, schema) as writer:
+            for start in range(0, max(columns.point_count, 1), row_group_rows):
+                stop = start + row_group_rows
+                writer.write_table(
+                    pa.table(
+                        {
+                            "timestamp": pa.array(columns.timestamps[start:stop], pa.string()),
+                            columns.value_field: pa.array(columns.values[start:stop]),
+                        },
+                        schema=schema,
+                    )
+                )
+    return StreamedArtifactV0(
+        path=path,
+        sha256=sink.digest.hexdigest(),
+        byte_count=sink.byte_count,
+        row_count=columns.point_count,
+    )
+
+
+def read_curve_parquet_v0(path: Path) -> CurveColumnsV0:
+    import pyarrow.parquet as pq
+
+    table = pq.read_table(path)
+    value_field = table.schema.names[1]
+    return CurveColumnsV0(
+        value_field=value_field,
+        timestamps=np.array(table.column("timestamp").to_pylist(), dtype=object),
+        values=table.column(value_field).to_numpy().astype(np.float64, copy=False),
+    )
+
+
 def compute_bundle_file_digest(content: str) -> str:
     return hashlib.sha256(content.encode("utf-8")).hexdigest()
 
@@ -535,9 +747,10 @@ def compute_bundle_file_digest(content: str) -> str:
 class CanonicalObservabilityBundleV0:
     snapshot_payload: dict[str, Any]
     registry_payload: dict[str, Any]
-    trade_ledger_jsonl: str
-    equity_curve_csv: str
-    drawdown_curve_csv: str
+    # Pre-rendered text; None in columnar mode (see artifact_text / iter_artifact_text).
+    trade_ledger_jsonl: Optional[str]
+    equity_curve_csv: Optional[str]
+    drawdown_curve_csv: Optional[str]
     drawdown_not_applicable_payload: Optional[dict[str, Any]]
     decision_funnel_payload: dict[str, Any]
     data_quality_payload: dict[str, Any]
@@ -547,10 +760,23 @@ class CanonicalObservabilityBundleV0:
     final_report_md: str = ""
     report_summary_json: dict[str, Any] = field(default_factory=dict)
     advanced_capability_payloads: dict[str, dict[str, Any]] = field(default_factory=dict)
+    # Columnar mode: large artifacts are streamed from these instead of the text fields above.
+    trade_ledger_rows: Optional[tuple[TradeLedgerRowV0, ...]] = None
+    equity_curve_columns: Optional[CurveColumnsV0] = None
+    drawdown_curve_columns: Optional[CurveColumnsV0] = None
     bundle_digest: str = field(default="", init=False)
 
-    def artifact_payloads(self) -> dict[str, str | dict[str, Any]]:
-        artifacts: dict[str, str | dict[str, Any]] = {
+    def _streamed_artifact_chunks(self, name: str) -> Optional[Iterator[str]]:
+        if name == "TRADE_LEDGER.jsonl" and self.trade_ledger_rows is not None:
+            return iter_trade_ledger_jsonl_chunks_v0(self.trade_ledger_rows)
+        if name == "EQUITY_CURVE.csv" and self.equity_curve_columns is not None:
+            return iter_curve_csv_chunks_v0(self.equity_curve_columns)
+        if name == "DRAWDOWN_CURVE.csv" and self.drawdown_curve_columns is not None:
+            return iter_curve_csv_chunks_v0(self.drawdown_curve_columns)
+        return None
+
+    def _artifact_sources(self) -> dict[str, Optional[str] | dict[str, Any]]:
+        artifacts: dict[str, Optional[str] | dict[str, Any]] = {
             "OBSERVABILITY_SNAPSHOT.json": self.snapshot_payload,
             "METRIC_REGISTRY_SNAPSHOT.json": self.registry_payload,
             "TRADE_LEDGER.jsonl": self.trade_ledger_jsonl,
@@ -572,27 +798,57 @@ class CanonicalObservabilityBundleV0:
         artifacts.update(self.advanced_capability_payloads)
         return artifacts
 
+    def artifact_names(self) -> list[str]:
+        """Sorted artifact file names without rendering any artifact text."""
+        return sorted(self._artifact_sources())
+
+    def artifact_payloads(self) -> dict[str, str | dict[str, Any]]:
+        artifacts = self._artifact_sources()
+        for name, payload in artifacts.items():
+            if not isinstance(payload, dict):
+                artifacts[name] = self.artifact_text(name)
+        return artifacts  # type: ignore[return-value]
+
+    def artifact_text(self, name: str) -> str:
+        """Full canonical text of one artifact (works in text and columnar mode)."""
+        return "".join(self.iter_artifact_text(name))
+
+    def iter_artifact_text(self, name: str) -> Iterator[str]:
+        """Canonical text of one artifact in chunks (dicts as canonical JSON)."""
+        chunks = self._streamed_artifact_chunks(name)
+        if chunks is not None:
+            yield from chunks
+            return
+        payload = self._artifact_sources()[name]
+        if payload is None:
+            raise PersistenceContractError(f"artifact_source_missing:{name}")
+        yield serialize_canonical_json(payload) if isinstance(payload, dict) else payload
+
     def compute_digest(self) -> str:
-        canonical_parts = []
-        for name in sorted(self.artifact_payloads()):
-            payload = self.artifact_payloads()[name]
-            if isinstance(payload, dict):
-                canonical_parts.append(serialize_canonical_json(payload))
-            else:
-                canonical_parts.append(str(payload))
-        digest = hashlib.sha256("\n".join(canonical_parts).encode("utf-8")).hexdigest()
+        hasher = hashlib.sha256()
+        for position, name in enumerate(sorted(self._artifact_sources())):
+            if position:
+                hasher.update(b"\n")
+            for chunk in self.iter_artifact_text(name):
+                hasher.update(chunk.encode("utf-8"))
+        digest = hasher.hexdigest()
         self.bundle_digest = digest
         return digest
 
 
-def write_observability_bundle_v0(bundle: CanonicalObservabilityBundleV0, output_dir: Path) -> None:
+def write_observability_bundle_v0(
+    bundle: CanonicalObservabilityBundleV0, output_dir: Path
+) -> dict[str, str]:
+    """Write all bundle artifacts; returns the SHA256 of each written file by name."""
     output_dir.mkdir(parents=True, exist_ok=True)
-    for name, payload in bundle.artifact_payloads().items():
+    file_digests: dict[str, str] = {}
+    for name, payload in bundle._artifact_sources().items():
         path = output_dir / name
         if isinstance(payload, dict):
-            path.write_text(
+            chunks: Iterable[str] = (
                 json.dumps(payload, indent=2, ensure_ascii=False, sort_keys=True) + "\n",
-                encoding="utf-8",
             )
         else:
-            path.write_text(str(payload), encoding="utf-8")
+            chunks = bundle.iter_artifact_text(name)
+        file_digests[name] = write_text_chunks_v0(path, chunks).sha256
+    return file_digests
@@ -12,88 +12,91 @@ Config-Subsysteme (Imports bewusst wählen — Kurzüberblick):
 Leitfaden: ``docs/project_docs/CONFIG_IMPORT_GUIDE.md``.
 """
 
-# Wave A (Stability): Error Taxonomy
-from .errors import (
-    PeakTradeError,
-    DataContractError,
-    ConfigError,
-    ProviderError,
-    CacheCorruptionError,
-    BacktestInvariantError,
-)
-
-# Alte Pydantic-Config (Legacy)
-from .config_pydantic import (
-    Settings,
-    StrategyConfig,
-    load_config,  # Behalte Original-Namen für Rückwärtskompatibilität
-    load_config as load_pydantic_config,  # Alias
-    load_settings_from_file,
-    get_config,
-    get_strategy_cfg,
-    list_strategies,
-    reset_config,
-    resolve_config_path,
-    DEFAULT_CONFIG_ENV_VAR,
-    DEFAULT_CONFIG_PATH,
-)
-
-# Neue TOML-Config (OOP)
-from .peak_config import (
-    PeakConfig,
-    load_config as load_peak_config,
-    load_config_with_live_overrides,
-    AUTO_LIVE_OVERRIDES_PATH,
-)
-
-# Registry-Config (Portfolio)
-from .config_registry import (
-    get_config as get_registry_config,
-    get_active_strategies,
-    get_strategy_config,
-    list_strategies as list_registry_strategies,
-)
-
-# Environment & Safety (Phase 17)
-from .environment import (
-    TradingEnvironment,
-    EnvironmentConfig,
-    LIVE_CONFIRM_TOKEN,
-    get_environment_from_config,
-    create_default_environment,
-    is_paper,
-    is_testnet,
-    is_live,
-)
-
-# Wave A (Stability): Repro Context & Seed Policy
-from .repro import (
-    ReproContext,
-    set_global_seed,
-    verify_determinism,
-    get_git_sha,  # Wave B: public export
-    stable_hash_dict,  # Wave B: public export
-)
-
-# Resilience & Stability
-from .resilience import (
-    CircuitBreaker,
-    CircuitState,
-    circuit_breaker,
-    retry_with_backoff,
-    HealthCheck,
-    HealthCheckResult,
-    health_check,
-)
+from .lazy_imports import install_lazy_exports, lazy_exports
 
-# Performance Monitoring
-from .performance import (
-    PerformanceMonitor,
-    PerformanceMetric,
-    MetricSummary,
-    performance_monitor,
-    performance_timer,
+# Re-exports werden beim ersten Zugriff geladen (PEP 562), damit ``import src.core``
+# kein pandas/pydantic zieht. Direkte Submodul-Imports bleiben unverändert.
+_LAZY_EXPORTS = lazy_exports(
+    __name__,
+    {
+        # Wave A (Stability): Error Taxonomy
+        ".errors": (
+            "PeakTradeError",
+            "DataContractError",
+            "ConfigError",
+            "ProviderError",
+            "CacheCorruptionError",
+            "BacktestInvariantError",
+        ),
+        # Alte Pydantic-Config (Legacy)
+        ".config_pydantic": (
+            "Settings",
+            "StrategyConfig",
+            "load_config",  # Behalte Original-Namen für Rückwärtskompatibilität
+            ("load_pydantic_config", "load_config"),  # Alias
+            "load_settings_from_file",
+            "get_config",
+            "get_strategy_cfg",
+            "list_strategies",
+            "reset_config",
+            "resolve_config_path",
+            "DEFAULT_CONFIG_ENV_VAR",
+            "DEFAULT_CONFIG_PATH",
+        ),
+        # Neue TOML-Config (OOP)
+        ".peak_config": (
+            "PeakConfig",
+            ("load_peak_config", "load_config"),
+            "load_config_with_live_overrides",
+            "AUTO_LIVE_OVERRIDES_PATH",
+        ),
+        # Registry-Config (Portfolio)
+        ".config_registry": (
+            ("get_registry_config", "get_config"),
+            "get_active_strategies",
+            "get_strategy_config",
+            ("list_registry_strategies", "list_strategies"),
+        ),
+        # Environment & Safety (Phase 17)
+        ".environment": (
+            "TradingEnvironment",
+            "EnvironmentConfig",
+            "LIVE_CONFIRM_TOKEN",
+            "get_environment_from_config",
+            "create_default_environment",
+            "is_paper",
+            "is_testnet",
+            "is_live",
+        ),
+        # Wave A (Stability): Repro Context & Seed Policy
+        ".repro": (
+            "ReproContext",
+            "set_global_seed",
+            "verify_determinism",
+            "get_git_sha",  # Wave B: public export
+            "stable_hash_dict",  # Wave B: public export
+        ),
+        # Resilience & Stability
+        ".resilience": (
+            "CircuitBreaker",
+            "CircuitState",
+            "circuit_breaker",
+            "retry_with_backoff",
+            "HealthCheck",
+            "HealthCheckResult",
+            "health_check",
+        ),
+        # Performance Monitoring
+        ".performance": (
+            "PerformanceMonitor",
+            "PerformanceMetric",
+            "MetricSummary",
+            "performance_monitor",
+            "performance_timer",
+        ),
+    },
 )
+install_lazy_exports(globals(), _LAZY_EXPORTS)
 
 __all__ = [
     # Wave A (Stability): Error Taxonomy
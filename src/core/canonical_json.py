@@ -0,0 +1,273 @@
+"""
+Canonical JSON Serialization & Digests
+======================================
+One shared implementation of the canonical JSON form used for evidence,
+manifest and config digests across the repo::
+
+    json.dumps(payload, sort_keys=True, separators=(",", ":"), ...)
+    hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+Output is byte-identical to those per-module helpers (``_stable_digest``,
+``canonical_json_dumps``, ``sha256_canonical_v1``, ...) for the same options,
+so they can migrate without changing any recorded digest.
+
+Design:
+- Encoders are built once per option set and reused (``json.dumps`` builds a
+  new ``JSONEncoder`` on every call with non-default options).
+- ``CanonicalDigestCache`` memoizes digests of payloads that are treated as
+  frozen, keyed by identity or by an explicit content key.
+- Streaming variants hash large payloads and artifact files chunk by chunk
+  without materializing the full text.
+
+Usage:
+    from src.core.canonical_json import canonical_sha256, stable_digest
+
+    digest = canonical_sha256({"b": 1, "a": [1, 2]})
+    legacy = stable_digest(payload)  # == _stable_digest (default=str) helpers
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, Optional, Tuple, Union
+
+Default = Optional[Callable[[Any], Any]]
+
+DEFAULT_FILE_CHUNK_SIZE = 1 << 20
+
+
+@lru_cache(maxsize=32)
+def _encoder(ensure_ascii: bool, default: Default, allow_nan: bool) -> json.JSONEncoder:
+    return json.JSONEncoder(
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=ensure_ascii,
+        default=default,
+        allow_nan=allow_nan,
+    )
+
+
+def canonical_json_text(
+    payload: Any,
+    *,
+    ensure_ascii: bool = True,
+    default: Default = None,
+    allow_nan: bool = True,
+) -> str:
+    """
+    Canonical JSON text (sorted keys, compact separators).
+
+    Identical to ``json.dumps(payload, sort_keys=True, separators=(",", ":"),
+    ensure_ascii=..., default=..., allow_nan=...)``, including the raised
+    ``TypeError``/``ValueError`` for unsupported values.
+    """
+    return _encoder(ensure_ascii, default, allow_nan).encode(payload)
+
+
+def canonical_json_bytes(
+    payload: Any,
+    *,
+    ensure_ascii: bool = True,
+    default: Default = None,
+    allow_nan: bool = True,
+) -> bytes:
+    """UTF-8 encoded ``canonical_json_text``."""
+    return canonical_json_text(
+        payload, ensure_ascii=ensure_ascii, default=default, allow_nan=allow_nan
+    ).encode("utf-8")
+
+
+def canonical_json_file_text(
+    payload: Any,
+    *,
+    ensure_ascii: bool = True,
+    default: Default = None,
+    allow_nan: bool = True,
+) -> str:
+    """``canonical_json_text`` plus a trailing newline (file body form)."""
+    return (
+        canonical_json_text(
+            payload, ensure_ascii=ensure_ascii, default=default, allow_nan=allow_nan
+        )
+        + "\n"
+    )
+
+
+def canonical_sha256(
+    payload: Any,
+    *,
+    ensure_ascii: bool = True,
+    default: Default = None,
+    allow_nan: bool = True,
+) -> str:
+    """SHA256 hex digest of ``canonical_json_bytes``."""
+    return hashlib.sha256(
+        canonical_json_bytes(
+            payload, ensure_ascii=ensure_ascii, default=default, allow_nan=allow_nan
+        )
+    ).hexdigest()
+
+
+def stable_digest(payload: Any) -> str:
+    """
+    Digest of the widespread ``_stable_digest`` helpers.
+
+    Equivalent to ``canonical_sha256(payload, default=str)``: non-JSON values
+    such as ``Decimal``, ``datetime`` or ``Path`` are digested via ``str()``.
+    """
+    return canonical_sha256(payload, default=str)
+
+
+# =============================================================================
+# Streaming
+# =============================================================================
+
+
+def iter_canonical_json_chunks(
+    payload: Any,
+    *,
+    ensure_ascii: bool = True,
+    default: Default = None,
+    allow_nan: bool = True,
+) -> Iterator[str]:
+    """
+    Canonical JSON text as an iterator of chunks.
+
+    Joining the chunks yields ``canonical_json_text``; memory stays bounded by
+    the largest scalar instead of the full document.
+    """
+    return _encoder(ensure_ascii, default, allow_nan).iterencode(payload)
+
+
+def sha256_chunks(chunks: Iterable[Union[str, bytes]]) -> str:
+    """SHA256 hex digest over ``chunks`` (``str`` chunks are UTF-8 encoded)."""
+    digest = hashlib.sha256()
+    for chunk in chunks:
+        digest.update(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+    return digest.hexdigest()
+
+
+def canonical_sha256_streaming(
+    payload: Any,
+    *,
+    ensure_ascii: bool = True,
+    default: Default = None,
+    allow_nan: bool = True,
+) -> str:
+    """
+    ``canonical_sha256`` without materializing the canonical text.
+
+    Slower per byte than the one-shot encoder; intended for payloads too large
+    to hold twice in memory.
+    """
+    return sha256_chunks(
+        iter_canonical_json_chunks(
+            payload, ensure_ascii=ensure_ascii, default=default, allow_nan=allow_nan
+        )
+    )
+
+
+def sha256_file(path: Union[str, Path], *, chunk_size: int = DEFAULT_FILE_CHUNK_SIZE) -> str:
+    """SHA256 hex digest of a file's bytes, read in ``chunk_size`` blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# =============================================================================
+# Memoization
+# =============================================================================
+
+
+class CanonicalDigestCache:
+    """
+    Bounded LRU cache of canonical digests for frozen payloads.
+
+    Without ``key`` entries are identity-keyed: the cache holds a reference to
+    the payload (so its ``id`` cannot be reused) and returns the memoized digest
+    while the same object is passed again. Callers must not mutate a payload
+    after its first digest. With ``key`` (any hashable content key, e.g. a run
+    id plus schema version) entries are shared across equal keys.
+
+    Example:
+        >>> cache = CanonicalDigestCache(default=str)
+        >>> body_digest = cache.sha256(body)        # computed
+        >>> body_digest == cache.sha256(body)       # memoized
+        True
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        *,
+        ensure_ascii: bool = True,
+        default: Default = None,
+        allow_nan: bool = True,
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self._options: Dict[str, Any] = {
+            "ensure_ascii": ensure_ascii,
+            "default": default,
+            "allow_nan": allow_nan,
+        }
+        self._entries: "OrderedDict[Hashable, Tuple[Any, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def sha256(self, payload: Any, *, key: Optional[Hashable] = None) -> str:
+        """Memoized ``canonical_sha256(payload)`` with this cache's options."""
+        cache_key: Hashable = ("key", key) if key is not None else ("id", id(payload))
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None and (key is not None or entry[0] is payload):
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return entry[1]
+        digest = canonical_sha256(payload, **self._options)
+        with self._lock:
+            self.misses += 1
+            self._entries[cache_key] = (payload if key is None else None, digest)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return digest
+
+    def cache_info(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+__all__ = [
+    "CanonicalDigestCache",
+    "DEFAULT_FILE_CHUNK_SIZE",
+    "canonical_json_bytes",
+    "canonical_json_file_text",
+    "canonical_json_text",
+    "canonical_sha256",
+    "canonical_sha256_streaming",
+    "iter_canonical_json_chunks",
+    "sha256_chunks",
+    "sha256_file",
+    "stable_digest",
+]
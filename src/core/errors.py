@@ -27,8 +27,10 @@ Usage:
         raise chain_error(e, "Failed to load strategy", hint="Check configuration")
 """
 
-from typing import Any, Dict, Optional
-import pandas as pd
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class PeakTradeError(Exception):
@@ -215,7 +217,7 @@ class RiskError(PeakTradeError):
 
 
 def add_backtest_context(
-    error: PeakTradeError, *, run_id: str, timestamp: pd.Timestamp
+    error: PeakTradeError, *, run_id: str, timestamp: "pd.Timestamp"
 ) -> PeakTradeError:
     """
     Enrich error with backtest context.
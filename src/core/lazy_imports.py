@@ -0,0 +1,107 @@
+"""
+Lazy Package Exports
+====================
+PEP 562 helpers for package ``__init__`` re-exports.
+
+A package declares which names it re-exports from which submodule; the
+submodule is imported on first attribute access (``from pkg import Name`` or
+``pkg.Name``) and the value is cached in the package namespace. Importing the
+package itself stays cheap, so CLI entrypoints only pay for what they use.
+
+Usage (in ``src/<pkg>/__init__.py``):
+
+    from src.core.lazy_imports import install_lazy_exports, lazy_exports
+
+    _LAZY_EXPORTS = lazy_exports(
+        __name__,
+        {
+            ".errors": ("PeakTradeError", "ConfigError"),
+            ".peak_config": (("load_peak_config", "load_config"), "PeakConfig"),
+        },
+    )
+    install_lazy_exports(globals(), _LAZY_EXPORTS)
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+from typing import Any, Callable, Dict, Mapping, MutableMapping, Sequence, Tuple, Union
+
+ExportSpec = Union[str, Tuple[str, str]]
+LazyExports = Dict[str, Tuple[str, str]]
+
+
+def lazy_exports(package: str, spec: Mapping[str, Sequence[ExportSpec]]) -> LazyExports:
+    """
+    Build ``{export_name: (absolute_module, attribute)}`` from a per-module spec.
+
+    Module keys may be relative to ``package`` (``".errors"``). Entries are either
+    a name exported as-is or an ``(export_name, attribute)`` alias pair.
+    """
+    exports: LazyExports = {}
+    for module, names in spec.items():
+        absolute = (
+            importlib.util.resolve_name(module, package) if module.startswith(".") else module
+        )
+        for entry in names:
+            export_name, attr = (entry, entry) if isinstance(entry, str) else entry
+            if export_name in exports:
+                raise ValueError(f"duplicate lazy export {export_name!r} in {package}")
+            exports[export_name] = (absolute, attr)
+    return exports
+
+
+def install_lazy_exports(
+    namespace: MutableMapping[str, Any],
+    exports: Mapping[str, Tuple[str, str]],
+    *,
+    fallback: Callable[[str], Any] | None = None,
+) -> None:
+    """
+    Install module-level ``__getattr__``/``__dir__`` into a package namespace.
+
+    Unknown names fall back to ``fallback(name)`` (if given), then to importing
+    a submodule of the same name (matching the attribute an eager ``__init__``
+    would have bound), and finally raise ``AttributeError``.
+    """
+    package = str(namespace["__name__"])
+
+    def __getattr__(name: str) -> Any:
+        target = exports.get(name)
+        if target is not None:
+            value = getattr(importlib.import_module(target[0]), target[1])
+            namespace[name] = value
+            return value
+        if fallback is not None:
+            try:
+                return fallback(name)
+            except AttributeError:
+                pass
+        if (
+            "__path__" in namespace
+            and not name.startswith("__")
+            and importlib.util.find_spec(f"{package}.{name}") is not None
+        ):
+            return importlib.import_module(f"{package}.{name}")
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(exports))
+
+    namespace["__getattr__"] = __getattr__
+    namespace["__dir__"] = __dir__
+
+
+def resolve_all_exports(module: Any) -> Dict[str, Any]:
+    """Eagerly resolve every name in ``module.__all__`` (for tests and warm-up)."""
+    return {name: getattr(module, name) for name in getattr(module, "__all__", ())}
+
+
+__all__ = [
+    "ExportSpec",
+    "LazyExports",
+    "install_lazy_exports",
+    "lazy_exports",
+    "resolve_all_exports",
+]
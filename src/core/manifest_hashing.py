@@ -0,0 +1,182 @@
+"""
+Parallel File Hashing & SHA256 Manifests
+========================================
+Shared SHA256 hashing for evidence bundles and data caches.
+
+Design:
+- Large batches are hashed on a shared thread pool (``hashlib`` releases the
+  GIL for large buffers, so hashing scales across cores and overlaps I/O);
+  small batches are hashed sequentially, where a pool only adds overhead.
+- Large files are hashed from a read-only ``mmap``; smaller files through a
+  reused 1 MiB buffer.
+- ``build_sha256_manifest`` renders the ``MANIFEST.sha256`` text byte-identical
+  to the sequential writers (sorted relative paths, ``"<digest>  <rel>"``).
+
+Usage:
+    from src.core.manifest_hashing import write_sha256_manifest
+
+    write_sha256_manifest(bundle_dir)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+MANIFEST_FILENAME = "MANIFEST.sha256"
+DEFAULT_CHUNK_SIZE = 1 << 20
+DEFAULT_MMAP_THRESHOLD = 8 << 20
+# Below these batch sizes thread hand-off costs more than it saves.
+PARALLEL_MIN_FILES = 8
+PARALLEL_MIN_BYTES = 4 << 20
+
+PathLike = Union[str, Path]
+
+
+def default_max_workers() -> int:
+    """Thread pool size used when ``max_workers`` is not given."""
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+def sha256_file_fast(
+    path: PathLike,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    mmap_threshold: int = DEFAULT_MMAP_THRESHOLD,
+) -> str:
+    """SHA256 hex digest of a file (mmap for large files, buffered reads otherwise)."""
+    digest = hashlib.sha256()
+    with open(path, "rb", buffering=0) as fh:
+        size = os.fstat(fh.fileno()).st_size
+        if size and size >= mmap_threshold:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                digest.update(mapped)
+            return digest.hexdigest()
+        buffer = bytearray(min(chunk_size, max(size, 1)))
+        view = memoryview(buffer)
+        while True:
+            n = fh.readinto(buffer)
+            if not n:
+                break
+            digest.update(view[:n])
+    return digest.hexdigest()
+
+
+_SHARED_POOL: Optional[ThreadPoolExecutor] = None
+_SHARED_POOL_LOCK = threading.Lock()
+
+
+def _shared_pool() -> ThreadPoolExecutor:
+    """Process-wide hashing pool (created on first parallel batch, then reused)."""
+    global _SHARED_POOL
+    with _SHARED_POOL_LOCK:
+        if _SHARED_POOL is None:
+            _SHARED_POOL = ThreadPoolExecutor(
+                max_workers=default_max_workers(), thread_name_prefix="sha256"
+            )
+        return _SHARED_POOL
+
+
+def _worth_parallel(items: Sequence[Path]) -> bool:
+    """True when the batch is large enough to amortize thread hand-off."""
+    if len(items) < PARALLEL_MIN_FILES:
+        return False
+    total = 0
+    for path in items:
+        try:
+            total += os.stat(path).st_size
+        except OSError:
+            continue
+        if total >= PARALLEL_MIN_BYTES:
+            return True
+    return False
+
+
+def hash_files(
+    paths: Iterable[PathLike],
+    *,
+    max_workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    mmap_threshold: int = DEFAULT_MMAP_THRESHOLD,
+    return_exceptions: bool = False,
+) -> Dict[Path, Union[str, BaseException]]:
+    """
+    SHA256 digests for ``paths`` (in input order).
+
+    Batches below ``PARALLEL_MIN_FILES`` files or ``PARALLEL_MIN_BYTES`` bytes
+    are hashed sequentially; larger ones on the shared pool (or a dedicated
+    pool when ``max_workers`` is given). With ``return_exceptions`` a failing
+    file maps to its exception instead of aborting the whole batch.
+    """
+    items: List[Path] = [Path(p) for p in paths]
+
+    def run(path: Path) -> Union[str, BaseException]:
+        try:
+            return sha256_file_fast(path, chunk_size=chunk_size, mmap_threshold=mmap_threshold)
+        except Exception as exc:
+            if return_exceptions:
+                return exc
+            raise
+
+    if (max_workers is not None and max_workers <= 1) or not _worth_parallel(items):
+        results = [run(p) for p in items]
+    elif max_workers is None:
+        results = list(_shared_pool().map(run, items))
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+            results = list(pool.map(run, items))
+    return dict(zip(items, results))
+
+
+def list_manifest_files(
+    root: PathLike, *, exclude_names: Sequence[str] = (MANIFEST_FILENAME,)
+) -> List[Path]:
+    """All regular files under ``root`` (recursive, sorted), excluding ``exclude_names``."""
+    return sorted(p for p in Path(root).rglob("*") if p.is_file() and p.name not in exclude_names)
+
+
+def build_sha256_manifest(
+    root: PathLike,
+    *,
+    exclude_names: Sequence[str] = (MANIFEST_FILENAME,),
+    max_workers: Optional[int] = None,
+) -> str:
+    """``MANIFEST.sha256`` text for ``root``: ``"<sha256>  <posix rel path>"`` per line."""
+    root_path = Path(root)
+    files = list_manifest_files(root_path, exclude_names=exclude_names)
+    digests = hash_files(files, max_workers=max_workers)
+    lines = [f"{digests[p]}  {p.relative_to(root_path).as_posix()}" for p in files]
+    return "\n".join(lines) + ("\n" if lines else "")
+
+
+def write_sha256_manifest(
+    root: PathLike,
+    *,
+    manifest_name: str = MANIFEST_FILENAME,
+    max_workers: Optional[int] = None,
+) -> Path:
+    """Write ``build_sha256_manifest(root)`` to ``root / manifest_name``."""
+    manifest = Path(root) / manifest_name
+    text = build_sha256_manifest(root, exclude_names=(manifest_name,), max_workers=max_workers)
+    manifest.write_text(text, encoding="utf-8")
+    return manifest
+
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "DEFAULT_MMAP_THRESHOLD",
+    "MANIFEST_FILENAME",
+    "PARALLEL_MIN_BYTES",
+    "PARALLEL_MIN_FILES",
+    "build_sha256_manifest",
+    "default_max_workers",
+    "hash_files",
+    "list_manifest_files",
+    "sha256_file_fast",
+    "write_sha256_manifest",
+]
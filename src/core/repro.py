@@ -20,7 +20,6 @@ Usage:
     set_global_seed(42)
 """
 
-import hashlib
 import json
 import platform
 import random
@@ -29,6 +28,8 @@ import uuid
 from dataclasses import asdict, dataclass
 from typing import Any, Dict, Optional
 
+from .canonical_json import canonical_sha256
+
 
 @dataclass
 class ReproContext:
@@ -168,10 +169,8 @@ def stable_hash_dict(d: Dict[str, Any], short: bool = True) -> str:
         >>> stable_hash_dict(config)  # '1a2b3c4d5e6f7g8h'
         >>> stable_hash_dict(config, short=False)  # '1a2b3c4d...(64 chars)'
     """
-    # Canonical JSON: sorted keys, no whitespace
-    canonical_json = json.dumps(d, sort_keys=True, separators=(",", ":"))
-    sha256 = hashlib.sha256(canonical_json.encode("utf-8"))
-    return sha256.hexdigest()[:16] if short else sha256.hexdigest()
+    digest = canonical_sha256(d)
+    return digest[:16] if short else digest
 
 
 def _stable_hash_dict(d: Dict[str, Any]) -> str:
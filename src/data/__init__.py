@@ -17,6 +17,7 @@ __all__ = [
     "get_kraken_client",
     "fetch_ohlcv_df",
     "clear_cache",
+    "backfill_ohlcv",
     "KrakenDataPipeline",
     "fetch_kraken_data",
     "test_kraken_connection",
@@ -51,6 +52,7 @@ _OPTIONAL_SYMBOLS: dict[str, tuple[str, str]] = {
     "get_kraken_client": ("src.data.kraken", "get_kraken_client"),
     "fetch_ohlcv_df": ("src.data.kraken", "fetch_ohlcv_df"),
     "clear_cache": ("src.data.kraken", "clear_cache"),
+    "backfill_ohlcv": ("src.data.kraken", "backfill_ohlcv"),
     "KrakenDataPipeline": ("src.data.kraken_pipeline", "KrakenDataPipeline"),
     "fetch_kraken_data": ("src.data.kraken_pipeline", "fetch_kraken_data"),
     "test_kraken_connection": ("src.data.kraken_pipeline", "test_kraken_connection"),
@@ -0,0 +1,446 @@
+"""
+Peak_Trade OHLCV Backfill Service
+=================================
+Paginiertes, nebenläufiges Historien-Backfill für viele Symbole.
+
+Features:
+- Paginierung beliebiger Zeiträume pro Symbol (``since_ms`` Cursor)
+- Mehrere Symbole parallel (Thread-Pool) unter einem gemeinsamen RateLimiter
+- Gemeinsamer CircuitBreaker gegen kaskadierende API-Fehler
+- Inkrementelles Schreiben (eine Parquet-Page pro Request) + Resume-State
+- Finales Merge in den Parquet-Cache (``<SYMBOL>_<tf>.parquet``)
+
+Usage:
+    from src.data.backfill import BackfillRequest, OhlcvBackfillService
+    from src.data.providers.kraken_ccxt_backend import KrakenCcxtBackend
+
+    service = OhlcvBackfillService(KrakenCcxtBackend(), cache_dir="data/cache")
+    report = service.run([BackfillRequest("BTC/EUR", "1h", start_ms, end_ms)])
+
+Die Quelle muss nur ``fetch_ohlcv(symbol, timeframe, since_ms, limit)`` mit
+canonical records liefern (siehe ``KrakenCcxtBackend``).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Protocol, Sequence
+
+import pandas as pd
+
+from ..core.errors import ProviderError
+from ..core.rate_limiter import RateLimiter
+from ..core.resilience import CircuitBreaker, CircuitState
+from .cache_atomic import atomic_write
+
+logger = logging.getLogger(__name__)
+
+STATE_SCHEMA = "OHLCV_BACKFILL_STATE_V1"
+RATE_LIMIT_ENDPOINT = "ohlcv"
+
+# ccxt Exception-Klassennamen (Best-effort Mapping ohne ccxt Import, wie in kraken.py)
+RATE_LIMIT_ERRORS = ("RateLimitExceeded", "DDoSProtection")
+TRANSIENT_ERRORS = ("NetworkError", "RequestTimeout", "ExchangeNotAvailable")
+
+_TIMEFRAME_UNITS_MS = {"m": 60_000, "h": 3_600_000, "d": 86_400_000, "w": 604_800_000}
+
+
+def timeframe_to_ms(timeframe: str) -> int:
+    """
+    Wandelt einen ccxt-Timeframe ("1m", "4h", "1d", "1w") in Millisekunden um.
+
+    Raises:
+        ValueError: Bei unbekanntem Format
+    """
+    match = re.fullmatch(r"(\d+)([mhdw])", timeframe.strip())
+    if not match:
+        raise ValueError(f"Unsupported timeframe: {timeframe!r}")
+    return int(match.group(1)) * _TIMEFRAME_UNITS_MS[match.group(2)]
+
+
+class OhlcvPageSource(Protocol):
+    """Read-only OHLCV Quelle (z.B. ``KrakenCcxtBackend``)."""
+
+    def fetch_ohlcv(
+        self,
+        symbol: str,
+        timeframe: str,
+        since_ms: int | None = None,
+        limit: int | None = None,
+    ) -> list[dict]: ...
+
+
+@dataclass(frozen=True)
+class BackfillRequest:
+    """Zeitraum ``[start_ms, end_ms)`` für ein Symbol/Timeframe."""
+
+    symbol: str
+    timeframe: str
+    start_ms: int
+    end_ms: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.symbol.replace('/', '_')}_{self.timeframe}"
+
+
+@dataclass
+class BackfillState:
+    """Persistierter Fortschritt eines Backfills (Resume nach Abbruch)."""
+
+    symbol: str
+    timeframe: str
+    start_ms: int
+    end_ms: int
+    next_since_ms: int
+    pages: List[str] = field(default_factory=list)
+    rows: int = 0
+    done: bool = False
+    schema: str = STATE_SCHEMA
+
+    def matches(self, request: BackfillRequest) -> bool:
+        return (
+            self.schema == STATE_SCHEMA
+            and self.symbol == request.symbol
+            and self.timeframe == request.timeframe
+            and self.start_ms == request.start_ms
+            and self.end_ms == request.end_ms
+        )
+
+
+@dataclass(frozen=True)
+class BackfillResult:
+    """Ergebnis pro Symbol."""
+
+    symbol: str
+    timeframe: str
+    status: str  # "complete" | "failed"
+    rows: int
+    requests: int
+    resumed: bool
+    cache_path: Optional[str] = None
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class BackfillReport:
+    """Gesamtergebnis eines Backfill-Laufs."""
+
+    results: List[BackfillResult]
+
+    @property
+    def ok(self) -> bool:
+        return all(r.status == "complete" for r in self.results)
+
+    @property
+    def failed(self) -> List[BackfillResult]:
+        return [r for r in self.results if r.status != "complete"]
+
+
+class OhlcvBackfillService:
+    """
+    Nebenläufiges OHLCV-Backfill mit gemeinsamem Rate-Limit und Circuit Breaker.
+
+    Jeder Request wird in Pages von ``page_limit`` Bars geholt. Jede Page wird
+    sofort atomar als Parquet-Part geschrieben und der State-Cursor
+    fortgeschrieben; ein erneuter Lauf setzt beim letzten Cursor fort. Nach der
+    letzten Page werden alle Parts (plus ein evtl. vorhandener Cache) dedupliziert
+    in ``<cache_dir>/<SYMBOL>_<tf>.parquet`` gemerged.
+
+    Args:
+        source: OHLCV Quelle (``fetch_ohlcv(symbol, timeframe, since_ms, limit)``)
+        cache_dir: Zielverzeichnis für den Parquet-Cache
+        rate_limiter: Gemeinsamer Limiter für alle Worker (default: 1 req/s)
+        circuit_breaker: Gemeinsamer Breaker für alle Worker
+        max_workers: Anzahl paralleler Symbole
+        page_limit: Bars pro Request (Kraken: max. 720)
+        max_retries: Retries pro Page bei Rate-Limit/Netzwerkfehlern
+        retry_base_delay: Basis für exponentielles Backoff (Sekunden)
+        sleep: Injizierbares ``time.sleep`` (Tests)
+    """
+
+    def __init__(
+        self,
+        source: OhlcvPageSource,
+        cache_dir: str | Path,
+        *,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        max_workers: int = 4,
+        page_limit: int = 720,
+        max_retries: int = 5,
+        retry_base_delay: float = 1.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if page_limit <= 0:
+            raise ValueError(f"page_limit must be > 0, got {page_limit}")
+        self.source = source
+        self.cache_dir = Path(cache_dir)
+        self.rate_limiter = rate_limiter or RateLimiter(
+            max_requests=1, window_seconds=1.0, name="ohlcv_backfill"
+        )
+        self.circuit_breaker = circuit_breaker or CircuitBreaker(
+            failure_threshold=5, recovery_timeout=30.0, name="ohlcv_backfill"
+        )
+        self.max_workers = max(1, int(max_workers))
+        self.page_limit = int(page_limit)
+        self.max_retries = int(max_retries)
+        self.retry_base_delay = float(retry_base_delay)
+        self._sleep = sleep
+        self._fetch = self.circuit_breaker.call(self._fetch_page)
+
+    # ------------------------------------------------------------------
+    # Paths / state
+    # ------------------------------------------------------------------
+
+    @property
+    def work_dir(self) -> Path:
+        return self.cache_dir / "backfill"
+
+    def cache_path(self, request: BackfillRequest) -> Path:
+        return self.cache_dir / f"{request.key}.parquet"
+
+    def _state_path(self, request: BackfillRequest) -> Path:
+        return self.work_dir / f"{request.key}.state.json"
+
+    def _parts_dir(self, request: BackfillRequest) -> Path:
+        return self.work_dir / request.key
+
+    def load_state(self, request: BackfillRequest) -> Optional[BackfillState]:
+        """Lädt den Resume-State (None wenn keiner existiert oder er nicht passt)."""
+        path = self._state_path(request)
+        if not path.exists():
+            return None
+        try:
+            state = BackfillState(**json.loads(path.read_text(encoding="utf-8")))
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Ignoriere ungültigen Backfill-State {path}: {e}")
+            return None
+        return state if state.matches(request) else None
+
+    def _save_state(self, request: BackfillRequest, state: BackfillState) -> None:
+        path = self._state_path(request)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(asdict(state), f, sort_keys=True)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    # ------------------------------------------------------------------
+    # Run
+    # ------------------------------------------------------------------
+
+    def run(self, requests: Sequence[BackfillRequest]) -> BackfillReport:
+        """
+        Führt alle Requests nebenläufig aus.
+
+        Fehler einzelner Symbole brechen den Lauf nicht ab; sie erscheinen als
+        ``status="failed"`` im Report und können per erneutem ``run`` fortgesetzt
+        werden.
+        """
+        keys = [r.key for r in requests]
+        if len(set(keys)) != len(keys):
+            raise ValueError("Duplicate symbol/timeframe in backfill requests")
+        if not requests:
+            return BackfillReport(results=[])
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(requests)),
+            thread_name_prefix="ohlcv-backfill",
+        ) as pool:
+            results = list(pool.map(self._run_one, requests))
+        return BackfillReport(results=results)
+
+    def _run_one(self, request: BackfillRequest) -> BackfillResult:
+        state = self.load_state(request)
+        resumed = state is not None
+        if state is None:
+            state = BackfillState(
+                symbol=request.symbol,
+                timeframe=request.timeframe,
+                start_ms=request.start_ms,
+                end_ms=request.end_ms,
+                next_since_ms=request.start_ms,
+            )
+        requests_made = 0
+        try:
+            if not state.done:
+                requests_made = self._paginate(request, state)
+                self._merge(request, state)
+                state.done = True
+                self._save_state(request, state)
+                self._cleanup_parts(request, state)
+            logger.info(f"Backfill {request.key}: {state.rows} Bars ({requests_made} Requests)")
+            return BackfillResult(
+                symbol=request.symbol,
+                timeframe=request.timeframe,
+                status="complete",
+                rows=state.rows,
+                requests=requests_made,
+                resumed=resumed,
+                cache_path=str(self.cache_path(request)),
+            )
+        except Exception as e:
+            logger.error(f"Backfill {request.key} fehlgeschlagen: {e}")
+            return BackfillResult(
+                symbol=request.symbol,
+                timeframe=request.timeframe,
+                status="failed",
+                rows=state.rows,
+                requests=requests_made,
+                resumed=resumed,
+                error=str(e),
+            )
+
+    def _paginate(self, request: BackfillRequest, state: BackfillState) -> int:
+        tf_ms = timeframe_to_ms(request.timeframe)
+        requests_made = 0
+        while state.next_since_ms < request.end_ms:
+            since = state.next_since_ms
+            records, attempts = self._fetch_with_retry(request, since)
+            requests_made += attempts
+            page = [r for r in records if since <= r["ts_ms"] < request.end_ms]
+            if page:
+                name = f"page_{since}.parquet"
+                atomic_write(_records_to_df(page), str(self._parts_dir(request) / name))
+                state.pages.append(name)
+                state.rows += len(page)
+                state.next_since_ms = page[-1]["ts_ms"] + 1
+            last_ts = records[-1]["ts_ms"] if records else None
+            if records and not page and last_ts < request.end_ms:
+                # Seite liegt komplett vor ``since``: der Provider rückt nicht vor.
+                # Nicht als "complete" werten, sonst bleibt [since, end) stumm eine Lücke.
+                self._save_state(request, state)
+                raise ProviderError(
+                    f"OHLCV backfill for {request.symbol} did not advance past since_ms",
+                    hint="Provider returned only bars before the cursor; re-run to resume",
+                    context={
+                        "symbol": request.symbol,
+                        "timeframe": request.timeframe,
+                        "since_ms": since,
+                        "last_ts_ms": last_ts,
+                    },
+                )
+            # Ende: keine Daten mehr, nur Bars nach dem Zeitraum oder letzte Bar erreicht
+            if last_ts is None or last_ts + tf_ms >= request.end_ms:
+                state.next_since_ms = request.end_ms
+            self._save_state(request, state)
+        return requests_made
+
+    def _fetch_page(self, symbol: str, timeframe: str, since_ms: int) -> list[dict]:
+        return self.source.fetch_ohlcv(symbol, timeframe, since_ms=since_ms, limit=self.page_limit)
+
+    def _fetch_with_retry(self, request: BackfillRequest, since_ms: int) -> tuple[list[dict], int]:
+        attempts = 0
+        while True:
+            self._wait_for_circuit()
+            self._acquire_token()
+            attempts += 1
+            failures_before = self.circuit_breaker.stats.failure_count
+            try:
+                records = self._fetch(request.symbol, request.timeframe, since_ms)
+                return sorted(records, key=lambda r: r["ts_ms"]), attempts
+            except Exception as e:
+                name = e.__class__.__name__
+                # Vom offenen Breaker abgewiesen (kein neuer Fehler gezählt) -> warten + retry
+                rejected = (
+                    self.circuit_breaker.state == CircuitState.OPEN
+                    and self.circuit_breaker.stats.failure_count == failures_before
+                )
+                retryable = rejected or name in RATE_LIMIT_ERRORS or name in TRANSIENT_ERRORS
+                if not retryable or attempts > self.max_retries:
+                    raise ProviderError(
+                        f"OHLCV backfill page failed for {request.symbol}",
+                        hint="Re-run the backfill to resume from the last stored page",
+                        context={
+                            "symbol": request.symbol,
+                            "timeframe": request.timeframe,
+                            "since_ms": since_ms,
+                            "attempts": attempts,
+                        },
+                        cause=e,
+                    ) from e
+                delay = self.retry_base_delay * (2 ** (attempts - 1))
+                logger.warning(
+                    f"Backfill {request.key}: {name} (Versuch {attempts}), warte {delay:.2f}s"
+                )
+                self._sleep(delay)
+
+    def _acquire_token(self) -> None:
+        while not self.rate_limiter.acquire(RATE_LIMIT_ENDPOINT):
+            self._sleep(max(self.rate_limiter.get_wait_time(RATE_LIMIT_ENDPOINT), 0.001))
+
+    def _wait_for_circuit(self) -> None:
+        breaker = self.circuit_breaker
+        if breaker.state != CircuitState.OPEN or breaker.stats.last_failure_time is None:
+            return
+        remaining = breaker.recovery_timeout - (time.time() - breaker.stats.last_failure_time)
+        if remaining > 0:
+            self._sleep(remaining)
+
+    # ------------------------------------------------------------------
+    # Merge
+    # ------------------------------------------------------------------
+
+    def _merge(self, request: BackfillRequest, state: BackfillState) -> None:
+        parts_dir = self._parts_dir(request)
+        frames = [pd.read_parquet(parts_dir / name) for name in state.pages]
+        target = self.cache_path(request)
+        if target.exists():
+            frames.insert(0, pd.read_parquet(target))
+        if not frames:
+            return
+        df = pd.concat(frames)
+        df.index = pd.to_datetime(df.index, utc=True)
+        df = df[~df.index.duplicated(keep="last")].sort_index()
+        atomic_write(df, str(target))
+
+    def _cleanup_parts(self, request: BackfillRequest, state: BackfillState) -> None:
+        parts_dir = self._parts_dir(request)
+        for name in state.pages:
+            try:
+                (parts_dir / name).unlink()
+            except FileNotFoundError:
+                pass
+        try:
+            parts_dir.rmdir()
+        except OSError:
+            pass
+
+
+def _records_to_df(records: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Canonical records -> DataFrame mit UTC-DatetimeIndex (wie fetch_ohlcv_df)."""
+    df = pd.DataFrame(
+        [
+            {
+                "timestamp": r["ts_ms"],
+                "open": r["open"],
+                "high": r["high"],
+                "low": r["low"],
+                "close": r["close"],
+                "volume": r["volume"],
+            }
+            for r in records
+        ]
+    )
+    df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms", utc=True)
+    return df.set_index("timestamp")
+
+
+__all__ = [
+    "BackfillReport",
+    "BackfillRequest",
+    "BackfillResult",
+    "BackfillState",
+    "OhlcvBackfillService",
+    "OhlcvPageSource",
+    "timeframe_to_ms",
+]
@@ -19,7 +19,6 @@ Usage:
     df = atomic_read("path/to/file.parquet", verify_checksum=True)
 """
 
-import hashlib
 import os
 import tempfile
 from pathlib import Path
@@ -28,15 +27,12 @@ from typing import Optional
 import pandas as pd
 
 from src.core.errors import CacheCorruptionError
+from src.core.manifest_hashing import sha256_file_fast
 
 
 def _compute_checksum(filepath: str) -> str:
     """Compute SHA256 checksum of a file."""
-    sha256 = hashlib.sha256()
-    with open(filepath, "rb") as f:
-        while chunk := f.read(8192):
-            sha256.update(chunk)
-    return sha256.hexdigest()
+    return sha256_file_fast(filepath)
 
 
 def _checksum_path(filepath: str) -> str:
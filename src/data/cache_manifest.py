@@ -48,7 +48,6 @@ Usage:
     manifest.validate()
 """
 
-import hashlib
 import json
 import os
 import platform
@@ -59,6 +58,7 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 from src.core.errors import CacheCorruptionError
+from src.core.manifest_hashing import hash_files, sha256_file_fast
 
 
 @dataclass
@@ -211,31 +211,34 @@ class CacheManifest:
 
         errors = []
 
+        # Resolve paths, then hash all existing files in parallel
+        resolved = []
         for entry in self.files:
-            # Resolve path
             if base_dir and not os.path.isabs(entry.path):
-                full_path = os.path.join(base_dir, entry.path)
+                resolved.append((entry, os.path.join(base_dir, entry.path)))
             else:
-                full_path = entry.path
+                resolved.append((entry, entry.path))
+        existing = [full_path for _, full_path in resolved if os.path.exists(full_path)]
+        checksums = hash_files(existing, return_exceptions=True)
 
+        for entry, full_path in resolved:
             # Check existence
-            if not os.path.exists(full_path):
+            if Path(full_path) not in checksums:
                 errors.append(f"Missing file: {entry.path}")
                 continue
 
             # Verify checksum
-            try:
-                actual_checksum = self._compute_checksum(full_path)
-                expected_checksum = entry.checksum.replace("sha256:", "")
-
-                if actual_checksum != expected_checksum:
-                    errors.append(
-                        f"Checksum mismatch: {entry.path} "
-                        f"(expected: {expected_checksum[:8]}..., "
-                        f"got: {actual_checksum[:8]}...)"
-                    )
-            except Exception as exc:
-                errors.append(f"Failed to verify {entry.path}: {exc}")
+            actual_checksum = checksums[Path(full_path)]
+            if isinstance(actual_checksum, BaseException):
+                errors.append(f"Failed to verify {entry.path}: {actual_checksum}")
+                continue
+            expected_checksum = entry.checksum.replace("sha256:", "")
+            if actual_checksum != expected_checksum:
+                errors.append(
+                    f"Checksum mismatch: {entry.path} "
+                    f"(expected: {expected_checksum[:8]}..., "
+                    f"got: {actual_checksum[:8]}...)"
+                )
 
         if errors:
             raise CacheCorruptionError(
@@ -380,8 +383,4 @@ class CacheManifest:
     @staticmethod
     def _compute_checksum(filepath: str) -> str:
         """Compute SHA256 checksum of a file."""
-        sha256 = hashlib.sha256()
-        with open(filepath, "rb") as f:
-            while chunk := f.read(8192):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+        return sha256_file_fast(filepath)
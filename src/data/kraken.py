@@ -12,7 +12,7 @@ Features:
 
 import pandas as pd
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 import logging
 
 from ..core.config_registry import get_config
@@ -182,6 +182,43 @@ def fetch_ohlcv_df(
         )
 
 
+def backfill_ohlcv(
+    symbols: Sequence[str],
+    timeframe: str,
+    start_ms: int,
+    end_ms: int,
+    max_workers: int = 4,
+    page_limit: int = 720,
+) -> Any:
+    """
+    Paginiertes Backfill mehrerer Symbole in den Parquet-Cache.
+
+    Nutzt den ``OhlcvBackfillService`` mit gemeinsamem RateLimiter/CircuitBreaker;
+    ein abgebrochener Lauf wird beim nächsten Aufruf fortgesetzt.
+
+    Args:
+        symbols: Trading-Pairs (z.B. ["BTC/EUR", "ETH/EUR"])
+        timeframe: Zeitrahmen ("1m", "5m", "1h", "1d")
+        start_ms: Start (inklusive) in Millisekunden
+        end_ms: Ende (exklusive) in Millisekunden
+        max_workers: Parallele Symbole
+        page_limit: Bars pro Request (max. 720)
+
+    Returns:
+        BackfillReport
+    """
+    from .backfill import BackfillRequest, OhlcvBackfillService
+    from .providers.kraken_ccxt_backend import KrakenCcxtBackend
+
+    cache_dir = _get_cache_path(symbols[0] if symbols else "_", timeframe).parent
+    # ccxt-internes Rate-Limit aus; das gemeinsame Limit übernimmt der Service.
+    backend = KrakenCcxtBackend(enable_rate_limit=False, timeout_ms=30000)
+    service = OhlcvBackfillService(
+        backend, cache_dir, max_workers=max_workers, page_limit=page_limit
+    )
+    return service.run([BackfillRequest(symbol, timeframe, start_ms, end_ms) for symbol in symbols])
+
+
 def clear_cache(symbol: Optional[str] = None, timeframe: Optional[str] = None) -> None:
     """
     Löscht Cache-Dateien.
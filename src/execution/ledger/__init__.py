@@ -15,6 +15,12 @@ Scope (Slice 2):
 
 from .engine import LedgerEngine
 from .engine_legacy import LegacyLedgerEngine, LegacyLedgerState
+from .engine_fixed_point import (
+    CrossCheckLedgerEngine,
+    FixedPointLedgerEngine,
+    LedgerCrossCheckError,
+    make_replay_ledger_engine,
+)
 from .execution_to_ledger import iter_beta_exec_v1_events
 from .export import (
     dumps_canonical_json,
@@ -48,6 +54,10 @@ __all__ = [
     "LedgerEngine",
     "LegacyLedgerEngine",
     "LegacyLedgerState",
+    "FixedPointLedgerEngine",
+    "CrossCheckLedgerEngine",
+    "LedgerCrossCheckError",
+    "make_replay_ledger_engine",
     "FifoLedgerEngine",
     "iter_beta_exec_v1_events",
     "snapshot_mark_to_market",
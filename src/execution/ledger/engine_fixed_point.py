@@ -0,0 +1,552 @@
+from __future__ import annotations
+
+# Fixed-point (scaled integer) backend for the legacy WAC ledger.
+#
+# Replay packs (src/execution/replay_pack/runner.py) feed BETA_EXEC_V1 events
+# through LegacyLedgerEngine, which does every step in Decimal, re-quantizes on
+# each arithmetic op and builds a stable_id-hashed JournalEntry per fill. For
+# million-fill bundles this dominates replay time.
+#
+# FixedPointLedgerEngine keeps quantities, prices and money as Python ints
+# scaled by the QuantizationPolicy exponents (1e-8 by default, i.e. values fit
+# int64) and reproduces LegacyLedgerEngine's quantization semantics exactly:
+# - ingestion: ROUND_HALF_UP to the policy quant (string fast path, Decimal fallback)
+# - products: exact integer product + ROUND_HALF_UP; falls back to Decimal when
+#   the exact product exceeds the Decimal context precision (28 digits) so the
+#   context rounding Decimal would apply is reproduced
+# - WAC average cost division: delegated to Decimal (double rounding identical)
+# - position/account string outputs identical to str(Decimal) of the legacy state
+#
+# The journal is NOT materialized (no JournalEntry / stable_id per fill);
+# the double-entry invariant is still checked per fill. Use CrossCheckLedgerEngine
+# to run both backends and assert identical state after every event.
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Dict, Mapping, Optional, Union
+
+from .engine_legacy import (
+    LegacyLedgerEngine,
+    _acct_cash,
+    _acct_fees,
+    _acct_inventory,
+    _acct_realized_pnl,
+)
+from .models import QuantizationPolicy
+from .quantization import d, parse_symbol
+
+# Decimal default context precision (significant digits).
+_DECIMAL_CONTEXT_DIGITS_LIMIT = 10**28
+_INT64_MAX = 2**63 - 1
+
+_PLAIN_DECIMAL_RE = re.compile(r"^([+-]?)(\d*)(?:\.(\d*))?$")
+
+
+class LedgerCrossCheckError(AssertionError):
+    """Decimal and fixed-point ledger backends diverged."""
+
+
+def _quant_exponent(quant: Decimal, *, name: str) -> int:
+    """Return ``e`` for a quant of exactly ``10**-e`` (e >= 0)."""
+    t = quant.as_tuple()
+    if t.digits != (1,) or not isinstance(t.exponent, int) or t.exponent > 0:
+        raise ValueError(f"fixed-point backend requires a power-of-ten {name}, got {quant!r}")
+    return -t.exponent
+
+
+def _round_half_up_div(n: int, den: int) -> int:
+    """``n / den`` rounded half away from zero (``den > 0``)."""
+    q, r = divmod(abs(n), den)
+    if 2 * r >= den:
+        q += 1
+    return -q if n < 0 else q
+
+
+def _check_range(v: int) -> int:
+    if v > _INT64_MAX or v < -_INT64_MAX:
+        raise OverflowError("value exceeds int64 fixed-point range; use the Decimal ledger backend")
+    return v
+
+
+@dataclass(frozen=True)
+class FixedPointScale:
+    """Scale exponents derived from a :class:`QuantizationPolicy`."""
+
+    qty_exp: int
+    price_exp: int
+    money_exp: int
+
+    @classmethod
+    def from_policy(cls, policy: QuantizationPolicy) -> "FixedPointScale":
+        if policy.rounding != ROUND_HALF_UP:
+            raise ValueError(
+                f"fixed-point backend supports ROUND_HALF_UP only, got {policy.rounding!r}"
+            )
+        return cls(
+            qty_exp=_quant_exponent(policy.qty_quant, name="qty_quant"),
+            price_exp=_quant_exponent(policy.price_quant, name="price_quant"),
+            money_exp=_quant_exponent(policy.money_quant, name="money_quant"),
+        )
+
+
+def to_scaled(value: Any, exp: int) -> int:
+    """
+    Quantize ``value`` to ``10**-exp`` (ROUND_HALF_UP) and return the scaled int.
+
+    Accepts the same inputs as :func:`src.execution.ledger.quantization.d`
+    (str/int/Decimal; floats rejected).
+    """
+    if type(value) is str:
+        return _str_to_scaled(value, exp)
+    if isinstance(value, int) and not isinstance(value, bool):
+        return _check_range(value * 10**exp)
+    dec = d(value)
+    return _check_range(int(dec.scaleb(exp).quantize(Decimal(1), rounding=ROUND_HALF_UP)))
+
+
+@lru_cache(maxsize=65536)
+def _str_to_scaled(value: str, exp: int) -> int:
+    # Replays repeat the same price/qty/fee strings; parse each once.
+    m = _PLAIN_DECIMAL_RE.match(value)
+    if m is None or not (m.group(2) or m.group(3)):
+        dec = d(value)
+        return _check_range(int(dec.scaleb(exp).quantize(Decimal(1), rounding=ROUND_HALF_UP)))
+    sign, whole, frac = m.group(1), m.group(2) or "0", m.group(3) or ""
+    if len(frac) <= exp:
+        v = int(whole + frac.ljust(exp, "0"))
+    else:
+        v = int(whole + frac[:exp])
+        if frac[exp] >= "5":
+            v += 1
+    return _check_range(-v if sign == "-" else v)
+
+
+def from_scaled(v: int, exp: int) -> Decimal:
+    """Scaled int -> quantized Decimal (same coefficient/exponent as the legacy value)."""
+    return Decimal(v).scaleb(-exp)
+
+
+def _mul_q(a: int, a_exp: int, b: int, b_exp: int, out_exp: int) -> int:
+    """Quantized product, identical to ``q((a*10^-a_exp) * (b*10^-b_exp))`` in Decimal."""
+    p = a * b
+    if -_DECIMAL_CONTEXT_DIGITS_LIMIT < p < _DECIMAL_CONTEXT_DIGITS_LIMIT:
+        shift = a_exp + b_exp - out_exp
+        if shift >= 0:
+            return _check_range(_round_half_up_div(p, 10**shift))
+        return _check_range(p * 10 ** (-shift))
+    prod = from_scaled(a, a_exp) * from_scaled(b, b_exp)
+    return to_scaled(prod, out_exp)
+
+
+def _div_q(n: int, n_exp: int, den: int, den_exp: int, out_exp: int) -> int:
+    """Quantized quotient via Decimal (reproduces context rounding before quantize)."""
+    return to_scaled(from_scaled(n, n_exp) / from_scaled(den, den_exp), out_exp)
+
+
+class FixedPointPosition:
+    """WAC position state in scaled ints (mirrors ``models.Position``)."""
+
+    __slots__ = ("symbol", "quantity", "avg_cost", "avg_literal_zero", "realized_pnl", "fees")
+
+    def __init__(self, symbol: str) -> None:
+        self.symbol = symbol
+        self.quantity = 0
+        self.avg_cost = 0
+        # Legacy stores Decimal("0") (str "0") vs. a quantized zero (str "0E-8").
+        self.avg_literal_zero = True
+        self.realized_pnl = 0
+        self.fees = 0
+
+
+class FixedPointLedgerEngine:
+    """
+    Scaled-integer drop-in for :class:`LegacyLedgerEngine` on BETA_EXEC_V1 events.
+
+    Replay/backtest only: journal entries are not materialized. Positions and
+    account balances match the Decimal engine bit-for-bit (see
+    :class:`CrossCheckLedgerEngine`).
+    """
+
+    def __init__(
+        self,
+        *,
+        quote_currency: str,
+        policy: Optional[QuantizationPolicy] = None,
+        track_event_ids: bool = True,
+    ):
+        self.quote_currency = str(quote_currency)
+        self.policy = policy or QuantizationPolicy()
+        self.scale = FixedPointScale.from_policy(self.policy)
+        self.accounts: Dict[str, int] = {}
+        self.positions: Dict[str, FixedPointPosition] = {}
+        # track_event_ids=False: caller (e.g. the streaming replay runner) owns
+        # duplicate detection, so the engine does not retain every event.
+        self.track_event_ids = bool(track_event_ids)
+        self.seen_event_ids: Dict[str, Dict[str, Any]] = {}
+        self.last_ts_sim = -1
+        self._acct_cash = _acct_cash(self.quote_currency)
+        self._acct_fees = _acct_fees(self.quote_currency)
+        self._acct_realized = _acct_realized_pnl(self.quote_currency)
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    def apply(self, event: Mapping[str, Any]) -> None:
+        if type(event) is not dict and not isinstance(event, Mapping):
+            raise TypeError("FixedPointLedgerEngine supports BETA_EXEC_V1 mapping events only")
+        self._apply_beta_event(event)
+
+    def positions_as_strings(self) -> Dict[str, Dict[str, str]]:
+        """Positions in the replay-pack ``expected_positions.json`` format."""
+        sc = self.scale
+        out: Dict[str, Dict[str, str]] = {}
+        for sym in sorted(self.positions.keys()):
+            pos = self.positions[sym]
+            out[sym] = {
+                "quantity": "0"
+                if pos.quantity == 0
+                else str(from_scaled(pos.quantity, sc.qty_exp)),
+                "avg_cost": (
+                    "0" if pos.avg_literal_zero else str(from_scaled(pos.avg_cost, sc.price_exp))
+                ),
+                "fees": str(from_scaled(pos.fees, sc.money_exp)),
+                "realized_pnl": str(from_scaled(pos.realized_pnl, sc.money_exp)),
+            }
+        return out
+
+    def accounts_as_strings(self) -> Dict[str, str]:
+        me = self.scale.money_exp
+        return {k: str(from_scaled(self.accounts[k], me)) for k in sorted(self.accounts.keys())}
+
+    def export_state(self) -> Dict[str, Any]:
+        """JSON-safe engine state (scaled ints) for checkpoints; excludes seen event ids."""
+        return {
+            "quote_currency": self.quote_currency,
+            "last_ts_sim": self.last_ts_sim,
+            "accounts": {k: self.accounts[k] for k in sorted(self.accounts.keys())},
+            "positions": {
+                sym: [
+                    pos.quantity,
+                    pos.avg_cost,
+                    pos.avg_literal_zero,
+                    pos.realized_pnl,
+                    pos.fees,
+                ]
+                for sym, pos in sorted(self.positions.items())
+            },
+        }
+
+    def load_state(self, state: Mapping[str, Any]) -> None:
+        """Restore state produced by :meth:`export_state`."""
+        if str(state.get("quote_currency")) != self.quote_currency:
+            raise ValueError(
+                f"Quote currency mismatch: engine={self.quote_currency}, "
+                f"state={state.get('quote_currency')}"
+            )
+        self.last_ts_sim = int(state.get("last_ts_sim", -1))
+        self.accounts = {str(k): int(v) for k, v in dict(state.get("accounts") or {}).items()}
+        self.positions = {}
+        for sym, row in dict(state.get("positions") or {}).items():
+            pos = FixedPointPosition(str(sym))
+            qty, avg, literal_zero, realized, fees = row
+            pos.quantity = int(qty)
+            pos.avg_cost = int(avg)
+            pos.avg_literal_zero = bool(literal_zero)
+            pos.realized_pnl = int(realized)
+            pos.fees = int(fees)
+            self.positions[pos.symbol] = pos
+
+    # -------------------------------------------------------------------------
+    # Beta event ingestion (mirrors LegacyLedgerEngine._apply_beta_event)
+    # -------------------------------------------------------------------------
+
+    def _apply_beta_event(self, event: Mapping[str, Any]) -> None:
+        schema = event.get("schema_version")
+        if schema != "BETA_EXEC_V1":
+            raise ValueError(f"Unsupported event schema_version: {schema!r}")
+
+        event_id = str(event.get("event_id") or "")
+        if not event_id:
+            raise ValueError("Missing event_id")
+
+        if event_id in self.seen_event_ids:
+            prior = self.seen_event_ids[event_id]
+            if dict(prior) == dict(event):
+                return
+            raise ValueError(f"Conflicting duplicate event_id detected: {event_id}")
+
+        ts_sim = int(event.get("ts_sim", -1))
+        if ts_sim < 0:
+            raise ValueError("Missing/invalid ts_sim")
+        if ts_sim < self.last_ts_sim:
+            raise ValueError(f"Non-monotonic ts_sim: {ts_sim} < {self.last_ts_sim}")
+
+        self.last_ts_sim = ts_sim
+        if self.track_event_ids:
+            self.seen_event_ids[event_id] = dict(event)
+
+        if str(event.get("event_type") or "") != "FILL":
+            return
+
+        symbol = str(event.get("symbol") or "")
+        if not symbol:
+            raise ValueError("FILL missing symbol")
+
+        payload = event.get("payload") or {}
+        if type(payload) is not dict and not isinstance(payload, Mapping):
+            raise ValueError("payload must be a mapping")
+
+        side = payload.get("side")
+        if side is None:
+            raise ValueError(
+                "BETA_EXEC_V1 FILL payload missing 'side'. "
+                "Update Slice-1 emitter to include side for deterministic accounting."
+            )
+
+        sc = self.scale
+        qty = to_scaled(payload.get("quantity"), sc.qty_exp)
+        price = to_scaled(payload.get("price"), sc.price_exp)
+        fee = to_scaled(payload.get("fee", "0"), sc.money_exp)
+        fee_ccy = str(payload.get("fee_currency") or self.quote_currency)
+
+        _, quote = parse_symbol(symbol)
+        if quote != self.quote_currency:
+            raise ValueError(
+                f"Quote currency mismatch: engine={self.quote_currency}, event={quote}"
+            )
+        if fee_ccy != self.quote_currency:
+            raise ValueError(
+                f"Fee currency mismatch (Slice 2 single-ccy): fee_currency={fee_ccy}, quote={quote}"
+            )
+
+        self._apply_fill(symbol=symbol, side=str(side), qty=qty, price=price, fee=fee)
+
+    # -------------------------------------------------------------------------
+    # Fill application (mirrors LegacyLedgerEngine._apply_fill / _update_position_wac)
+    # -------------------------------------------------------------------------
+
+    def _inventory(self, pos: FixedPointPosition) -> int:
+        if pos.quantity == 0 or pos.avg_cost == 0:
+            return 0
+        sc = self.scale
+        return _mul_q(pos.avg_cost, sc.price_exp, pos.quantity, sc.qty_exp, sc.money_exp)
+
+    def _apply_fill(self, *, symbol: str, side: str, qty: int, price: int, fee: int) -> None:
+        sc = self.scale
+        side_u = side.upper()
+        if side_u not in {"BUY", "SELL"}:
+            raise ValueError(f"Unsupported side: {side!r}")
+
+        notional = _mul_q(qty, sc.qty_exp, price, sc.price_exp, sc.money_exp)
+
+        pos = self.positions.get(symbol)
+        if pos is None:
+            pos = FixedPointPosition(symbol)
+            self.positions[symbol] = pos
+        pre_qty = pos.quantity
+        pre_avg = pos.avg_cost
+        pre_inv = self._inventory(pos)
+
+        realized = 0
+        if side_u == "BUY":
+            if pre_qty < 0:
+                cover_qty = min(qty, -pre_qty)
+                realized = _mul_q(
+                    pre_avg - price, sc.price_exp, cover_qty, sc.qty_exp, sc.money_exp
+                )
+        elif pre_qty > 0:
+            close_qty = min(qty, pre_qty)
+            realized = _mul_q(price - pre_avg, sc.price_exp, close_qty, sc.qty_exp, sc.money_exp)
+        self._update_position_wac(pos, side=side_u, qty=qty, price=price, fee=fee)
+
+        inv_delta = self._inventory(pos) - pre_inv
+
+        cash_delta = (notional - fee) if side_u == "SELL" else -(notional + fee)
+        if cash_delta + fee + inv_delta - realized != 0:
+            raise AssertionError(
+                "Double-entry invariant violated: postings_sum="
+                f"{from_scaled(cash_delta + fee + inv_delta - realized, sc.money_exp)} for {symbol}"
+            )
+
+        acc = self.accounts
+        acc[self._acct_cash] = _check_range(acc.get(self._acct_cash, 0) + cash_delta)
+        acc[self._acct_fees] = _check_range(acc.get(self._acct_fees, 0) + fee)
+        inv_key = _acct_inventory(symbol, self.quote_currency)
+        acc[inv_key] = _check_range(acc.get(inv_key, 0) + inv_delta)
+        if realized != 0:
+            acc[self._acct_realized] = _check_range(acc.get(self._acct_realized, 0) - realized)
+
+        pos.realized_pnl = _check_range(pos.realized_pnl + realized)
+
+    def _update_position_wac(
+        self, pos: FixedPointPosition, *, side: str, qty: int, price: int, fee: int
+    ) -> None:
+        sc = self.scale
+        pre_qty = pos.quantity
+        pre_avg = pos.avg_cost
+
+        if side == "BUY":
+            if pre_qty >= 0:
+                new_qty = _check_range(pre_qty + qty)
+                if new_qty == 0:
+                    self._set_flat(pos)
+                else:
+                    pre_cost = _mul_q(pre_avg, sc.price_exp, pre_qty, sc.qty_exp, sc.money_exp)
+                    add_cost = _mul_q(price, sc.price_exp, qty, sc.qty_exp, sc.money_exp)
+                    pos.quantity = new_qty
+                    pos.avg_cost = _div_q(
+                        pre_cost + add_cost, sc.money_exp, new_qty, sc.qty_exp, sc.price_exp
+                    )
+                    pos.avg_literal_zero = False
+            else:
+                cover_qty = min(qty, -pre_qty)
+                remaining = qty - cover_qty
+                post_qty = pre_qty + cover_qty
+                if post_qty == 0 and remaining == 0:
+                    self._set_flat(pos)
+                elif post_qty == 0 and remaining > 0:
+                    pos.quantity = remaining
+                    pos.avg_cost = price
+                    pos.avg_literal_zero = False
+                else:
+                    pos.quantity = post_qty
+        else:
+            if pre_qty <= 0:
+                new_qty = _check_range(pre_qty - qty)
+                if new_qty == 0:
+                    self._set_flat(pos)
+                else:
+                    pre_cost_abs = _mul_q(pre_avg, sc.price_exp, -pre_qty, sc.qty_exp, sc.money_exp)
+                    add_cost_abs = _mul_q(price, sc.price_exp, qty, sc.qty_exp, sc.money_exp)
+                    pos.quantity = new_qty
+                    pos.avg_cost = _div_q(
+                        pre_cost_abs + add_cost_abs,
+                        sc.money_exp,
+                        -new_qty,
+                        sc.qty_exp,
+                        sc.price_exp,
+                    )
+                    pos.avg_literal_zero = False
+            else:
+                close_qty = min(qty, pre_qty)
+                remaining = qty - close_qty
+                post_qty = pre_qty - close_qty
+                if post_qty == 0 and remaining == 0:
+                    self._set_flat(pos)
+                elif post_qty == 0 and remaining > 0:
+                    pos.quantity = -remaining
+                    pos.avg_cost = price
+                    pos.avg_literal_zero = False
+                else:
+                    pos.quantity = post_qty
+
+        pos.fees = _check_range(pos.fees + fee)
+
+    @staticmethod
+    def _set_flat(pos: FixedPointPosition) -> None:
+        pos.quantity = 0
+        pos.avg_cost = 0
+        pos.avg_literal_zero = True
+
+
+def legacy_positions_as_strings(eng: LegacyLedgerEngine) -> Dict[str, Dict[str, str]]:
+    """Positions of a Decimal :class:`LegacyLedgerEngine` in the replay-pack format."""
+    out: Dict[str, Dict[str, str]] = {}
+    for sym in sorted(eng.state.positions.keys()):
+        pos = eng.state.positions[sym]
+        out[sym] = {
+            "quantity": str(pos.quantity),
+            "avg_cost": str(pos.avg_cost),
+            "fees": str(pos.fees),
+            "realized_pnl": str(pos.realized_pnl),
+        }
+    return out
+
+
+class CrossCheckLedgerEngine:
+    """
+    Runs :class:`LegacyLedgerEngine` and :class:`FixedPointLedgerEngine` side by side.
+
+    After every applied event the positions and account balances of both
+    backends are compared; any difference raises :class:`LedgerCrossCheckError`.
+    Exceptions must also agree (same type and message).
+    """
+
+    def __init__(self, *, quote_currency: str, policy: Optional[QuantizationPolicy] = None):
+        self.decimal = LegacyLedgerEngine(quote_currency=quote_currency, policy=policy)
+        self.fixed = FixedPointLedgerEngine(quote_currency=quote_currency, policy=policy)
+        self.events_checked = 0
+
+    def apply(self, event: Mapping[str, Any]) -> None:
+        err_dec: Optional[BaseException] = None
+        err_fix: Optional[BaseException] = None
+        try:
+            self.decimal.apply(event)
+        except (ValueError, TypeError, ArithmeticError) as ex:
+            err_dec = ex
+        try:
+            self.fixed.apply(event)
+        except (ValueError, TypeError, ArithmeticError) as ex:
+            err_fix = ex
+        if err_dec is not None or err_fix is not None:
+            if (
+                err_dec is None
+                or err_fix is None
+                or type(err_dec) is not type(err_fix)
+                or str(err_dec) != str(err_fix)
+            ):
+                raise LedgerCrossCheckError(
+                    f"backend error mismatch for event {event.get('event_id')!r}: "
+                    f"decimal={err_dec!r} fixed_point={err_fix!r}"
+                )
+            raise err_dec
+        self._compare(event)
+        self.events_checked += 1
+
+    def positions_as_strings(self) -> Dict[str, Dict[str, str]]:
+        return legacy_positions_as_strings(self.decimal)
+
+    def _compare(self, event: Mapping[str, Any]) -> None:
+        pos_dec = legacy_positions_as_strings(self.decimal)
+        pos_fix = self.fixed.positions_as_strings()
+        if pos_dec != pos_fix:
+            raise LedgerCrossCheckError(
+                f"positions mismatch after event {event.get('event_id')!r}: "
+                f"decimal={pos_dec} fixed_point={pos_fix}"
+            )
+        acc_dec = {
+            k: str(self.decimal.state.accounts[k]) for k in sorted(self.decimal.state.accounts)
+        }
+        acc_fix = self.fixed.accounts_as_strings()
+        if acc_dec != acc_fix:
+            raise LedgerCrossCheckError(
+                f"accounts mismatch after event {event.get('event_id')!r}: "
+                f"decimal={acc_dec} fixed_point={acc_fix}"
+            )
+
+
+LEDGER_BACKENDS = ("decimal", "fixed_point", "cross_check")
+
+ReplayLedgerEngine = Union[LegacyLedgerEngine, FixedPointLedgerEngine, CrossCheckLedgerEngine]
+
+
+def make_replay_ledger_engine(
+    backend: str, *, quote_currency: str, policy: Optional[QuantizationPolicy] = None
+) -> ReplayLedgerEngine:
+    """Factory for the replay/backtest ledger backend (``decimal`` is the live default)."""
+    if backend == "decimal":
+        return LegacyLedgerEngine(quote_currency=quote_currency, policy=policy)
+    if backend == "fixed_point":
+        return FixedPointLedgerEngine(quote_currency=quote_currency, policy=policy)
+    if backend == "cross_check":
+        return CrossCheckLedgerEngine(quote_currency=quote_currency, policy=policy)
+    raise ValueError(f"Unknown ledger backend {backend!r}; expected one of {LEDGER_BACKENDS}")
+
+
+def replay_positions_as_strings(eng: ReplayLedgerEngine) -> Dict[str, Dict[str, str]]:
+    if isinstance(eng, LegacyLedgerEngine):
+        return legacy_positions_as_strings(eng)
+    return eng.positions_as_strings()
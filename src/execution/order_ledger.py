@@ -7,16 +7,24 @@ Single source of truth for order state.
 Design Goals:
 - In-memory storage (future: persistent backend)
 - Fast lookups by client_order_id and exchange_order_id
-- Append-only history (immutable past)
+- Secondary indexes (state, symbol, active set, state counters) maintained on
+  add/update, so reconciliation queries cost O(k) in the result size
+- Append-only history (immutable past), stored compactly per order
 - Thread-safe (future: locking/transactions)
 """
 
-from typing import Dict, List, Optional
+from array import array
+from typing import Dict, Iterable, List, Optional
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from src.execution.contracts import Order, OrderState
 
+_EPOCH = datetime(1970, 1, 1)
+_ONE_US = timedelta(microseconds=1)
+_STATES: List[OrderState] = list(OrderState)
+_STATE_CODE: Dict[OrderState, int] = {s: i for i, s in enumerate(_STATES)}
+
 
 # ============================================================================
 # Order History Entry
@@ -34,6 +42,46 @@ class OrderHistoryEntry:
     metadata: Dict = field(default_factory=dict)
 
 
+class _OrderHistory:
+    """
+    Compact append-only history of one order.
+
+    Column storage (timestamps as int microseconds, states as byte codes, interned
+    event names) instead of one OrderHistoryEntry object per transition; entries
+    are materialized on read.
+    """
+
+    __slots__ = ("ts_us", "states", "events", "snapshots")
+
+    def __init__(self) -> None:
+        self.ts_us = array("q")
+        self.states = bytearray()
+        self.events: List[str] = []
+        self.snapshots: List[Dict] = []
+
+    def append(self, timestamp: datetime, state: OrderState, snapshot: Dict, event: str) -> None:
+        self.ts_us.append((timestamp - _EPOCH) // _ONE_US)
+        self.states.append(_STATE_CODE[state])
+        self.events.append(event)
+        self.snapshots.append(snapshot)
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def entries(self) -> List[OrderHistoryEntry]:
+        return [
+            OrderHistoryEntry(
+                timestamp=_EPOCH + timedelta(microseconds=ts),
+                state=_STATES[code],
+                snapshot=snapshot,
+                event=event,
+            )
+            for ts, code, snapshot, event in zip(
+                self.ts_us, self.states, self.snapshots, self.events
+            )
+        ]
+
+
 # ============================================================================
 # Order Ledger
 # ============================================================================
@@ -48,6 +96,10 @@ class OrderLedger:
     - Track by exchange_order_id (after ACK)
     - Order history (append-only)
     - Query by state, symbol, session
+
+    Indexes reflect each order as of its last ``add_order``/``update_order`` call
+    (callers mutate orders in place and then call ``update_order``). Query results
+    keep insertion order, same as a scan over all orders.
     """
 
     def __init__(self):
@@ -58,8 +110,22 @@ class OrderLedger:
         # Secondary index: exchange_order_id → client_order_id
         self._exchange_to_client: Dict[str, str] = {}
 
-        # Order history: client_order_id → List[OrderHistoryEntry]
-        self._history: Dict[str, List[OrderHistoryEntry]] = {}
+        # Order history: client_order_id → compact history
+        self._history: Dict[str, _OrderHistory] = {}
+
+        # Insertion sequence (keeps query results in insertion order)
+        self._seq: Dict[str, int] = {}
+
+        # Indexed (state, symbol) per order as of the last add/update; needed
+        # because callers mutate the Order object before calling update_order.
+        self._indexed_state: Dict[str, OrderState] = {}
+        self._indexed_symbol: Dict[str, str] = {}
+
+        # Secondary indexes: state/symbol → client_order_ids, active set, counters
+        self._by_state: Dict[OrderState, Dict[str, None]] = {}
+        self._by_symbol: Dict[str, Dict[str, None]] = {}
+        self._active: Dict[str, None] = {}
+        self._state_counts: Dict[OrderState, int] = {}
 
         # Counters
         self._total_orders = 0
@@ -77,9 +143,12 @@ class OrderLedger:
         if order.client_order_id in self._orders:
             return False  # Already exists (idempotent)
 
-        self._orders[order.client_order_id] = order
-        self._history[order.client_order_id] = []
+        cid = order.client_order_id
+        self._orders[cid] = order
+        self._history[cid] = _OrderHistory()
+        self._seq[cid] = self._total_orders
         self._total_orders += 1
+        self._index_order(order)
 
         # Add initial history entry
         self._add_history_entry(
@@ -104,10 +173,7 @@ class OrderLedger:
             return False
 
         self._orders[order.client_order_id] = order
-
-        # Update exchange_order_id index if set
-        if order.exchange_order_id:
-            self._exchange_to_client[order.exchange_order_id] = order.client_order_id
+        self._index_order(order)
 
         # Add history entry
         self._add_history_entry(order=order, event=event)
@@ -151,7 +217,13 @@ class OrderLedger:
         Returns:
             List of history entries (chronological)
         """
-        return self._history.get(client_order_id, [])
+        history = self._history.get(client_order_id)
+        return history.entries() if history is not None else []
+
+    def get_history_length(self, client_order_id: str) -> int:
+        """Number of history entries of an order (without materializing them)."""
+        history = self._history.get(client_order_id)
+        return len(history) if history is not None else 0
 
     def get_orders_by_state(self, state: OrderState) -> List[Order]:
         """
@@ -163,7 +235,7 @@ class OrderLedger:
         Returns:
             List of orders
         """
-        return [order for order in self._orders.values() if order.state == state]
+        return self._materialize(self._by_state.get(state, ()))
 
     def get_orders_by_symbol(self, symbol: str) -> List[Order]:
         """
@@ -175,7 +247,13 @@ class OrderLedger:
         Returns:
             List of orders
         """
-        return [order for order in self._orders.values() if order.symbol == symbol]
+        ids = self._by_symbol.get(symbol)
+        if not ids:
+            return []
+        # Symbols rarely change, so the bucket is normally already in insertion order.
+        if self._is_insertion_ordered(ids):
+            return [self._orders[cid] for cid in ids]
+        return self._materialize(ids)
 
     def get_active_orders(self) -> List[Order]:
         """
@@ -184,7 +262,11 @@ class OrderLedger:
         Returns:
             List of active orders
         """
-        return [order for order in self._orders.values() if order.state.is_active()]
+        return self._materialize(self._active)
+
+    def get_active_count(self) -> int:
+        """Number of active orders (O(1))."""
+        return len(self._active)
 
     def get_all_orders(self) -> List[Order]:
         """
@@ -206,10 +288,69 @@ class OrderLedger:
         Returns:
             Dict mapping state to count
         """
-        counts: Dict[OrderState, int] = {}
+        return {state: count for state, count in self._state_counts.items() if count}
+
+    def reindex(self) -> None:
+        """
+        Rebuild all secondary indexes from the stored orders.
+
+        Only needed if orders were mutated without a subsequent ``update_order``.
+        """
+        self._exchange_to_client = {}
+        self._indexed_state = {}
+        self._indexed_symbol = {}
+        self._by_state = {}
+        self._by_symbol = {}
+        self._active = {}
+        self._state_counts = {}
         for order in self._orders.values():
-            counts[order.state] = counts.get(order.state, 0) + 1
-        return counts
+            self._index_order(order)
+
+    def _index_order(self, order: Order) -> None:
+        """Internal: Move order between index buckets after add/update."""
+        cid = order.client_order_id
+
+        if order.exchange_order_id:
+            self._exchange_to_client[order.exchange_order_id] = cid
+
+        new_state = order.state
+        old_state = self._indexed_state.get(cid)
+        if old_state is not new_state:
+            if old_state is not None:
+                self._by_state[old_state].pop(cid, None)
+                self._state_counts[old_state] -= 1
+            self._by_state.setdefault(new_state, {})[cid] = None
+            self._state_counts[new_state] = self._state_counts.get(new_state, 0) + 1
+            self._indexed_state[cid] = new_state
+            if new_state.is_active():
+                self._active[cid] = None
+            else:
+                self._active.pop(cid, None)
+
+        new_symbol = order.symbol
+        old_symbol = self._indexed_symbol.get(cid)
+        if old_symbol != new_symbol:
+            if old_symbol is not None:
+                bucket = self._by_symbol[old_symbol]
+                bucket.pop(cid, None)
+                if not bucket:
+                    del self._by_symbol[old_symbol]
+            self._by_symbol.setdefault(new_symbol, {})[cid] = None
+            self._indexed_symbol[cid] = new_symbol
+
+    def _is_insertion_ordered(self, ids: Iterable[str]) -> bool:
+        prev = -1
+        seq = self._seq
+        for cid in ids:
+            cur = seq[cid]
+            if cur < prev:
+                return False
+            prev = cur
+        return True
+
+    def _materialize(self, ids: Iterable[str]) -> List[Order]:
+        """Internal: Orders for index ids, in insertion order (O(k log k))."""
+        return [self._orders[cid] for cid in sorted(ids, key=self._seq.__getitem__)]
 
     def _add_history_entry(self, order: Order, event: str) -> None:
         """
@@ -219,18 +360,17 @@ class OrderLedger:
             order: Order
             event: Event type
         """
-        if order.client_order_id not in self._history:
-            self._history[order.client_order_id] = []
+        history = self._history.get(order.client_order_id)
+        if history is None:
+            history = self._history[order.client_order_id] = _OrderHistory()
 
-        entry = OrderHistoryEntry(
+        history.append(
             timestamp=datetime.utcnow(),
             state=order.state,
             snapshot=order.to_dict(),
             event=event,
         )
 
-        self._history[order.client_order_id].append(entry)
-
     def to_dict(self) -> Dict:
         """
         Export ledger summary as dict.
@@ -240,7 +380,7 @@ class OrderLedger:
         """
         return {
             "total_orders": self._total_orders,
-            "active_orders": len(self.get_active_orders()),
+            "active_orders": len(self._active),
             "state_counts": {
                 state.value: count for state, count in self.get_state_counts().items()
             },
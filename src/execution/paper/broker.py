@@ -9,7 +9,7 @@ import random
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from uuid import uuid4
 
 from src.execution.contracts import Fill, Order, OrderSide, OrderState, OrderType
@@ -44,6 +44,16 @@ class FillSimulationConfig:
             raise ValueError(f"fee_bps must be >= 0, got {self.fee_bps}")
 
 
+@dataclass(frozen=True)
+class _FillPricing:
+    """Slippage multipliers and fee factor derived from a FillSimulationConfig."""
+
+    buy_mult: Decimal
+    sell_mult: Decimal
+    fee_factor: Decimal
+    slippage_meta: str
+
+
 class PaperBroker:
     """
     Paper broker with deterministic fill simulation.
@@ -93,6 +103,66 @@ class PaperBroker:
             order: Order to submit
             current_price: Current market price for the symbol
 
+        Returns:
+            Tuple of (new_order_state, fills_generated)
+        """
+        return self._submit(order, current_price, self._pricing(), datetime.utcnow())
+
+    def submit_orders(
+        self,
+        orders: Sequence[Order],
+        current_prices: Sequence[Decimal],
+    ) -> List[tuple[OrderState, List[Fill]]]:
+        """
+        Submit a batch of orders (same results as :meth:`submit_order` per order).
+
+        Slippage multipliers and the fee factor are computed once per batch and
+        fills of one batch share ``filled_at``. The partial-fill RNG is consumed
+        in order, so seeded simulations stay reproducible.
+
+        Args:
+            orders: Orders to submit
+            current_prices: Market price per order
+
+        Returns:
+            (new_order_state, fills_generated) per order
+        """
+        if len(orders) != len(current_prices):
+            raise ValueError("orders and current_prices must have the same length")
+
+        pricing = self._pricing()
+        now = datetime.utcnow()
+        return [
+            self._submit(order, current_price, pricing, now)
+            for order, current_price in zip(orders, current_prices)
+        ]
+
+    def _pricing(self) -> _FillPricing:
+        """Derive slippage multipliers and fee factor from the config."""
+        slippage_factor = self.config.slippage_bps / Decimal("10000")
+        return _FillPricing(
+            buy_mult=Decimal("1") + slippage_factor,
+            sell_mult=Decimal("1") - slippage_factor,
+            fee_factor=self.config.fee_bps / Decimal("10000"),
+            slippage_meta=str(self.config.slippage_bps),
+        )
+
+    def _submit(
+        self,
+        order: Order,
+        current_price: Decimal,
+        pricing: _FillPricing,
+        filled_at: datetime,
+    ) -> tuple[OrderState, List[Fill]]:
+        """
+        Fill kernel shared by :meth:`submit_order` and :meth:`submit_orders`.
+
+        Args:
+            order: Order to submit
+            current_price: Current market price for the symbol
+            pricing: Precomputed slippage/fee factors
+            filled_at: Timestamp for generated fills
+
         Returns:
             Tuple of (new_order_state, fills_generated)
         """
@@ -103,67 +173,42 @@ class PaperBroker:
             logger.warning(f"Invalid order quantity: {order.quantity}")
             return (OrderState.REJECTED, [])
 
-        # Simulate ACK
         logger.debug(
             f"Paper order submitted: {order.client_order_id} "
             f"{order.side.value} {order.quantity} {order.symbol}"
         )
 
-        # Generate fills based on order type
+        is_buy = order.side == OrderSide.BUY
         if order.order_type == OrderType.MARKET:
-            fills = self._simulate_market_order_fill(order, current_price)
+            # Apply slippage
+            fill_price = current_price * (pricing.buy_mult if is_buy else pricing.sell_mult)
+            if self._should_partial_fill():
+                # Partial fill: 50-90% of quantity
+                fill_ratio = Decimal(str(self._rng.uniform(0.5, 0.9)))
+                fill_qty = order.quantity * fill_ratio
+            else:
+                fill_qty = order.quantity
+            simulation, slippage_meta = "paper_market", pricing.slippage_meta
         elif order.order_type == OrderType.LIMIT:
             # For Phase 1: Immediate fill at limit price if price is favorable
-            fills = self._simulate_limit_order_fill(order, current_price)
+            if order.price is None:
+                logger.warning("Limit order without price")
+                return (OrderState.ACKNOWLEDGED, [])
+            if (is_buy and current_price > order.price) or (
+                not is_buy and current_price < order.price
+            ):
+                logger.debug(f"Limit order not filled: market={current_price} limit={order.price}")
+                return (OrderState.ACKNOWLEDGED, [])
+            # Fill at limit price (no slippage for limit orders)
+            fill_price = order.price
+            fill_qty = order.quantity
+            simulation, slippage_meta = "paper_limit", "0"
         else:
             logger.warning(f"Unsupported order type: {order.order_type}")
             return (OrderState.REJECTED, [])
 
-        # Determine final state
-        if not fills:
-            return (OrderState.ACKNOWLEDGED, [])
-
-        total_filled = sum(fill.quantity for fill in fills)
-
-        if total_filled >= order.quantity:
-            return (OrderState.FILLED, fills)
-        elif total_filled > 0:
-            return (OrderState.PARTIALLY_FILLED, fills)
-        else:
-            return (OrderState.ACKNOWLEDGED, [])
-
-    def _simulate_market_order_fill(
-        self,
-        order: Order,
-        current_price: Decimal,
-    ) -> List[Fill]:
-        """
-        Simulate market order fill.
-
-        Args:
-            order: Market order
-            current_price: Current market price
-
-        Returns:
-            List of fills
-        """
-        # Apply slippage
-        fill_price = self._apply_slippage(current_price, order.side)
-
-        # Calculate fee
-        notional = fill_price * order.quantity
-        fee = self._calculate_fee(notional)
-
-        # Check for partial fill
-        if self._should_partial_fill():
-            # Partial fill: 50-90% of quantity
-            fill_ratio = Decimal(str(self._rng.uniform(0.5, 0.9)))
-            fill_qty = order.quantity * fill_ratio
-        else:
-            # Full fill
-            fill_qty = order.quantity
-
-        # Generate fill
+        # Fee on the full order notional
+        fee = (fill_price * order.quantity) * pricing.fee_factor
         fill = Fill(
             fill_id=str(uuid4()),
             client_order_id=order.client_order_id,
@@ -174,13 +219,9 @@ class PaperBroker:
             price=fill_price,
             fee=fee,
             fee_currency="USD",  # Simplified
-            filled_at=datetime.utcnow(),
-            metadata={
-                "simulation": "paper_market",
-                "slippage_bps": str(self.config.slippage_bps),
-            },
+            filled_at=filled_at,
+            metadata={"simulation": simulation, "slippage_bps": slippage_meta},
         )
-
         self._fills_generated += 1
         self._total_fees += fee
 
@@ -188,108 +229,12 @@ class PaperBroker:
             f"Paper fill: {fill.fill_id} @ {fill.price} (qty: {fill.quantity}, fee: {fill.fee})"
         )
 
-        return [fill]
-
-    def _simulate_limit_order_fill(
-        self,
-        order: Order,
-        current_price: Decimal,
-    ) -> List[Fill]:
-        """
-        Simulate limit order fill.
-
-        For Phase 1: Simplified logic (immediate fill if price is favorable).
-
-        Args:
-            order: Limit order
-            current_price: Current market price
-
-        Returns:
-            List of fills
-        """
-        if order.price is None:
-            logger.warning("Limit order without price")
-            return []
-
-        # Check if limit price is favorable
-        should_fill = False
-        if order.side == OrderSide.BUY and current_price <= order.price:
-            # Buy limit: fill if market price <= limit price
-            should_fill = True
-        elif order.side == OrderSide.SELL and current_price >= order.price:
-            # Sell limit: fill if market price >= limit price
-            should_fill = True
-
-        if not should_fill:
-            logger.debug(f"Limit order not filled: market={current_price} limit={order.price}")
-            return []
-
-        # Fill at limit price (no slippage for limit orders)
-        fill_price = order.price
-
-        # Calculate fee
-        notional = fill_price * order.quantity
-        fee = self._calculate_fee(notional)
-
-        # Generate fill
-        fill = Fill(
-            fill_id=str(uuid4()),
-            client_order_id=order.client_order_id,
-            exchange_order_id=order.exchange_order_id or str(uuid4()),
-            symbol=order.symbol,
-            side=order.side,
-            quantity=order.quantity,  # Full fill for limit
-            price=fill_price,
-            fee=fee,
-            fee_currency="USD",
-            filled_at=datetime.utcnow(),
-            metadata={
-                "simulation": "paper_limit",
-                "slippage_bps": "0",  # No slippage for limit
-            },
-        )
-
-        self._fills_generated += 1
-        self._total_fees += fee
-
-        return [fill]
-
-    def _apply_slippage(
-        self,
-        price: Decimal,
-        side: OrderSide,
-    ) -> Decimal:
-        """
-        Apply slippage to price.
-
-        Args:
-            price: Base price
-            side: Order side
-
-        Returns:
-            Price with slippage
-        """
-        slippage_factor = self.config.slippage_bps / Decimal("10000")
-
-        if side == OrderSide.BUY:
-            # Buy: slippage increases price
-            return price * (Decimal("1") + slippage_factor)
+        if fill_qty >= order.quantity:
+            return (OrderState.FILLED, [fill])
+        elif fill_qty > 0:
+            return (OrderState.PARTIALLY_FILLED, [fill])
         else:
-            # Sell: slippage decreases price
-            return price * (Decimal("1") - slippage_factor)
-
-    def _calculate_fee(self, notional: Decimal) -> Decimal:
-        """
-        Calculate fee for a trade.
-
-        Args:
-            notional: Notional value (price * quantity)
-
-        Returns:
-            Fee amount
-        """
-        fee_factor = self.config.fee_bps / Decimal("10000")
-        return notional * fee_factor
+            return (OrderState.ACKNOWLEDGED, [])
 
     def _should_partial_fill(self) -> bool:
         """
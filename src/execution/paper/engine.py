@@ -9,7 +9,7 @@ import logging
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional, Sequence
 
 from src.execution.audit_log import AuditLog
 from src.execution.contracts import Fill, LedgerEntry, Order, OrderSide, OrderState, OrderType
@@ -137,26 +137,7 @@ class PaperExecutionEngine:
         Returns:
             Tuple of (order, fills)
         """
-        # Generate client order ID if not provided
-        if client_order_id is None:
-            import uuid
-
-            client_order_id = f"paper_{uuid.uuid4().hex[:8]}"
-
-        # Create order
-        order = Order(
-            client_order_id=client_order_id,
-            symbol=symbol,
-            side=side,
-            order_type=order_type,
-            quantity=quantity,
-            price=price,
-            state=OrderState.CREATED,
-            strategy_id=self.config.strategy_id,
-            session_id=self.config.session_id,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
-        )
+        order = self._create_order(symbol, side, quantity, order_type, price, client_order_id)
 
         # Add to ledger
         self.order_ledger.add_order(order)
@@ -227,6 +208,93 @@ class PaperExecutionEngine:
             self._process_fill(fill)
 
         # Journal entry
+        self._journal_fills(order, fills)
+
+        logger.info(
+            f"Order {order.client_order_id} submitted: state={order.state.value} fills={len(fills)}"
+        )
+
+        return (order, fills)
+
+    def submit_orders(
+        self, requests: Sequence[Mapping[str, Any]]
+    ) -> List[tuple[Order, List[Fill]]]:
+        """
+        Submit a batch of orders.
+
+        Each request holds the keyword arguments of :meth:`submit_order`. With a
+        risk runtime every order is checked sequentially (risk decisions depend on
+        the ledger state left by previous fills). Without one, orders are
+        simulated in one :meth:`PaperBroker.submit_orders` pass and ledgers are
+        updated afterwards in order, with the same results as single submits.
+
+        Returns:
+            (order, fills) per request
+        """
+        if self.risk_runtime:
+            return [self.submit_order(**dict(req)) for req in requests]
+
+        orders = [self._create_order(**dict(req)) for req in requests]
+        results: List[Optional[tuple[Order, List[Fill]]]] = [None] * len(orders)
+        to_submit: List[int] = []
+        for i, order in enumerate(orders):
+            self.order_ledger.add_order(order)
+            if self._current_prices.get(order.symbol, Decimal("0")) == 0:
+                logger.error(f"No market price for {order.symbol}")
+                order.state = OrderState.FAILED
+                self.order_ledger.update_order(order, event="NO_MARKET_DATA")
+                results[i] = (order, [])
+            else:
+                to_submit.append(i)
+
+        batch = [orders[i] for i in to_submit]
+        outcomes = self.broker.submit_orders(batch, [self._current_prices[o.symbol] for o in batch])
+        now = datetime.utcnow()
+        for i, (new_state, fills) in zip(to_submit, outcomes):
+            order = orders[i]
+            order.state = new_state
+            order.updated_at = now
+            self.order_ledger.update_order(order, event="ORDER_SUBMITTED")
+            for fill in fills:
+                self._process_fill(fill)
+            self._journal_fills(order, fills)
+            results[i] = (order, fills)
+
+        logger.info(f"Batch submitted: orders={len(orders)} simulated={len(batch)}")
+        return results  # type: ignore[return-value]
+
+    def _create_order(
+        self,
+        symbol: str,
+        side: OrderSide,
+        quantity: Decimal,
+        order_type: OrderType = OrderType.MARKET,
+        price: Optional[Decimal] = None,
+        client_order_id: Optional[str] = None,
+    ) -> Order:
+        """Create a new order in CREATED state."""
+        # Generate client order ID if not provided
+        if client_order_id is None:
+            import uuid
+
+            client_order_id = f"paper_{uuid.uuid4().hex[:8]}"
+
+        return Order(
+            client_order_id=client_order_id,
+            symbol=symbol,
+            side=side,
+            order_type=order_type,
+            quantity=quantity,
+            price=price,
+            state=OrderState.CREATED,
+            strategy_id=self.config.strategy_id,
+            session_id=self.config.session_id,
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow(),
+        )
+
+    def _journal_fills(self, order: Order, fills: List[Fill]) -> None:
+        """Add a journal entry for the fills of an order (if any)."""
         if fills:
             self.journal.add_entry(
                 JournalEntry(
@@ -246,12 +314,6 @@ class PaperExecutionEngine:
                 )
             )
 
-        logger.info(
-            f"Order {order.client_order_id} submitted: state={order.state.value} fills={len(fills)}"
-        )
-
-        return (order, fills)
-
     def _check_risk(self, order: Order) -> any:
         """
         Check order against risk runtime.
@@ -102,9 +102,11 @@ def _is_kill_switch_blocking(state_path: Optional[str] = None) -> bool:
     """
     Check if kill switch state file indicates trading should be blocked.
 
-    Delegates to :func:`resolve_kill_switch_limit_from_state_file` in
-    ``src.ops.gates.risk_gate`` so JSON parsing matches the ops risk gate and
-    live safety. Uses :func:`kill_switch_state_path_from_env` when
+    Delegates to the shared stat-cached
+    :class:`~src.ops.gates.kill_switch_state_reader.KillSwitchStateReader`
+    (wrapping :func:`resolve_kill_switch_limit_from_state_file`) so JSON
+    parsing matches the ops risk gate and live safety while each order costs at
+    most one ``stat`` (re-parse only when inode/size/mtime change). Uses :func:`kill_switch_state_path_from_env` when
     ``state_path`` is omitted so ``PEAK_KILL_SWITCH_STATE_PATH`` and
     ``PEAKTRADE_KILL_SWITCH_STATE_PATH`` both apply. Fail-open: returns
     ``False`` when the resolver yields ``None`` (missing file, unreadable).
@@ -112,13 +114,11 @@ def _is_kill_switch_blocking(state_path: Optional[str] = None) -> bool:
 
     Used only for bounded_pilot mode (config: require_kill_switch_active).
     """
-    from src.ops.gates.risk_gate import (
-        kill_switch_state_path_from_env,
-        resolve_kill_switch_limit_from_state_file,
-    )
+    from src.ops.gates.kill_switch_state_reader import get_kill_switch_state_reader
+    from src.ops.gates.risk_gate import kill_switch_state_path_from_env
 
     path = state_path if state_path is not None else kill_switch_state_path_from_env()
-    return resolve_kill_switch_limit_from_state_file(path) is True
+    return get_kill_switch_state_reader(path).is_blocking()
 
 
 def _signal_label_from_int(sig: int) -> str:
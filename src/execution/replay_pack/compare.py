@@ -26,6 +26,7 @@ from .datarefs import (
 from .hashing import collect_files_for_hashing, write_sha256sums
 from .loader import ReplayBundle, load_replay_pack
 from .runner import _replay_events  # reuse identical replay semantics
+from .streaming import NoExecutionEventsError, NonCanonicalOrderError, stream_replay
 from .validator import validate_replay_pack
 
 
@@ -184,6 +185,45 @@ def _write_compare_report_into_bundle(
     return out_path
 
 
+def _materialized_invariants(
+    bundle: ReplayBundle, *, check_outputs: bool, ledger_backend: str, sample_n: int
+) -> Tuple[InvariantStatus, InvariantStatus, Dict[str, Any], Dict[str, Any]]:
+    """
+    Fills/positions invariants via full materialization (sorts events and fills).
+
+    Fallback for bundles that are not in canonical order; canonical bundles are
+    compared incrementally by :func:`streaming.stream_replay`.
+    """
+    fills_status: InvariantStatus = "SKIP"
+    pos_status: InvariantStatus = "SKIP"
+    fills_diff: Dict[str, Any] = {"added": 0, "removed": 0, "changed": 0, "sample": []}
+    positions_diff: Dict[str, Any] = {"added": 0, "removed": 0, "changed": 0, "sample": []}
+
+    events = list(bundle.execution_events())
+    if not events:
+        raise NoExecutionEventsError("no execution events in bundle")
+    result = _replay_events(events, ledger_backend=ledger_backend)
+    if not check_outputs:
+        return fills_status, pos_status, fills_diff, positions_diff
+
+    expected_fills_iter = bundle.expected_fills()
+    expected_positions = bundle.expected_positions()
+    if expected_fills_iter is not None:
+        got_fills = sorted(
+            [normalize_beta_exec_v1_event(e) for e in result.fills], key=sort_key_beta_exec_v1
+        )
+        exp_fills = sorted(
+            [normalize_beta_exec_v1_event(e) for e in expected_fills_iter],
+            key=sort_key_beta_exec_v1,
+        )
+        fills_status = "PASS" if exp_fills == got_fills else "FAIL"
+        fills_diff = _fills_diff(exp_fills, got_fills, sample_n=sample_n)
+    if expected_positions is not None:
+        pos_status = "PASS" if expected_positions == result.positions else "FAIL"
+        positions_diff = _positions_diff(expected_positions, result.positions, sample_n=sample_n)
+    return fills_status, pos_status, fills_diff, positions_diff
+
+
 def generate_compare_report(
     bundle_path: str | Path,
     *,
@@ -193,9 +233,15 @@ def generate_compare_report(
     generated_at_utc: Optional[str] = None,
     out_path: Optional[str | Path] = None,
     sample_n: int = 5,
+    ledger_backend: str = "decimal",
 ) -> Tuple[int, Dict[str, Any]]:
     """
     Generate deterministic compare_report.json (baseline vs replay).
+
+    Events and expected fills are streamed and compared incrementally
+    (:func:`streaming.stream_replay`); memory is bounded by the divergence, not the
+    bundle. Bundles that are not in canonical order fall back to the materialized
+    replay with identical results.
     """
     bundle_root = Path(bundle_path)
 
@@ -312,55 +358,32 @@ def generate_compare_report(
         replay_exit_code = exit_code
     else:
         try:
-            events = list(bundle.execution_events())
-            if not events:
-                reasons.append("CONTRACT:NO_EVENTS")
-                replay_exit_code = EXIT_CONTRACT
-            else:
-                result = _replay_events(events)
-                replay_exit_code = EXIT_OK
-
-                if check_outputs:
-                    expected_fills_iter = bundle.expected_fills()
-                    expected_positions = bundle.expected_positions()
-
-                    if expected_fills_iter is None and expected_positions is None:
-                        fills_status = "SKIP"
-                        pos_status = "SKIP"
-                    else:
-                        got_fills = sorted(
-                            [normalize_beta_exec_v1_event(e) for e in result.fills],
-                            key=sort_key_beta_exec_v1,
-                        )
-                        exp_fills = (
-                            sorted(
-                                [normalize_beta_exec_v1_event(e) for e in expected_fills_iter],
-                                key=sort_key_beta_exec_v1,
-                            )
-                            if expected_fills_iter is not None
-                            else []
-                        )
-                        got_pos = result.positions
-                        exp_pos = expected_positions or {}
-
-                        if expected_fills_iter is None:
-                            fills_status = "SKIP"
-                        else:
-                            fills_status = "PASS" if exp_fills == got_fills else "FAIL"
-                            fills_diff = _fills_diff(exp_fills, got_fills, sample_n=sample_n)
-
-                        if expected_positions is None:
-                            pos_status = "SKIP"
-                        else:
-                            pos_status = "PASS" if exp_pos == got_pos else "FAIL"
-                            positions_diff = _positions_diff(exp_pos, got_pos, sample_n=sample_n)
-
-                        if fills_status == "FAIL" or pos_status == "FAIL":
-                            reasons.append("REPLAY_MISMATCH:EXPECTED_OUTPUTS")
-                            replay_exit_code = EXIT_REPLAY_MISMATCH
-                else:
-                    fills_status = "SKIP"
-                    pos_status = "SKIP"
+            try:
+                streamed = stream_replay(
+                    bundle.root,
+                    check_outputs=check_outputs,
+                    ledger_backend=ledger_backend,
+                    sample_n=sample_n,
+                )
+                fills_status = streamed.fills_status  # type: ignore[assignment]
+                pos_status = streamed.positions_status  # type: ignore[assignment]
+                fills_diff = streamed.fills_diff
+                positions_diff = streamed.positions_diff
+            except NonCanonicalOrderError:
+                # Hand-edited / legacy bundles: replay the sorted, materialized events.
+                fills_status, pos_status, fills_diff, positions_diff = _materialized_invariants(
+                    bundle,
+                    check_outputs=check_outputs,
+                    ledger_backend=ledger_backend,
+                    sample_n=sample_n,
+                )
+            replay_exit_code = EXIT_OK
+            if fills_status == "FAIL" or pos_status == "FAIL":
+                reasons.append("REPLAY_MISMATCH:EXPECTED_OUTPUTS")
+                replay_exit_code = EXIT_REPLAY_MISMATCH
+        except NoExecutionEventsError:
+            reasons.append("CONTRACT:NO_EVENTS")
+            replay_exit_code = EXIT_CONTRACT
         except ReplayMismatchError:
             # Defensive: should not occur because we don't call runner check path that raises.
             reasons.append("REPLAY_MISMATCH:EXPECTED_OUTPUTS")
@@ -6,7 +6,11 @@ from pathlib import Path
 from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
 from src.execution.beta_bridge.schema import normalize_beta_exec_v1_event, sort_key_beta_exec_v1
-from src.execution.ledger.engine_legacy import LegacyLedgerEngine as LedgerEngine
+from src.execution.ledger.engine_fixed_point import (
+    LEDGER_BACKENDS,
+    make_replay_ledger_engine,
+    replay_positions_as_strings,
+)
 from src.execution.ledger.quantization import parse_symbol
 
 from .contract import ContractViolationError, HashMismatchError, ReplayMismatchError
@@ -28,26 +32,24 @@ class ReplayResult:
     positions: Dict[str, Dict[str, str]]
 
 
-def _compute_expected_positions_from_engine(eng: LedgerEngine) -> Dict[str, Dict[str, str]]:
-    out: Dict[str, Dict[str, str]] = {}
-    for sym in sorted(eng.state.positions.keys()):
-        pos = eng.state.positions[sym]
-        out[sym] = {
-            "quantity": str(pos.quantity),
-            "avg_cost": str(pos.avg_cost),
-            "fees": str(pos.fees),
-            "realized_pnl": str(pos.realized_pnl),
-        }
-    return out
-
+def _replay_events(
+    events: Iterable[Mapping[str, Any]], *, ledger_backend: str = "decimal"
+) -> ReplayResult:
+    """
+    Replay normalized BETA_EXEC_V1 events through the selected ledger backend.
 
-def _replay_events(events: Iterable[Mapping[str, Any]]) -> ReplayResult:
+    ``ledger_backend``: ``decimal`` (LegacyLedgerEngine, default), ``fixed_point``
+    (scaled-int FixedPointLedgerEngine, identical results) or ``cross_check``
+    (both, asserting equal state after every event).
+    """
+    if ledger_backend not in LEDGER_BACKENDS:
+        raise ValueError(f"Unknown ledger backend {ledger_backend!r}; expected {LEDGER_BACKENDS}")
     normalized = [normalize_beta_exec_v1_event(e) for e in events]
     normalized = sorted(normalized, key=sort_key_beta_exec_v1)
 
     first_symbol = str(normalized[0].get("symbol") or "")
     _, quote = parse_symbol(first_symbol)
-    eng = LedgerEngine(quote_currency=quote)
+    eng = make_replay_ledger_engine(ledger_backend, quote_currency=quote)
 
     fills: List[Dict[str, Any]] = []
     for e in normalized:
@@ -55,7 +57,7 @@ def _replay_events(events: Iterable[Mapping[str, Any]]) -> ReplayResult:
         if str(e.get("event_type")) == "FILL":
             fills.append(dict(e))
 
-    return ReplayResult(fills=fills, positions=_compute_expected_positions_from_engine(eng))
+    return ReplayResult(fills=fills, positions=replay_positions_as_strings(eng))
 
 
 def replay_bundle(
@@ -65,10 +67,14 @@ def replay_bundle(
     resolve_datarefs: Optional[ResolutionMode] = None,
     cache_root: Optional[str | Path] = None,
     datarefs_generated_at_utc: Optional[str] = None,
+    ledger_backend: str = "decimal",
 ) -> int:
     """
     Deterministically replay a bundle.
 
+    ``ledger_backend`` selects the accounting backend (see :func:`_replay_events`);
+    ``fixed_point`` is the fast path for large bundles, ``cross_check`` verifies it.
+
     Exit codes:
       0: pass
       2: contract/schema violation
@@ -130,7 +136,7 @@ def replay_bundle(
     if not events:
         return 2
 
-    result = _replay_events(events)
+    result = _replay_events(events, ledger_backend=ledger_backend)
 
     if not check_outputs:
         return 0
@@ -158,11 +164,15 @@ def replay_bundle(
     return 0
 
 
-def replay_bundle_exit_code(bundle_path: str | Path, *, check_outputs: bool = False) -> int:
+def replay_bundle_exit_code(
+    bundle_path: str | Path, *, check_outputs: bool = False, ledger_backend: str = "decimal"
+) -> int:
     """
     Wrapper that maps ReplayMismatchError to exit code 4.
     """
     try:
-        return replay_bundle(bundle_path, check_outputs=check_outputs)
+        return replay_bundle(
+            bundle_path, check_outputs=check_outputs, ledger_backend=ledger_backend
+        )
     except ReplayMismatchError:
         return 4
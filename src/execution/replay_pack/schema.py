@@ -3,6 +3,7 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
 from typing import Any, Mapping, Sequence
 
 from .contract import (
@@ -43,6 +44,22 @@ def assert_lf_only_bytes(b: bytes, *, label: str) -> None:
         raise ContractViolationError(f"missing trailing LF in deterministic artifact: {label}")
 
 
+def assert_lf_only_file(path: Path, *, label: str, chunk_size: int = 1024 * 1024) -> None:
+    """
+    Chunked equivalent of :func:`assert_lf_only_bytes` (bounded memory for large files).
+    """
+    prev = b""
+    last = b""
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            if b"\r\n" in prev + chunk[:1] or b"\r\n" in chunk:
+                raise ContractViolationError(f"CRLF forbidden in deterministic artifacts: {label}")
+            prev = chunk[-1:]
+            last = chunk
+    if not last.endswith(b"\n"):
+        raise ContractViolationError(f"missing trailing LF in deterministic artifact: {label}")
+
+
 def _require_non_empty_str(d: Mapping[str, Any], key: str) -> str:
     v = d.get(key)
     if not isinstance(v, str) or not v.strip():
@@ -0,0 +1,671 @@
+from __future__ import annotations
+
+# Streaming / sharded replay for large replay packs.
+#
+# replay_bundle() materializes all events, sorts them and keeps every FILL in
+# memory for the compare step. This module replays the same bundle in bounded
+# memory:
+# - events are read line by line from events/execution_events.jsonl (the builder
+#   writes them in canonical sort_key_beta_exec_v1 order; out-of-order input is a
+#   contract violation here instead of being re-sorted)
+# - duplicate / monotonic-ts_sim checks run once in the parent. In canonical order
+#   identical duplicates share the whole sort key, so only the event digests of the
+#   current (run_id, session_id, ts_sim) group are retained (and checkpointed);
+#   memory stays bounded by the largest group, not by the event count
+# - FILL events are sharded by instrument (crc32(symbol) % workers) across worker
+#   processes; positions are per-symbol and shared accounts are additive, so
+#   merged shard results equal the sequential engine
+# - periodic checkpoints (fixed_point backend) allow resuming an interrupted replay
+# - expected fills are compared incrementally (lock-step + pending-by-event_id diff)
+#
+# Results (positions, compare invariants, diffs) are identical to replay_bundle /
+# generate_compare_report for canonical bundles.
+
+import hashlib
+import heapq
+import json
+import multiprocessing as mp
+import os
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from src.execution.beta_bridge.schema import normalize_beta_exec_v1_event, sort_key_beta_exec_v1
+from src.execution.ledger.engine_fixed_point import (
+    LEDGER_BACKENDS,
+    FixedPointLedgerEngine,
+    make_replay_ledger_engine,
+    replay_positions_as_strings,
+)
+from src.execution.ledger.quantization import parse_symbol
+
+from .canonical import dumps_canonical
+from .contract import (
+    ContractViolationError,
+    HashMismatchError,
+    ReplayMismatchError,
+)
+from .loader import load_replay_pack
+from .validator import validate_replay_pack
+
+STREAM_CHECKPOINT_SCHEMA_VERSION = "REPLAY_STREAM_CHECKPOINT_V1"
+
+DEFAULT_BATCH_SIZE = 2048
+# Bounded inter-process queues (batches in flight per shard) keep memory flat.
+_QUEUE_MAX_BATCHES = 8
+
+_REraisable = (ValueError, TypeError, AssertionError, ArithmeticError, KeyError)
+
+
+class NonCanonicalOrderError(ContractViolationError):
+    """Events or expected fills are not in canonical order (streaming cannot compare)."""
+
+
+class NoExecutionEventsError(ContractViolationError):
+    """The bundle contains no execution events."""
+
+
+def iter_jsonl_skip(path: Path, skip: int = 0) -> Iterator[Dict[str, Any]]:
+    """
+    Like :func:`canonical.iter_jsonl` but skips the first ``skip`` non-empty lines
+    without JSON-decoding them (resume from checkpoint).
+    """
+    seen = 0
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            seen += 1
+            if seen <= skip:
+                continue
+            yield json.loads(line)
+
+
+def shard_for_symbol(symbol: str, workers: int) -> int:
+    """Deterministic shard index (process-independent, unlike ``hash()``)."""
+    if workers <= 1:
+        return 0
+    return zlib.crc32(symbol.encode("utf-8")) % workers
+
+
+def _event_digest(ev: Mapping[str, Any]) -> str:
+    raw = json.dumps(ev, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+# =============================================================================
+# Incremental fills diff
+# =============================================================================
+
+
+class IncrementalFillsDiff:
+    """
+    Incremental equivalent of ``sorted(expected) == sorted(got)`` + ``compare._fills_diff``.
+
+    Both streams arrive in canonical order. Equality is decided lock-step; the
+    diff keeps only unmatched events (keyed by event_id) plus the ``sample_n``
+    smallest changed ids, so memory is bounded by the divergence, not the bundle.
+    """
+
+    def __init__(self, expected: Optional[Iterator[Dict[str, Any]]], *, sample_n: int = 5):
+        self._expected = expected
+        self.sample_n = int(sample_n)
+        self.enabled = expected is not None
+        self.equal = True
+        self.expected_count = 0
+        self.got_count = 0
+        self.changed_count = 0
+        self._last_expected_key: Optional[tuple] = None
+        self._pending_expected: Dict[str, Dict[str, Any]] = {}
+        self._pending_got: Dict[str, Dict[str, Any]] = {}
+        # max-heap (negated ordering via wrapper) of smallest changed ids.
+        self._changed: List[Tuple["_RevStr", Dict[str, Any], Dict[str, Any]]] = []
+
+    def _next_expected(self) -> Optional[Dict[str, Any]]:
+        if self._expected is None:
+            return None
+        raw = next(self._expected, None)
+        if raw is None:
+            self._expected = None
+            return None
+        ev = normalize_beta_exec_v1_event(raw)
+        key = sort_key_beta_exec_v1(ev)
+        if self._last_expected_key is not None and key < self._last_expected_key:
+            raise NonCanonicalOrderError(
+                "outputs/expected_fills.jsonl not in canonical order (streaming compare)"
+            )
+        self._last_expected_key = key
+        self.expected_count += 1
+        return ev
+
+    def add_got(self, ev: Dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+        self.got_count += 1
+        exp = self._next_expected()
+        if exp is None or exp != ev:
+            self.equal = False
+        if exp is not None:
+            self._match(exp, mine=self._pending_expected, other=self._pending_got, is_expected=True)
+        self._match(ev, mine=self._pending_got, other=self._pending_expected, is_expected=False)
+
+    def finish(self) -> None:
+        if not self.enabled:
+            return
+        while True:
+            exp = self._next_expected()
+            if exp is None:
+                break
+            self.equal = False
+            self._match(exp, mine=self._pending_expected, other=self._pending_got, is_expected=True)
+
+    def _match(
+        self,
+        ev: Dict[str, Any],
+        *,
+        mine: Dict[str, Dict[str, Any]],
+        other: Dict[str, Dict[str, Any]],
+        is_expected: bool,
+    ) -> None:
+        eid = str(ev.get("event_id") or "")
+        if not eid:
+            return
+        if eid in other:
+            counterpart = other.pop(eid)
+            exp, got = (ev, counterpart) if is_expected else (counterpart, ev)
+            if exp != got:
+                self.changed_count += 1
+                item = (_RevStr(eid), exp, got)
+                if len(self._changed) < self.sample_n:
+                    heapq.heappush(self._changed, item)
+                elif self._changed and item[0] > self._changed[0][0]:
+                    heapq.heapreplace(self._changed, item)
+        else:
+            mine[eid] = ev
+
+    def diff(self) -> Dict[str, Any]:
+        from .compare import _fills_diff
+
+        expected = list(self._pending_expected.values()) + [e for _, e, _ in self._changed]
+        got = list(self._pending_got.values()) + [g for _, _, g in self._changed]
+        out = _fills_diff(expected, got, sample_n=self.sample_n)
+        out["changed"] = int(self.changed_count)
+        return out
+
+    def passed(self) -> bool:
+        return self.equal and self.expected_count == self.got_count
+
+    # -- checkpoint support ---------------------------------------------------
+
+    def export_state(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "equal": self.equal,
+            "expected_count": self.expected_count,
+            "got_count": self.got_count,
+            "changed_count": self.changed_count,
+            "last_expected_key": list(self._last_expected_key)
+            if self._last_expected_key is not None
+            else None,
+            "pending_expected": self._pending_expected,
+            "pending_got": self._pending_got,
+            "changed_sample": [[str(i), e, g] for i, e, g in sorted(self._changed, reverse=True)],
+        }
+
+    def load_state(self, state: Mapping[str, Any], expected_path: Optional[Path]) -> None:
+        self.equal = bool(state["equal"])
+        self.expected_count = int(state["expected_count"])
+        self.got_count = int(state["got_count"])
+        self.changed_count = int(state["changed_count"])
+        lk = state.get("last_expected_key")
+        self._last_expected_key = tuple(lk) if lk is not None else None
+        self._pending_expected = dict(state.get("pending_expected") or {})
+        self._pending_got = dict(state.get("pending_got") or {})
+        self._changed = []
+        for i, e, g in state.get("changed_sample") or []:
+            heapq.heappush(self._changed, (_RevStr(str(i)), e, g))
+        if self.enabled and expected_path is not None:
+            self._expected = iter_jsonl_skip(expected_path, self.expected_count)
+
+
+class _RevStr(str):
+    """str with reversed ordering (heapq min-heap -> keeps the smallest ids)."""
+
+    def __lt__(self, other: str) -> bool:  # type: ignore[override]
+        return str.__gt__(self, other)
+
+    def __gt__(self, other: str) -> bool:  # type: ignore[override]
+        return str.__lt__(self, other)
+
+
+# =============================================================================
+# Ledger shards
+# =============================================================================
+
+
+def _new_shard_engine(backend: str, quote_currency: str) -> Any:
+    if backend == "fixed_point":
+        return FixedPointLedgerEngine(quote_currency=quote_currency, track_event_ids=False)
+    return make_replay_ledger_engine(backend, quote_currency=quote_currency)
+
+
+class _LocalShard:
+    """In-process shard (workers=1)."""
+
+    def __init__(self, backend: str, quote_currency: str, state: Optional[Mapping[str, Any]]):
+        self.backend = backend
+        self.engine = _new_shard_engine(backend, quote_currency)
+        if state is not None:
+            self.engine.load_state(state)
+
+    def submit(self, batch: List[Dict[str, Any]]) -> None:
+        for ev in batch:
+            self.engine.apply(ev)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return self.engine.export_state()
+
+    def close(self) -> Dict[str, Dict[str, str]]:
+        return replay_positions_as_strings(self.engine)
+
+
+def _shard_worker_main(
+    in_q: Any, out_q: Any, backend: str, quote_currency: str, state: Optional[Dict[str, Any]]
+) -> None:
+    failure: Optional[Tuple[str, str]] = None
+    try:
+        shard: Optional[_LocalShard] = _LocalShard(backend, quote_currency, state)
+    except Exception as ex:  # noqa: BLE001
+        shard = None
+        failure = (type(ex).__name__, str(ex))
+    while True:
+        kind, payload = in_q.get()
+        if kind == "events":
+            if failure is None and shard is not None:
+                try:
+                    shard.submit(payload)
+                except Exception as ex:  # noqa: BLE001
+                    failure = (type(ex).__name__, str(ex))
+            continue
+        if failure is not None or shard is None:
+            out_q.put(("error", failure))
+            if kind == "close":
+                return
+            continue
+        if kind == "snapshot":
+            out_q.put(("state", shard.snapshot()))
+        elif kind == "close":
+            out_q.put(("positions", shard.close()))
+            return
+
+
+def _reraise_worker_error(failure: Tuple[str, str]) -> None:
+    name, msg = failure
+    for exc_type in _REraisable + (OverflowError,):
+        if exc_type.__name__ == name:
+            raise exc_type(msg)
+    raise RuntimeError(f"replay shard failed: {name}: {msg}")
+
+
+class _ProcessShard:
+    """Shard running its own ledger engine in a worker process."""
+
+    def __init__(self, backend: str, quote_currency: str, state: Optional[Dict[str, Any]]):
+        ctx = mp.get_context()
+        self._in = ctx.Queue(maxsize=_QUEUE_MAX_BATCHES)
+        self._out = ctx.Queue()
+        self._proc = ctx.Process(
+            target=_shard_worker_main,
+            args=(self._in, self._out, backend, quote_currency, state),
+            daemon=True,
+        )
+        self._proc.start()
+
+    def submit(self, batch: List[Dict[str, Any]]) -> None:
+        self._in.put(("events", batch))
+
+    def _request(self, kind: str) -> Any:
+        self._in.put((kind, None))
+        tag, payload = self._out.get()
+        if tag == "error":
+            self._terminate()
+            _reraise_worker_error(payload)
+        return payload
+
+    def snapshot(self) -> Dict[str, Any]:
+        return self._request("snapshot")
+
+    def close(self) -> Dict[str, Dict[str, str]]:
+        try:
+            return self._request("close")
+        finally:
+            self._proc.join(timeout=10)
+
+    def _terminate(self) -> None:
+        if self._proc.is_alive():
+            self._proc.terminate()
+        self._proc.join(timeout=10)
+
+
+def _split_engine_state(state: Mapping[str, Any], workers: int) -> List[Dict[str, Any]]:
+    """Split a merged fixed-point state into per-shard states (inverse of merge)."""
+    out: List[Dict[str, Any]] = []
+    for i in range(workers):
+        out.append(
+            {
+                "quote_currency": state["quote_currency"],
+                "last_ts_sim": state["last_ts_sim"],
+                "accounts": {},
+                "positions": {},
+            }
+        )
+    positions = dict(state.get("positions") or {})
+    for sym, row in positions.items():
+        out[shard_for_symbol(sym, workers)]["positions"][sym] = row
+    for acct, val in dict(state.get("accounts") or {}).items():
+        # INVENTORY_COST:<symbol>:<quote> belongs to the symbol's shard; shared
+        # accounts (cash/fees/realized) start on shard 0 (shard sums are additive).
+        idx = 0
+        if acct.startswith("INVENTORY_COST:"):
+            sym = acct[len("INVENTORY_COST:") : acct.rindex(":")]
+            idx = shard_for_symbol(sym, workers)
+        out[idx]["accounts"][acct] = val
+    return out
+
+
+def _merge_engine_states(states: List[Mapping[str, Any]], quote_currency: str, last_ts: int):
+    accounts: Dict[str, int] = {}
+    positions: Dict[str, Any] = {}
+    for st in states:
+        for k, v in dict(st.get("accounts") or {}).items():
+            accounts[k] = accounts.get(k, 0) + int(v)
+        positions.update(dict(st.get("positions") or {}))
+    return {
+        "quote_currency": quote_currency,
+        "last_ts_sim": last_ts,
+        "accounts": {k: accounts[k] for k in sorted(accounts)},
+        "positions": {k: positions[k] for k in sorted(positions)},
+    }
+
+
+# =============================================================================
+# Streaming replay
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class StreamingReplayResult:
+    positions: Dict[str, Dict[str, str]]
+    events_consumed: int
+    fills_count: int
+    fills_status: str  # PASS | FAIL | SKIP
+    positions_status: str  # PASS | FAIL | SKIP
+    fills_diff: Dict[str, Any]
+    positions_diff: Dict[str, Any]
+    checkpoints_written: int
+    resumed_from: int
+    accounts: Optional[Dict[str, int]] = None
+
+
+def _empty_diff() -> Dict[str, Any]:
+    return {"added": 0, "removed": 0, "changed": 0, "sample": []}
+
+
+def _write_checkpoint(path: Path, doc: Mapping[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8", newline="\n") as f:
+        f.write(dumps_canonical(doc))
+        f.write("\n")
+    os.replace(tmp, path)
+
+
+def stream_replay(
+    bundle_path: str | Path,
+    *,
+    check_outputs: bool = False,
+    ledger_backend: str = "fixed_point",
+    workers: int = 1,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    checkpoint_path: Optional[str | Path] = None,
+    checkpoint_every: int = 0,
+    resume: bool = False,
+    sample_n: int = 5,
+) -> StreamingReplayResult:
+    """
+    Replay a (validated) bundle incrementally.
+
+    - ``workers > 1`` shards instruments across processes.
+    - ``checkpoint_path`` + ``checkpoint_every`` (events) write resumable
+      checkpoints (``fixed_point`` backend only); ``resume=True`` continues from an
+      existing checkpoint.
+
+    Raises the same ledger errors as :func:`runner._replay_events`,
+    :class:`NoExecutionEventsError` for empty bundles and :class:`NonCanonicalOrderError`
+    for non-canonically ordered events or expected fills.
+    Conflicting duplicate event_ids are detected within a (run_id, session_id,
+    ts_sim) group; canonical bundles carry no duplicates (the builder dedupes).
+    """
+    if ledger_backend not in LEDGER_BACKENDS:
+        raise ValueError(f"Unknown ledger backend {ledger_backend!r}; expected {LEDGER_BACKENDS}")
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    if checkpoint_path is not None and ledger_backend != "fixed_point":
+        raise ValueError("checkpoints require ledger_backend='fixed_point'")
+
+    bundle = load_replay_pack(bundle_path)
+    events_path = bundle.path("events/execution_events.jsonl")
+    expected_fills_path = bundle.path("outputs/expected_fills.jsonl")
+    expected_positions = bundle.expected_positions() if check_outputs else None
+    has_expected_fills = check_outputs and expected_fills_path.exists()
+    ckpt_path = Path(checkpoint_path) if checkpoint_path is not None else None
+
+    fills = IncrementalFillsDiff(
+        iter_jsonl_skip(expected_fills_path) if has_expected_fills else None, sample_n=sample_n
+    )
+
+    ckpt: Optional[Dict[str, Any]] = None
+    if resume and ckpt_path is not None and ckpt_path.exists():
+        ckpt = json.loads(ckpt_path.read_text(encoding="utf-8"))
+        if ckpt.get("schema_version") != STREAM_CHECKPOINT_SCHEMA_VERSION:
+            raise ContractViolationError("unsupported replay checkpoint schema_version")
+        if ckpt.get("bundle_id") != str(bundle.manifest.get("bundle_id") or ""):
+            raise ContractViolationError("replay checkpoint belongs to a different bundle")
+        if bool(ckpt.get("check_outputs")) != bool(check_outputs):
+            raise ContractViolationError("replay checkpoint check_outputs mismatch")
+        fills.load_state(ckpt["fills"], expected_fills_path if has_expected_fills else None)
+
+    skip = int(ckpt["events_consumed"]) if ckpt is not None else 0
+    consumed = skip
+    fills_count = int(ckpt["fills_count"]) if ckpt is not None else 0
+    last_key: Optional[tuple] = tuple(ckpt["last_key"]) if ckpt and ckpt["last_key"] else None
+    last_ts = int(ckpt["last_ts_sim"]) if ckpt is not None else -1
+    # event_id -> digest for the current (run_id, session_id, ts_sim) group only
+    seen: Dict[str, str] = dict(ckpt["seen"]) if ckpt is not None else {}
+    seen_group: Optional[tuple] = last_key[:3] if last_key is not None else None
+    quote: Optional[str] = ckpt.get("quote_currency") if ckpt is not None else None
+
+    shards: List[Any] = []
+    batches: List[List[Dict[str, Any]]] = []
+    checkpoints_written = 0
+
+    def _start_shards(q: str, state: Optional[Mapping[str, Any]]) -> None:
+        split = _split_engine_state(state, workers) if state is not None else [None] * workers
+        for i in range(workers):
+            if workers == 1:
+                shards.append(_LocalShard(ledger_backend, q, split[i]))
+            else:
+                shards.append(_ProcessShard(ledger_backend, q, split[i]))
+            batches.append([])
+
+    def _flush(i: int) -> None:
+        if batches[i]:
+            shards[i].submit(batches[i])
+            batches[i] = []
+
+    def _checkpoint() -> None:
+        nonlocal checkpoints_written
+        assert ckpt_path is not None and quote is not None
+        for i in range(workers):
+            _flush(i)
+        state = _merge_engine_states([s.snapshot() for s in shards], quote, last_ts)
+        _write_checkpoint(
+            ckpt_path,
+            {
+                "schema_version": STREAM_CHECKPOINT_SCHEMA_VERSION,
+                "bundle_id": str(bundle.manifest.get("bundle_id") or ""),
+                "check_outputs": bool(check_outputs),
+                "events_consumed": consumed,
+                "fills_count": fills_count,
+                "last_key": list(last_key) if last_key is not None else None,
+                "last_ts_sim": last_ts,
+                "quote_currency": quote,
+                "engine": state,
+                "seen": seen,
+                "fills": fills.export_state(),
+            },
+        )
+        checkpoints_written += 1
+
+    if quote is not None:
+        _start_shards(quote, ckpt["engine"] if ckpt is not None else None)
+
+    try:
+        for raw in iter_jsonl_skip(events_path, skip):
+            ev = normalize_beta_exec_v1_event(raw)
+            key = sort_key_beta_exec_v1(ev)
+            if last_key is not None and key < last_key:
+                raise NonCanonicalOrderError(
+                    "events/execution_events.jsonl not in canonical order (streaming replay)"
+                )
+            last_key = key
+            consumed += 1
+            if key[:3] != seen_group:
+                seen.clear()
+                seen_group = key[:3]
+
+            if quote is None:
+                _, quote = parse_symbol(str(ev.get("symbol") or ""))
+                _start_shards(quote, None)
+
+            eid = ev["event_id"]
+            digest = _event_digest(ev)
+            prior = seen.get(eid)
+            duplicate = False
+            if prior is not None:
+                if prior != digest:
+                    raise ValueError(f"Conflicting duplicate event_id detected: {eid}")
+                duplicate = True
+            else:
+                ts_sim = int(ev["ts_sim"])
+                if ts_sim < last_ts:
+                    raise ValueError(f"Non-monotonic ts_sim: {ts_sim} < {last_ts}")
+                last_ts = ts_sim
+                seen[eid] = digest
+
+            if ev.get("event_type") == "FILL":
+                fills_count += 1
+                fills.add_got(ev)
+                if not duplicate:
+                    idx = shard_for_symbol(str(ev.get("symbol") or ""), workers)
+                    batches[idx].append(ev)
+                    if len(batches[idx]) >= batch_size:
+                        _flush(idx)
+
+            if ckpt_path is not None and checkpoint_every > 0 and consumed % checkpoint_every == 0:
+                _checkpoint()
+
+        if consumed == 0:
+            raise NoExecutionEventsError("no execution events in bundle")
+
+        for i in range(workers):
+            _flush(i)
+        accounts: Optional[Dict[str, int]] = None
+        if ledger_backend == "fixed_point":
+            merged = _merge_engine_states([s.snapshot() for s in shards], quote or "", last_ts)
+            accounts = dict(merged["accounts"])
+        positions: Dict[str, Dict[str, str]] = {}
+        for s in shards:
+            positions.update(s.close())
+        positions = {k: positions[k] for k in sorted(positions)}
+    except BaseException:
+        for s in shards:
+            if isinstance(s, _ProcessShard):
+                s._terminate()
+        raise
+
+    fills.finish()
+
+    from .compare import _positions_diff
+
+    fills_status = "SKIP"
+    pos_status = "SKIP"
+    fills_diff = _empty_diff()
+    positions_diff = _empty_diff()
+    if check_outputs and (has_expected_fills or expected_positions is not None):
+        if has_expected_fills:
+            fills_status = "PASS" if fills.passed() else "FAIL"
+            fills_diff = fills.diff()
+        if expected_positions is not None:
+            pos_status = "PASS" if expected_positions == positions else "FAIL"
+            positions_diff = _positions_diff(expected_positions, positions, sample_n=sample_n)
+
+    return StreamingReplayResult(
+        positions=positions,
+        events_consumed=consumed,
+        fills_count=fills_count,
+        fills_status=fills_status,
+        positions_status=pos_status,
+        fills_diff=fills_diff,
+        positions_diff=positions_diff,
+        checkpoints_written=checkpoints_written,
+        resumed_from=skip,
+        accounts=accounts,
+    )
+
+
+def replay_bundle_streaming(
+    bundle_path: str | Path,
+    *,
+    check_outputs: bool = False,
+    ledger_backend: str = "fixed_point",
+    workers: int = 1,
+    checkpoint_path: Optional[str | Path] = None,
+    checkpoint_every: int = 0,
+    resume: bool = False,
+) -> int:
+    """
+    Streaming counterpart of :func:`runner.replay_bundle` (same exit codes).
+
+    Market data ref resolution is not part of the streaming path; use
+    ``replay_bundle(..., resolve_datarefs=...)`` for that.
+    """
+    try:
+        validate_replay_pack(bundle_path)
+    except HashMismatchError:
+        return 3
+    except ContractViolationError:
+        return 2
+    except Exception:
+        return 5
+
+    try:
+        result = stream_replay(
+            bundle_path,
+            check_outputs=check_outputs,
+            ledger_backend=ledger_backend,
+            workers=workers,
+            checkpoint_path=checkpoint_path,
+            checkpoint_every=checkpoint_every,
+            resume=resume,
+        )
+    except ContractViolationError:
+        return 2
+
+    if result.fills_status == "FAIL":
+        raise ReplayMismatchError("fills mismatch vs outputs/expected_fills.jsonl")
+    if result.positions_status == "FAIL":
+        raise ReplayMismatchError("positions mismatch vs outputs/expected_positions.json")
+    return 0
@@ -18,6 +18,7 @@ from .contract import (
 from .hashing import collect_files_for_hashing, parse_sha256sums_text, sha256_file
 from .schema import (
     assert_lf_only_bytes,
+    assert_lf_only_file,
     assert_no_floats,
     validate_execution_event_object_strict,
     validate_market_data_refs_document_strict,
@@ -136,7 +137,7 @@ def validate_replay_pack(bundle_path: str | Path) -> ValidationReport:
 
     # Event ordering invariant check: (event_time_utc, seq) strictly increasing.
     ev_path = root / "events" / "execution_events.jsonl"
-    assert_lf_only_bytes(ev_path.read_bytes(), label="execution_events.jsonl")
+    assert_lf_only_file(ev_path, label="execution_events.jsonl")
     last: Tuple[datetime, int] | None = None
     expected_seq = 0
     with open(ev_path, "r", encoding="utf-8") as f:
@@ -193,7 +194,7 @@ def validate_replay_pack(bundle_path: str | Path) -> ValidationReport:
 
         ent_path = root / "ledger" / "ledger_fifo_entries.jsonl"
         if ent_path.exists():
-            assert_lf_only_bytes(ent_path.read_bytes(), label="ledger_fifo_entries.jsonl")
+            assert_lf_only_file(ent_path, label="ledger_fifo_entries.jsonl")
             with open(ent_path, "r", encoding="utf-8") as f:
                 for line_no, line in enumerate(f, start=1):
                     if not line.strip():
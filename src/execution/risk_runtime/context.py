@@ -123,16 +123,17 @@ def build_context_snapshot(
     if order_ledger:
         snapshot.total_orders_count = order_ledger.get_order_count()
 
-        # Count active orders (not terminal)
-        active_orders = order_ledger.get_active_orders()
-        snapshot.active_orders_count = len(active_orders)
-
-        # Count open orders (CREATED/SUBMITTED/ACKNOWLEDGED)
+        # Count active / open orders from the ledger's state counters (no scan)
         from src.execution.contracts import OrderState
 
+        state_counts = order_ledger.get_state_counts()
+        snapshot.active_orders_count = sum(
+            count for state, count in state_counts.items() if state.is_active()
+        )
+
+        # Count open orders (CREATED/SUBMITTED/ACKNOWLEDGED)
         open_states = {OrderState.CREATED, OrderState.SUBMITTED, OrderState.ACKNOWLEDGED}
-        open_orders = [o for o in order_ledger.get_all_orders() if o.state in open_states]
-        snapshot.open_orders_count = len(open_orders)
+        snapshot.open_orders_count = sum(state_counts.get(state, 0) for state in open_states)
 
     # Extract position state from position_ledger (if provided)
     if position_ledger:
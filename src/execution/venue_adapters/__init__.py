@@ -19,7 +19,11 @@ from src.execution.venue_adapters.fill_models import (
     FixedFeeModel,
     SlippageModel,
     FixedSlippageModel,
+    DepthAwareFillModel,
+    OrderArrays,
+    OrderBookDepth,
 )
+from src.execution.venue_adapters.batch import BatchFills, simulate_fills
 
 __all__ = [
     # Base
@@ -36,4 +40,10 @@ __all__ = [
     "FixedFeeModel",
     "SlippageModel",
     "FixedSlippageModel",
+    "DepthAwareFillModel",
+    "OrderArrays",
+    "OrderBookDepth",
+    # Batch simulation
+    "BatchFills",
+    "simulate_fills",
 ]
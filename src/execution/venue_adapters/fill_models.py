@@ -9,15 +9,152 @@ Design Goals:
 - Realistic: Simulates real market conditions (within reason)
 
 IMPORTANT: NO randomness. All calculations must be deterministic.
+
+Batch API:
+- ``OrderArrays`` holds orders column-wise (numpy); the models' ``*_array`` kernels
+  compute fill prices / fees / slippage for all rows in one vectorized pass.
+- Quantization to 8 decimals is done on the scaled float64 values; rows whose
+  value lies too close to a rounding boundary (or beyond float precision) are
+  recomputed with the scalar Decimal path (see :func:`quantize_e8_guarded`), so
+  batch results are identical to the scalar methods.
+- ``DepthAwareFillModel`` walks an order book snapshot (VWAP over levels).
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Protocol
+from typing import Callable, Dict, List, Optional, Protocol, Sequence, Tuple
+
+import numpy as np
 
 from src.execution.contracts import Order, OrderType, OrderSide
 
+QUANT_EXP = 8
+_SCALE = float(10**QUANT_EXP)
+# Float64 products of a few factors carry < 1e-15 relative error; scaled values
+# closer to a rounding boundary than this are recomputed exactly.
+_GUARD_REL = 2e-14
+_GUARD_MAX = float(2**52)
+
+
+# ============================================================================
+# Columnar batch helpers
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class OrderArrays:
+    """
+    Orders in columnar form for vectorized fill simulation.
+
+    Attributes:
+        symbols: Symbol per row (object array)
+        is_buy: True for BUY, False for SELL
+        is_limit: True for LIMIT orders (others use market rules)
+        quantity: Order quantity (float64)
+        limit_price: Limit price (float64, NaN if unset)
+    """
+
+    symbols: np.ndarray
+    is_buy: np.ndarray
+    is_limit: np.ndarray
+    quantity: np.ndarray
+    limit_price: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.is_buy.shape[0])
+
+    @classmethod
+    def from_orders(cls, orders: Sequence[Order]) -> "OrderArrays":
+        """Build columns from Order objects."""
+        n = len(orders)
+        return cls(
+            symbols=np.array([o.symbol for o in orders], dtype=object),
+            is_buy=np.fromiter((o.side == OrderSide.BUY for o in orders), dtype=bool, count=n),
+            is_limit=np.fromiter(
+                (o.order_type == OrderType.LIMIT for o in orders), dtype=bool, count=n
+            ),
+            quantity=_to_float_array([o.quantity for o in orders]),
+            limit_price=np.fromiter(
+                (float(o.price) if o.price is not None else np.nan for o in orders),
+                dtype=np.float64,
+                count=n,
+            ),
+        )
+
+    def order(self, i: int) -> Order:
+        """Row ``i`` as an Order (exact decimal values via the shortest float repr)."""
+        limit = self.limit_price[i]
+        return Order(
+            client_order_id=f"row_{i}",
+            symbol=str(self.symbols[i]),
+            side=OrderSide.BUY if self.is_buy[i] else OrderSide.SELL,
+            order_type=OrderType.LIMIT if self.is_limit[i] else OrderType.MARKET,
+            quantity=float_to_decimal(self.quantity[i]),
+            price=None if np.isnan(limit) else float_to_decimal(limit),
+        )
+
+
+def float_to_decimal(x: float) -> Decimal:
+    """Decimal with the shortest repr of ``x`` (e.g. 0.1 → Decimal("0.1"))."""
+    return Decimal(repr(float(x)))
+
+
+def _to_float_array(values: Sequence[Decimal]) -> np.ndarray:
+    return np.fromiter((float(v) for v in values), dtype=np.float64, count=len(values))
+
+
+def quantize_e8_guarded(
+    values: np.ndarray, exact: Callable[[int], Decimal]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Round float64 values to 8 decimals as scaled int64 (value * 1e8).
+
+    Rows where float rounding could differ from Decimal ``quantize`` (near ties,
+    huge or non-finite values) are taken from ``exact(i)`` instead.
+
+    Returns:
+        (int64 scaled values, mask of rows computed exactly)
+    """
+    scaled = np.asarray(values, dtype=np.float64) * _SCALE
+    with np.errstate(invalid="ignore"):
+        frac_dist = np.abs(np.abs(scaled - np.floor(scaled)) - 0.5)
+        unsafe = ~np.isfinite(scaled) | (np.abs(scaled) >= _GUARD_MAX)
+        unsafe |= frac_dist <= np.abs(scaled) * _GUARD_REL + 1e-6
+    out = np.where(unsafe, 0.0, np.rint(scaled)).astype(np.int64)
+    for i in np.flatnonzero(unsafe):
+        out[i] = int(exact(int(i)).scaleb(QUANT_EXP))
+    return out, unsafe
+
+
+def e8_to_decimals(values: np.ndarray) -> List[Decimal]:
+    """Scaled int64 (1e-8 units) → Decimals with exponent -8 (as ``quantize`` yields)."""
+    return [Decimal(v).scaleb(-QUANT_EXP) for v in values.tolist()]
+
+
+def _slip_and_limit(
+    ref: np.ndarray, bps: np.ndarray, is_buy: np.ndarray, is_limit: np.ndarray, limit: np.ndarray
+) -> np.ndarray:
+    """Vectorized ImmediateFillModel price rule on reference prices ``ref``."""
+    factor = np.asarray(bps, dtype=np.float64) / 10000.0
+    price = np.where(is_buy, ref * (1.0 + factor), ref * (1.0 - factor))
+    return np.where(
+        is_limit,
+        np.where(is_buy, np.fmin(limit, price), np.fmax(limit, price)),
+        price,
+    )
+
+
+def _check_limit_prices(orders: OrderArrays) -> None:
+    if bool(np.any(orders.is_limit & np.isnan(orders.limit_price))):
+        raise ValueError("LIMIT order must have price")
+
+
+# ============================================================================
+# Fill models
+# ============================================================================
+
 
 class FillModel(Protocol):
     """
@@ -99,6 +236,25 @@ class ImmediateFillModel:
         # Round to 8 decimals (crypto standard)
         return fill_price.quantize(Decimal("0.00000001"))
 
+    def fill_prices_array(
+        self, orders: OrderArrays, market_price: np.ndarray, slippage_bps: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized fill prices (unquantized float64).
+
+        Returns:
+            (fill prices, fillable mask — always True for immediate fills)
+        """
+        _check_limit_prices(orders)
+        price = _slip_and_limit(
+            np.asarray(market_price, dtype=np.float64),
+            slippage_bps,
+            orders.is_buy,
+            orders.is_limit,
+            orders.limit_price,
+        )
+        return price, np.ones(len(orders), dtype=bool)
+
 
 class FeeModel(Protocol):
     """
@@ -149,6 +305,10 @@ class FixedFeeModel:
         # Round to 8 decimals
         return fee.quantize(Decimal("0.00000001"))
 
+    def fees_array(self, fill_qty: np.ndarray, fill_price: np.ndarray) -> np.ndarray:
+        """Vectorized fees (unquantized float64)."""
+        return fill_qty * fill_price * float(self.fee_rate)
+
 
 class SlippageModel(Protocol):
     """
@@ -194,3 +354,173 @@ class FixedSlippageModel:
     def calculate_slippage_bps(self, order: Order) -> int:
         """Return fixed slippage (deterministic)."""
         return self.slippage_bps
+
+    def slippage_bps_array(self, orders: OrderArrays) -> np.ndarray:
+        """Vectorized slippage (int64 bps per row)."""
+        return np.full(len(orders), self.slippage_bps, dtype=np.int64)
+
+
+# ============================================================================
+# Order book depth
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class OrderBookDepth:
+    """
+    Order book snapshot for one symbol.
+
+    Attributes:
+        bids: (price, size) levels, best (highest) first
+        asks: (price, size) levels, best (lowest) first
+    """
+
+    bids: Tuple[Tuple[Decimal, Decimal], ...] = ()
+    asks: Tuple[Tuple[Decimal, Decimal], ...] = ()
+    _arrays: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def levels(self, side: OrderSide) -> Tuple[Tuple[Decimal, Decimal], ...]:
+        """Levels an order on ``side`` consumes (BUY → asks, SELL → bids)."""
+        return self.asks if side == OrderSide.BUY else self.bids
+
+    def cumulative(self, side: OrderSide) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(level prices, cumulative size, cumulative notional) as float64 arrays."""
+        key = side.value
+        cached = self._arrays.get(key)
+        if cached is None:
+            lv = self.levels(side)
+            prices = np.array([float(p) for p, _ in lv], dtype=np.float64)
+            sizes = np.array([float(q) for _, q in lv], dtype=np.float64)
+            cached = (prices, np.cumsum(sizes), np.cumsum(prices * sizes))
+            self._arrays[key] = cached
+        return cached
+
+
+class DepthAwareFillModel:
+    """
+    Order-book-depth-aware fill model (deterministic).
+
+    Rules:
+    - Orders walk the opposite side of the book; the reference price is the VWAP
+      of the consumed levels (LIMIT orders only consume levels within the limit)
+    - Slippage (bps) and the LIMIT cap are applied on top, as in ImmediateFillModel
+    - Insufficient depth → ValueError (the simulated adapter turns this into a
+      REJECT; use :meth:`calculate_fill` for the fillable quantity)
+    - Symbols without a book fall back to ImmediateFillModel on the market price
+    """
+
+    def __init__(self, books: Optional[Dict[str, OrderBookDepth]] = None):
+        self.books: Dict[str, OrderBookDepth] = dict(books or {})
+        self._immediate = ImmediateFillModel()
+
+    def set_book(self, symbol: str, book: OrderBookDepth) -> None:
+        """Replace the order book snapshot for ``symbol``."""
+        self.books[symbol] = book
+
+    def calculate_fill(self, order: Order, market_price: Decimal) -> Tuple[Decimal, Decimal]:
+        """
+        Walk the book for ``order``.
+
+        Returns:
+            (fillable quantity, VWAP of the consumed levels); VWAP is 0 if nothing fills
+        """
+        book = self.books.get(order.symbol)
+        if book is None:
+            return order.quantity, market_price
+        remaining = order.quantity
+        notional = Decimal(0)
+        for price, size in book.levels(order.side):
+            if order.order_type == OrderType.LIMIT and order.price is not None:
+                if (order.side == OrderSide.BUY and price > order.price) or (
+                    order.side == OrderSide.SELL and price < order.price
+                ):
+                    break
+            take = min(remaining, size)
+            notional += take * price
+            remaining -= take
+            if remaining <= 0:
+                break
+        filled = order.quantity - remaining
+        if filled <= 0:
+            return Decimal(0), Decimal(0)
+        return filled, notional / filled
+
+    def calculate_fill_price(
+        self, order: Order, market_price: Decimal, slippage_bps: int = 0
+    ) -> Decimal:
+        """Calculate fill price (VWAP over book levels + slippage)."""
+        filled, vwap = self.calculate_fill(order, market_price)
+        if filled < order.quantity:
+            raise ValueError(
+                f"Insufficient book depth for {order.symbol}: "
+                f"fillable={filled} requested={order.quantity}"
+            )
+        return self._immediate.calculate_fill_price(order, vwap, slippage_bps)
+
+    def fill_prices_array(
+        self,
+        orders: OrderArrays,
+        market_price: np.ndarray,
+        slippage_bps: np.ndarray,
+        *,
+        exact_fillable: Optional[Callable[[int], bool]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized fill prices (unquantized float64) via cumulative book depth.
+
+        ``exact_fillable(i)`` decides rows whose quantity equals the available depth
+        within float precision (defaults to the float comparison).
+
+        Returns:
+            (fill prices, fully-fillable mask); prices of unfillable rows are undefined
+        """
+        _check_limit_prices(orders)
+        qty = orders.quantity
+        ref = np.array(market_price, dtype=np.float64)
+        ok = np.ones(len(orders), dtype=bool)
+
+        for symbol, book in self.books.items():
+            on_symbol = orders.symbols == symbol
+            if not bool(np.any(on_symbol)):
+                continue
+            for buy in (True, False):
+                idx = np.flatnonzero(on_symbol & (orders.is_buy == buy))
+                if idx.size == 0:
+                    continue
+                prices, cum_size, cum_notional = book.cumulative(
+                    OrderSide.BUY if buy else OrderSide.SELL
+                )
+                if prices.size == 0:
+                    ok[idx] = False
+                    continue
+                q = qty[idx]
+                # Depth available within the limit price (all levels for MARKET).
+                n_levels = np.full(idx.size, prices.size, dtype=np.intp)
+                lim_rows = orders.is_limit[idx]
+                if bool(np.any(lim_rows)):
+                    lim = orders.limit_price[idx][lim_rows]
+                    if buy:
+                        n_levels[lim_rows] = np.searchsorted(prices, lim, side="right")
+                    else:
+                        n_levels[lim_rows] = np.searchsorted(-prices, -lim, side="right")
+                depth = np.where(n_levels > 0, cum_size[np.maximum(n_levels - 1, 0)], 0.0)
+                fillable = q <= depth
+                if exact_fillable is not None:
+                    near = np.abs(q - depth) <= np.maximum(q, depth) * _GUARD_REL
+                    for j in np.flatnonzero(near):
+                        fillable[j] = exact_fillable(int(idx[j]))
+                # Level where the order completes, then partial take of that level.
+                k = np.minimum(np.searchsorted(cum_size, q, side="left"), prices.size - 1)
+                prev_size = np.where(k > 0, cum_size[np.maximum(k - 1, 0)], 0.0)
+                prev_notional = np.where(k > 0, cum_notional[np.maximum(k - 1, 0)], 0.0)
+                notional = prev_notional + (q - prev_size) * prices[k]
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    ref[idx] = np.where(q > 0, notional / q, ref[idx])
+                ok[idx] = fillable
+
+        price = _slip_and_limit(
+            ref, slippage_bps, orders.is_buy, orders.is_limit, orders.limit_price
+        )
+        return price, ok
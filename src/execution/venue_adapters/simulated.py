@@ -17,11 +17,14 @@ from __future__ import annotations
 import logging
 from datetime import datetime
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
 
 from src.execution.contracts import Order, OrderSide, OrderType, Fill
 from src.execution.orchestrator import ExecutionEvent
 from src.execution.venue_adapters.base import VenueAdapterError
+from src.execution.venue_adapters.batch import BatchFills, simulate_fills
 from src.execution.venue_adapters.fill_models import (
     FillModel,
     ImmediateFillModel,
@@ -29,6 +32,7 @@ from src.execution.venue_adapters.fill_models import (
     FixedFeeModel,
     SlippageModel,
     FixedSlippageModel,
+    OrderArrays,
 )
 
 logger = logging.getLogger(__name__)
@@ -204,6 +208,142 @@ class SimulatedVenueAdapter:
 
         return event
 
+    def execute_orders(
+        self, orders: Sequence[Order], idempotency_keys: Sequence[str]
+    ) -> List[ExecutionEvent]:
+        """
+        Execute a batch of orders (vectorized fill/fee/slippage computation).
+
+        Same per-order results as calling :meth:`execute_order` for each order in
+        sequence (idempotency across and within the batch, validation, REJECT on
+        fill errors); fill prices and fees are computed in one vectorized pass
+        (:func:`batch.simulate_fills`). Events of one batch share a timestamp.
+
+        Args:
+            orders: Orders to execute
+            idempotency_keys: One idempotency key per order
+
+        Returns:
+            ExecutionEvent per order (same order as input)
+        """
+        if len(orders) != len(idempotency_keys):
+            raise VenueAdapterError("orders and idempotency_keys must have the same length")
+
+        now = datetime.utcnow()
+        results: List[Optional[ExecutionEvent]] = [None] * len(orders)
+        first_in_batch: Dict[str, int] = {}
+        duplicates: List[tuple] = []
+        pending: List[int] = []
+
+        for i, (order, key) in enumerate(zip(orders, idempotency_keys)):
+            cached = self._idempotency_cache.get(key)
+            if cached is not None:
+                results[i] = cached
+                continue
+            if key in first_in_batch:
+                duplicates.append((i, first_in_batch[key]))
+                continue
+            first_in_batch[key] = i
+
+            validation_error = self._validate_order(order)
+            if validation_error:
+                results[i] = ExecutionEvent(
+                    event_type="REJECT",
+                    order_id=order.client_order_id,
+                    reject_reason=validation_error,
+                    timestamp=now,
+                )
+            elif not self.enable_fills:
+                results[i] = ExecutionEvent(
+                    event_type="ACK",
+                    order_id=order.client_order_id,
+                    exchange_order_id=f"sim_ack_{order.client_order_id}",
+                    timestamp=now,
+                )
+            else:
+                pending.append(i)
+
+        if pending:
+            batch = [orders[i] for i in pending]
+            market_prices = [self._get_market_price(o.symbol) for o in batch]
+            result = simulate_fills(
+                OrderArrays.from_orders(batch),
+                np.fromiter((float(p) for p in market_prices), dtype=np.float64),
+                fill_model=self.fill_model,
+                fee_model=self.fee_model,
+                slippage_model=self.slippage_model,
+                source_orders=batch,
+                source_prices=market_prices,
+            )
+            prices = result.fill_prices_decimal()
+            fees = result.fees_decimal()
+
+            for j, i in enumerate(pending):
+                order = batch[j]
+                if not result.filled[j]:
+                    logger.error(
+                        f"[SIMULATED ADAPTER] Fill price calculation failed: {result.errors[j]}"
+                    )
+                    results[i] = ExecutionEvent(
+                        event_type="REJECT",
+                        order_id=order.client_order_id,
+                        reject_reason=f"Fill calculation error: {result.errors[j]}",
+                        timestamp=now,
+                    )
+                    continue
+                fill = Fill(
+                    fill_id=f"sim_fill_{order.client_order_id}",
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=f"sim_exch_{order.client_order_id}",
+                    symbol=order.symbol,
+                    side=order.side,
+                    quantity=order.quantity,
+                    price=prices[j],
+                    fee=fees[j],
+                    fee_currency=order.symbol.split("/")[1] if "/" in order.symbol else "EUR",
+                    filled_at=now,
+                )
+                results[i] = ExecutionEvent(
+                    event_type="FILL",
+                    order_id=order.client_order_id,
+                    exchange_order_id=f"sim_exch_{order.client_order_id}",
+                    fill=fill,
+                    timestamp=now,
+                )
+
+        for key, i in first_in_batch.items():
+            self._idempotency_cache[key] = results[i]  # type: ignore[assignment]
+        for i, first in duplicates:
+            results[i] = results[first]
+
+        logger.info(
+            f"[SIMULATED ADAPTER] Batch executed: orders={len(orders)}, "
+            f"fills={sum(1 for e in results if e is not None and e.event_type == 'FILL')}"
+        )
+        return results  # type: ignore[return-value]
+
+    def simulate_fills(self, orders: OrderArrays, market_price: np.ndarray) -> BatchFills:
+        """
+        Columnar fill simulation with this adapter's models (no events, no caching).
+
+        For order-layer backtests that keep orders as arrays; results equal the
+        fill prices/fees :meth:`execute_order` would produce for the same orders.
+
+        Args:
+            orders: Orders in columnar form
+            market_price: Reference market price per row
+
+        Returns:
+            BatchFills (prices/fees as 1e-8 scaled ints and float64 views)
+        """
+        return simulate_fills(
+            orders,
+            market_price,
+            fill_model=self.fill_model,
+            fee_model=self.fee_model,
+            slippage_model=self.slippage_model,
+        )
+
     def _validate_order(self, order: Order) -> Optional[str]:
         """
         Validate order before execution.
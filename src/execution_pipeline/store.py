@@ -2,15 +2,45 @@
 Read-only store for execution_pipeline events (JSONL).
 
 Used by watch-only API/UI.
+
+A run index (run_id -> line byte offsets, counts, first/last event) is kept next to the
+JSONL file (``<filename>.runidx.json``). It is caught up incrementally from the last
+indexed byte on each read, so ``list_runs`` costs O(runs + appended bytes) and ``get_run``
+seeks directly to a run's lines. The index also carries the file-wide aggregates the watch
+API reports (malformed lines, parsed UTC timestamps), so no endpoint needs a full scan.
+The JSONL itself is never modified; if the index cannot be written (read-only mount) it is
+kept in memory only.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
-from dataclasses import dataclass
-from datetime import datetime
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+RUN_INDEX_SCHEMA_V0 = "execution_run_index_v0"
+RUN_INDEX_SUFFIX = ".runidx.json"
+
+# Bytes of the JSONL head fingerprinted in the index (detects replaced/rotated files).
+_HEAD_FINGERPRINT_BYTES = 4096
+
+# Timestamp keys in precedence order (explicit UTC fields first, then current v0 events).
+EVENT_TIMESTAMP_KEYS: Tuple[str, ...] = (
+    "ts_utc",
+    "event_utc",
+    "created_at_utc",
+    "timestamp_utc",
+    "ts",
+    "created_at",
+)
 
 
 def _safe_parse_dt(s: Optional[str]) -> Optional[datetime]:
@@ -22,6 +52,32 @@ def _safe_parse_dt(s: Optional[str]) -> Optional[datetime]:
         return None
 
 
+def parse_iso8601_utc_strict(s: str) -> datetime:
+    """Parse an ISO-8601 timestamp that carries a timezone (``Z`` or offset); returns UTC."""
+    raw = (s or "").strip()
+    if not raw:
+        raise ValueError("empty_timestamp")
+    if raw.endswith("Z"):
+        raw = raw[:-1] + "+00:00"
+    dt = datetime.fromisoformat(raw)
+    if dt.tzinfo is None:
+        raise ValueError("naive_timestamp_disallowed")
+    return dt.astimezone(timezone.utc)
+
+
+def event_timestamp_utc(ev: Dict[str, Any]) -> Optional[datetime]:
+    """First parseable timestamp along ``EVENT_TIMESTAMP_KEYS``, or None."""
+    for k in EVENT_TIMESTAMP_KEYS:
+        v = ev.get(k)
+        if not isinstance(v, str):
+            continue
+        try:
+            return parse_iso8601_utc_strict(v)
+        except Exception:
+            continue
+    return None
+
+
 @dataclass(frozen=True)
 class RunSummaryV0:
     run_id: str
@@ -32,20 +88,165 @@ class RunSummaryV0:
     counts: Dict[str, int]
 
 
+def _status_from_counts(counts: Dict[str, int]) -> str:
+    if counts.get("failed", 0) > 0:
+        return "failed"
+    if counts.get("canceled", 0) > 0:
+        return "canceled"
+    if counts.get("filled", 0) > 0:
+        return "success"
+    return "unknown"
+
+
+def _parse_event_line(line: bytes) -> Optional[Dict[str, Any]]:
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        obj = json.loads(line)
+    except Exception:
+        return None
+    if not isinstance(obj, dict) or obj.get("schema") != "execution_event_v0":
+        return None
+    return obj
+
+
+def _is_malformed_line(line: bytes) -> bool:
+    """True for a non-blank line that is not valid JSON."""
+    line = line.strip()
+    if not line:
+        return False
+    try:
+        json.loads(line)
+    except Exception:
+        return True
+    return False
+
+
+@dataclass
+class RunIndexEntryV0:
+    """Per-run aggregate; first/last follow a stable sort by ``ts`` (file order on ties).
+
+    ``max_utc``/``last_utc`` are parsed timestamps (UTC ISO, microsecond precision so they
+    compare as strings); ``utc_regressed`` is set once a parsed timestamp goes backwards in
+    file order and ``ts_errors`` counts events with timestamp keys but none parseable.
+    """
+
+    offsets: List[int] = field(default_factory=list)
+    counts: Dict[str, int] = field(default_factory=dict)
+    first_ts: Optional[str] = None
+    first_correlation_id: Any = None
+    last_ts: Optional[str] = None
+    max_utc: Optional[str] = None
+    last_utc: Optional[str] = None
+    utc_regressed: bool = False
+    ts_errors: int = 0
+
+    def add(self, offset: int, ev: Dict[str, Any]) -> None:
+        ts = ev.get("ts")
+        key = ts or ""
+        if not self.offsets or key < (self.first_ts or ""):
+            self.first_ts = ts
+            self.first_correlation_id = ev.get("correlation_id")
+        if not self.offsets or key >= (self.last_ts or ""):
+            self.last_ts = ts
+        self.offsets.append(offset)
+        et = str(ev.get("event_type") or "")
+        if et:
+            self.counts[et] = self.counts.get(et, 0) + 1
+
+        dt = event_timestamp_utc(ev)
+        if dt is None:
+            if any(k in ev for k in EVENT_TIMESTAMP_KEYS):
+                self.ts_errors += 1
+            return
+        utc = dt.isoformat(timespec="microseconds")
+        if self.max_utc is None or utc > self.max_utc:
+            self.max_utc = utc
+        if self.last_utc is not None and utc < self.last_utc:
+            self.utc_regressed = True
+        self.last_utc = utc
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "offsets": self.offsets,
+            "counts": self.counts,
+            "first_ts": self.first_ts,
+            "first_correlation_id": self.first_correlation_id,
+            "last_ts": self.last_ts,
+            "max_utc": self.max_utc,
+            "last_utc": self.last_utc,
+            "utc_regressed": self.utc_regressed,
+            "ts_errors": self.ts_errors,
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "RunIndexEntryV0":
+        return cls(
+            offsets=[int(o) for o in d["offsets"]],
+            counts={str(k): int(v) for k, v in d["counts"].items()},
+            first_ts=d.get("first_ts"),
+            first_correlation_id=d.get("first_correlation_id"),
+            last_ts=d.get("last_ts"),
+            max_utc=d["max_utc"],
+            last_utc=d["last_utc"],
+            utc_regressed=bool(d["utc_regressed"]),
+            ts_errors=int(d["ts_errors"]),
+        )
+
+
+@dataclass
+class RunIndexV0:
+    indexed_bytes: int = 0
+    head_sha256: str = ""
+    malformed_lines: int = 0
+    runs: Dict[str, RunIndexEntryV0] = field(default_factory=dict)
+
+    def to_dict(self, *, source: str) -> Dict[str, Any]:
+        return {
+            "schema": RUN_INDEX_SCHEMA_V0,
+            "source": source,
+            "indexed_bytes": self.indexed_bytes,
+            "head_sha256": self.head_sha256,
+            "malformed_lines": self.malformed_lines,
+            "runs": {rid: entry.to_dict() for rid, entry in self.runs.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "RunIndexV0":
+        if d.get("schema") != RUN_INDEX_SCHEMA_V0:
+            raise ValueError("run_index_schema_mismatch")
+        return cls(
+            indexed_bytes=int(d["indexed_bytes"]),
+            head_sha256=str(d["head_sha256"]),
+            malformed_lines=int(d["malformed_lines"]),
+            runs={str(rid): RunIndexEntryV0.from_dict(e) for rid, e in d["runs"].items()},
+        )
+
+
 class JsonlExecutionRunStore:
     def __init__(
         self,
         *,
         root: Path = Path("logs/execution"),
         filename: str = "execution_pipeline_events_v0.jsonl",
+        use_index: bool = True,
+        persist_index: bool = True,
     ) -> None:
         self.root = root
         self.filename = filename
+        self.use_index = use_index
+        self.persist_index = persist_index
+        self._index: Optional[RunIndexV0] = None
 
     @property
     def path(self) -> Path:
         return self.root / self.filename
 
+    @property
+    def index_path(self) -> Path:
+        return self.root / (self.filename + RUN_INDEX_SUFFIX)
+
     def _iter_events(self) -> Iterable[Dict[str, Any]]:
         p = self.path
         if not p.exists():
@@ -65,7 +266,148 @@ class JsonlExecutionRunStore:
                 out.append(obj)
         return out
 
+    # ------------------------------------------------------------------
+    # Run index
+    # ------------------------------------------------------------------
+
+    def _head_sha256(self, f: Any, size: int) -> str:
+        f.seek(0)
+        return hashlib.sha256(f.read(min(size, _HEAD_FINGERPRINT_BYTES))).hexdigest()
+
+    def _load_persisted_index(self) -> Optional[RunIndexV0]:
+        try:
+            with self.index_path.open("r", encoding="utf-8") as f:
+                return RunIndexV0.from_dict(json.load(f))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Ignoring unreadable execution run index %s: %s", self.index_path, e)
+            return None
+
+    def _save_index(self, index: RunIndexV0) -> None:
+        if not self.persist_index:
+            return
+        tmp = self.index_path.with_name(
+            f"{self.index_path.name}.tmp{os.getpid()}.{threading.get_ident()}"
+        )
+        try:
+            with tmp.open("w", encoding="utf-8") as f:
+                json.dump(index.to_dict(source=self.filename), f, separators=(",", ":"))
+            os.replace(tmp, self.index_path)
+        except OSError as e:
+            logger.debug("Execution run index not persisted (%s); keeping it in memory.", e)
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+    def _catch_up(self, index: RunIndexV0, f: Any, size: int) -> bool:
+        """Index complete lines appended since ``indexed_bytes``; returns True if advanced."""
+        f.seek(index.indexed_bytes)
+        offset = index.indexed_bytes
+        for line in f:
+            if not line.endswith(b"\n"):
+                break  # partially written line: index it once complete
+            ev = _parse_event_line(line)
+            if ev is None and _is_malformed_line(line):
+                index.malformed_lines += 1
+            elif ev is not None:
+                rid = str(ev.get("run_id") or "")
+                entry = index.runs.get(rid)
+                if entry is None:
+                    entry = index.runs[rid] = RunIndexEntryV0()
+                entry.add(offset, ev)
+            offset += len(line)
+        advanced = offset != index.indexed_bytes
+        index.indexed_bytes = offset
+        if not index.head_sha256 or index.indexed_bytes <= _HEAD_FINGERPRINT_BYTES:
+            index.head_sha256 = self._head_sha256(f, index.indexed_bytes)
+        return advanced
+
+    def _run_index(self) -> Optional[RunIndexV0]:
+        """Current index (loaded, validated and caught up), or None without a JSONL file."""
+        p = self.path
+        try:
+            f = p.open("rb")
+        except FileNotFoundError:
+            self._index = None
+            return None
+        with f:
+            size = os.fstat(f.fileno()).st_size
+            index = self._index if self._index is not None else self._load_persisted_index()
+            dirty = False
+            if index is not None and (
+                index.indexed_bytes > size
+                or self._head_sha256(f, index.indexed_bytes) != index.head_sha256
+            ):
+                index = None  # truncated, rotated or replaced: rebuild
+            if index is None:
+                index = RunIndexV0()
+                dirty = True
+            if index.indexed_bytes < size and self._catch_up(index, f, size):
+                dirty = True
+        self._index = index
+        if dirty:
+            self._save_index(index)
+        return index
+
+    def run_index(self) -> Optional[RunIndexV0]:
+        """Caught-up run index (independent of ``use_index``), or None without a JSONL file."""
+        return self._run_index()
+
+    def read_run_events(self, run_id: str) -> List[Tuple[int, Dict[str, Any]]]:
+        """``(byte_offset, event)`` pairs of one run in file order, read via the index."""
+        index = self._run_index()
+        entry = index.runs.get(run_id) if index is not None else None
+        if entry is None:
+            return []
+        return self._read_events_at(entry.offsets)
+
+    def rebuild_index(self) -> Optional[RunIndexV0]:
+        """Discard any persisted index and re-index the whole JSONL file."""
+        self._index = RunIndexV0()
+        try:
+            with self.path.open("rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                self._catch_up(self._index, f, size)
+        except FileNotFoundError:
+            self._index = None
+            return None
+        self._save_index(self._index)
+        return self._index
+
+    def _read_events_at(self, offsets: List[int]) -> List[Tuple[int, Dict[str, Any]]]:
+        out: List[Tuple[int, Dict[str, Any]]] = []
+        with self.path.open("rb") as f:
+            for offset in offsets:
+                f.seek(offset)
+                ev = _parse_event_line(f.readline())
+                if ev is not None:
+                    out.append((offset, ev))
+        return out
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
     def list_runs(self, *, limit: int = 200) -> List[RunSummaryV0]:
+        if self.use_index:
+            index = self._run_index()
+            summaries = [
+                RunSummaryV0(
+                    run_id=rid,
+                    correlation_id=str(entry.first_correlation_id or ""),
+                    started_at=entry.first_ts,
+                    last_event_at=entry.last_ts,
+                    status=_status_from_counts(entry.counts),
+                    counts=dict(entry.counts),
+                )
+                for rid, entry in (index.runs.items() if index is not None else ())
+                if rid
+            ]
+            summaries.sort(key=lambda s: s.last_event_at or "", reverse=True)
+            return summaries[:limit]
+
         grouped: Dict[str, List[Dict[str, Any]]] = {}
         for ev in self._iter_events():
             rid = str(ev.get("run_id") or "")
@@ -73,31 +415,24 @@ class JsonlExecutionRunStore:
                 continue
             grouped.setdefault(rid, []).append(ev)
 
-        summaries: List[RunSummaryV0] = []
+        summaries = []
         for rid, evs in grouped.items():
             evs_sorted = sorted(evs, key=lambda e: e.get("ts") or "")
             started = evs_sorted[0].get("ts")
             last = evs_sorted[-1].get("ts")
             corr = str(evs_sorted[0].get("correlation_id") or "")
             counts: Dict[str, int] = {}
-            status = "unknown"
             for e in evs_sorted:
                 et = str(e.get("event_type") or "")
                 if et:
                     counts[et] = counts.get(et, 0) + 1
-            if counts.get("failed", 0) > 0:
-                status = "failed"
-            elif counts.get("canceled", 0) > 0:
-                status = "canceled"
-            elif counts.get("filled", 0) > 0:
-                status = "success"
             summaries.append(
                 RunSummaryV0(
                     run_id=rid,
                     correlation_id=corr,
                     started_at=started,
                     last_event_at=last,
-                    status=status,
+                    status=_status_from_counts(counts),
                     counts=counts,
                 )
             )
@@ -106,7 +441,12 @@ class JsonlExecutionRunStore:
         return summaries[:limit]
 
     def get_run(self, run_id: str, *, limit: int = 2000) -> Dict[str, Any]:
-        evs = [e for e in self._iter_events() if str(e.get("run_id") or "") == run_id]
+        if self.use_index:
+            index = self._run_index()
+            entry = index.runs.get(run_id) if index is not None else None
+            evs = [ev for _, ev in self._read_events_at(entry.offsets)] if entry is not None else []
+        else:
+            evs = [e for e in self._iter_events() if str(e.get("run_id") or "") == run_id]
         evs = sorted(evs, key=lambda e: e.get("ts") or "")[:limit]
         if not evs:
             return {"run_id": run_id, "events": [], "count": 0, "summary": None}
@@ -117,14 +457,6 @@ class JsonlExecutionRunStore:
             if et:
                 counts[et] = counts.get(et, 0) + 1
 
-        status = "unknown"
-        if counts.get("failed", 0) > 0:
-            status = "failed"
-        elif counts.get("canceled", 0) > 0:
-            status = "canceled"
-        elif counts.get("filled", 0) > 0:
-            status = "success"
-
         return {
             "run_id": run_id,
             "correlation_id": evs[0].get("correlation_id"),
@@ -133,7 +465,7 @@ class JsonlExecutionRunStore:
             "summary": {
                 "started_at": evs[0].get("ts"),
                 "last_event_at": evs[-1].get("ts"),
-                "status": status,
+                "status": _status_from_counts(counts),
                 "counts": counts,
             },
         }
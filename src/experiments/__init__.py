@@ -37,127 +37,128 @@ Example:
 
 from __future__ import annotations
 
-from .base import (
-    ParamSweep,
-    ExperimentConfig,
-    SweepResultRow,
-    ExperimentResult,
-    ExperimentRunner,
-)
-
-from .strategy_sweeps import (
-    get_ma_crossover_sweeps,
-    get_bollinger_sweeps,
-    get_macd_sweeps,
-    get_momentum_sweeps,
-    get_trend_following_sweeps,
-    get_vol_breakout_sweeps,
-    get_mean_reversion_sweeps,
-    get_rsi_reversion_sweeps,
-    get_breakout_sweeps,
-    get_vol_regime_filter_sweeps,
-    get_donchian_sweeps,
-    get_strategy_sweeps,
-    list_available_strategies,
-    STRATEGY_SWEEP_REGISTRY,
-)
-
-from .research_playground import (
-    StrategySweepConfig,
-    ParamConstraint,
-    get_predefined_sweep,
-    list_predefined_sweeps,
-    get_all_predefined_sweeps,
-    get_sweeps_for_strategy,
-    get_sweeps_by_tag,
-    run_sweep_batch,
-    create_custom_sweep,
-    print_sweep_catalog,
-)
-
-from .regime_sweeps import (
-    get_volatility_detector_sweeps,
-    get_range_compression_detector_sweeps,
-    get_regime_detector_sweeps,
-    get_strategy_switching_sweeps,
-    get_combined_regime_strategy_sweeps,
-    REGIME_SWEEP_REGISTRY,
-)
-
-from .regime_aware_portfolio_sweeps import (
-    get_regime_aware_portfolio_sweeps,
-    get_regime_aware_aggressive_sweeps,
-    get_regime_aware_conservative_sweeps,
-    get_regime_aware_volmetric_sweeps,
-    get_regime_aware_combined_sweeps,
-    get_regime_aware_sweep,
-    list_available_regime_aware_sweeps,
-    REGIME_AWARE_PORTFOLIO_SWEEP_REGISTRY,
-)
-
-# Strategy Profiles (Phase 41B)
-from .strategy_profiles import (
-    StrategyProfile,
-    StrategyProfileBuilder,
-    Metadata,
-    PerformanceMetrics,
-    RobustnessMetrics,
-    RegimeProfile,
-    SingleRegimeProfile,
-    StrategyTieringInfo,
-    load_tiering_config,
-    get_tiering_for_strategy,
-    generate_markdown_profile,
-    PROFILE_VERSION,
-)
-
-# Live Session Registry (Phase 81)
-from .live_session_registry import (
-    LiveSessionRecord,
-    register_live_session_run,
-    load_session_record,
-    find_live_session_registry_json_for_session_id,
-    iter_live_session_registry_entries,
-    list_session_records,
-    get_session_summary,
-    generate_session_run_id,
-    # Report Renderers
-    render_session_markdown,
-    render_sessions_markdown,
-    render_session_html,
-    render_sessions_html,
-    # Constants
-    DEFAULT_LIVE_SESSION_DIR,
-    RUN_TYPE_LIVE_SESSION,
-    RUN_TYPE_LIVE_SESSION_SHADOW,
-    RUN_TYPE_LIVE_SESSION_TESTNET,
-    RUN_TYPE_LIVE_SESSION_PAPER,
-    RUN_TYPE_LIVE_SESSION_LIVE,
-    STATUS_STARTED,
-    STATUS_COMPLETED,
-    STATUS_FAILED,
-    STATUS_ABORTED,
-)
+from src.core.lazy_imports import install_lazy_exports, lazy_exports
 
-# Armstrong × El-Karoui Kombi-Experiment (R&D)
-from .armstrong_elkaroui_combi_experiment import (
-    ArmstrongElKarouiCombiConfig,
-    CombiExperimentResult,
-    run_armstrong_elkaroui_combi_experiment,
-    generate_armstrong_elkaroui_combi_report,
-    compute_armstrong_event_labels,
-    compute_elkaroui_regime_labels,
-    compute_forward_returns,
-    create_combo_state_labels,
-    compute_combo_stats,
-    ArmstrongEventState,
-    ElKarouiRegime,
-    RUN_TYPE_ARMSTRONG_ELKAROUI_COMBI,
-    ALLOWED_ENVIRONMENTS as ARMSTRONG_ELKAROUI_ALLOWED_ENVIRONMENTS,
+# Re-Exports werden lazy (PEP 562) beim ersten Zugriff geladen, damit leichte
+# Submodule (z.B. cross_lane_identity_join_v1) kein pandas über base ziehen.
+_LAZY_EXPORTS = lazy_exports(
+    __name__,
+    {
+        ".base": (
+            "ParamSweep",
+            "ExperimentConfig",
+            "SweepResultRow",
+            "ExperimentResult",
+            "ExperimentRunner",
+        ),
+        ".strategy_sweeps": (
+            "get_ma_crossover_sweeps",
+            "get_bollinger_sweeps",
+            "get_macd_sweeps",
+            "get_momentum_sweeps",
+            "get_trend_following_sweeps",
+            "get_vol_breakout_sweeps",
+            "get_mean_reversion_sweeps",
+            "get_rsi_reversion_sweeps",
+            "get_breakout_sweeps",
+            "get_vol_regime_filter_sweeps",
+            "get_donchian_sweeps",
+            "get_strategy_sweeps",
+            "list_available_strategies",
+            "STRATEGY_SWEEP_REGISTRY",
+        ),
+        ".research_playground": (
+            "StrategySweepConfig",
+            "ParamConstraint",
+            "get_predefined_sweep",
+            "list_predefined_sweeps",
+            "get_all_predefined_sweeps",
+            "get_sweeps_for_strategy",
+            "get_sweeps_by_tag",
+            "run_sweep_batch",
+            "create_custom_sweep",
+            "print_sweep_catalog",
+        ),
+        ".regime_sweeps": (
+            "get_volatility_detector_sweeps",
+            "get_range_compression_detector_sweeps",
+            "get_regime_detector_sweeps",
+            "build_regime_detector_configs",
+            "get_strategy_switching_sweeps",
+            "get_combined_regime_strategy_sweeps",
+            "REGIME_SWEEP_REGISTRY",
+        ),
+        ".regime_aware_portfolio_sweeps": (
+            "get_regime_aware_portfolio_sweeps",
+            "get_regime_aware_aggressive_sweeps",
+            "get_regime_aware_conservative_sweeps",
+            "get_regime_aware_volmetric_sweeps",
+            "get_regime_aware_combined_sweeps",
+            "get_regime_aware_sweep",
+            "list_available_regime_aware_sweeps",
+            "REGIME_AWARE_PORTFOLIO_SWEEP_REGISTRY",
+        ),
+        # Strategy Profiles (Phase 41B)
+        ".strategy_profiles": (
+            "StrategyProfile",
+            "StrategyProfileBuilder",
+            "Metadata",
+            "PerformanceMetrics",
+            "RobustnessMetrics",
+            "RegimeProfile",
+            "SingleRegimeProfile",
+            "StrategyTieringInfo",
+            "load_tiering_config",
+            "get_tiering_for_strategy",
+            "generate_markdown_profile",
+            "PROFILE_VERSION",
+        ),
+        # Live Session Registry (Phase 81)
+        ".live_session_registry": (
+            "LiveSessionRecord",
+            "register_live_session_run",
+            "load_session_record",
+            "find_live_session_registry_json_for_session_id",
+            "iter_live_session_registry_entries",
+            "list_session_records",
+            "get_session_summary",
+            "generate_session_run_id",
+            "render_session_markdown",
+            "render_sessions_markdown",
+            "render_session_html",
+            "render_sessions_html",
+            "DEFAULT_LIVE_SESSION_DIR",
+            # Backward compatibility alias
+            ("DEFAULT_SESSIONS_DIR", "DEFAULT_LIVE_SESSION_DIR"),
+            "RUN_TYPE_LIVE_SESSION",
+            "RUN_TYPE_LIVE_SESSION_SHADOW",
+            "RUN_TYPE_LIVE_SESSION_TESTNET",
+            "RUN_TYPE_LIVE_SESSION_PAPER",
+            "RUN_TYPE_LIVE_SESSION_LIVE",
+            "STATUS_STARTED",
+            "STATUS_COMPLETED",
+            "STATUS_FAILED",
+            "STATUS_ABORTED",
+        ),
+        # Armstrong × El-Karoui Kombi-Experiment (R&D)
+        ".armstrong_elkaroui_combi_experiment": (
+            "ArmstrongElKarouiCombiConfig",
+            "CombiExperimentResult",
+            "run_armstrong_elkaroui_combi_experiment",
+            "generate_armstrong_elkaroui_combi_report",
+            "compute_armstrong_event_labels",
+            "compute_elkaroui_regime_labels",
+            "compute_forward_returns",
+            "create_combo_state_labels",
+            "compute_combo_stats",
+            "ArmstrongEventState",
+            "ElKarouiRegime",
+            "RUN_TYPE_ARMSTRONG_ELKAROUI_COMBI",
+            ("ARMSTRONG_ELKAROUI_ALLOWED_ENVIRONMENTS", "ALLOWED_ENVIRONMENTS"),
+        ),
+    },
 )
-
-# Backward compatibility alias
-DEFAULT_SESSIONS_DIR = DEFAULT_LIVE_SESSION_DIR
+install_lazy_exports(globals(), _LAZY_EXPORTS)
 
 __all__ = [
     # Base types
@@ -185,6 +186,7 @@ __all__ = [
     "get_volatility_detector_sweeps",
     "get_range_compression_detector_sweeps",
     "get_regime_detector_sweeps",
+    "build_regime_detector_configs",
     "get_strategy_switching_sweeps",
     "get_combined_regime_strategy_sweeps",
     "REGIME_SWEEP_REGISTRY",
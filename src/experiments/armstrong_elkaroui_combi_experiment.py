@@ -50,6 +50,8 @@ from typing import Any, Dict, List, Optional, Tuple
 import numpy as np
 import pandas as pd
 
+from src.utils.rolling_stats import rolling_rank
+
 logger = logging.getLogger(__name__)
 
 # =============================================================================
@@ -326,19 +328,7 @@ def _rolling_vol_quantile_rank(
 
     Semantics match ``Series.rolling(...).apply(lambda x: pd.Series(x).rank(pct=True).iloc[-1])``.
     """
-    values = vol_annualized.to_numpy(dtype=np.float64, copy=True)
-    values[np.isinf(values)] = np.nan
-    n = len(values)
-    out = np.full(n, np.nan, dtype=np.float64)
-
-    for end in range(n):
-        start = max(0, end - lookback_window + 1)
-        win = values[start : end + 1]
-        if np.count_nonzero(~np.isnan(win)) < min_periods:
-            continue
-        out[end] = pd.Series(win).rank(pct=True).iloc[-1]
-
-    return pd.Series(out, index=vol_annualized.index, dtype=np.float64)
+    return rolling_rank(vol_annualized, lookback_window, min_periods, pct=True).rename(None)
 
 
 def compute_elkaroui_regime_labels(
@@ -9,6 +9,8 @@ Verfügbare Funktionen:
 - get_volatility_detector_sweeps(): VolatilityRegimeDetector Parameter
 - get_range_compression_detector_sweeps(): RangeCompressionRegimeDetector Parameter
 - get_regime_detector_sweeps(): Kombinierte Sweeps für beide Detectors
+- build_regime_detector_configs(): Sweep-Grid -> RegimeDetectorConfigs
+  (Input für src.regime.batch.detect_regimes_batch)
 - get_strategy_switching_sweeps(): Strategy-Switching Parameter
 
 Utility:
@@ -37,8 +39,12 @@ Example:
 
 from __future__ import annotations
 
+from dataclasses import fields, replace
+from itertools import product
 from typing import Callable, Dict, List, Literal, Optional
 
+from src.regime.config import RegimeDetectorConfig
+
 from .base import ParamSweep
 
 
@@ -280,6 +286,56 @@ def get_all_regime_detector_sweeps(
     }
 
 
+def build_regime_detector_configs(
+    detector_name: str,
+    sweeps: List[ParamSweep],
+    prefix: str = "regime_",
+    base: Optional[RegimeDetectorConfig] = None,
+) -> List[RegimeDetectorConfig]:
+    """
+    Expandiert Regime-Sweeps zu einer Liste von RegimeDetectorConfigs.
+
+    Die Configs können direkt an ``src.regime.batch.detect_regimes_batch``
+    übergeben werden, das gemeinsame Indikatoren über das ganze Grid nur
+    einmal berechnet.
+
+    Args:
+        detector_name: "volatility_breakout" oder "range_compression"
+        sweeps: ParamSweeps, z.B. aus get_regime_detector_sweeps()
+        prefix: Prefix der Parameter-Namen (wird entfernt)
+        base: Basis-Config für nicht gesweepte Parameter (default: Defaults)
+
+    Returns:
+        Liste von RegimeDetectorConfigs (kartesisches Produkt, enabled=True)
+
+    Raises:
+        ValueError: Bei Parametern, die RegimeDetectorConfig nicht kennt
+
+    Example:
+        >>> sweeps = get_regime_detector_sweeps("volatility_breakout", "coarse")
+        >>> configs = build_regime_detector_configs("volatility_breakout", sweeps)
+        >>> len(configs)
+        27
+    """
+    known = {f.name for f in fields(RegimeDetectorConfig)}
+    names = []
+    for sweep in sweeps:
+        name = sweep.name[len(prefix) :] if sweep.name.startswith(prefix) else sweep.name
+        if name not in known:
+            raise ValueError(f"Unbekannter Regime-Parameter: '{sweep.name}'")
+        names.append(name)
+
+    template = replace(
+        base if base is not None else RegimeDetectorConfig(),
+        enabled=True,
+        detector_name=detector_name,
+    )
+    return [
+        replace(template, **dict(zip(names, combo)))
+        for combo in product(*(sweep.values for sweep in sweeps))
+    ]
+
+
 # ============================================================================
 # STRATEGY SWITCHING SWEEPS
 # ============================================================================
@@ -0,0 +1,43 @@
+"""Offline point-in-time feature store v1.
+
+Materializes feature definitions (catalog-bound via the Feature/Data Contract
+Layer v1 where applicable) into partitioned parquet files with lineage, and
+serves as-of joins for backtests and offline research. Offline only; not
+trading authority.
+"""
+
+from __future__ import annotations
+
+from src.features.offline_feature_store_v1.consumers_v1 import (
+    FeatureStoreBindingV1,
+    materialize_and_join_v1,
+    materialize_features_v1,
+)
+from src.features.offline_feature_store_v1.definitions_v1 import (
+    BUILTIN_FEATURE_DEFINITIONS,
+    LOG_RETURN_V1,
+    VOLATILITY_ESTIMATE_V1,
+    FeatureDefinitionV1,
+    OfflineFeatureStoreError,
+    builtin_definition_v1,
+)
+from src.features.offline_feature_store_v1.store_v1 import (
+    MaterializationResultV1,
+    OfflineFeatureStoreV1,
+    PartitionKeyV1,
+)
+
+__all__ = [
+    "BUILTIN_FEATURE_DEFINITIONS",
+    "FeatureDefinitionV1",
+    "FeatureStoreBindingV1",
+    "LOG_RETURN_V1",
+    "MaterializationResultV1",
+    "OfflineFeatureStoreError",
+    "OfflineFeatureStoreV1",
+    "PartitionKeyV1",
+    "VOLATILITY_ESTIMATE_V1",
+    "builtin_definition_v1",
+    "materialize_and_join_v1",
+    "materialize_features_v1",
+]
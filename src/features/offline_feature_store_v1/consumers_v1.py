@@ -0,0 +1,77 @@
+"""Read-side helpers for backtests and offline research.
+
+``materialize_and_join_v1`` brings a store partition up to date for the given
+bars (new bars only) and returns the bars with point-in-time feature columns,
+so repeated runs over the same data reuse the stored features.
+``FeatureStoreBindingV1`` carries store, definitions and timeframe for consumers
+that only know their bars and symbol (``BacktestEngine``, linear evidence).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence
+
+import pandas as pd
+
+from src.features.offline_feature_store_v1.definitions_v1 import FeatureDefinitionV1
+from src.features.offline_feature_store_v1.store_v1 import (
+    MaterializationResultV1,
+    OfflineFeatureStoreV1,
+)
+
+
+def materialize_features_v1(
+    store: OfflineFeatureStoreV1,
+    bars: pd.DataFrame,
+    definitions: Sequence[FeatureDefinitionV1],
+    *,
+    symbol: str,
+    timeframe: str,
+) -> tuple[MaterializationResultV1, ...]:
+    return tuple(
+        store.materialize(definition, bars, symbol=symbol, timeframe=timeframe)
+        for definition in definitions
+    )
+
+
+def materialize_and_join_v1(
+    store: OfflineFeatureStoreV1,
+    bars: pd.DataFrame,
+    definitions: Sequence[FeatureDefinitionV1],
+    *,
+    symbol: str,
+    timeframe: str,
+    availability_lag: pd.Timedelta | str | None = None,
+) -> pd.DataFrame:
+    materialize_features_v1(store, bars, definitions, symbol=symbol, timeframe=timeframe)
+    return store.asof_join(
+        bars,
+        definitions,
+        symbol=symbol,
+        timeframe=timeframe,
+        availability_lag=availability_lag,
+    )
+
+
+@dataclass(frozen=True)
+class FeatureStoreBindingV1:
+    store: OfflineFeatureStoreV1
+    definitions: tuple[FeatureDefinitionV1, ...]
+    timeframe: str
+    availability_lag: pd.Timedelta | str | None = None
+
+    @property
+    def feature_columns(self) -> tuple[str, ...]:
+        return tuple(name for definition in self.definitions for name in definition.columns)
+
+    def join(self, bars: pd.DataFrame, *, symbol: str) -> pd.DataFrame:
+        """``materialize_and_join_v1`` with this binding's store and definitions."""
+        return materialize_and_join_v1(
+            self.store,
+            bars,
+            self.definitions,
+            symbol=symbol,
+            timeframe=self.timeframe,
+            availability_lag=self.availability_lag,
+        )
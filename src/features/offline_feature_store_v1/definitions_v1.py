@@ -0,0 +1,155 @@
+"""Feature definitions for the offline feature store v1.
+
+A definition is a pure, point-in-time function of input bars: the value at bar
+``t`` may only depend on bars ``<= t`` and needs at most ``lookback_bars``
+prior bars of context. Catalog-bound definitions take their ``schema_id`` from
+the UQ6 catalog and must be admissible for ``ConsumerIntent.NORMALIZE``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
+
+import numpy as np
+import pandas as pd
+
+from src.features.canonical_feature_data_contract_layer_v1.catalog_v1 import catalog_entry
+from src.features.canonical_feature_data_contract_layer_v1.constants_v1 import I25_FEATURE_ID
+from src.features.canonical_feature_data_contract_layer_v1.lineage_v1 import digest_mapping
+from src.features.canonical_feature_data_contract_layer_v1.models_v1 import (
+    ConsumerIntent,
+    FeatureDataContractLayerError,
+)
+from src.features.canonical_feature_data_contract_layer_v1.selective_engine_v1 import (
+    assert_consumer_intent_admissible_v1,
+)
+from src.trading.master_v2.canonical_volatility_estimate_feature_contract_v1 import (
+    DDOF as I25_DDOF,
+    FEATURE_NAME as I25_FEATURE_NAME,
+    LOOKBACK_BARS as I25_LOOKBACK_BARS,
+    MIN_PERIODS as I25_MIN_PERIODS,
+)
+
+STORE_SCHEMA_PREFIX = "offline_feature_store_v1"
+
+FeatureComputeV1 = Callable[[pd.DataFrame, Mapping[str, Any]], pd.DataFrame]
+
+
+class OfflineFeatureStoreError(FeatureDataContractLayerError):
+    """Fail-closed offline feature store error."""
+
+
+@dataclass(frozen=True, eq=False)
+class FeatureDefinitionV1:
+    feature_id: str
+    version: str
+    columns: tuple[str, ...]
+    compute: FeatureComputeV1
+    lookback_bars: int
+    input_columns: tuple[str, ...] = ("close",)
+    params: Mapping[str, Any] = field(default_factory=dict)
+    catalog_feature_id: str | None = None
+
+    def __post_init__(self) -> None:
+        if not self.feature_id or "/" in self.feature_id:
+            raise OfflineFeatureStoreError(f"invalid_feature_id:{self.feature_id!r}")
+        if not self.version or "/" in self.version:
+            raise OfflineFeatureStoreError(f"invalid_feature_version:{self.version!r}")
+        if not self.columns or len(set(self.columns)) != len(self.columns):
+            raise OfflineFeatureStoreError(f"invalid_feature_columns:{self.feature_id}")
+        if self.lookback_bars < 0:
+            raise OfflineFeatureStoreError(f"negative_lookback_bars:{self.feature_id}")
+        if self.catalog_feature_id is not None:
+            assert_consumer_intent_admissible_v1(
+                feature_id=self.catalog_feature_id, intent=ConsumerIntent.NORMALIZE
+            )
+
+    @property
+    def schema_id(self) -> str:
+        if self.catalog_feature_id is not None:
+            return catalog_entry(self.catalog_feature_id).schema_id
+        return f"{STORE_SCHEMA_PREFIX}/{self.feature_id}"
+
+    @property
+    def lineage_feature_id(self) -> str:
+        return self.catalog_feature_id or self.feature_id
+
+    def to_mapping(self) -> dict[str, Any]:
+        return {
+            "catalog_feature_id": self.catalog_feature_id,
+            "columns": list(self.columns),
+            "compute": f"{self.compute.__module__}.{self.compute.__qualname__}",
+            "feature_id": self.feature_id,
+            "input_columns": list(self.input_columns),
+            "lookback_bars": self.lookback_bars,
+            "params": dict(self.params),
+            "schema_id": self.schema_id,
+            "version": self.version,
+        }
+
+    def definition_digest(self) -> str:
+        return digest_mapping(self.to_mapping())
+
+    def compute_frame(self, bars: pd.DataFrame) -> pd.DataFrame:
+        """Run ``compute`` on ``bars`` and check the output shape (fail closed)."""
+        missing = [name for name in self.input_columns if name not in bars.columns]
+        if missing:
+            raise OfflineFeatureStoreError(f"input_columns_missing:{self.feature_id}:{missing}")
+        out = self.compute(bars.loc[:, list(self.input_columns)], self.params)
+        if not isinstance(out, pd.DataFrame):
+            raise OfflineFeatureStoreError(f"compute_not_dataframe:{self.feature_id}")
+        if tuple(out.columns) != self.columns:
+            raise OfflineFeatureStoreError(
+                f"compute_columns_mismatch:{self.feature_id}:{list(out.columns)}"
+            )
+        if not out.index.equals(bars.index):
+            raise OfflineFeatureStoreError(f"compute_index_mismatch:{self.feature_id}")
+        return out.astype("float64")
+
+
+def _rolling_log_return_volatility(bars: pd.DataFrame, params: Mapping[str, Any]) -> pd.DataFrame:
+    prices = bars["close"].astype("float64")
+    if (prices <= 0).any() or prices.isna().any():
+        raise OfflineFeatureStoreError("null_or_nonpositive_price")
+    log_returns = np.log(prices).diff()
+    volatility = log_returns.rolling(
+        window=int(params["window"]), min_periods=int(params["min_periods"])
+    ).std(ddof=int(params["ddof"]))
+    return pd.DataFrame({I25_FEATURE_NAME: volatility}, index=bars.index)
+
+
+def _log_return(bars: pd.DataFrame, params: Mapping[str, Any]) -> pd.DataFrame:
+    prices = bars["close"].astype("float64")
+    return pd.DataFrame({"log_return": np.log(prices).diff()}, index=bars.index)
+
+
+VOLATILITY_ESTIMATE_V1 = FeatureDefinitionV1(
+    feature_id=I25_FEATURE_NAME,
+    version="v1",
+    columns=(I25_FEATURE_NAME,),
+    compute=_rolling_log_return_volatility,
+    lookback_bars=I25_LOOKBACK_BARS,
+    params={"window": I25_LOOKBACK_BARS, "min_periods": I25_MIN_PERIODS, "ddof": I25_DDOF},
+    catalog_feature_id=I25_FEATURE_ID,
+)
+
+LOG_RETURN_V1 = FeatureDefinitionV1(
+    feature_id="log_return",
+    version="v1",
+    columns=("log_return",),
+    compute=_log_return,
+    lookback_bars=1,
+)
+
+BUILTIN_FEATURE_DEFINITIONS: Mapping[str, FeatureDefinitionV1] = MappingProxyType(
+    {definition.feature_id: definition for definition in (VOLATILITY_ESTIMATE_V1, LOG_RETURN_V1)}
+)
+
+
+def builtin_definition_v1(feature_id: str) -> FeatureDefinitionV1:
+    definition = BUILTIN_FEATURE_DEFINITIONS.get(feature_id)
+    if definition is None:
+        raise OfflineFeatureStoreError(f"unknown_store_feature_id:{feature_id}")
+    return definition
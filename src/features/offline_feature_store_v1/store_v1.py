@@ -0,0 +1,308 @@
+"""Partitioned, point-in-time offline feature store v1.
+
+Layout (one partition per feature/version/symbol/timeframe)::
+
+    <root>/<feature_id>/version=<version>/symbol=<symbol>/timeframe=<timeframe>/
+        part-00000.parquet
+        part-00001.parquet
+        _partition.json
+
+Materialization is append-only: only bars after the last stored timestamp are
+computed (with ``lookback_bars`` of context) and written as a new part.
+``_partition.json`` records per-part time ranges and digests plus the
+partition ``lineage_sha256``. Offline research/backtest input only; no trading
+authority.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Mapping, Sequence
+
+import pandas as pd
+
+from src.features.canonical_feature_data_contract_layer_v1.lineage_v1 import (
+    digest_mapping,
+    lineage_sha256,
+)
+from src.features.offline_feature_store_v1.definitions_v1 import (
+    FeatureDefinitionV1,
+    OfflineFeatureStoreError,
+)
+
+PARTITION_SCHEMA_VERSION = "offline_feature_store_partition_v1"
+PARTITION_MANIFEST_FILENAME = "_partition.json"
+
+
+def _reject(message: str) -> None:
+    raise OfflineFeatureStoreError(message)
+
+
+def _safe_segment(value: str) -> str:
+    text = str(value).replace("/", "-").replace(os.sep, "-")
+    if not text or text in {".", ".."}:
+        _reject(f"invalid_partition_segment:{value!r}")
+    return text
+
+
+def _frame_digest(frame: pd.DataFrame) -> str:
+    hashed = pd.util.hash_pandas_object(frame, index=True).to_numpy()
+    digest = hashlib.sha256(hashed.tobytes())
+    digest.update(json.dumps([str(c) for c in frame.columns]).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _validate_bars(bars: pd.DataFrame) -> None:
+    if not isinstance(bars.index, pd.DatetimeIndex):
+        _reject("bars_index_not_datetime")
+    if not bars.index.is_monotonic_increasing or bars.index.has_duplicates:
+        _reject("bars_index_not_strictly_increasing")
+
+
+@dataclass(frozen=True)
+class PartitionKeyV1:
+    feature_id: str
+    version: str
+    symbol: str
+    timeframe: str
+
+    def rel_path(self) -> Path:
+        return (
+            Path(_safe_segment(self.feature_id))
+            / f"version={_safe_segment(self.version)}"
+            / f"symbol={_safe_segment(self.symbol)}"
+            / f"timeframe={_safe_segment(self.timeframe)}"
+        )
+
+
+@dataclass(frozen=True)
+class MaterializationResultV1:
+    key: PartitionKeyV1
+    rows_written: int
+    total_rows: int
+    part_file: str | None
+    last_timestamp: str | None
+    lineage_sha256: str | None
+
+
+class OfflineFeatureStoreV1:
+    """Materialize and read point-in-time features under ``root``."""
+
+    def __init__(self, root: Path | str) -> None:
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self._frames: dict[Path, tuple[tuple[int, int], pd.DataFrame]] = {}
+
+    def partition_dir(self, key: PartitionKeyV1) -> Path:
+        return self.root / key.rel_path()
+
+    def load_manifest(self, key: PartitionKeyV1) -> dict[str, Any] | None:
+        path = self.partition_dir(key) / PARTITION_MANIFEST_FILENAME
+        if not path.is_file():
+            return None
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        if not isinstance(payload, dict):
+            _reject(f"partition_manifest_not_object:{path}")
+        if payload.get("schema_version") != PARTITION_SCHEMA_VERSION:
+            _reject(f"partition_manifest_schema_mismatch:{path}")
+        return payload
+
+    def materialize(
+        self,
+        definition: FeatureDefinitionV1,
+        bars: pd.DataFrame,
+        *,
+        symbol: str,
+        timeframe: str,
+    ) -> MaterializationResultV1:
+        """Compute and append feature rows for bars newer than the stored partition."""
+        _validate_bars(bars)
+        key = PartitionKeyV1(definition.feature_id, definition.version, symbol, timeframe)
+        with self._lock:
+            manifest = self.load_manifest(key)
+            definition_digest = definition.definition_digest()
+            if manifest is not None and manifest["definition_digest"] != definition_digest:
+                _reject(
+                    f"definition_digest_mismatch:{definition.feature_id}:{definition.version}"
+                    ":bump_version_to_change_definition"
+                )
+            parts: list[dict[str, Any]] = list(manifest["parts"]) if manifest else []
+            total_rows = int(manifest["total_rows"]) if manifest else 0
+
+            first_new = 0
+            if manifest is not None and manifest["last_timestamp"] is not None:
+                last = pd.Timestamp(manifest["last_timestamp"])
+                first_new = int(bars.index.searchsorted(last, side="right"))
+            if first_new >= len(bars):
+                return MaterializationResultV1(
+                    key=key,
+                    rows_written=0,
+                    total_rows=total_rows,
+                    part_file=None,
+                    last_timestamp=manifest["last_timestamp"] if manifest else None,
+                    lineage_sha256=manifest["lineage_sha256"] if manifest else None,
+                )
+
+            start = max(0, first_new - definition.lookback_bars)
+            # A short partition can still be extended from its first bar (full history).
+            from_partition_start = (
+                start == 0 and bool(parts) and bars.index[0] == pd.Timestamp(parts[0]["start"])
+            )
+            if (
+                manifest is not None
+                and first_new - start < definition.lookback_bars
+                and not from_partition_start
+            ):
+                _reject(f"insufficient_lookback_context:{definition.feature_id}")
+            context = bars.iloc[start:]
+            computed = definition.compute_frame(context).iloc[first_new - start :]
+
+            part_dir = self.partition_dir(key)
+            part_dir.mkdir(parents=True, exist_ok=True)
+            part_name = f"part-{len(parts):05d}.parquet"
+            tmp_part = part_dir / f".{part_name}.{os.getpid()}.tmp"
+            computed.to_parquet(tmp_part, index=True)
+            os.replace(tmp_part, part_dir / part_name)
+
+            parts.append(
+                {
+                    "file": part_name,
+                    "rows": int(len(computed)),
+                    "start": computed.index[0].isoformat(),
+                    "end": computed.index[-1].isoformat(),
+                    "feature_digest": _frame_digest(computed),
+                    "source_digest": _frame_digest(context.loc[:, list(definition.input_columns)]),
+                }
+            )
+            total_rows += int(len(computed))
+            payload_digest = digest_mapping(
+                {
+                    "definition_digest": definition_digest,
+                    "parts": [[p["file"], p["feature_digest"], p["source_digest"]] for p in parts],
+                    "symbol": symbol,
+                    "timeframe": timeframe,
+                }
+            )
+            lineage = lineage_sha256(
+                feature_id=definition.lineage_feature_id,
+                schema_id=definition.schema_id,
+                payload_digest=payload_digest,
+            )
+            new_manifest = {
+                "schema_version": PARTITION_SCHEMA_VERSION,
+                "feature_id": definition.feature_id,
+                "version": definition.version,
+                "symbol": symbol,
+                "timeframe": timeframe,
+                "schema_id": definition.schema_id,
+                "columns": list(definition.columns),
+                "definition": definition.to_mapping(),
+                "definition_digest": definition_digest,
+                "parts": parts,
+                "total_rows": total_rows,
+                "last_timestamp": parts[-1]["end"],
+                "payload_digest": payload_digest,
+                "lineage_sha256": lineage,
+            }
+            manifest_path = part_dir / PARTITION_MANIFEST_FILENAME
+            tmp_manifest = part_dir / f".{PARTITION_MANIFEST_FILENAME}.{os.getpid()}.tmp"
+            tmp_manifest.write_text(
+                json.dumps(new_manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+            )
+            os.replace(tmp_manifest, manifest_path)
+            self._frames.pop(part_dir, None)
+        return MaterializationResultV1(
+            key=key,
+            rows_written=int(len(computed)),
+            total_rows=total_rows,
+            part_file=part_name,
+            last_timestamp=new_manifest["last_timestamp"],
+            lineage_sha256=lineage,
+        )
+
+    def read(
+        self,
+        definition: FeatureDefinitionV1,
+        *,
+        symbol: str,
+        timeframe: str,
+        start: Any = None,
+        end: Any = None,
+    ) -> pd.DataFrame:
+        """Stored feature rows in ``[start, end]`` (cached in-process per partition state)."""
+        key = PartitionKeyV1(definition.feature_id, definition.version, symbol, timeframe)
+        part_dir = self.partition_dir(key)
+        manifest_path = part_dir / PARTITION_MANIFEST_FILENAME
+        try:
+            st = manifest_path.stat()
+        except FileNotFoundError:
+            _reject(f"partition_not_materialized:{key.rel_path().as_posix()}")
+        state = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            cached = self._frames.get(part_dir)
+        if cached is not None and cached[0] == state:
+            frame = cached[1]
+        else:
+            manifest = self.load_manifest(key)
+            assert manifest is not None
+            if manifest["definition_digest"] != definition.definition_digest():
+                _reject(f"definition_digest_mismatch:{definition.feature_id}:{definition.version}")
+            frames = [pd.read_parquet(part_dir / part["file"]) for part in manifest["parts"]]
+            frame = pd.concat(frames) if frames else pd.DataFrame(columns=list(definition.columns))
+            with self._lock:
+                self._frames[part_dir] = (state, frame)
+        if start is not None or end is not None:
+            frame = frame.loc[start:end]
+        return frame.copy()
+
+    def asof_join(
+        self,
+        bars: pd.DataFrame,
+        definitions: Sequence[FeatureDefinitionV1],
+        *,
+        symbol: str,
+        timeframe: str,
+        availability_lag: pd.Timedelta | str | None = None,
+    ) -> pd.DataFrame:
+        """
+        Join stored features onto ``bars`` as of each bar timestamp.
+
+        A feature row stamped ``t`` becomes visible at ``t + availability_lag``;
+        each bar sees the latest visible row (never a future one).
+        """
+        _validate_bars(bars)
+        lag = pd.Timedelta(availability_lag) if availability_lag is not None else None
+        out = bars.copy()
+        for definition in definitions:
+            clash = [name for name in definition.columns if name in out.columns]
+            if clash:
+                _reject(f"feature_column_collision:{definition.feature_id}:{clash}")
+            end = bars.index[-1] if len(bars) else None
+            features = self.read(definition, symbol=symbol, timeframe=timeframe, end=end)
+            if lag is not None:
+                features.index = features.index + lag
+            joined = pd.merge_asof(
+                out.loc[:, []],
+                features,
+                left_index=True,
+                right_index=True,
+                direction="backward",
+                allow_exact_matches=True,
+            )
+            for name in definition.columns:
+                out[name] = joined[name].to_numpy()
+        return out
+
+    def describe(
+        self, definition: FeatureDefinitionV1, *, symbol: str, timeframe: str
+    ) -> Mapping[str, Any]:
+        key = PartitionKeyV1(definition.feature_id, definition.version, symbol, timeframe)
+        manifest = self.load_manifest(key)
+        if manifest is None:
+            _reject(f"partition_not_materialized:{key.rel_path().as_posix()}")
+        return manifest
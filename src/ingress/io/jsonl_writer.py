@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
+import threading
+import weakref
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Optional, Tuple
+from typing import Any, BinaryIO, Iterable, Optional, Tuple
 
 from ..normalized_event import NormalizedEvent
 from ..validate import validate_normalized_event
@@ -24,6 +27,17 @@ class JsonlWriteResult:
     sha256_chain_head: str
 
 
+@dataclass
+class _AppendState:
+    chain_head: str
+    records: int
+    bytes_written: int
+    chain_entries: list
+    file_digest: Any
+    file_size: int
+    file_id: Tuple[int, int]
+
+
 class JsonlEventWriter:
     """
     Append-only JSONL writer with sha256 chain.
@@ -38,16 +52,42 @@ class JsonlEventWriter:
           "chain": [{"i":1,"line_sha256":"...","chain":"..."}, ...]  # optional: can be elided later
         }
     NOTE: chain list can be truncated later; for now keep full for auditability.
+
+    The append handle, chain state and a running file sha256 are kept between
+    append() calls, so an append costs O(batch) instead of re-opening and
+    re-hashing the whole file. If the JSONL is changed behind the writer's back
+    (size/inode differ), state is reloaded from disk. Each batch is validated
+    completely before any byte is written. Call close() (or use ``with``) when
+    done; the handle is also closed when the writer is garbage-collected.
     """
 
     def __init__(self, base_path: Path):
         self.base_path = Path(base_path)
         self.path_jsonl = self.base_path.with_suffix(".jsonl")
         self.path_manifest = self.base_path.with_suffix(".manifest.json")
+        self._lock = threading.Lock()
+        self._fh: Optional[BinaryIO] = None
+        self._state: Optional[_AppendState] = None
+        self._finalizer: Optional[weakref.finalize] = None
 
-    def append(self, events: Iterable[NormalizedEvent]) -> JsonlWriteResult:
-        self.path_jsonl.parent.mkdir(parents=True, exist_ok=True)
+    def __enter__(self) -> "JsonlEventWriter":
+        return self
 
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_handle()
+
+    def _close_handle(self) -> None:
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+        self._fh = None
+        self._state = None
+
+    def _load_state(self) -> _AppendState:
         chain_head = "0" * 64
         records = 0
         bytes_written = 0
@@ -61,37 +101,91 @@ class JsonlEventWriter:
             bytes_written = int(m.get("bytes", 0))
             chain_entries = list(m.get("chain", []))
 
-        with self.path_jsonl.open("ab") as f:
-            for ev in events:
-                validate_normalized_event(ev)
-                line = ev.to_json_line().encode("utf-8")
-                line_sha = _sha256_hex(line)
-                chain_head = _sha256_hex((chain_head + line_sha).encode("utf-8"))
-                f.write(line)
-                bytes_written += len(line)
-                records += 1
-                chain_entries.append({"i": records, "line_sha256": line_sha, "chain": chain_head})
-
-        file_sha = _sha256_hex(self.path_jsonl.read_bytes())
-
-        manifest = {
-            "algo": "sha256",
-            "records": records,
-            "bytes": bytes_written,
-            "file_sha256": file_sha,
-            "chain_head": chain_head,
-            "chain": chain_entries,
-        }
-        self.path_manifest.write_text(
-            json.dumps(manifest, sort_keys=True, separators=(",", ":"), ensure_ascii=False) + "\n",
-            encoding="utf-8",
-        )
-
-        return JsonlWriteResult(
-            path_jsonl=self.path_jsonl,
-            path_manifest=self.path_manifest,
+        # One read of pre-existing content; later appends extend the running digest.
+        digest = hashlib.sha256()
+        assert self._fh is not None
+        with self.path_jsonl.open("rb") as existing:
+            for block in iter(lambda: existing.read(1 << 20), b""):
+                digest.update(block)
+        st = os.fstat(self._fh.fileno())
+        return _AppendState(
+            chain_head=chain_head,
+            records=records,
             bytes_written=bytes_written,
-            records_written=records,
-            sha256_file=file_sha,
-            sha256_chain_head=chain_head,
+            chain_entries=chain_entries,
+            file_digest=digest,
+            file_size=st.st_size,
+            file_id=(st.st_dev, st.st_ino),
         )
+
+    def _ensure_open(self) -> Tuple[BinaryIO, _AppendState]:
+        if self._fh is not None and self._state is not None:
+            try:
+                st = self.path_jsonl.stat()
+            except FileNotFoundError:
+                st = None
+            if (
+                st is not None
+                and (st.st_dev, st.st_ino) == self._state.file_id
+                and st.st_size == self._state.file_size
+            ):
+                return self._fh, self._state
+            self._close_handle()
+
+        self.path_jsonl.parent.mkdir(parents=True, exist_ok=True)
+        fh = self.path_jsonl.open("ab")
+        self._fh = fh
+        self._finalizer = weakref.finalize(self, fh.close)
+        self._state = self._load_state()
+        return fh, self._state
+
+    def append(self, events: Iterable[NormalizedEvent]) -> JsonlWriteResult:
+        lines: list[bytes] = []
+        for ev in events:
+            validate_normalized_event(ev)
+            lines.append(ev.to_json_line().encode("utf-8"))
+
+        with self._lock:
+            fh, state = self._ensure_open()
+            chain_head = state.chain_head
+            new_entries: list = []
+            for offset, line in enumerate(lines, start=1):
+                line_sha = _sha256_hex(line)
+                chain_head = _sha256_hex((chain_head + line_sha).encode("utf-8"))
+                new_entries.append(
+                    {"i": state.records + offset, "line_sha256": line_sha, "chain": chain_head}
+                )
+
+            blob = b"".join(lines)
+            fh.write(blob)
+            fh.flush()
+            state.file_digest.update(blob)
+            state.file_size += len(blob)
+            state.bytes_written += len(blob)
+            state.records += len(lines)
+            state.chain_head = chain_head
+            state.chain_entries.extend(new_entries)
+            file_sha = state.file_digest.hexdigest()
+
+            manifest = {
+                "algo": "sha256",
+                "records": state.records,
+                "bytes": state.bytes_written,
+                "file_sha256": file_sha,
+                "chain_head": chain_head,
+                "chain": state.chain_entries,
+            }
+            self.path_manifest.write_text(
+                json.dumps(manifest, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+                + "\n",
+                encoding="utf-8",
+            )
+
+            return JsonlWriteResult(
+                path_jsonl=self.path_jsonl,
+                path_manifest=self.path_manifest,
+                bytes_written=state.bytes_written,
+                records_written=state.records,
+                sha256_file=file_sha,
+                sha256_chain_head=chain_head,
+            )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, Mapping, Sequence
+from collections.abc import Mapping, Sequence
+from typing import Any
 
 from .normalized_event import NormalizedEvent
 
@@ -8,20 +9,46 @@ from .normalized_event import NormalizedEvent
 _ALLOWED_SENS = {"public", "internal", "restricted"}
 
 
-def validate_normalized_event(ev: NormalizedEvent) -> None:
-    if not isinstance(ev.event_id, str) or not ev.event_id:
+def validate_event_fields(
+    *,
+    event_id: Any,
+    ts_ms: Any,
+    source: Any,
+    kind: Any,
+    scope: Any,
+    tags: Any,
+    sensitivity: Any,
+    payload: Any,
+) -> None:
+    """NormalizedEvent rules on plain field values (hot path for JSONL scans)."""
+    if not isinstance(event_id, str) or not event_id:
         raise ValueError("event_id must be non-empty str")
-    if not isinstance(ev.ts_ms, int) or ev.ts_ms < 0:
+    if not isinstance(ts_ms, int) or ts_ms < 0:
         raise ValueError("ts_ms must be non-negative int")
-    for name in ("source", "kind", "scope"):
-        v = getattr(ev, name)
-        if not isinstance(v, str) or not v:
-            raise ValueError(f"{name} must be non-empty str")
-    if not isinstance(ev.tags, Sequence):
+    if not isinstance(source, str) or not source:
+        raise ValueError("source must be non-empty str")
+    if not isinstance(kind, str) or not kind:
+        raise ValueError("kind must be non-empty str")
+    if not isinstance(scope, str) or not scope:
+        raise ValueError("scope must be non-empty str")
+    if not isinstance(tags, Sequence):
         raise ValueError("tags must be a sequence of str")
-    if any((not isinstance(t, str) or not t) for t in ev.tags):
+    if any((not isinstance(t, str) or not t) for t in tags):
         raise ValueError("tags entries must be non-empty str")
-    if ev.sensitivity not in _ALLOWED_SENS:
+    if sensitivity not in _ALLOWED_SENS:
         raise ValueError(f"sensitivity must be one of {_ALLOWED_SENS}")
-    if not isinstance(ev.payload, Mapping):
+    if not isinstance(payload, Mapping):
         raise ValueError("payload must be a mapping (JSON object)")
+
+
+def validate_normalized_event(ev: NormalizedEvent) -> None:
+    validate_event_fields(
+        event_id=ev.event_id,
+        ts_ms=ev.ts_ms,
+        source=ev.source,
+        kind=ev.kind,
+        scope=ev.scope,
+        tags=ev.tags,
+        sensitivity=ev.sensitivity,
+        payload=ev.payload,
+    )
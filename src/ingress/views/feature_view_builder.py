@@ -1,95 +1,241 @@
 """
 Build FeatureView from event JSONL (Runbook A3).
 Deterministic aggregations; never include raw payload in output.
+
+Single pass: each line is parsed, validated (``validate_event_fields``),
+aggregated and fed into the file sha256 while the file is read once. Large files
+can be scanned in newline-aligned byte ranges by worker processes
+(``max_workers``); the sha256 is then computed concurrently in the caller.
 """
 
 from __future__ import annotations
 
 import hashlib
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
-from src.ingress.normalized_event import NormalizedEvent
+from src.ingress.validate import validate_event_fields
 from src.ingress.views.feature_view import ArtifactPointer, FeatureView
 from src.risk.cmes import default_cmes_facts
 
+try:  # optional fast decoder; stdlib json stays the reference
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on environment
+    _orjson = None
+
+_READ_CHUNK_BYTES = 1 << 20
+DEFAULT_PARALLEL_CHUNK_BYTES = 32 << 20
+
+
+def _loads(line: bytes) -> Any:
+    if _orjson is not None:
+        try:
+            return _orjson.loads(line)
+        except ValueError:
+            pass  # NaN/Infinity literals, >64-bit ints: defer to stdlib semantics
+    return json.loads(line)
+
+
+def _parse_event(line: bytes) -> Optional[Tuple[str, int, str, str]]:
+    """(kind, ts_ms, scope, source) of a valid NormalizedEvent line, else None."""
+    try:
+        obj = _loads(line)
+        kind = obj["kind"]
+        ts_ms = int(obj["ts_ms"])
+        scope = obj["scope"]
+        source = obj["source"]
+        # Same coercions as NormalizedEvent.from_json_line, without building the dataclass.
+        validate_event_fields(
+            event_id=obj["event_id"],
+            ts_ms=ts_ms,
+            source=source,
+            kind=kind,
+            scope=scope,
+            tags=list(obj.get("tags", [])),
+            sensitivity=obj.get("sensitivity", "internal"),
+            payload=obj.get("payload", {}),
+        )
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
+    return kind, ts_ms, scope, source
+
+
+@dataclass
+class EventScanStats:
+    """Aggregates of one scan (whole file or one byte range); mergeable in file order."""
+
+    counts: Dict[str, int] = field(default_factory=dict)
+    ts_min: Optional[int] = None
+    ts_max: Optional[int] = None
+    scope: Optional[str] = None
+    source: Optional[str] = None
+    lines_accepted: int = 0
+    lines_rejected: int = 0
+
+    def add_line(self, line: bytes) -> None:
+        if not line.strip():
+            return
+        parsed = _parse_event(line)
+        if parsed is None:
+            self.lines_rejected += 1
+            return
+        kind, ts_ms, scope, source = parsed
+        self.lines_accepted += 1
+        # Aggregate counts by kind
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+        if self.ts_min is None or ts_ms < self.ts_min:
+            self.ts_min = ts_ms
+        if self.ts_max is None or ts_ms > self.ts_max:
+            self.ts_max = ts_ms
+        # Safe facts from scope/source (no payload); first occurrence wins
+        if self.scope is None:
+            self.scope = scope
+        if self.source is None:
+            self.source = source
+
+    def merge(self, later: "EventScanStats") -> None:
+        """Fold in the stats of a byte range that follows this one in the file."""
+        for kind, n in later.counts.items():
+            self.counts[kind] = self.counts.get(kind, 0) + n
+        if later.ts_min is not None and (self.ts_min is None or later.ts_min < self.ts_min):
+            self.ts_min = later.ts_min
+        if later.ts_max is not None and (self.ts_max is None or later.ts_max > self.ts_max):
+            self.ts_max = later.ts_max
+        self.scope = self.scope if self.scope is not None else later.scope
+        self.source = self.source if self.source is not None else later.source
+        self.lines_accepted += later.lines_accepted
+        self.lines_rejected += later.lines_rejected
+
+
+def _scan_stream(f: Any, limit: Optional[int] = None, digest: Any = None) -> EventScanStats:
+    """Parse lines from a binary handle in large reads, optionally hashing the same bytes."""
+    stats = EventScanStats()
+    tail = b""
+    remaining = limit
+    while remaining is None or remaining > 0:
+        block = f.read(
+            _READ_CHUNK_BYTES if remaining is None else min(_READ_CHUNK_BYTES, remaining)
+        )
+        if not block:
+            break
+        if remaining is not None:
+            remaining -= len(block)
+        if digest is not None:
+            digest.update(block)
+        lines = (tail + block).split(b"\n")
+        tail = lines.pop()
+        for line in lines:
+            stats.add_line(line)
+    if tail:
+        stats.add_line(tail)
+    return stats
+
+
+def _scan_range(path: str, start: int, end: int) -> EventScanStats:
+    with open(path, "rb") as f:
+        f.seek(start)
+        return _scan_stream(f, limit=end - start)
+
+
+def _line_aligned_ranges(path: Path, size: int, chunk_bytes: int) -> List[Tuple[int, int]]:
+    bounds = [0]
+    with path.open("rb") as f:
+        pos = chunk_bytes
+        while pos < size:
+            f.seek(pos)
+            f.readline()
+            aligned = f.tell()
+            if aligned >= size:
+                break
+            if aligned > bounds[-1]:
+                bounds.append(aligned)
+            pos = aligned + chunk_bytes
+    bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for block in iter(lambda: f.read(_READ_CHUNK_BYTES), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def scan_events_jsonl(
+    path: Path,
+    *,
+    max_workers: Optional[int] = None,
+    chunk_bytes: int = DEFAULT_PARALLEL_CHUNK_BYTES,
+) -> Tuple[EventScanStats, str]:
+    """
+    Scan an events JSONL file; returns (aggregates, file sha256).
+
+    Sequential (default): one read feeds both parser and hash. With
+    ``max_workers > 1`` and a file larger than ``chunk_bytes``, newline-aligned
+    ranges are parsed in worker processes while the sha256 is computed here.
+    Lines that fail to parse or validate are skipped (counted in
+    ``lines_rejected``).
+    """
+    path = Path(path)
+    size = path.stat().st_size
+    if max_workers is None or max_workers <= 1 or size <= chunk_bytes:
+        digest = hashlib.sha256()
+        with path.open("rb") as f:
+            stats = _scan_stream(f, digest=digest)
+        return stats, digest.hexdigest()
 
-def _sha256_hex(data: bytes) -> str:
-    return hashlib.sha256(data).hexdigest()
+    ranges = _line_aligned_ranges(path, size, chunk_bytes)
+    workers = min(max_workers, len(ranges), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_scan_range, str(path), start, end) for start, end in ranges]
+        file_sha = _sha256_file(path)
+        stats = EventScanStats()
+        for future in futures:
+            stats.merge(future.result())
+    return stats, file_sha
 
 
 def build_feature_view_from_jsonl(
     jsonl_path: str,
     run_id: str = "default",
+    *,
+    max_workers: Optional[int] = None,
+    chunk_bytes: int = DEFAULT_PARALLEL_CHUNK_BYTES,
 ) -> FeatureView:
     """
     Read events from JSONL, aggregate counts and safe facts only.
     Never put payload, raw, transcript, api_key, secret, token into FeatureView.
+    Events failing ingress validation are skipped like malformed lines.
     """
     path = Path(jsonl_path)
     if not jsonl_path or not str(jsonl_path).strip() or not path.exists() or not path.is_file():
         facts = default_cmes_facts()
         return FeatureView(run_id=run_id, ts_ms=0, counts={}, facts=facts, artifacts=[])
 
-    counts: Dict[str, int] = {}
-    facts: Dict[str, Any] = {}
-    ts_min: int | None = None
-    ts_max: int | None = None
-
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                obj = json.loads(line)
-                ev = NormalizedEvent(
-                    event_id=obj["event_id"],
-                    ts_ms=int(obj["ts_ms"]),
-                    source=obj["source"],
-                    kind=obj["kind"],
-                    scope=obj["scope"],
-                    tags=list(obj.get("tags", [])),
-                    sensitivity=obj.get("sensitivity", "internal"),
-                    payload=obj.get("payload", {}),
-                )
-            except (KeyError, TypeError, ValueError):
-                continue
-            # Aggregate counts by kind
-            kind = ev.kind
-            counts[kind] = counts.get(kind, 0) + 1
-            if ts_min is None or ev.ts_ms < ts_min:
-                ts_min = ev.ts_ms
-            if ts_max is None or ev.ts_ms > ts_max:
-                ts_max = ev.ts_ms
-            # Safe facts from scope/source (no payload)
-            if ev.scope and "scope" not in facts:
-                facts["scope"] = ev.scope
-            if ev.source and "source" not in facts:
-                facts["source"] = ev.source
-
-    if ts_max is None:
-        ts_max = 0
-    if ts_min is None:
-        ts_min = 0
+    stats, file_sha = scan_events_jsonl(path, max_workers=max_workers, chunk_bytes=chunk_bytes)
+    ts_min = stats.ts_min if stats.ts_min is not None else 0
+    ts_max = stats.ts_max if stats.ts_max is not None else 0
 
     # CMES 7 facts (canonical, pointer-only); default for now; upstream can override later
     cmes = default_cmes_facts()
     # Safe run-scope facts (no payload)
     final_facts: Dict[str, Any] = {
         **cmes,
-        "event_count_total": sum(counts.values()),
+        "event_count_total": sum(stats.counts.values()),
         "ts_min": ts_min,
         "ts_max": ts_max,
     }
-    if facts.get("scope"):
-        final_facts["scope"] = facts["scope"]
-    if facts.get("source"):
-        final_facts["source"] = facts["source"]
+    if stats.scope:
+        final_facts["scope"] = stats.scope
+    if stats.source:
+        final_facts["source"] = stats.source
 
-    # Artifact pointer for the JSONL itself (path + sha256 of file)
-    file_sha = _sha256_hex(path.read_bytes())
+    # Artifact pointer for the JSONL itself (path + sha256 of file, same read)
     artifacts: List[ArtifactPointer] = [
         ArtifactPointer(path=str(path), sha256=file_sha),
     ]
@@ -97,7 +243,7 @@ def build_feature_view_from_jsonl(
     return FeatureView(
         run_id=run_id,
         ts_ms=ts_max,
-        counts=counts,
+        counts=stats.counts,
         facts=final_facts,
         artifacts=artifacts,
     )
@@ -0,0 +1,724 @@
+# src/live/timeseries_downsampling.py
+"""
+Peak_Trade: Downsampling & Multi-Resolution-Tiles für Dashboard-Zeitreihen
+==========================================================================
+
+Equity-, PnL-, Drawdown- und Positions-Zeitreihen eines Runs werden serverseitig
+auf eine begrenzte Punktzahl reduziert, damit Chart-Endpoints unabhängig von der
+Run-Länge eine beschränkte Antwort liefern.
+
+Features:
+- LTTB (Largest-Triangle-Three-Buckets) und Min/Max-Bucketing
+- Vorberechnete Auflösungsstufen (Min/Max-Hüllkurve, Faktor ``fanout`` pro Stufe)
+  pro Run und Metrik
+- Bereichsabfragen (start/end) über die Zeitachse
+- In-Memory-LRU-Cache, invalidiert über mtime/Größe der Events-Datei; wächst eine
+  ``events.csv`` nur durch Anhängen, wird die Pyramide ab dem bekannten Stand fortgeschrieben
+
+WICHTIG: Read-only. Es wird nichts auf Disk geschrieben.
+
+Example:
+    >>> pyramid = load_run_timeseries_pyramid(Path("live_runs") / run_id)
+    >>> series = pyramid.query("equity", max_points=1000, method="lttb")
+"""
+
+from __future__ import annotations
+
+import io
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .run_logging import load_run_events
+
+DOWNSAMPLE_METHODS = ("lttb", "minmax")
+TIMESERIES_METRICS = ("equity", "realized_pnl", "unrealized_pnl", "drawdown", "position_size")
+
+DEFAULT_MAX_POINTS = 1000
+MAX_POINTS_LIMIT = 10_000
+
+# Reduktionsfaktor zwischen zwei Auflösungsstufen.
+DEFAULT_TILE_FANOUT = 4
+# Gröbste Stufe: nicht weiter reduzieren, sobald so wenige Punkte übrig sind.
+DEFAULT_TILE_MIN_POINTS = 512
+# Eine Stufe wird gewählt, wenn sie höchstens so viele Punkte je Zielpunkt enthält;
+# der Rest wird exakt per LTTB/Min-Max reduziert.
+_LEVEL_OVERSAMPLE = 4
+# Bytes am Ende des bekannten Stands, die vor dem Fortschreiben verglichen werden.
+_SOURCE_TAIL_BYTES = 4096
+
+
+# =============================================================================
+# Downsampling-Primitive
+# =============================================================================
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: wählt ``n_out`` visuell repräsentative Punkte.
+
+    Erster und letzter Punkt bleiben immer erhalten.
+
+    Args:
+        x: Monoton steigende x-Werte (z.B. Zeit in ns)
+        y: Endliche y-Werte gleicher Länge
+        n_out: Zielanzahl Punkte (>= 3 für echtes LTTB)
+
+    Returns:
+        Aufsteigende Indizes in ``x``/``y``
+    """
+    n = len(y)
+    if n_out >= n or n <= 2:
+        return np.arange(n, dtype=np.int64)
+    if n_out < 3:
+        return np.array([0, n - 1], dtype=np.int64)[: max(n_out, 0)]
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    # Bucket-Grenzen für die inneren Punkte 1..n-2
+    edges = np.floor(np.linspace(1, n - 1, n_out - 1)).astype(np.int64)
+    out = np.empty(n_out, dtype=np.int64)
+    out[0] = 0
+    out[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < n_out - 1:
+            nlo, nhi = edges[i + 1], edges[i + 2]
+            avg_x = x[nlo:nhi].mean()
+            avg_y = y[nlo:nhi].mean()
+        else:
+            avg_x, avg_y = x[n - 1], y[n - 1]
+        bx = x[lo:hi]
+        by = y[lo:hi]
+        area = np.abs((x[a] - avg_x) * (by - y[a]) - (x[a] - bx) * (avg_y - y[a]))
+        a = lo + int(np.argmax(area))
+        out[i + 1] = a
+    return out
+
+
+def _bucket_extrema(y: np.ndarray, width: int) -> np.ndarray:
+    """Aufsteigende Indizes von Minimum und Maximum je Block aus ``width`` Punkten."""
+    n = len(y)
+    if n == 0:
+        return np.empty(0, dtype=np.int64)
+    n_buckets = -(-n // width)
+    pad = n_buckets * width - n
+    y = np.asarray(y, dtype=np.float64)
+    lo = np.concatenate([y, np.full(pad, np.inf)]).reshape(n_buckets, width)
+    hi = np.concatenate([y, np.full(pad, -np.inf)]).reshape(n_buckets, width)
+    base = np.arange(n_buckets, dtype=np.int64) * width
+    idx = np.concatenate([base + lo.argmin(axis=1), base + hi.argmax(axis=1)])
+    return np.unique(idx)
+
+
+def minmax_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Min/Max-Bucketing: pro Bucket Minimum und Maximum (Hüllkurve bleibt erhalten).
+
+    Args:
+        y: Endliche y-Werte
+        n_out: Zielanzahl Punkte (zwei Punkte pro Bucket)
+
+    Returns:
+        Aufsteigende, eindeutige Indizes in ``y`` (höchstens ``n_out``)
+    """
+    n = len(y)
+    if n_out >= n:
+        return np.arange(n, dtype=np.int64)
+    if n_out < 2:
+        # Kein Platz für ein Min/Max-Paar
+        return np.array([0, n - 1], dtype=np.int64)[: max(n_out, 0)]
+    return _bucket_extrema(y, -(-n // (n_out // 2)))
+
+
+def downsample_indices(x: np.ndarray, y: np.ndarray, n_out: int, method: str) -> np.ndarray:
+    """
+    Dispatcher für ``lttb`` / ``minmax``; beide behalten ersten und letzten Punkt.
+    """
+    if method == "lttb":
+        return lttb_indices(x, y, n_out)
+    if method == "minmax":
+        n = len(y)
+        if n_out >= n:
+            return np.arange(n, dtype=np.int64)
+        if n_out < 4:
+            # Kein Platz für ein Min/Max-Paar neben den Endpunkten
+            return np.array([0, n - 1], dtype=np.int64)[: max(n_out, 0)]
+        # Endpunkte zusätzlich zur Hüllkurve, Budget bleibt n_out
+        inner = minmax_indices(y, n_out - 2)
+        return np.union1d(inner, [0, n - 1])
+    raise ValueError(f"unknown_downsample_method: {method}")
+
+
+# =============================================================================
+# Tile-Pyramide
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class DownsampledSeries:
+    """
+    Ergebnis einer Bereichs-/Auflösungsabfrage.
+
+    Attributes:
+        metric: Metrik-Name
+        method: Verwendetes Verfahren
+        level: Verwendete Auflösungsstufe (0 = volle Auflösung)
+        source_points: Anzahl Rohpunkte (endlich) im Bereich
+        indices: Zeilenindizes in die Quell-Zeitreihe (aufsteigend)
+    """
+
+    metric: str
+    method: str
+    level: int
+    source_points: int
+    indices: np.ndarray
+
+
+@dataclass(frozen=True)
+class _TileLevel:
+    """
+    Eine Auflösungsstufe: ``rows[:stable]`` stammt aus vollständigen Blöcken der
+    Vorstufe und ändert sich beim Anhängen neuer Zeilen nicht mehr.
+    """
+
+    rows: np.ndarray
+    stable: int
+    buckets: int
+
+
+@dataclass(frozen=True)
+class _AppendState:
+    """Was zum Fortschreiben einer Pyramide um neue Events-Zeilen nötig ist."""
+
+    columns: Tuple[str, ...]
+    ts_col: str
+    last_step: Optional[float]
+    running_max: float
+
+
+@dataclass(frozen=True)
+class _CsvSource:
+    """Bekannter Stand einer ``events.csv``: Größe, Kopfzeile und letzte Bytes."""
+
+    size: int
+    header: bytes
+    tail: bytes
+
+
+def _build_tiles(
+    values: np.ndarray,
+    level0: np.ndarray,
+    previous: Sequence[_TileLevel],
+    fanout: int,
+    min_points: int,
+) -> List[_TileLevel]:
+    """
+    Baut die Stufen über ``level0``; vollständige Blöcke aus ``previous`` werden übernommen.
+
+    Jede Stufe fasst Blöcke aus ``2 * fanout`` Punkten der Vorstufe zu Minimum und
+    Maximum zusammen und behält ersten und letzten Punkt. Nur Blöcke im stabilen Teil
+    der Vorstufe gelten als vollständig, daher liefert das Fortschreiben dieselben
+    Stufen wie ein Neuaufbau.
+    """
+    width = 2 * fanout
+    tiles = [_TileLevel(rows=level0, stable=len(level0), buckets=0)]
+    while len(tiles[-1].rows) > min_points:
+        parent = tiles[-1]
+        old = previous[len(tiles)] if len(tiles) < len(previous) else None
+        settled = parent.rows[: parent.stable]
+        buckets = len(settled) // width
+        start = old.buckets if old is not None else 0
+        base = old.rows[: old.stable] if old is not None else parent.rows[:1]
+        block = settled[start * width : buckets * width]
+        added = block[_bucket_extrema(values[block], width)]
+        if len(base) and len(added) and added[0] <= base[-1]:
+            added = added[added > base[-1]]
+        stable = np.concatenate([base, added])
+        rest = parent.rows[buckets * width :]
+        tail = np.concatenate([rest[_bucket_extrema(values[rest], width)], parent.rows[-1:]])
+        rows = np.union1d(stable, tail)
+        if len(rows) >= len(parent.rows):
+            break
+        tiles.append(_TileLevel(rows=rows, stable=len(stable), buckets=buckets))
+    return tiles
+
+
+@dataclass
+class TimeseriesPyramid:
+    """
+    Mehrstufige Auflösungs-Tiles einer Run-Zeitreihe.
+
+    Stufe 0 enthält alle Zeilen mit endlichem Wert, jede weitere Stufe die
+    Min/Max-Hüllkurve von Blöcken aus ``2 * fanout`` Punkten der vorherigen
+    (Reduktionsfaktor ``fanout``). Stufen werden pro Metrik beim ersten Zugriff
+    berechnet, danach wiederverwendet und beim Anhängen von Zeilen fortgeschrieben.
+
+    Attributes:
+        ts: Zeitstempel-Strings (wie im Events-Log) pro Zeile
+        x: Zeitachse in ns (``x_is_time``) bzw. Zeilenposition
+        columns: Metrik-Name -> float64-Werte (NaN = nicht vorhanden)
+    """
+
+    ts: np.ndarray
+    x: np.ndarray
+    columns: Dict[str, np.ndarray]
+    x_is_time: bool = True
+    fanout: int = DEFAULT_TILE_FANOUT
+    min_points: int = DEFAULT_TILE_MIN_POINTS
+    _tiles: Dict[str, List[_TileLevel]] = field(default_factory=dict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _append_state: Optional[_AppendState] = field(default=None, repr=False)
+    _source: Optional[_CsvSource] = field(default=None, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def levels(self, metric: str) -> List[np.ndarray]:
+        """Zeilenindizes pro Stufe (Stufe 0 zuerst)."""
+        with self._lock:
+            tiles = self._tiles.get(metric)
+            if tiles is None:
+                values = self.columns.get(metric)
+                if values is None:
+                    raise KeyError(metric)
+                level0 = np.flatnonzero(np.isfinite(values))
+                tiles = _build_tiles(values, level0, (), self.fanout, self.min_points)
+                self._tiles[metric] = tiles
+            return [tile.rows for tile in tiles]
+
+    def _range_bounds(
+        self, rows: np.ndarray, start: Optional[int], end: Optional[int]
+    ) -> Tuple[int, int]:
+        xs = self.x[rows]
+        lo = 0 if start is None else int(np.searchsorted(xs, start, side="left"))
+        hi = len(rows) if end is None else int(np.searchsorted(xs, end, side="right"))
+        return lo, max(lo, hi)
+
+    def query(
+        self,
+        metric: str,
+        *,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        max_points: int = DEFAULT_MAX_POINTS,
+        method: str = "lttb",
+    ) -> DownsampledSeries:
+        """
+        Liefert höchstens ``max_points`` Zeilen für ``metric`` im Bereich [start, end].
+
+        Args:
+            metric: Metrik-Name (siehe ``TIMESERIES_METRICS``)
+            start: Untere Grenze auf der x-Achse (ns) oder None
+            end: Obere Grenze auf der x-Achse (ns) oder None
+            max_points: Maximale Punktzahl der Antwort
+            method: ``lttb`` oder ``minmax``
+
+        Raises:
+            KeyError: Metrik nicht vorhanden
+            ValueError: Ungültige Methode/Punktzahl oder Bereich ohne Zeitachse
+        """
+        if method not in DOWNSAMPLE_METHODS:
+            raise ValueError(f"unknown_downsample_method: {method}")
+        if max_points < 2:
+            raise ValueError("max_points must be >= 2")
+        if (start is not None or end is not None) and not self.x_is_time:
+            raise ValueError("range_requires_timestamps")
+
+        levels = self.levels(metric)
+        lo, hi = self._range_bounds(levels[0], start, end)
+        source_points = hi - lo
+
+        level = 0
+        rows = levels[0][lo:hi]
+        budget = max_points * _LEVEL_OVERSAMPLE
+        while len(rows) > budget and level + 1 < len(levels):
+            level += 1
+            lo, hi = self._range_bounds(levels[level], start, end)
+            rows = levels[level][lo:hi]
+
+        if len(rows) > max_points:
+            values = self.columns[metric]
+            rows = rows[downsample_indices(self.x[rows], values[rows], max_points, method)]
+
+        return DownsampledSeries(
+            metric=metric,
+            method=method,
+            level=level,
+            source_points=source_points,
+            indices=rows,
+        )
+
+
+def _first_column(df: pd.DataFrame, *names: str) -> Optional[str]:
+    for name in names:
+        if name in df.columns:
+            return name
+    return None
+
+
+def _step_bound(df: pd.DataFrame) -> Tuple[bool, Optional[float]]:
+    """(fortschreibbar, größter ``step``); NaN- oder nicht-numerische Steps sind es nicht."""
+    if "step" not in df.columns:
+        return True, None
+    if not pd.api.types.is_numeric_dtype(df["step"]) or df["step"].isna().any():
+        return False, None
+    return True, (float(df["step"].max()) if len(df) else None)
+
+
+def _metric_columns(
+    df: pd.DataFrame, order: Optional[np.ndarray], running_max: float
+) -> Tuple[Dict[str, np.ndarray], float]:
+    """Metrik-Spalten (in ``order``) und das laufende Equity-Maximum am Ende."""
+
+    def _col(*names: str) -> np.ndarray:
+        name = _first_column(df, *names)
+        if name is None:
+            return np.full(len(df), np.nan)
+        values = pd.to_numeric(df[name], errors="coerce").to_numpy(dtype=np.float64)
+        return values[order] if order is not None else values
+
+    equity = _col("equity")
+    if "drawdown" in df.columns:
+        drawdown = _col("drawdown")
+    else:
+        # Wie expanding().max() auf der Equity-Spalte (NaN werden übersprungen),
+        # fortgesetzt ab ``running_max`` des bereits bekannten Teils
+        peak = np.fmax.accumulate(np.concatenate([[running_max], equity]))[1:]
+        if len(peak):
+            running_max = float(peak[-1])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            drawdown = (equity - peak) / peak
+
+    columns = {
+        "equity": equity,
+        "realized_pnl": _col("realized_pnl", "pnl"),
+        "unrealized_pnl": _col("unrealized_pnl"),
+        "drawdown": drawdown,
+        "position_size": _col("position_size"),
+    }
+    return columns, running_max
+
+
+def build_timeseries_pyramid(
+    events_df: pd.DataFrame,
+    *,
+    fanout: int = DEFAULT_TILE_FANOUT,
+    min_points: int = DEFAULT_TILE_MIN_POINTS,
+) -> TimeseriesPyramid:
+    """
+    Baut die Tile-Pyramide aus einem Events-DataFrame (``load_run_events``).
+
+    Spaltenwahl wie ``/api/v0/runs/{run_id}/equity``: Zeitstempel aus ``ts_event``
+    bzw. ``ts_bar``, Reihenfolge nach ``step``, PnL aus ``realized_pnl`` bzw. ``pnl``,
+    Drawdown aus Equity berechnet, falls keine Spalte vorhanden ist.
+    """
+    if fanout < 2:
+        raise ValueError("fanout must be >= 2")
+    if min_points < 2:
+        raise ValueError("min_points must be >= 2")
+
+    ts_col = _first_column(events_df, "ts_event", "ts_bar")
+    if ts_col is None or len(events_df) == 0:
+        empty = np.empty(0, dtype=np.float64)
+        return TimeseriesPyramid(
+            ts=np.empty(0, dtype=object),
+            x=np.empty(0, dtype=np.int64),
+            columns={m: empty for m in TIMESERIES_METRICS},
+            fanout=fanout,
+            min_points=min_points,
+        )
+
+    df = events_df
+    appendable, last_step = _step_bound(df)
+    if "step" in df.columns:
+        try:
+            df = df.sort_values("step", kind="stable")
+        except Exception:
+            appendable = False
+    df = df[df[ts_col].notna()]
+
+    ts = df[ts_col].astype(str).to_numpy(dtype=object)
+    parsed = pd.to_datetime(df[ts_col], utc=True, errors="coerce", format="ISO8601")
+    x_is_time = bool(len(parsed)) and not parsed.isna().any()
+    order: Optional[np.ndarray] = None
+    if x_is_time:
+        x = parsed.to_numpy(dtype="datetime64[ns]").astype(np.int64)
+        if len(x) > 1 and np.any(np.diff(x) < 0):
+            order = np.argsort(x, kind="stable")
+            x = x[order]
+            ts = ts[order]
+    else:
+        x = np.arange(len(df), dtype=np.int64)
+
+    columns, running_max = _metric_columns(df, order, np.nan)
+    state = None
+    if appendable and len(df):
+        state = _AppendState(
+            columns=tuple(events_df.columns),
+            ts_col=ts_col,
+            last_step=last_step,
+            running_max=running_max,
+        )
+    return TimeseriesPyramid(
+        ts=ts,
+        x=x,
+        columns=columns,
+        x_is_time=x_is_time,
+        fanout=fanout,
+        min_points=min_points,
+        _append_state=state,
+    )
+
+
+def _append_events(
+    pyramid: TimeseriesPyramid, events_df: pd.DataFrame
+) -> Optional[TimeseriesPyramid]:
+    """
+    Schreibt ``pyramid`` um neu angehängte Events-Zeilen fort.
+
+    Liefert dasselbe Ergebnis wie ``build_timeseries_pyramid`` über alle Zeilen oder
+    ``None``, wenn die neuen Zeilen die bisherige Reihenfolge ändern würden (kleinerer
+    ``step`` bzw. Zeitstempel, andere Spalten, nicht parsebare Zeitstempel).
+    """
+    state = pyramid._append_state
+    if state is None or tuple(events_df.columns) != state.columns:
+        return None
+    appendable, new_last_step = _step_bound(events_df)
+    if not appendable:
+        return None
+    df = events_df
+    last_step = state.last_step
+    if new_last_step is not None:
+        if last_step is not None and float(df["step"].min()) < last_step:
+            return None
+        df = df.sort_values("step", kind="stable")
+        last_step = new_last_step
+    df = df[df[state.ts_col].notna()]
+
+    ts = df[state.ts_col].astype(str).to_numpy(dtype=object)
+    order: Optional[np.ndarray] = None
+    n_old = len(pyramid)
+    if pyramid.x_is_time:
+        parsed = pd.to_datetime(df[state.ts_col], utc=True, errors="coerce", format="ISO8601")
+        if parsed.isna().any():
+            return None
+        x = parsed.to_numpy(dtype="datetime64[ns]").astype(np.int64)
+        if len(x) and x.min() < pyramid.x[-1]:
+            return None
+        if len(x) > 1 and np.any(np.diff(x) < 0):
+            order = np.argsort(x, kind="stable")
+            x = x[order]
+            ts = ts[order]
+    else:
+        x = np.arange(n_old, n_old + len(df), dtype=np.int64)
+
+    added, running_max = _metric_columns(df, order, state.running_max)
+    columns = {m: np.concatenate([pyramid.columns[m], added[m]]) for m in TIMESERIES_METRICS}
+    with pyramid._lock:
+        known = dict(pyramid._tiles)
+    tiles = {}
+    for metric, previous in known.items():
+        level0 = np.concatenate(
+            [previous[0].rows, n_old + np.flatnonzero(np.isfinite(added[metric]))]
+        )
+        tiles[metric] = _build_tiles(
+            columns[metric], level0, previous, pyramid.fanout, pyramid.min_points
+        )
+    return TimeseriesPyramid(
+        ts=np.concatenate([pyramid.ts, ts]),
+        x=np.concatenate([pyramid.x, x]),
+        columns=columns,
+        x_is_time=pyramid.x_is_time,
+        fanout=pyramid.fanout,
+        min_points=pyramid.min_points,
+        _tiles=tiles,
+        _append_state=_AppendState(
+            columns=state.columns,
+            ts_col=state.ts_col,
+            last_step=last_step,
+            running_max=running_max,
+        ),
+    )
+
+
+# =============================================================================
+# Cache
+# =============================================================================
+
+
+class TimeseriesTileCache:
+    """
+    Thread-sicherer LRU-Cache für Tile-Pyramiden.
+
+    Schlüssel enthalten mtime/Größe der Events-Datei, d.h. ein fortgeschriebener
+    Run erzeugt automatisch einen neuen Eintrag; ``latest`` liefert den bisherigen
+    Stand derselben Datei als Ausgangspunkt zum Fortschreiben.
+    """
+
+    def __init__(self, maxsize: int = 16) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._items: "OrderedDict[Tuple, TimeseriesPyramid]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get_or_build(
+        self, key: Tuple, builder: Callable[[], TimeseriesPyramid]
+    ) -> TimeseriesPyramid:
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return item
+            self.misses += 1
+        item = builder()
+        with self._lock:
+            self._items[key] = item
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+        return item
+
+    def latest(self, path: str) -> Optional[TimeseriesPyramid]:
+        """Zuletzt verwendete Pyramide zur Events-Datei ``path`` (beliebiger Stand)."""
+        with self._lock:
+            for key in reversed(self._items):
+                if key[0] == path:
+                    return self._items[key]
+        return None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_DEFAULT_TILE_CACHE = TimeseriesTileCache()
+
+
+def _events_file_key(run_dir: Path) -> Tuple:
+    for name in ("events.parquet", "events.csv"):
+        p = run_dir / name
+        try:
+            st = p.stat()
+        except FileNotFoundError:
+            continue
+        return (str(p.resolve()), st.st_mtime_ns, st.st_size)
+    raise FileNotFoundError(f"Keine Events-Datei gefunden in: {run_dir}")
+
+
+def _csv_source(data: bytes) -> Optional[_CsvSource]:
+    """Stand einer vollständig gelesenen CSV; ``None`` bei abgeschnittener letzter Zeile."""
+    newline = data.find(b"\n")
+    if newline < 0 or not data.endswith(b"\n"):
+        return None
+    return _CsvSource(size=len(data), header=data[: newline + 1], tail=data[-_SOURCE_TAIL_BYTES:])
+
+
+def _append_csv(path: Path, pyramid: TimeseriesPyramid) -> Optional[TimeseriesPyramid]:
+    """
+    Liest nur die seit ``pyramid`` angehängten Bytes von ``path`` und schreibt fort.
+
+    Der RunLogger hängt an ``events.csv`` nur an; geprüft werden Kopfzeile und die
+    letzten Bytes des bekannten Stands, sonst ``None`` (Neuaufbau).
+    """
+    source = pyramid._source
+    if source is None:
+        return None
+    with path.open("rb") as fh:
+        if fh.read(len(source.header)) != source.header:
+            return None
+        fh.seek(source.size - len(source.tail))
+        data = fh.read()
+    if len(data) <= len(source.tail) or not data.startswith(source.tail):
+        return None
+    added = data[len(source.tail) :]
+    extended = _append_events(pyramid, pd.read_csv(io.BytesIO(source.header + added)))
+    if extended is not None:
+        tail = (source.tail + added)[-_SOURCE_TAIL_BYTES:]
+        if added.endswith(b"\n"):
+            extended._source = _CsvSource(
+                size=source.size + len(added), header=source.header, tail=tail
+            )
+    return extended
+
+
+def _load_csv_pyramid(path: Path, previous: Optional[TimeseriesPyramid]) -> TimeseriesPyramid:
+    if previous is not None:
+        extended = _append_csv(path, previous)
+        if extended is not None:
+            return extended
+    data = path.read_bytes()
+    pyramid = build_timeseries_pyramid(pd.read_csv(io.BytesIO(data)))
+    pyramid._source = _csv_source(data)
+    return pyramid
+
+
+def load_run_timeseries_pyramid(
+    run_dir: str | Path,
+    *,
+    cache: Optional[TimeseriesTileCache] = None,
+) -> TimeseriesPyramid:
+    """
+    Lädt (bzw. holt aus dem Cache) die Tile-Pyramide eines Run-Verzeichnisses.
+
+    Ist ``events.csv`` seit dem letzten gecachten Stand nur gewachsen, werden nur die
+    neuen Zeilen gelesen und die Pyramide fortgeschrieben.
+
+    Args:
+        run_dir: Pfad zum Run-Verzeichnis
+        cache: Optionaler Cache (Default: Modul-Cache)
+
+    Raises:
+        FileNotFoundError: Wenn keine Events-Datei existiert
+    """
+    run_dir = Path(run_dir)
+    cache = cache if cache is not None else _DEFAULT_TILE_CACHE
+    key = _events_file_key(run_dir)
+    path = Path(key[0])
+    if path.suffix == ".csv":
+        return cache.get_or_build(key, lambda: _load_csv_pyramid(path, cache.latest(key[0])))
+    return cache.get_or_build(key, lambda: build_timeseries_pyramid(load_run_events(run_dir)))
+
+
+def parse_range_bound(value: Optional[str]) -> Optional[int]:
+    """ISO-8601-Zeitstempel (naiv = UTC) -> ns seit Epoch; None bleibt None."""
+    if value is None or value == "":
+        return None
+    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    ts = pd.Timestamp(dt)
+    if ts.tzinfo is None:
+        ts = ts.tz_localize("UTC")
+    return int(ts.value)
+
+
+__all__ = [
+    "DEFAULT_MAX_POINTS",
+    "DOWNSAMPLE_METHODS",
+    "MAX_POINTS_LIMIT",
+    "TIMESERIES_METRICS",
+    "DownsampledSeries",
+    "TimeseriesPyramid",
+    "TimeseriesTileCache",
+    "build_timeseries_pyramid",
+    "downsample_indices",
+    "load_run_timeseries_pyramid",
+    "lttb_indices",
+    "minmax_indices",
+    "parse_range_bound",
+]
@@ -6,12 +6,22 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
 
+import numpy as np
 import pandas as pd
 from fastapi import APIRouter, HTTPException, Query, Request
 from fastapi.responses import StreamingResponse
 
 from ..monitoring import list_runs as monitoring_list_runs
 from ..run_logging import load_run_events, load_run_metadata
+from ..timeseries_downsampling import (
+    DOWNSAMPLE_METHODS,
+    MAX_POINTS_LIMIT,
+    DownsampledSeries,
+    TIMESERIES_METRICS,
+    TimeseriesPyramid,
+    load_run_timeseries_pyramid,
+    parse_range_bound,
+)
 from .models_v0 import (
     EquityPointV0,
     EventItemV02,
@@ -31,6 +41,8 @@ from .models_v0 import (
     RunSummaryV02,
     SignalPointV0B,
     SignalsResponseV0B,
+    TimeseriesPointV0,
+    TimeseriesResponseV0,
 )
 
 
@@ -146,11 +158,98 @@ def build_api_v0_router(
             total_blocked_orders=snapshot.total_blocked_orders,
         )
 
+    def _load_pyramid_v0(run_id: str, missing_detail: str) -> TimeseriesPyramid:
+        run_dir = _run_dir_for(run_id)
+        try:
+            return load_run_timeseries_pyramid(run_dir)
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail=f"{missing_detail}: {run_id}")
+
+    def _range_v0(start: Optional[str], end: Optional[str]) -> tuple[Optional[int], Optional[int]]:
+        try:
+            return parse_range_bound(start), parse_range_bound(end)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="invalid_range")
+
+    def _query_v0(
+        pyramid: TimeseriesPyramid,
+        metric: str,
+        start: Optional[str],
+        end: Optional[str],
+        max_points: int,
+        method: str,
+    ) -> DownsampledSeries:
+        start_ns, end_ns = _range_v0(start, end)
+        try:
+            return pyramid.query(
+                metric, start=start_ns, end=end_ns, max_points=max_points, method=method
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    @router.get("/runs/{run_id}/timeseries", response_model=TimeseriesResponseV0)
+    async def api_v0_run_timeseries(
+        run_id: str,
+        metric: str = Query(default="equity"),
+        start: Optional[str] = Query(default=None),
+        end: Optional[str] = Query(default=None),
+        max_points: int = Query(default=1000, ge=2, le=MAX_POINTS_LIMIT),
+        method: str = Query(default="lttb"),
+    ) -> TimeseriesResponseV0:
+        """Downsampled metric series (LTTB/min-max over precomputed tiles, cached per run)."""
+        if metric not in TIMESERIES_METRICS:
+            raise HTTPException(status_code=400, detail=f"unknown_metric: {metric}")
+        if method not in DOWNSAMPLE_METHODS:
+            raise HTTPException(status_code=400, detail=f"unknown_downsample_method: {method}")
+        pyramid = _load_pyramid_v0(run_id, "timeseries_not_available")
+        series = _query_v0(pyramid, metric, start, end, max_points, method)
+        values = pyramid.columns[metric][series.indices]
+        return TimeseriesResponseV0(
+            run_id=run_id,
+            metric=metric,
+            method=method,
+            level=series.level,
+            source_points=series.source_points,
+            count=len(series.indices),
+            start=start,
+            end=end,
+            points=[
+                TimeseriesPointV0(ts=ts, value=float(v))
+                for ts, v in zip(pyramid.ts[series.indices], values)
+            ],
+        )
+
     @router.get("/runs/{run_id}/equity", response_model=List[EquityPointV0])
     async def api_v0_run_equity(
         run_id: str,
         limit: int = Query(default=500, ge=1, le=5000),
+        max_points: Optional[int] = Query(default=None, ge=2, le=MAX_POINTS_LIMIT),
+        start: Optional[str] = Query(default=None),
+        end: Optional[str] = Query(default=None),
+        method: str = Query(default="lttb"),
     ) -> List[EquityPointV0]:
+        if max_points is not None or start is not None or end is not None:
+            # Downsampled over the full run (or [start, end]) instead of the last `limit` rows.
+            if method not in DOWNSAMPLE_METHODS:
+                raise HTTPException(status_code=400, detail=f"unknown_downsample_method: {method}")
+            pyramid = _load_pyramid_v0(run_id, "equity_not_available")
+            series = _query_v0(pyramid, "equity", start, end, max_points or limit, method)
+
+            def _opt(metric: str, i: int) -> Optional[float]:
+                v = pyramid.columns[metric][i]
+                return float(v) if np.isfinite(v) else None
+
+            return [
+                EquityPointV0(
+                    ts=str(pyramid.ts[i]),
+                    equity=_opt("equity", i),
+                    realized_pnl=_opt("realized_pnl", i),
+                    unrealized_pnl=_opt("unrealized_pnl", i),
+                    drawdown=_opt("drawdown", i),
+                )
+                for i in series.indices
+            ]
+
         run_dir = _run_dir_for(run_id)
         try:
             events_df = load_run_events(run_dir)
@@ -121,6 +121,27 @@ class EquityPointV0(BaseModel):
     drawdown: Optional[float] = None
 
 
+class TimeseriesPointV0(BaseModel):
+    """v0: downsampled time series point."""
+
+    ts: str
+    value: float
+
+
+class TimeseriesResponseV0(BaseModel):
+    """v0: downsampled metric series (bounded point count, optional range)."""
+
+    run_id: str
+    metric: str
+    method: str
+    level: int
+    source_points: int
+    count: int
+    start: Optional[str] = None
+    end: Optional[str] = None
+    points: List[TimeseriesPointV0]
+
+
 class SignalPointV0B(BaseModel):
     """v0.1B: signal point (best effort, read-only)."""
 
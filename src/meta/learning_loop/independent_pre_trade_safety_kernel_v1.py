@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Callable, Mapping
 
 from scripts.ops.primary_evidence_retention_v0 import (
     is_under_tmp,
@@ -54,6 +54,7 @@ from src.meta.learning_loop.venue_capability_snapshot_v1 import (
     VenueCapabilitySnapshotError,
     reverify_venue_capability_snapshot_v1,
 )
+from src.meta.learning_loop.verified_bundle_cache_v1 import verify_bundle_cached_v1
 
 CONTRACT_NAME = "independent_pre_trade_safety_kernel_v1"
 CONTRACT_VERSION = "v1"
@@ -709,21 +710,48 @@ def _validate_inline_snapshot_binding(
     return facts
 
 
+def _verify_bundle_integrity(
+    path: Path,
+    *,
+    kind: str,
+    artifact_rel: str,
+    reverify: Callable[..., None],
+    reverify_error: type[Exception],
+) -> None:
+    """MANIFEST.sha256 + owner reverify, skipped while an unchanged pass is cached."""
+
+    def _check() -> None:
+        ok, msg = verify_manifest_sha256(path)
+        if not ok:
+            raise IndependentPreTradeSafetyKernelError(
+                f"MANIFEST.sha256 verification failed: {msg}"
+            )
+        artifact_path = path / artifact_rel
+        _validate_regular_file(artifact_path, label=artifact_rel)
+        read_manifest(artifact_path)
+        try:
+            reverify(output_dir=path)
+        except reverify_error as exc:
+            raise IndependentPreTradeSafetyKernelError(str(exc)) from exc
+
+    verify_bundle_cached_v1(f"{CONTRACT_NAME}:{kind}", path, _check)
+
+
 def verify_order_intent_idempotency_bundle(
     bundle_dir: Path | str,
 ) -> VerifiedOrderIntentIdempotencyBundle:
     path = Path(bundle_dir)
     _validate_bundle_dir(path, label="order_intent_idempotency_bundle_dir")
-    ok, msg = verify_manifest_sha256(path)
-    if not ok:
-        raise IndependentPreTradeSafetyKernelError(f"MANIFEST.sha256 verification failed: {msg}")
     artifact_path = path / IDEMPOTENCY_ARTIFACT_REL
+    _verify_bundle_integrity(
+        path,
+        kind="order_intent_idempotency",
+        artifact_rel=IDEMPOTENCY_ARTIFACT_REL,
+        reverify=reverify_order_intent_idempotency_v1,
+        reverify_error=OrderIntentIdempotencyError,
+    )
     _validate_regular_file(artifact_path, label=IDEMPOTENCY_ARTIFACT_REL)
     payload = read_manifest(artifact_path)
-    try:
-        reverify_order_intent_idempotency_v1(output_dir=path)
-    except OrderIntentIdempotencyError as exc:
-        raise IndependentPreTradeSafetyKernelError(str(exc)) from exc
     intent = _extract_order_intent_fields(payload)
     executor_epoch = str(payload.get("executor_epoch", intent["trading_epoch"]))
     revocation_epoch = str(
@@ -773,16 +801,16 @@ def verify_runtime_state_reconciliation_bundle(
 ) -> VerifiedRuntimeStateReconciliationBundle:
     path = Path(bundle_dir)
     _validate_bundle_dir(path, label="runtime_state_reconciliation_bundle_dir")
-    ok, msg = verify_manifest_sha256(path)
-    if not ok:
-        raise IndependentPreTradeSafetyKernelError(f"MANIFEST.sha256 verification failed: {msg}")
     artifact_path = path / RECONCILIATION_ARTIFACT_REL
+    _verify_bundle_integrity(
+        path,
+        kind="runtime_state_reconciliation",
+        artifact_rel=RECONCILIATION_ARTIFACT_REL,
+        reverify=reverify_runtime_state_reconciliation_v1,
+        reverify_error=RuntimeStateReconciliationError,
+    )
     _validate_regular_file(artifact_path, label=RECONCILIATION_ARTIFACT_REL)
     payload = read_manifest(artifact_path)
-    try:
-        reverify_runtime_state_reconciliation_v1(output_dir=path)
-    except RuntimeStateReconciliationError as exc:
-        raise IndependentPreTradeSafetyKernelError(str(exc)) from exc
     return VerifiedRuntimeStateReconciliationBundle(
         bundle_dir=path,
         contract_name=str(payload.get("contract_name", "")),
@@ -805,16 +833,16 @@ def verify_trading_core_decision_attestation_bundle(
 ) -> VerifiedTradingCoreDecisionAttestationBundle:
     path = Path(bundle_dir)
     _validate_bundle_dir(path, label="trading_core_decision_attestation_bundle_dir")
-    ok, msg = verify_manifest_sha256(path)
-    if not ok:
-        raise IndependentPreTradeSafetyKernelError(f"MANIFEST.sha256 verification failed: {msg}")
     artifact_path = path / ATTESTATION_ARTIFACT_REL
+    _verify_bundle_integrity(
+        path,
+        kind="trading_core_decision_attestation",
+        artifact_rel=ATTESTATION_ARTIFACT_REL,
+        reverify=reverify_trading_core_decision_attestation_v1,
+        reverify_error=TradingCoreDecisionAttestationError,
+    )
     _validate_regular_file(artifact_path, label=ATTESTATION_ARTIFACT_REL)
     payload = read_manifest(artifact_path)
-    try:
-        reverify_trading_core_decision_attestation_v1(output_dir=path)
-    except TradingCoreDecisionAttestationError as exc:
-        raise IndependentPreTradeSafetyKernelError(str(exc)) from exc
     intent = payload.get("canonical_order_intent_identity", {})
     if not isinstance(intent, Mapping):
         intent = {}
@@ -849,16 +877,16 @@ def verify_venue_capability_snapshot_bundle(
 ) -> VerifiedVenueCapabilitySnapshotBundle:
     path = Path(bundle_dir)
     _validate_bundle_dir(path, label="venue_capability_snapshot_bundle_dir")
-    ok, msg = verify_manifest_sha256(path)
-    if not ok:
-        raise IndependentPreTradeSafetyKernelError(f"MANIFEST.sha256 verification failed: {msg}")
     artifact_path = path / VENUE_CAPABILITY_ARTIFACT_REL
+    _verify_bundle_integrity(
+        path,
+        kind="venue_capability_snapshot",
+        artifact_rel=VENUE_CAPABILITY_ARTIFACT_REL,
+        reverify=reverify_venue_capability_snapshot_v1,
+        reverify_error=VenueCapabilitySnapshotError,
+    )
     _validate_regular_file(artifact_path, label=VENUE_CAPABILITY_ARTIFACT_REL)
     payload = read_manifest(artifact_path)
-    try:
-        reverify_venue_capability_snapshot_v1(output_dir=path)
-    except VenueCapabilitySnapshotError as exc:
-        raise IndependentPreTradeSafetyKernelError(str(exc)) from exc
     return VerifiedVenueCapabilitySnapshotBundle(
         bundle_dir=path,
         contract_name=str(payload.get("contract_name", "")),
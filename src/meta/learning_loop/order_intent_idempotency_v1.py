@@ -40,6 +40,7 @@ from src.meta.learning_loop.contract_safety_v1 import (
     compute_content_sha256,
     deterministic_json_dumps,
 )
+from src.meta.learning_loop.verified_bundle_cache_v1 import verify_bundle_cached_v1
 
 CONTRACT_NAME = "order_intent_idempotency_v1"
 CONTRACT_VERSION = "v1"
@@ -549,27 +550,37 @@ def derive_canonical_idempotency_key(
     )
 
 
+def _validate_lifecycle_identity(payload: Mapping[str, Any]) -> None:
+    if payload.get("contract_name") != LIFECYCLE_CONTRACT_NAME:
+        raise OrderIntentIdempotencyError("lifecycle contract_name mismatch")
+    if payload.get("contract_version") != LIFECYCLE_OWNER_CONTRACT_VERSION:
+        raise OrderIntentIdempotencyError("lifecycle contract_version mismatch")
+
+
 def verify_canonical_order_lifecycle_bundle(
     bundle_dir: Path | str,
 ) -> VerifiedCanonicalOrderLifecycleBundle:
     path = Path(bundle_dir)
     _validate_bundle_dir(path, label="canonical order lifecycle bundle")
-    ok, msg = verify_manifest_sha256(path)
-    if not ok:
-        raise OrderIntentIdempotencyError(f"lifecycle MANIFEST.sha256 verification failed: {msg}")
-
     artifact_path = path / LIFECYCLE_ARTIFACT_REL
+
+    def _check() -> None:
+        ok, msg = verify_manifest_sha256(path)
+        if not ok:
+            raise OrderIntentIdempotencyError(
+                f"lifecycle MANIFEST.sha256 verification failed: {msg}"
+            )
+        _validate_regular_file(artifact_path, label=LIFECYCLE_ARTIFACT_REL)
+        _validate_lifecycle_identity(read_manifest(artifact_path))
+        try:
+            reverify_canonical_order_lifecycle_v1(output_dir=path)
+        except CanonicalOrderLifecycleError as exc:
+            raise OrderIntentIdempotencyError(str(exc)) from exc
+
+    verify_bundle_cached_v1(f"{CONTRACT_NAME}:canonical_order_lifecycle", path, _check)
     _validate_regular_file(artifact_path, label=LIFECYCLE_ARTIFACT_REL)
     payload = read_manifest(artifact_path)
-    if payload.get("contract_name") != LIFECYCLE_CONTRACT_NAME:
-        raise OrderIntentIdempotencyError("lifecycle contract_name mismatch")
-    if payload.get("contract_version") != LIFECYCLE_OWNER_CONTRACT_VERSION:
-        raise OrderIntentIdempotencyError("lifecycle contract_version mismatch")
-
-    try:
-        reverify_canonical_order_lifecycle_v1(output_dir=path)
-    except CanonicalOrderLifecycleError as exc:
-        raise OrderIntentIdempotencyError(str(exc)) from exc
+    _validate_lifecycle_identity(payload)
 
     lifecycle_evidence_digest = str(payload.get("lifecycle_evidence_digest", ""))
     lifecycle_contract_digest = compute_content_sha256(
@@ -0,0 +1,308 @@
+"""Offline verified-bundle cache for learning-loop evidence verification v1.
+
+Records successful bundle verifications keyed by verification kind, resolved
+bundle path and a stat fingerprint of every entry in the bundle
+(inode, size, mtime_ns, ctime_ns) plus the MANIFEST.sha256 digest.
+
+Upstream bundles verified while a verification runs (observed through
+``verify_manifest_sha256``) are fingerprinted as dependencies, so a change
+anywhere in the verified chain invalidates the record. Failures are never
+recorded; a lookup that cannot prove an unchanged chain falls back to full
+verification (fail closed).
+
+As with the kill-switch state reader, a verification is not recorded while any
+fingerprinted entry has an mtime/ctime within ``RACY_WINDOW_NS`` of the check
+time: an in-place rewrite of equal size inside the filesystem timestamp
+granularity would otherwise leave the fingerprint unchanged.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from time import time_ns
+from typing import Any, Callable
+
+from scripts.ops.primary_evidence_retention_v0 import (
+    MANIFEST_FILENAME,
+    add_manifest_verify_observer,
+)
+from src.ops.gates.kill_switch_state_reader import RACY_WINDOW_NS
+
+CACHE_SCHEMA_VERSION = "verified_bundle_cache_v1"
+
+_MISSING: tuple[Any, ...] = ("missing",)
+
+_ACTIVE_FRAMES: ContextVar[tuple[dict[str, tuple[Any, ...]], ...]] = ContextVar(
+    "verified_bundle_cache_v1_frames", default=()
+)
+
+
+def bundle_fingerprint_v1(bundle_dir: Path | str) -> tuple[Any, ...]:
+    """Stat fingerprint of a bundle directory; ``("missing",)`` if unreadable."""
+    root = Path(bundle_dir)
+    try:
+        root_stat = os.lstat(root)
+        manifest_digest = hashlib.sha256((root / MANIFEST_FILENAME).read_bytes()).hexdigest()
+        entries: list[tuple[Any, ...]] = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            rel_dir = os.path.relpath(dirpath, root)
+            for name in sorted(dirnames + filenames):
+                st = os.lstat(os.path.join(dirpath, name))
+                entries.append(
+                    (
+                        os.path.normpath(os.path.join(rel_dir, name)),
+                        st.st_mode,
+                        st.st_ino,
+                        st.st_size,
+                        st.st_mtime_ns,
+                        st.st_ctime_ns,
+                    )
+                )
+    except OSError:
+        return _MISSING
+    return (
+        manifest_digest,
+        (root_stat.st_ino, root_stat.st_mtime_ns, root_stat.st_ctime_ns),
+        tuple(entries),
+    )
+
+
+def _newest_stamp_ns(fingerprint: tuple[Any, ...]) -> int:
+    """Newest mtime/ctime in a :func:`bundle_fingerprint_v1` result."""
+    _, (_, root_mtime, root_ctime), entries = fingerprint
+    return max(
+        [root_mtime, root_ctime] + [stamp for entry in entries for stamp in (entry[4], entry[5])]
+    )
+
+
+def _as_tuple(value: Any) -> Any:
+    if isinstance(value, list):
+        return tuple(_as_tuple(item) for item in value)
+    return value
+
+
+def _record_fingerprints(fingerprints: dict[str, tuple[Any, ...]]) -> None:
+    for frame in _ACTIVE_FRAMES.get():
+        for root, fingerprint in fingerprints.items():
+            frame.setdefault(root, fingerprint)
+
+
+def _observe_manifest_verification(root: Path) -> None:
+    if not _ACTIVE_FRAMES.get():
+        return
+    resolved = str(Path(root).resolve())
+    _record_fingerprints({resolved: bundle_fingerprint_v1(resolved)})
+
+
+@dataclass(frozen=True)
+class _VerifiedBundleRecord:
+    manifest_digest: str
+    fingerprints: tuple[tuple[str, tuple[Any, ...]], ...]
+
+
+class VerifiedBundleCacheV1:
+    """Process-wide record of successful bundle verifications (optionally persisted)."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 4096,
+        persist_path: Path | str | None = None,
+        enabled: bool = True,
+    ) -> None:
+        self.max_entries = max_entries
+        self.persist_path = Path(persist_path) if persist_path is not None else None
+        self.enabled = enabled
+        self._records: OrderedDict[tuple[str, str], _VerifiedBundleRecord] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if self.persist_path is not None:
+            self._load()
+
+    def verify(
+        self,
+        kind: str,
+        bundle_dir: Path | str,
+        check: Callable[[], None],
+    ) -> bool:
+        """
+        Run ``check()`` unless an unchanged successful verification is recorded.
+
+        ``check`` must raise on any verification failure. Returns True when the
+        verification was served from the cache. Successful checks of bundles
+        with racy timestamps are not recorded.
+        """
+        resolved = str(Path(bundle_dir).resolve())
+        key = (kind, resolved)
+        if not self.enabled:
+            check()
+            return False
+
+        with self._lock:
+            record = self._records.get(key)
+        if record is not None and all(
+            bundle_fingerprint_v1(root) == fingerprint for root, fingerprint in record.fingerprints
+        ):
+            with self._lock:
+                self.hits += 1
+                if key in self._records:
+                    self._records.move_to_end(key)
+            _record_fingerprints(dict(record.fingerprints))
+            return True
+
+        own = bundle_fingerprint_v1(resolved)
+        frame: dict[str, tuple[Any, ...]] = {resolved: own}
+        token = _ACTIVE_FRAMES.set(_ACTIVE_FRAMES.get() + (frame,))
+        _record_fingerprints({resolved: own})
+        try:
+            check()
+        except BaseException:
+            self._discard(key)
+            raise
+        finally:
+            _ACTIVE_FRAMES.reset(token)
+
+        with self._lock:
+            self.misses += 1
+        if own is _MISSING:
+            self._discard(key)
+            return False
+        if any(bundle_fingerprint_v1(root) != fingerprint for root, fingerprint in frame.items()):
+            # Something changed while verifying; do not vouch for either state.
+            self._discard(key)
+            return False
+        now_ns = time_ns()
+        if any(
+            now_ns - _newest_stamp_ns(fp) < RACY_WINDOW_NS
+            for fp in frame.values()
+            if fp != _MISSING
+        ):
+            # Racy timestamps: a same-size rewrite could keep this fingerprint.
+            self._discard(key)
+            return False
+        self._store(key, _VerifiedBundleRecord(str(own[0]), tuple(sorted(frame.items()))))
+        return False
+
+    def invalidate(self, bundle_dir: Path | str | None = None) -> None:
+        """Drop records for ``bundle_dir`` (any kind) or all records."""
+        with self._lock:
+            if bundle_dir is None:
+                self._records.clear()
+            else:
+                resolved = str(Path(bundle_dir).resolve())
+                for key in [k for k in self._records if k[1] == resolved]:
+                    del self._records[key]
+        self._save()
+
+    def clear(self) -> None:
+        self.invalidate()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._records), "hits": self.hits, "misses": self.misses}
+
+    def _discard(self, key: tuple[str, str]) -> None:
+        with self._lock:
+            removed = self._records.pop(key, None) is not None
+        if removed:
+            self._save()
+
+    def _store(self, key: tuple[str, str], record: _VerifiedBundleRecord) -> None:
+        with self._lock:
+            self._records[key] = record
+            self._records.move_to_end(key)
+            while len(self._records) > self.max_entries:
+                self._records.popitem(last=False)
+        self._save()
+
+    def _load(self) -> None:
+        assert self.persist_path is not None
+        try:
+            payload = json.loads(self.persist_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(payload, dict) or payload.get("schema_version") != CACHE_SCHEMA_VERSION:
+            return
+        for item in payload.get("records", []):
+            try:
+                key = (str(item["kind"]), str(item["bundle_dir"]))
+                fingerprints = tuple(
+                    (str(root), _as_tuple(fingerprint))
+                    for root, fingerprint in item["fingerprints"]
+                )
+                self._records[key] = _VerifiedBundleRecord(
+                    str(item["manifest_digest"]), fingerprints
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+
+    def _save(self) -> None:
+        if self.persist_path is None:
+            return
+        with self._lock:
+            records = [
+                {
+                    "kind": kind,
+                    "bundle_dir": bundle_dir,
+                    "manifest_digest": record.manifest_digest,
+                    "fingerprints": [list(item) for item in record.fingerprints],
+                }
+                for (kind, bundle_dir), record in self._records.items()
+            ]
+        body = json.dumps(
+            {"schema_version": CACHE_SCHEMA_VERSION, "records": records},
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        self.persist_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.persist_path.with_name(
+            f".{self.persist_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        tmp_path.write_text(body, encoding="utf-8")
+        os.replace(tmp_path, self.persist_path)
+
+
+_DEFAULT_CACHE = VerifiedBundleCacheV1()
+
+
+def get_verified_bundle_cache_v1() -> VerifiedBundleCacheV1:
+    """The cache shared by learning-loop bundle verifiers in this process."""
+    return _DEFAULT_CACHE
+
+
+def configure_verified_bundle_cache_v1(
+    *,
+    persist_path: Path | str | None = None,
+    enabled: bool = True,
+    max_entries: int = 4096,
+) -> VerifiedBundleCacheV1:
+    """Replace the shared cache (e.g. to persist records on disk or disable caching)."""
+    global _DEFAULT_CACHE
+    _DEFAULT_CACHE = VerifiedBundleCacheV1(
+        max_entries=max_entries, persist_path=persist_path, enabled=enabled
+    )
+    return _DEFAULT_CACHE
+
+
+def verify_bundle_cached_v1(
+    kind: str,
+    bundle_dir: Path | str,
+    check: Callable[[], None],
+) -> bool:
+    """``get_verified_bundle_cache_v1().verify(...)``."""
+    return _DEFAULT_CACHE.verify(kind, bundle_dir, check)
+
+
+add_manifest_verify_observer(_observe_manifest_verification)
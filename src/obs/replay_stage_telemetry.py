@@ -0,0 +1,172 @@
+"""
+MV2 Offline Replay Stage Telemetry (research/backtest safe)
+===========================================================
+
+Prometheus metrics for the opt-in per-stage profiler of the integrated
+MV2 offline trading logic replay
+(``trading.master_v2.integrated_offline_replay_stage_profiler_v1``).
+
+Hard constraints:
+- NO-LIVE: telemetry only; must never enable trading or change decisions.
+- Low-cardinality labels: stage names from a finite allowlist only; NO symbol,
+  NO run_id, NO epoch labels.
+- Graceful degradation: no-op if prometheus_client unavailable or registration fails.
+
+Metrics (v1):
+- peaktrade_mv2_replay_stage_seconds{stage}  (histogram)
+- peaktrade_mv2_replay_cycle_seconds  (histogram, one sample per replay cycle)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+Histogram = None  # type: ignore
+_PROM_AVAILABLE = False
+
+
+_METRICS_INIT = False
+
+_REPLAY_STAGE_SECONDS: Optional["Histogram"] = None
+_REPLAY_CYCLE_SECONDS: Optional["Histogram"] = None
+
+
+def _metrics_mode() -> str:
+    return (os.getenv("PEAKTRADE_METRICS_MODE", "") or "").strip().upper() or "A"
+
+
+def _mode_b_multiproc_dir() -> str:
+    # Default matches metricsd default.
+    return (
+        os.getenv("PEAKTRADE_METRICS_MULTIPROC_DIR", "") or ""
+    ).strip() or ".ops_local/prom_multiproc"
+
+
+# Mirrors REPLAY_STAGES_V1 of the profiler; unknown stages are dropped, not relabeled.
+_ALLOWED_REPLAY_STAGES = {
+    "input_guards",
+    "market_context_binding",
+    "typed_volatility_gate",
+    "scope_resolution",
+    "scope_event",
+    "directional_confirmation",
+    "survival",
+    "suitability",
+    "composition",
+    "state_switch",
+    "entry_exit",
+    "decision_evidence",
+}
+
+# Replay stages run in microseconds to milliseconds per bar.
+_STAGE_BUCKETS_S = (
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    1.0,
+)
+
+
+def _sanitize_stage(stage: str) -> Optional[str]:
+    s = (stage or "").strip().lower()
+    return s if s in _ALLOWED_REPLAY_STAGES else None
+
+
+def _ensure_metrics() -> None:
+    global _METRICS_INIT
+    global _REPLAY_STAGE_SECONDS, _REPLAY_CYCLE_SECONDS
+
+    if _METRICS_INIT:
+        return
+    _METRICS_INIT = True
+
+    global Histogram, _PROM_AVAILABLE
+
+    # Mode B: multiprocess workers must set PROMETHEUS_MULTIPROC_DIR before
+    # importing prometheus_client.
+    if _metrics_mode() == "B":
+        os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", _mode_b_multiproc_dir())
+
+    try:
+        from prometheus_client import Histogram as _Histogram  # type: ignore
+
+        Histogram = _Histogram  # type: ignore[misc]
+        _PROM_AVAILABLE = True
+    except Exception:  # pragma: no cover
+        Histogram = None  # type: ignore
+        _PROM_AVAILABLE = False
+        return
+
+    try:
+        _REPLAY_STAGE_SECONDS = Histogram(  # type: ignore[misc]
+            "peaktrade_mv2_replay_stage_seconds",
+            "Wall time per stage of the integrated MV2 offline replay (opt-in profiler).",
+            labelnames=("stage",),
+            buckets=_STAGE_BUCKETS_S,
+        )
+        _REPLAY_CYCLE_SECONDS = Histogram(  # type: ignore[misc]
+            "peaktrade_mv2_replay_cycle_seconds",
+            "Wall time per integrated MV2 offline replay cycle (opt-in profiler).",
+            buckets=_STAGE_BUCKETS_S,
+        )
+    except Exception:
+        # If metrics registration fails (e.g. duplicate registry), degrade to no-op.
+        logger.warning(
+            "Replay stage telemetry metrics init failed; telemetry will be no-op.", exc_info=True
+        )
+        _REPLAY_STAGE_SECONDS = None
+        _REPLAY_CYCLE_SECONDS = None
+
+
+def ensure_registered() -> None:
+    """
+    Ensure replay stage metrics are registered in the default Prometheus registry.
+
+    Safe to call when prometheus_client is unavailable (no-op).
+    """
+    _ensure_metrics()
+
+
+def observe_replay_stage(*, stage: str, seconds: float) -> None:
+    _ensure_metrics()
+    if not _PROM_AVAILABLE or _REPLAY_STAGE_SECONDS is None:
+        return
+    try:
+        st = _sanitize_stage(stage)
+        if st is None:
+            return
+        _REPLAY_STAGE_SECONDS.labels(stage=st).observe(max(0.0, float(seconds)))
+    except Exception:
+        logger.debug("observe_replay_stage failed (ignored).", exc_info=True)
+
+
+def observe_replay_cycle(*, seconds: float) -> None:
+    _ensure_metrics()
+    if not _PROM_AVAILABLE or _REPLAY_CYCLE_SECONDS is None:
+        return
+    try:
+        _REPLAY_CYCLE_SECONDS.observe(max(0.0, float(seconds)))
+    except Exception:
+        logger.debug("observe_replay_cycle failed (ignored).", exc_info=True)
+
+
+__all__ = [
+    "ensure_registered",
+    "observe_replay_stage",
+    "observe_replay_cycle",
+]
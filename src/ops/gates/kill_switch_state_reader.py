@@ -0,0 +1,185 @@
+"""
+Cached reader for the persisted kill-switch state file.
+
+The order path (bounded_pilot in ``ExecutionPipeline``, the ops risk gate and
+optionally the ``risk_layer`` ``ExecutionGate``) asks "is the persisted kill
+switch blocking?" once per order. Parsing ``data/kill_switch/state.json`` on
+every call costs an ``open`` + ``read`` + JSON parse; this reader keeps the last
+parsed result keyed by a stat fingerprint ``(st_ino, st_size, st_mtime_ns)``
+and only re-parses when the fingerprint changes.
+
+Guarantees:
+
+- Same contract as :func:`src.ops.gates.risk_gate.resolve_kill_switch_limit_from_state_file`
+  (``True`` blocking / ``False`` not blocking / ``None`` missing or unreadable).
+- Per call at most one ``stat``; with ``max_staleness_s > 0`` the ``stat`` is
+  skipped while the cached result is younger than the staleness bound.
+- Fail-closed: ``None`` (missing/unreadable) results are never served from the
+  cache, so a broken file is never promoted to "not blocking" and an operator
+  env fallback (``PEAK_KILL_SWITCH``) keeps working.
+- Racy writes: a fingerprint whose ``mtime`` lies within ``RACY_WINDOW_NS`` of
+  the check time is not trusted (same idea as git's racy-clean index), because
+  an in-place rewrite with equal size inside the filesystem timestamp
+  granularity would otherwise be invisible.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from src.ops.gates.risk_gate import (
+    DEFAULT_KILL_SWITCH_STATE_PATH,
+    resolve_kill_switch_limit_from_state_file,
+)
+
+# mtime granularity guard (see module docstring).
+RACY_WINDOW_NS = 2_000_000_000
+
+_Fingerprint = Tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class KillSwitchStateReaderStats:
+    """Counters for observability and benchmarks."""
+
+    calls: int
+    stats: int
+    reads: int
+    cache_hits: int
+
+
+class KillSwitchStateReader:
+    """
+    Stat-fingerprinted, bounded-staleness reader for one kill-switch state file.
+
+    Thread-safe; one instance per state path is shared via
+    :func:`get_kill_switch_state_reader`.
+    """
+
+    def __init__(
+        self,
+        state_path: Optional[str] = None,
+        *,
+        max_staleness_s: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_staleness_s < 0:
+            raise ValueError("max_staleness_s must be >= 0")
+        self._path = state_path or DEFAULT_KILL_SWITCH_STATE_PATH
+        self._max_staleness_s = float(max_staleness_s)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._fingerprint: Optional[_Fingerprint] = None
+        self._value: Optional[bool] = None
+        self._checked_at: Optional[float] = None
+        self._calls = 0
+        self._stats = 0
+        self._reads = 0
+        self._cache_hits = 0
+
+    @property
+    def state_path(self) -> str:
+        return self._path
+
+    @property
+    def max_staleness_s(self) -> float:
+        return self._max_staleness_s
+
+    def resolve(self) -> Optional[bool]:
+        """Return the cached equivalent of ``resolve_kill_switch_limit_from_state_file``."""
+        with self._lock:
+            self._calls += 1
+            now = self._clock()
+            if (
+                self._max_staleness_s > 0
+                and self._value is not None
+                and self._checked_at is not None
+                and (now - self._checked_at) < self._max_staleness_s
+            ):
+                self._cache_hits += 1
+                return self._value
+
+            self._stats += 1
+            try:
+                st = os.stat(self._path)
+            except OSError:
+                self._invalidate_locked()
+                return None
+            fingerprint = (st.st_ino, st.st_size, st.st_mtime_ns)
+            racy = (time.time_ns() - st.st_mtime_ns) < RACY_WINDOW_NS
+
+            if fingerprint == self._fingerprint and self._value is not None:
+                self._cache_hits += 1
+                self._checked_at = now
+                return self._value
+
+            value = self._read_locked()
+            if value is None or racy:
+                self._invalidate_locked()
+            else:
+                self._fingerprint = fingerprint
+                self._value = value
+                self._checked_at = now
+            return value
+
+    def is_blocking(self) -> bool:
+        """``True`` only when the persisted state is KILLED/RECOVERING."""
+        return self.resolve() is True
+
+    def invalidate(self) -> None:
+        """Drop the cached result (next :meth:`resolve` re-reads the file)."""
+        with self._lock:
+            self._invalidate_locked()
+
+    def stats(self) -> KillSwitchStateReaderStats:
+        with self._lock:
+            return KillSwitchStateReaderStats(
+                calls=self._calls,
+                stats=self._stats,
+                reads=self._reads,
+                cache_hits=self._cache_hits,
+            )
+
+    def _read_locked(self) -> Optional[bool]:
+        self._reads += 1
+        return resolve_kill_switch_limit_from_state_file(self._path)
+
+    def _invalidate_locked(self) -> None:
+        self._fingerprint = None
+        self._value = None
+        self._checked_at = None
+
+
+_READERS: Dict[Tuple[str, float], KillSwitchStateReader] = {}
+_READERS_LOCK = threading.Lock()
+
+
+def get_kill_switch_state_reader(
+    state_path: Optional[str] = None, *, max_staleness_s: float = 0.0
+) -> KillSwitchStateReader:
+    """
+    Return the process-wide shared reader for ``state_path`` (default path if ``None``).
+
+    Readers are shared per ``(state_path, max_staleness_s)``: a caller that tolerates
+    stale results (e.g. a dashboard) never relaxes the order path's default of one
+    ``stat`` per check.
+    """
+    if max_staleness_s < 0:
+        raise ValueError("max_staleness_s must be >= 0")
+    key = (state_path or DEFAULT_KILL_SWITCH_STATE_PATH, float(max_staleness_s))
+    with _READERS_LOCK:
+        reader = _READERS.get(key)
+        if reader is None:
+            reader = KillSwitchStateReader(key[0], max_staleness_s=key[1])
+            _READERS[key] = reader
+        return reader
+
+
+def reset_kill_switch_state_readers() -> None:
+    """Forget all shared readers (tests / after operator path changes)."""
+    with _READERS_LOCK:
+        _READERS.clear()
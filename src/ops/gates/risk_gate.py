@@ -103,15 +103,19 @@ def kill_switch_should_block_trading(*, explicit_active: bool = False) -> bool:
 
     - If ``explicit_active`` is True (e.g. orchestrator constructor), block.
     - Else read state via :func:`kill_switch_state_path_from_env` (default path
-      if unset) and :func:`resolve_kill_switch_limit_from_state_file`.
+      if unset) through the shared stat-cached
+      :class:`~src.ops.gates.kill_switch_state_reader.KillSwitchStateReader`
+      (same contract as :func:`resolve_kill_switch_limit_from_state_file`).
     - If resolver returns ``True``, block.
     - If ``None`` (missing/unreadable file), fall back to ``PEAK_KILL_SWITCH``.
     - If ``False`` (file says ACTIVE), do not block.
     """
     if explicit_active:
         return True
+    from src.ops.gates.kill_switch_state_reader import get_kill_switch_state_reader
+
     path = kill_switch_state_path_from_env()
-    resolved = resolve_kill_switch_limit_from_state_file(path)
+    resolved = get_kill_switch_state_reader(path).resolve()
     if resolved is True:
         return True
     if resolved is None:
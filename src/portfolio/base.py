@@ -17,8 +17,9 @@ from __future__ import annotations
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Protocol, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Protocol, Tuple, TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 
 if TYPE_CHECKING:
@@ -193,6 +194,87 @@ class BasePortfolioStrategy(ABC):
 
         return final_weights
 
+    def _compute_raw_weight_matrix(
+        self, symbols: List[str], closes: np.ndarray
+    ) -> Optional[Tuple[List[str], np.ndarray]]:
+        """
+        Berechnet rohe Gewichte für alle Bars auf einmal (optional).
+
+        Gegenstück zu `_compute_raw_weights` für den Matrix-Simulator. Bar t
+        entspricht einem Context mit ``symbols``, den Preisen ``closes[t]`` und
+        der Schlusskurs-Historie ``closes[: t + 1]``. Strategien, deren Gewichte
+        von Positionen, Equity oder Signalen abhängen, liefern None.
+
+        Args:
+            symbols: Context-Symbole (Spalten von ``closes``)
+            closes: Schlusskurse (bars × symbols)
+
+        Returns:
+            (Gewichts-Spalten in Dict-Reihenfolge, Matrix bars × Spalten mit
+            NaN = kein Gewicht) oder None
+        """
+        return None
+
+    def generate_target_weight_matrix(
+        self, symbols: List[str], closes: np.ndarray
+    ) -> Optional[Tuple[List[str], np.ndarray]]:
+        """
+        Vektorisierte Variante von `generate_target_weights` über alle Bars.
+
+        Liefert Zeile für Zeile exakt die Gewichte, die `generate_target_weights`
+        für den entsprechenden Context berechnen würde (gleiche Summations-
+        reihenfolge). NaN markiert Symbole, die im Dict fehlen würden.
+
+        Args:
+            symbols: Context-Symbole (Spalten von ``closes``)
+            closes: Schlusskurse (bars × symbols)
+
+        Returns:
+            (Spalten, Gewichtsmatrix) oder None, wenn die Strategie (bzw. eine
+            überschriebene Basismethode) nur Bar-für-Bar auswertbar ist
+        """
+        cls = type(self)
+        for method in (
+            "generate_target_weights",
+            "_apply_constraints",
+            "_normalize_weights",
+            "get_universe",
+        ):
+            if getattr(cls, method) is not getattr(BasePortfolioStrategy, method):
+                return None
+
+        raw = self._compute_raw_weight_matrix(symbols, closes)
+        if raw is None:
+            return None
+        columns, weights = raw
+
+        constrained = self._apply_constraints_matrix(weights)
+        if self.config.normalize_weights:
+            constrained = self._normalize_weights_matrix(constrained)
+        return columns, constrained
+
+    def _apply_constraints_matrix(self, weights: np.ndarray) -> np.ndarray:
+        """Matrix-Variante von `_apply_constraints` (NaN = entfernt)."""
+        max_weight = self.config.max_single_weight
+        result = np.where(np.abs(weights) < self.config.min_weight, np.nan, weights)
+        result = np.where(result > max_weight, max_weight, result)
+        return np.where(result < -max_weight, -max_weight, result)
+
+    def _normalize_weights_matrix(self, weights: np.ndarray) -> np.ndarray:
+        """Matrix-Variante von `_normalize_weights` (zeilenweise)."""
+        long_sum = sequential_row_sum(np.where(weights > 0, weights, 0.0))
+        short_sum = np.abs(sequential_row_sum(np.where(weights < 0, weights, 0.0)))
+        divisor = np.where(long_sum > 0, long_sum, np.where(short_sum > 0, short_sum, 1.0))
+        scale = (long_sum > 0) | (short_sum > 0)
+        return np.where(scale[:, None], weights / divisor[:, None], weights)
+
+    def get_universe_indices(self, symbols: List[str]) -> List[int]:
+        """Spaltenindizes des aktiven Universe (Reihenfolge wie `get_universe`)."""
+        if self.config.symbols:
+            positions = {s: i for i, s in enumerate(symbols)}
+            return [positions[s] for s in self.config.symbols if s in positions]
+        return list(range(len(symbols)))
+
     def _apply_constraints(self, weights: Dict[str, float]) -> Dict[str, float]:
         """
         Wendet Constraints auf Gewichte an.
@@ -289,6 +371,19 @@ class BasePortfolioStrategy(ABC):
         return f"<{self.name}(enabled={self.config.enabled}, strategy={self.config.name})>"
 
 
+def sequential_row_sum(values: np.ndarray) -> np.ndarray:
+    """
+    Zeilensummen in Spaltenreihenfolge, links-assoziativ wie ``sum()`` über ein Dict.
+
+    ``np.sum`` summiert paarweise und weicht dadurch in den letzten Bits ab;
+    für bitgleiche Gewichte wird hier strikt sequentiell akkumuliert.
+    """
+    total = np.zeros(values.shape[0])
+    for column in values.T:
+        total = total + column
+    return total
+
+
 def make_portfolio_strategy(config: "PortfolioConfig") -> Optional[BasePortfolioStrategy]:
     """
     Factory-Funktion: Erstellt Portfolio-Strategie basierend auf Config.
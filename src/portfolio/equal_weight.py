@@ -11,7 +11,9 @@ Dies ist die einfachste Portfolio-Strategie und dient als Baseline.
 from __future__ import annotations
 
 import logging
-from typing import Dict, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+import numpy as np
 
 from .base import BasePortfolioStrategy, PortfolioContext
 
@@ -86,3 +88,19 @@ class EqualWeightPortfolioStrategy(BasePortfolioStrategy):
         logger.debug(f"{self.name}: Equal weights für {n} Symbole: {weight:.4f} pro Symbol")
 
         return weights
+
+    def _compute_raw_weight_matrix(
+        self, symbols: List[str], closes: np.ndarray
+    ) -> Optional[Tuple[List[str], np.ndarray]]:
+        """Gleichgewichte für alle Bars (konstant über die Zeit)."""
+        if type(self)._compute_raw_weights is not EqualWeightPortfolioStrategy._compute_raw_weights:
+            return None
+        return equal_weight_matrix(symbols, self.get_universe_indices(symbols), len(closes))
+
+
+def equal_weight_matrix(
+    symbols: List[str], universe: List[int], n_bars: int
+) -> Tuple[List[str], np.ndarray]:
+    """1/n für jedes Universe-Symbol und jeden Bar (leere Matrix bei leerem Universe)."""
+    weights = np.full((n_bars, len(universe)), 1.0 / len(universe) if universe else np.nan)
+    return [symbols[i] for i in universe], weights
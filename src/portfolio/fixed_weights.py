@@ -9,9 +9,12 @@ Portfolio-Strategie mit festen, vordefinierten Gewichten aus der Config.
 from __future__ import annotations
 
 import logging
-from typing import Dict, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+import numpy as np
 
 from .base import BasePortfolioStrategy, PortfolioContext
+from .equal_weight import equal_weight_matrix
 
 if TYPE_CHECKING:
     from .config import PortfolioConfig
@@ -128,3 +131,20 @@ class FixedWeightsPortfolioStrategy(BasePortfolioStrategy):
             logger.debug(f"{self.name}: Symbole aus Config nicht im Context: {missing}")
 
         return weights
+
+    def _compute_raw_weight_matrix(
+        self, symbols: List[str], closes: np.ndarray
+    ) -> Optional[Tuple[List[str], np.ndarray]]:
+        """Feste Gewichte für alle Bars (konstant über die Zeit)."""
+        if (
+            type(self)._compute_raw_weights
+            is not FixedWeightsPortfolioStrategy._compute_raw_weights
+        ):
+            return None
+        universe = self.get_universe_indices(symbols)
+        if self._use_fallback:
+            return equal_weight_matrix(symbols, universe, len(closes))
+
+        columns = [symbols[i] for i in universe if symbols[i] in self._fixed_weights]
+        row = [self._fixed_weights[s] for s in columns]
+        return columns, np.tile(np.asarray(row, dtype=float), (len(closes), 1))
@@ -12,18 +12,21 @@ um das Risiko gleichmäßiger zu verteilen (Risk-Parity-Ansatz).
 from __future__ import annotations
 
 import logging
-from typing import Dict, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
 
-from .base import BasePortfolioStrategy, PortfolioContext
+from .base import BasePortfolioStrategy, PortfolioContext, sequential_row_sum
 
 if TYPE_CHECKING:
     from .config import PortfolioConfig
 
 logger = logging.getLogger(__name__)
 
+# Obergrenze für gleichzeitig materialisierte Rolling-Fenster (Elemente, ~32 MB)
+_WINDOW_CHUNK_ELEMENTS = 4_000_000
+
 
 class VolTargetPortfolioStrategy(BasePortfolioStrategy):
     """
@@ -225,6 +228,59 @@ class VolTargetPortfolioStrategy(BasePortfolioStrategy):
 
         return weights
 
+    def _compute_raw_weight_matrix(
+        self, symbols: List[str], closes: np.ndarray
+    ) -> Optional[Tuple[List[str], np.ndarray]]:
+        """
+        Inverse-Vol-Gewichte für alle Bars aus Rolling-Fenstern der Returns.
+
+        Bar t nutzt wie die Einzelauswertung die letzten ``vol_lookback`` Returns
+        aus ``closes[: t + 1]`` (Std mit ddof=1, gleiche Summationsreihenfolge
+        wie pandas); vorher bzw. ohne positive Vols: Equal-Weight-Fallback.
+        Nicht-endliche Returns (NaN/0-Preise) werden Bar-für-Bar ausgewertet.
+        """
+        cls = type(self)
+        for method in ("_compute_raw_weights", "_compute_volatilities", "_inverse_vol_weights"):
+            if getattr(cls, method) is not getattr(VolTargetPortfolioStrategy, method):
+                return None
+
+        universe = self.get_universe_indices(symbols)
+        columns = [symbols[i] for i in universe]
+        n_bars = len(closes)
+        if not universe:
+            return columns, np.empty((n_bars, 0))
+
+        prices = np.asarray(closes, dtype=float)[:, universe]
+        returns = prices[1:] / prices[:-1] - 1
+        if not np.all(np.isfinite(returns)):
+            return None
+
+        # Fallback (zu kurze Historie / keine positiven Vols): Equal-Weight
+        weights = np.full((n_bars, len(universe)), 1.0 / len(universe))
+        lookback = self.vol_lookback
+        if n_bars <= lookback:
+            return columns, weights
+
+        windows = np.lib.stride_tricks.sliding_window_view(returns, lookback, axis=0)
+        chunk = max(1, _WINDOW_CHUNK_ELEMENTS // (len(universe) * lookback))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for start in range(0, len(windows), chunk):
+                # Kontiguierliche Kopie: gleiche (paarweise) Summation wie Series.std()
+                block = np.ascontiguousarray(windows[start : start + chunk])
+                mean = block.sum(axis=-1) / lookback
+                var = ((mean[..., None] - block) ** 2).sum(axis=-1) / (lookback - 1)
+                annual_vol = np.sqrt(var) * self.annualization_factor
+
+                valid = annual_vol > 0
+                inv_vol = np.where(valid, 1.0 / annual_vol, 0.0)
+                total = sequential_row_sum(inv_vol)
+                block_weights = np.where(valid, inv_vol / total[:, None], np.nan)
+
+                has_vol = valid.any(axis=1)
+                rows = np.arange(start, start + len(block)) + lookback
+                weights[rows[has_vol]] = block_weights[has_vol]
+        return columns, weights
+
     def compute_portfolio_vol(
         self,
         weights: Dict[str, float],
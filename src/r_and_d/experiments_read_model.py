@@ -5,13 +5,20 @@ Source directory (typical): ``reports/r_and_d_experiments/*.json`` — same cont
 ``scripts/view_r_and_d_experiments.py`` and ``src/webui/r_and_d_api.py``.
 
 No writes, no network, no job triggers.
+
+``ExperimentsIndex`` is the process-level variant: it parses the directory once and
+afterwards re-reads only files whose fingerprint (name, mtime_ns, size) changed.
 """
 
 from __future__ import annotations
 
 import json
+import os
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 _SORT_KEYS = frozenset({"timestamp", "sharpe", "return", "total_return"})
 _SORT_ORDERS = frozenset({"asc", "desc"})
@@ -49,13 +56,146 @@ def load_experiments_from_directory(experiments_dir: Path) -> List[Dict[str, Any
         if data is not None:
             experiments.append(data)
 
-    def get_timestamp(exp: Dict[str, Any]) -> str:
-        return str(exp.get("experiment", {}).get("timestamp", "") or "")
-
-    experiments.sort(key=get_timestamp, reverse=True)
+    experiments.sort(key=_get_timestamp, reverse=True)
     return experiments
 
 
+def _get_timestamp(exp: Dict[str, Any]) -> str:
+    return str(exp.get("experiment", {}).get("timestamp", "") or "")
+
+
+Fingerprint = Tuple[int, int]
+
+
+@dataclass
+class _IndexEntry:
+    fingerprint: Fingerprint
+    raw: Optional[Dict[str, Any]]
+    flat: Optional[Dict[str, Any]] = None
+
+
+class ExperimentsIndex:
+    """
+    Incrementally refreshed in-memory index over ``experiments_dir/*.json``.
+
+    ``experiments()`` returns the same list as :func:`load_experiments_from_directory`
+    (same order, same dicts), but unchanged files are served from memory. Returned
+    dicts are shared between callers and must be treated as read-only.
+
+    ``flatten`` (optional) derives flat fields per experiment; they are computed once
+    per file version. ``memo`` caches derived values until the next change.
+    """
+
+    def __init__(
+        self,
+        experiments_dir: Path,
+        *,
+        flatten: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+        min_refresh_interval: float = 0.0,
+    ) -> None:
+        self.experiments_dir = Path(experiments_dir)
+        self.flatten = flatten
+        self.min_refresh_interval = min_refresh_interval
+        self.generation = 0
+        self._entries: Dict[str, _IndexEntry] = {}
+        self._ordered: List[Dict[str, Any]] = []
+        self._by_id: Dict[int, _IndexEntry] = {}
+        self._memo: Dict[str, Any] = {}
+        self._last_refresh: Optional[float] = None
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._ordered)
+
+    def refresh(self, force: bool = False) -> bool:
+        """Re-scan the directory; returns True if anything changed."""
+        with self._lock:
+            now = time.monotonic()
+            if (
+                not force
+                and self._last_refresh is not None
+                and now - self._last_refresh < self.min_refresh_interval
+            ):
+                return False
+            self._last_refresh = now
+
+            current: Dict[str, Fingerprint] = {}
+            if self.experiments_dir.exists():
+                with os.scandir(self.experiments_dir) as it:
+                    for entry in it:
+                        if not entry.name.endswith(".json"):
+                            continue
+                        try:
+                            if not entry.is_file():
+                                continue
+                            st = entry.stat()
+                        except OSError:
+                            continue
+                        current[entry.name] = (st.st_mtime_ns, st.st_size)
+
+            changed = current.keys() != self._entries.keys()
+            for name in [n for n in self._entries if n not in current]:
+                del self._entries[name]
+            for name, fingerprint in current.items():
+                entry = self._entries.get(name)
+                if entry is not None and entry.fingerprint == fingerprint:
+                    continue
+                self._entries[name] = _IndexEntry(
+                    fingerprint=fingerprint,
+                    raw=load_experiment_json_file(self.experiments_dir / name),
+                )
+                changed = True
+
+            if changed or self.generation == 0:
+                self._rebuild()
+            return changed
+
+    def _rebuild(self) -> None:
+        # Same order as load_experiments_from_directory: by filename, then timestamp desc.
+        ordered = [
+            self._entries[name].raw
+            for name in sorted(self._entries)
+            if self._entries[name].raw is not None
+        ]
+        ordered.sort(key=_get_timestamp, reverse=True)
+        self._ordered = ordered
+        self._by_id = {id(e.raw): e for e in self._entries.values() if e.raw is not None}
+        self._memo = {}
+        self.generation += 1
+
+    def experiments(self, refresh: bool = True) -> List[Dict[str, Any]]:
+        """All experiments (newest first); a new list on every call."""
+        with self._lock:
+            if refresh:
+                self.refresh()
+            return list(self._ordered)
+
+    def is_snapshot(self, experiments: List[Dict[str, Any]]) -> bool:
+        """True if ``experiments`` is exactly the current (unfiltered) list."""
+        ordered = self._ordered
+        return len(experiments) == len(ordered) and all(
+            a is b for a, b in zip(experiments, ordered)
+        )
+
+    def flat(self, exp: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Cached flat fields for an indexed experiment dict (None if not indexed)."""
+        if self.flatten is None:
+            return None
+        entry = self._by_id.get(id(exp))
+        if entry is None or entry.raw is not exp:
+            return None
+        if entry.flat is None:
+            entry.flat = self.flatten(exp)
+        return entry.flat
+
+    def memo(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Value of ``compute()`` cached until the index changes."""
+        with self._lock:
+            if key not in self._memo:
+                self._memo[key] = compute()
+            return self._memo[key]
+
+
 def sort_raw_experiments(
     experiments: List[Dict[str, Any]],
     sort_by: str = "timestamp",
@@ -10,6 +10,7 @@ Komponenten:
 1. **RegimeDetector**: Erkennt Marktphasen (breakout, ranging, trending)
 2. **StrategySwitchingPolicy**: Mappt Regime auf Strategien
 3. **RegimeConfig**: Konfiguration für Detector und Switching
+4. **detect_regimes_batch**: Viele Assets x viele Detector-Configs in einem Durchlauf
 
 Workflow:
     Data -> RegimeDetector -> StrategySwitchingPolicy -> Strategies -> Backtest
@@ -59,6 +60,12 @@ from .detectors import (
     make_regime_detector,
 )
 
+from .batch import (
+    REGIME_LABELS,
+    RegimeLabelCube,
+    detect_regimes_batch,
+)
+
 from .switching import (
     SimpleRegimeMappingPolicy,
     make_switching_policy,
@@ -79,6 +86,10 @@ __all__ = [
     "VolatilityRegimeDetector",
     "RangeCompressionRegimeDetector",
     "make_regime_detector",
+    # Batch
+    "REGIME_LABELS",
+    "RegimeLabelCube",
+    "detect_regimes_batch",
     # Switching
     "SimpleRegimeMappingPolicy",
     "make_switching_policy",
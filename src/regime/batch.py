@@ -0,0 +1,294 @@
+# src/regime/batch.py
+"""
+Peak_Trade Batched Regime Detection
+===================================
+
+Regime-Erkennung fuer ein Panel von Assets und ein Grid von Detector-Configs
+in einem Durchlauf.
+
+Die Detectors in ``detectors.py`` berechnen ATR, ATR-Perzentil, MA-Slope bzw.
+Range-Ratio bei jedem ``detect_regimes``-Aufruf neu. Bei Regime-Sweeps
+(viele Symbole x viele Parameter-Sets) dominiert diese redundante
+Indikator-Arbeit. Die Batch-Engine berechnet jeden Indikator pro Asset genau
+einmal je relevantem Parameter (z.B. ATR je ``vol_window``, Perzentil je
+``(vol_window, lookback_window)``) und wendet danach nur noch die Schwellen
+der einzelnen Configs vektorisiert an.
+
+Die Labels sind identisch zu ``make_regime_detector(config).detect_regimes(df)``
+(die Indikatoren werden ueber dieselben Detector-Methoden bzw. dieselben
+Rolling-Perzentile aus ``src.utils.rolling_stats`` berechnet).
+
+Usage:
+    >>> from src.regime.batch import detect_regimes_batch
+    >>> cube = detect_regimes_batch({"BTC/EUR": df_btc, "ETH/EUR": df_eth}, configs)
+    >>> cube.labels.shape  # (n_configs, n_assets, n_bars)
+    >>> cube.series(0, "BTC/EUR")  # wie detector.detect_regimes(df_btc)
+
+WICHTIG: Wie der gesamte Regime-Layer NUR fuer Research/Backtest/Shadow!
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import RegimeDetectorConfig
+from .detectors import RangeCompressionRegimeDetector, VolatilityRegimeDetector
+from src.utils.rolling_stats import rolling_last_pct_rank
+
+logger = logging.getLogger(__name__)
+
+#: Label-Codes der Regime-Cube (Index = Code)
+REGIME_LABELS: Tuple[str, ...] = ("unknown", "breakout", "ranging", "trending")
+
+_UNKNOWN, _BREAKOUT, _RANGING, _TRENDING = range(len(REGIME_LABELS))
+
+_VOLATILITY_NAMES = ("volatility_breakout", "volatility", "vol")
+_RANGE_NAMES = ("range_compression", "range", "compression")
+
+
+# ============================================================================
+# REGIME CUBE
+# ============================================================================
+
+
+@dataclass
+class RegimeLabelCube:
+    """
+    Regime-Labels fuer (Config x Asset x Bar).
+
+    Attributes:
+        labels: int8-Array der Form (n_configs, n_assets, n_bars) mit Codes aus REGIME_LABELS
+        index: Gemeinsamer Zeitindex (Vereinigung der Asset-Indizes)
+        assets: Asset-Namen (Reihenfolge der zweiten Achse)
+        configs: Detector-Configs (Reihenfolge der ersten Achse)
+    """
+
+    labels: np.ndarray
+    index: pd.Index
+    assets: List[str]
+    configs: List[RegimeDetectorConfig]
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        return self.labels.shape  # type: ignore[return-value]
+
+    def series(self, config_idx: int, asset: str) -> pd.Series:
+        """Labels einer Config fuer ein Asset (Format wie ``detect_regimes``)."""
+        codes = self.labels[config_idx, self.assets.index(asset)]
+        return pd.Series(
+            np.asarray(REGIME_LABELS, dtype=object)[codes], index=self.index, name="regime"
+        ).astype("string")
+
+    def to_frame(self, config_idx: int) -> pd.DataFrame:
+        """Labels einer Config als DataFrame (Spalten = Assets)."""
+        names = np.asarray(REGIME_LABELS, dtype=object)
+        return pd.DataFrame(
+            {asset: names[self.labels[config_idx, i]] for i, asset in enumerate(self.assets)},
+            index=self.index,
+        ).astype("string")
+
+    def regime_share(self) -> pd.DataFrame:
+        """Anteil je Regime pro (Config, Asset), z.B. fuer Sweep-Auswertungen."""
+        n_bars = max(self.labels.shape[2], 1)
+        rows = []
+        for c in range(self.labels.shape[0]):
+            for a, asset in enumerate(self.assets):
+                counts = np.bincount(self.labels[c, a], minlength=len(REGIME_LABELS))
+                row = {"config_idx": c, "asset": asset}
+                row.update({label: counts[k] / n_bars for k, label in enumerate(REGIME_LABELS)})
+                rows.append(row)
+        return pd.DataFrame(rows)
+
+
+# ============================================================================
+# BATCH ENGINE
+# ============================================================================
+
+
+class _AssetIndicatorCache:
+    """Indikatoren eines Assets, je Parameter-Schluessel genau einmal berechnet."""
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self.df = df
+        self._cache: Dict[Tuple, np.ndarray] = {}
+        self.computed = 0
+
+    def _get(self, key: Tuple, compute) -> np.ndarray:
+        if key not in self._cache:
+            self._cache[key] = compute()
+            self.computed += 1
+        return self._cache[key]
+
+    def _series(self, key: Tuple, compute) -> pd.Series:
+        return pd.Series(self._get(key, compute), index=self.df.index)
+
+    def atr(self, vol_window: int) -> pd.Series:
+        detector = VolatilityRegimeDetector(RegimeDetectorConfig(vol_window=vol_window))
+        return self._series(
+            ("atr", vol_window),
+            lambda: detector._compute_atr(self.df).to_numpy(dtype=np.float64),
+        )
+
+    def atr_percentile(self, vol_window: int, lookback_window: int) -> np.ndarray:
+        return self._get(
+            ("atr_pct", vol_window, lookback_window),
+            lambda: (
+                rolling_last_pct_rank(
+                    self.atr(vol_window), window=lookback_window, min_periods=vol_window
+                ).to_numpy()
+                / 100.0
+            ),
+        )
+
+    def ma_slope(self, ma_window: int) -> np.ndarray:
+        detector = VolatilityRegimeDetector(RegimeDetectorConfig(trending_ma_window=ma_window))
+        return self._get(
+            ("ma_slope", ma_window),
+            lambda: detector._compute_ma_slope(self.df).to_numpy(dtype=np.float64),
+        )
+
+    def range_ratio(self, window: int) -> pd.Series:
+        detector = RangeCompressionRegimeDetector(
+            RegimeDetectorConfig(range_compression_window=window)
+        )
+        return self._series(
+            ("range_ratio", window),
+            lambda: detector._compute_range_ratio(self.df).to_numpy(dtype=np.float64),
+        )
+
+    def range_ratio_percentile(self, window: int, lookback_window: int) -> np.ndarray:
+        return self._get(
+            ("range_pct", window, lookback_window),
+            lambda: (
+                rolling_last_pct_rank(
+                    self.range_ratio(window), window=lookback_window, min_periods=window
+                ).to_numpy()
+                / 100.0
+            ),
+        )
+
+    def directional_bias(self, ma_window: int) -> np.ndarray:
+        detector = RangeCompressionRegimeDetector(
+            RegimeDetectorConfig(trending_ma_window=ma_window)
+        )
+        return self._get(
+            ("bias", ma_window),
+            lambda: detector._compute_directional_bias(self.df).to_numpy(dtype=np.float64),
+        )
+
+
+def _classify(
+    percentile: np.ndarray,
+    upper: float,
+    lower: float,
+    trend_strength: np.ndarray,
+    trend_threshold: float,
+) -> np.ndarray:
+    """Schwellen-Logik der Detectors (gleiche Reihenfolge der Zuweisungen)."""
+    with np.errstate(invalid="ignore"):
+        high_mask = percentile >= upper
+        low_mask = percentile <= lower
+        trending = ~high_mask & ~low_mask & (np.abs(trend_strength) > trend_threshold)
+    codes = np.full(len(percentile), _UNKNOWN, dtype=np.int8)
+    codes[high_mask] = _BREAKOUT
+    codes[low_mask] = _RANGING
+    codes[trending] = _TRENDING
+    codes[np.isnan(percentile)] = _UNKNOWN
+    return codes
+
+
+def _detect_codes(cache: _AssetIndicatorCache, config: RegimeDetectorConfig) -> np.ndarray:
+    name = config.detector_name.lower()
+    if len(cache.df) < config.min_history_bars:
+        return np.full(len(cache.df), _UNKNOWN, dtype=np.int8)
+
+    if name in _VOLATILITY_NAMES:
+        return _classify(
+            cache.atr_percentile(config.vol_window, config.lookback_window),
+            config.vol_percentile_breakout,
+            config.vol_percentile_ranging,
+            cache.ma_slope(config.trending_ma_window),
+            config.trending_slope_threshold,
+        )
+    if name in _RANGE_NAMES:
+        return _classify(
+            cache.range_ratio_percentile(config.range_compression_window, config.lookback_window),
+            0.7,
+            config.compression_threshold,
+            cache.directional_bias(config.trending_ma_window),
+            0.02,
+        )
+    raise ValueError(
+        f"Unbekannter Regime-Detector: '{config.detector_name}'. "
+        f"Verfuegbar: 'volatility_breakout', 'range_compression'"
+    )
+
+
+def detect_regimes_batch(
+    panel: Mapping[str, pd.DataFrame],
+    configs: Sequence[RegimeDetectorConfig],
+) -> RegimeLabelCube:
+    """
+    Erkennt Regime fuer alle Assets eines Panels und alle Detector-Configs.
+
+    Jedes Asset wird auf seinem eigenen Index ausgewertet (identisch zu
+    ``detect_regimes``); Bars, die ein Asset im gemeinsamen Index nicht hat,
+    sind "unknown". ``config.enabled`` wird ignoriert - ausgewertet wird jede
+    uebergebene Config.
+
+    Args:
+        panel: Asset-Name -> OHLCV-DataFrame (Spalten high, low, close)
+        configs: Detector-Configs (z.B. aus einem Regime-Sweep)
+
+    Returns:
+        RegimeLabelCube mit Labels (n_configs, n_assets, n_bars)
+
+    Raises:
+        ValueError: Bei fehlenden Spalten oder unbekanntem detector_name
+    """
+    assets = list(panel.keys())
+    configs = list(configs)
+    for asset, df in panel.items():
+        for col in ("high", "low", "close"):
+            if col not in df.columns:
+                raise ValueError(
+                    f"Spalte '{col}' fehlt fuer Asset '{asset}'. Verfuegbar: {list(df.columns)}"
+                )
+
+    frames = list(panel.values())
+    index = frames[0].index if frames else pd.Index([])
+    for df in frames[1:]:
+        if not index.equals(df.index):
+            index = index.union(df.index)
+
+    labels = np.full((len(configs), len(assets), len(index)), _UNKNOWN, dtype=np.int8)
+    n_indicators = 0
+    for a, asset in enumerate(assets):
+        df = panel[asset]
+        cache = _AssetIndicatorCache(df)
+        positions = None if df.index.equals(index) else index.get_indexer(df.index)
+        for c, config in enumerate(configs):
+            codes = _detect_codes(cache, config)
+            if positions is None:
+                labels[c, a] = codes
+            else:
+                labels[c, a, positions] = codes
+        n_indicators += cache.computed
+
+    logger.debug(
+        f"Regime-Batch: {len(configs)} Configs x {len(assets)} Assets, "
+        f"{n_indicators} Indikator-Serien berechnet"
+    )
+    return RegimeLabelCube(labels=labels, index=index, assets=assets, configs=configs)
+
+
+__all__ = [
+    "REGIME_LABELS",
+    "RegimeLabelCube",
+    "detect_regimes_batch",
+]
@@ -28,7 +28,7 @@ from .base import (
     RegimeSeriesDetector,
 )
 from .config import RegimeDetectorConfig
-from src.strategies.vol_breakout import _rolling_last_pct_rank
+from src.utils.rolling_stats import rolling_last_pct_rank as _rolling_last_pct_rank
 
 if TYPE_CHECKING:
     pass
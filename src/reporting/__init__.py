@@ -12,6 +12,7 @@ Module:
 - html_reports: HTML-Report-Generierung (Phase 21)
 - base: Markdown Report-Typen und Helper (Phase 30)
 - plots: Zentrale Plot-Funktionen (Phase 30)
+- figure_pipeline: Gebündeltes, paralleles und gecachtes Figure-Rendering
 - backtest_report: Backtest-Report-Generierung (Phase 30)
 - experiment_report: Experiment/Sweep-Report-Generierung (Phase 30)
 - live_run_report: Live/Shadow Run Report-Generierung (Phase 32)
@@ -62,6 +63,13 @@ from .plots import (
     render_standard_2x2_heatmap_template,
 )
 
+from .figure_pipeline import (
+    FigureCache,
+    FigurePipeline,
+    FigureResult,
+    render_figure,
+)
+
 from .backtest_report import (
     build_backtest_summary_section,
     build_trade_stats_section,
@@ -197,6 +205,11 @@ __all__ = [
     "render_standard_2x2_heatmap_template",
     "save_histogram",
     "save_equity_with_regimes",
+    # Figure Pipeline
+    "FigureCache",
+    "FigurePipeline",
+    "FigureResult",
+    "render_figure",
     # Phase 30: Backtest Reports
     "build_backtest_summary_section",
     "build_trade_stats_section",
@@ -11,6 +11,10 @@ Komponenten:
 - build_drawdown_plot: Drawdown als PNG
 - build_backtest_report: Kompletter Backtest-Report
 
+Mit ``figure_pipeline`` (src.reporting.figure_pipeline) werden die Charts nur
+angemeldet und erst mit ``figure_pipeline.run()`` gerendert (gebündelt über
+mehrere Reports, parallel, gecacht).
+
 Usage:
     from src.reporting.backtest_report import build_backtest_report
 
@@ -32,6 +36,7 @@ from typing import Any, Dict, List, Optional, Union
 import pandas as pd
 
 from .base import Report, ReportSection, dict_to_markdown_table, df_to_markdown, format_metric
+from .figure_pipeline import FigurePipeline, render_figure
 from .plots import (
     save_equity_plot,
     save_drawdown_plot,
@@ -223,6 +228,24 @@ def build_drawdown_plot(
     return save_drawdown_plot(drawdown_series, output_path, title=title)
 
 
+def _render_equity_with_regimes(
+    equity_curve: pd.Series,
+    regimes: pd.Series,
+    output_path: Union[str, Path],
+) -> str:
+    """Equity mit Regime-Overlay (numerisch 1/0/-1) bzw. Regime-Bändern (Labels)."""
+    try:
+        # Versuche numerische Regime-Werte (1/0/-1)
+        regime_numeric = regimes.astype(float)
+        if regime_numeric.isin([1.0, 0.0, -1.0]).all() or regime_numeric.isin([1, 0, -1]).all():
+            return save_equity_with_regime_overlay(equity_curve, regimes, output_path)
+        # Fallback zu String-Labels
+        return save_equity_with_regimes(equity_curve, regimes, output_path)
+    except (ValueError, TypeError):
+        # Fallback zu String-Labels
+        return save_equity_with_regimes(equity_curve, regimes, output_path)
+
+
 # =============================================================================
 # FULL REPORT BUILDER
 # =============================================================================
@@ -239,6 +262,7 @@ def build_backtest_report(
     regimes: Optional[pd.Series] = None,
     output_dir: Optional[Union[str, Path]] = None,
     metadata: Optional[Dict[str, Any]] = None,
+    figure_pipeline: Optional[FigurePipeline] = None,
 ) -> Report:
     """
     Erstellt einen kompletten Backtest-Report.
@@ -254,6 +278,8 @@ def build_backtest_report(
         regimes: Optionale Regime-Series für Regime-Plot
         output_dir: Verzeichnis für Plot-Dateien (default: reports/images)
         metadata: Optionale Metadaten für Report
+        figure_pipeline: Optional: Charts nur anmelden; die PNGs entstehen erst mit
+            ``figure_pipeline.run()`` (default: sofort rendern)
 
     Returns:
         Report-Objekt mit allen Sections
@@ -295,20 +321,13 @@ def build_backtest_report(
         if regimes is not None and len(regimes) > 0:
             # Equity mit Regime-Bändern (numerische Regime-Werte)
             equity_path = output_dir / "equity_with_regimes.png"
-            try:
-                # Versuche numerische Regime-Werte (1/0/-1)
-                regime_numeric = regimes.astype(float)
-                if (
-                    regime_numeric.isin([1.0, 0.0, -1.0]).all()
-                    or regime_numeric.isin([1, 0, -1]).all()
-                ):
-                    save_equity_with_regime_overlay(equity_curve, regimes, equity_path)
-                else:
-                    # Fallback zu String-Labels
-                    save_equity_with_regimes(equity_curve, regimes, equity_path)
-            except (ValueError, TypeError):
-                # Fallback zu String-Labels
-                save_equity_with_regimes(equity_curve, regimes, equity_path)
+            render_figure(
+                figure_pipeline,
+                _render_equity_with_regimes,
+                equity_path,
+                equity_curve=equity_curve,
+                regimes=regimes,
+            )
             rel_path = os.path.relpath(equity_path, output_dir.parent)
             charts_content.append(
                 f"### Equity Curve with Regimes\n\n![Equity with Regimes]({rel_path})"
@@ -316,13 +335,17 @@ def build_backtest_report(
         else:
             # Standard Equity Plot
             equity_path = output_dir / "equity_curve.png"
-            build_equity_plot(equity_curve, equity_path)
+            render_figure(
+                figure_pipeline, build_equity_plot, equity_path, equity_curve=equity_curve
+            )
             rel_path = os.path.relpath(equity_path, output_dir.parent)
             charts_content.append(f"### Equity Curve\n\n![Equity Curve]({rel_path})")
 
     if drawdown_series is not None and len(drawdown_series) > 0:
         dd_path = output_dir / "drawdown.png"
-        build_drawdown_plot(drawdown_series, dd_path)
+        render_figure(
+            figure_pipeline, build_drawdown_plot, dd_path, drawdown_series=drawdown_series
+        )
         rel_path = os.path.relpath(dd_path, output_dir.parent)
         charts_content.append(f"### Drawdown\n\n![Drawdown]({rel_path})")
 
@@ -360,9 +383,11 @@ def build_backtest_report(
                 # Erstelle Contribution-Plot
                 contribution_plot_path = output_dir / "regime_contribution.png"
                 try:
-                    save_regime_contribution_bars(
+                    render_figure(
+                        figure_pipeline,
+                        save_regime_contribution_bars,
+                        contribution_plot_path,
                         regime_stats=regime_stats,
-                        output_path=contribution_plot_path,
                         title="Return Contribution by Regime",
                     )
                     rel_contribution_path = os.path.relpath(
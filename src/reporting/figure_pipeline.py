@@ -0,0 +1,412 @@
+# src/reporting/figure_pipeline.py
+"""
+Peak_Trade Figure-Pipeline für Report-Builds
+============================================
+
+Rendert die PNG-Figures eines oder mehrerer Reports gesammelt:
+
+- Figures werden zuerst nur angemeldet (``submit``) und dann in einem Schritt
+  gerendert (``run``), optional auf einem Prozess-Pool
+- jede Figure wird über einen Digest ihrer Eingaben adressiert (Plot-Funktion
+  inkl. Bytecode und Defaults, Quellcode von ``src/reporting`` und des Moduls der
+  Plot-Funktion, Daten, Parameter, Matplotlib-Version); identische Figures
+  werden aus einem Content-Addressed-Cache kopiert statt neu gerendert
+- inkrementell: liegt eine Figure mit unverändertem Digest bereits am Zielpfad,
+  wird sie nicht angefasst (Digest-Manifest ``.figure_digests.json`` pro Verzeichnis)
+
+Ohne Cache, ohne ``incremental`` und mit ``max_workers=1`` verhält sich die
+Pipeline wie direkte Aufrufe der Plot-Funktionen.
+
+Usage:
+    from src.reporting.figure_pipeline import FigurePipeline
+    from src.reporting.sweep_visualization import generate_sweep_plots_batch
+
+    pipeline = FigurePipeline(cache_dir=Path(".cache/figures"), max_workers=8, incremental=True)
+    plots = generate_sweep_plots_batch(sweeps, output_dir=images_dir, figure_pipeline=pipeline)
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sys
+import types
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Erhöhen, wenn sich die Digest-Bildung ändert (invalidiert Cache und Manifeste).
+FIGURE_PIPELINE_VERSION = 2
+
+FIGURE_MANIFEST_FILENAME = ".figure_digests.json"
+
+FIGURE_STATUSES = ("rendered", "cached", "unchanged", "failed")
+
+
+# =============================================================================
+# DIGEST
+# =============================================================================
+
+
+def _code_digest(h: "hashlib._Hash", code: types.CodeType) -> None:
+    h.update(code.co_code)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _code_digest(h, const)
+        else:
+            h.update(repr(const).encode("utf-8"))
+    h.update(repr(code.co_names).encode("utf-8"))
+
+
+def _update_digest(h: "hashlib._Hash", obj: Any) -> None:
+    if obj is None or isinstance(obj, (bool, int, float, str, bytes)):
+        h.update(f"{type(obj).__name__}:{obj!r};".encode("utf-8"))
+    elif isinstance(obj, Path):
+        h.update(f"path:{obj.as_posix()};".encode("utf-8"))
+    elif isinstance(obj, pd.DataFrame):
+        header = [
+            [str(c) for c in obj.columns],
+            [str(t) for t in obj.dtypes],
+            str(obj.index.dtype),
+            [str(n) for n in obj.index.names],
+            [str(n) for n in obj.columns.names],
+        ]
+        h.update(b"frame:" + json.dumps(header).encode("utf-8"))
+        h.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+    elif isinstance(obj, pd.Series):
+        header = [str(obj.name), str(obj.dtype), str(obj.index.dtype)]
+        h.update(b"series:" + json.dumps(header).encode("utf-8"))
+        h.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+    elif isinstance(obj, pd.Index):
+        h.update(f"index:{obj.dtype}:".encode("utf-8"))
+        h.update(pd.util.hash_pandas_object(obj).to_numpy().tobytes())
+    elif isinstance(obj, np.ndarray):
+        h.update(f"ndarray:{obj.dtype}:{obj.shape}:".encode("utf-8"))
+        if obj.dtype == object:
+            h.update(repr(obj.tolist()).encode("utf-8"))
+        else:
+            h.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, np.generic):
+        h.update(f"{obj.dtype}:{obj.item()!r};".encode("utf-8"))
+    elif isinstance(obj, (list, tuple)):
+        h.update(f"{type(obj).__name__}[{len(obj)}]".encode("utf-8"))
+        for item in obj:
+            _update_digest(h, item)
+    elif isinstance(obj, dict):
+        h.update(f"dict[{len(obj)}]".encode("utf-8"))
+        for key in sorted(obj, key=repr):
+            _update_digest(h, key)
+            _update_digest(h, obj[key])
+    elif isinstance(obj, types.FunctionType):
+        h.update(f"fn:{obj.__module__}.{obj.__qualname__}".encode("utf-8"))
+        _code_digest(h, obj.__code__)
+        _update_digest(h, obj.__defaults__)
+        _update_digest(h, obj.__kwdefaults__)
+    else:
+        # Unbekannte Objekte: repr (nicht deterministische reprs führen nur zu Cache-Misses)
+        h.update(f"{type(obj).__qualname__}:{obj!r};".encode("utf-8"))
+
+
+def _matplotlib_version() -> str:
+    try:
+        import matplotlib
+
+        return str(matplotlib.__version__)
+    except ImportError:  # pragma: no cover
+        return "none"
+
+
+@functools.lru_cache(maxsize=None)
+def _source_digest(path: str) -> str:
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return "missing"
+
+
+def _module_source_digest(module_name: str) -> str:
+    path = getattr(sys.modules.get(module_name), "__file__", None)
+    return _source_digest(str(Path(path).resolve())) if path else "none"
+
+
+@functools.lru_cache(maxsize=1)
+def reporting_code_version() -> str:
+    """
+    SHA256 über alle Quellen von ``src/reporting``.
+
+    Plot-Funktionen rufen Helfer wie ``plots.save_equity_plot`` auf und lesen
+    Modul-Konstanten (``DEFAULT_DPI``), die im Bytecode der Plot-Funktion nicht
+    sichtbar sind; jede Änderung am Reporting-Code invalidiert daher alle Figures.
+    """
+    h = hashlib.sha256()
+    for path in sorted(Path(__file__).resolve().parent.glob("*.py")):
+        h.update(f"{path.name}:{_source_digest(str(path))};".encode("utf-8"))
+    return h.hexdigest()
+
+
+def figure_digest(render: Callable[..., Any], kwargs: Dict[str, Any], suffix: str = ".png") -> str:
+    """
+    SHA256 über Plot-Funktion (Name, Bytecode, Defaults), Reporting-Code-Version,
+    Quellcode des Moduls der Plot-Funktion, Argumente und Ausgabeformat.
+
+    Der Zielpfad selbst gehört nicht zum Digest: identische Figures unter
+    verschiedenen Pfaden teilen sich einen Cache-Eintrag.
+    """
+    h = hashlib.sha256()
+    h.update(f"v{FIGURE_PIPELINE_VERSION}:mpl{_matplotlib_version()}:{suffix};".encode("utf-8"))
+    h.update(f"reporting:{reporting_code_version()};".encode("utf-8"))
+    module = getattr(render, "__module__", None) or ""
+    h.update(f"module:{module}:{_module_source_digest(module)};".encode("utf-8"))
+    _update_digest(h, render)
+    _update_digest(h, kwargs)
+    return h.hexdigest()
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+
+class FigureCache:
+    """
+    Content-Addressed-Cache für gerenderte Figures (``<root>/<ab>/<digest><suffix>``).
+
+    Einträge werden atomar geschrieben; der Cache kann von mehreren Builds
+    gleichzeitig genutzt werden.
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+
+    def path_for(self, digest: str, suffix: str = ".png") -> Path:
+        return self.root / digest[:2] / f"{digest}{suffix}"
+
+    def get(self, digest: str, suffix: str = ".png") -> Optional[Path]:
+        p = self.path_for(digest, suffix)
+        return p if p.is_file() else None
+
+    def put(self, digest: str, source: Path) -> None:
+        target = self.path_for(digest, source.suffix)
+        if target.is_file():
+            return
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f"{target.name}.tmp{os.getpid()}")
+        try:
+            shutil.copyfile(source, tmp)
+            os.replace(tmp, target)
+        except OSError as e:
+            logger.warning(f"Figure-Cache nicht beschreibbar ({target}): {e}")
+            tmp.unlink(missing_ok=True)
+
+
+def _read_manifest(directory: Path) -> Dict[str, str]:
+    try:
+        data = json.loads((directory / FIGURE_MANIFEST_FILENAME).read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+    return {str(k): str(v) for k, v in data.items()} if isinstance(data, dict) else {}
+
+
+def _write_manifest(directory: Path, entries: Dict[str, str]) -> None:
+    path = directory / FIGURE_MANIFEST_FILENAME
+    tmp = path.with_name(f"{path.name}.tmp{os.getpid()}")
+    tmp.write_text(json.dumps(entries, sort_keys=True, indent=1), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+# =============================================================================
+# PIPELINE
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class FigureTask:
+    """Eine angemeldete Figure: ``render(output_path=output_path, **kwargs)``."""
+
+    render: Callable[..., Any]
+    output_path: Path
+    kwargs: Dict[str, Any]
+
+
+@dataclass(frozen=True)
+class FigureResult:
+    """Ergebnis einer Figure nach ``FigurePipeline.run``."""
+
+    output_path: Path
+    digest: str
+    status: str  # rendered | cached | unchanged | failed
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status != "failed"
+
+
+def _render_figure_task(task: FigureTask) -> Optional[BaseException]:
+    """Worker: rendert eine Figure; Fehler werden zurückgegeben, nicht geworfen."""
+    try:
+        task.output_path.parent.mkdir(parents=True, exist_ok=True)
+        task.render(output_path=task.output_path, **task.kwargs)
+        return None
+    except Exception as e:
+        return e
+
+
+class FigurePipeline:
+    """
+    Sammelt Figure-Aufträge und rendert sie gebündelt.
+
+    Args:
+        cache_dir: Verzeichnis des Content-Addressed-Caches (None: kein Cache)
+        max_workers: Anzahl Worker-Prozesse (<= 1: sequentiell im Prozess)
+        incremental: Figures mit unverändertem Digest am Zielpfad nicht neu schreiben
+    """
+
+    def __init__(
+        self,
+        *,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_workers: int = 1,
+        incremental: bool = False,
+    ):
+        self.cache = FigureCache(cache_dir) if cache_dir is not None else None
+        self.max_workers = max(1, int(max_workers))
+        self.incremental = incremental
+        self.stats: Counter = Counter()
+        self._pending: Dict[Path, FigureTask] = {}
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def submit(
+        self, render: Callable[..., Any], output_path: Union[str, Path], **kwargs: Any
+    ) -> Path:
+        """
+        Meldet eine Figure an; gerendert wird erst in ``run``.
+
+        Ein erneuter Auftrag für denselben Zielpfad ersetzt den vorherigen.
+        """
+        path = Path(output_path)
+        self._pending[path] = FigureTask(render=render, output_path=path, kwargs=kwargs)
+        return path
+
+    def run(self, *, raise_on_error: bool = False) -> Dict[Path, FigureResult]:
+        """
+        Rendert alle angemeldeten Figures (Cache/Manifest zuerst, Rest im Pool).
+
+        Args:
+            raise_on_error: Ersten Render-Fehler (in Anmelde-Reihenfolge) erneut werfen
+
+        Returns:
+            Zielpfad -> FigureResult, in Anmelde-Reihenfolge
+        """
+        tasks = list(self._pending.values())
+        self._pending.clear()
+        if not tasks:
+            return {}
+
+        digests = {
+            t.output_path: figure_digest(t.render, t.kwargs, t.output_path.suffix) for t in tasks
+        }
+        manifests: Dict[Path, Dict[str, str]] = {}
+        results: Dict[Path, FigureResult] = {}
+        to_render: List[FigureTask] = []
+
+        for task in tasks:
+            path, digest = task.output_path, digests[task.output_path]
+            if self.incremental:
+                manifest = manifests.setdefault(path.parent, _read_manifest(path.parent))
+                if manifest.get(path.name) == digest and path.is_file():
+                    results[path] = FigureResult(path, digest, "unchanged")
+                    continue
+            cached = self.cache.get(digest, path.suffix) if self.cache is not None else None
+            if cached is not None:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(cached, path)
+                results[path] = FigureResult(path, digest, "cached")
+                continue
+            to_render.append(task)
+
+        for task, error in zip(to_render, self._render_all(to_render)):
+            path, digest = task.output_path, digests[task.output_path]
+            if error is not None:
+                logger.error(f"Fehler beim Rendern der Figure {path}: {error}")
+                results[path] = FigureResult(path, digest, "failed", error)
+                continue
+            if self.cache is not None:
+                self.cache.put(digest, path)
+            results[path] = FigureResult(path, digest, "rendered")
+
+        if self.incremental:
+            for task in tasks:
+                path = task.output_path
+                manifest = manifests.setdefault(path.parent, _read_manifest(path.parent))
+                if results[path].ok:
+                    manifest[path.name] = digests[path]
+                else:
+                    manifest.pop(path.name, None)
+            for directory, manifest in manifests.items():
+                try:
+                    _write_manifest(directory, manifest)
+                except OSError as e:
+                    logger.warning(f"Figure-Manifest nicht schreibbar ({directory}): {e}")
+
+        ordered = {t.output_path: results[t.output_path] for t in tasks}
+        self.stats.update(r.status for r in ordered.values())
+        if raise_on_error:
+            for r in ordered.values():
+                if r.error is not None:
+                    raise r.error
+        return ordered
+
+    def _render_all(self, tasks: List[FigureTask]) -> List[Optional[BaseException]]:
+        workers = min(self.max_workers, len(tasks), os.cpu_count() or 1)
+        if workers <= 1:
+            return [_render_figure_task(t) for t in tasks]
+        # Verzeichnisse vorab anlegen (Worker laufen parallel)
+        for task in tasks:
+            task.output_path.parent.mkdir(parents=True, exist_ok=True)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_render_figure_task, tasks, chunksize=1))
+
+
+def render_figure(
+    pipeline: Optional[FigurePipeline],
+    render: Callable[..., Any],
+    output_path: Union[str, Path],
+    **kwargs: Any,
+) -> Path:
+    """
+    Rendert sofort (``pipeline is None``) oder meldet die Figure bei ``pipeline`` an.
+
+    Im angemeldeten Fall entsteht die Datei erst mit ``pipeline.run()``.
+    """
+    if pipeline is None:
+        render(output_path=output_path, **kwargs)
+        return Path(output_path)
+    return pipeline.submit(render, output_path, **kwargs)
+
+
+__all__ = [
+    "FIGURE_MANIFEST_FILENAME",
+    "FIGURE_PIPELINE_VERSION",
+    "FigureCache",
+    "FigurePipeline",
+    "FigureResult",
+    "FigureTask",
+    "figure_digest",
+    "render_figure",
+    "reporting_code_version",
+]
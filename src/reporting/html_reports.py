@@ -7,7 +7,9 @@ Generiert statische HTML-Reports für Experimente und Sweeps.
 Hauptkomponenten:
 - ReportFigure, ReportTable, ReportSection, HtmlReport: Dataclasses für Report-Struktur
 - HtmlReportBuilder: Zentrale Klasse zum Erzeugen von HTML-Reports
-- Hilfsfunktionen für Equity-Plots, Drawdown-Plots, Parameter-Heatmaps
+- Hilfsfunktionen für Equity-Plots, Drawdown-Plots, Parameter-Heatmaps; mit
+  ``figure_pipeline`` (src.reporting.figure_pipeline) werden die Grafiken nur
+  angemeldet und erst mit ``figure_pipeline.run()`` gerendert
 
 WICHTIG: Nur lesender Zugriff auf Registry/Analytics-Daten.
 Keine Order-/Execution-Pfade werden verändert.
@@ -35,6 +37,8 @@ from typing import Any, Dict, List, Optional, Sequence, TYPE_CHECKING
 import numpy as np
 import pandas as pd
 
+from .figure_pipeline import FigurePipeline, render_figure
+
 try:
     import matplotlib
 
@@ -498,27 +502,17 @@ def _render_html_report(report: HtmlReport) -> str:
 # =============================================================================
 
 
-def plot_equity_curve(
-    equity: pd.Series,
-    title: str = "Equity Curve",
-    output_path: Optional[Path] = None,
-    figsize: tuple = (12, 6),
-) -> Optional[Path]:
-    """
-    Erstellt einen Equity-Kurven-Plot.
-
-    Args:
-        equity: Equity-Series mit DatetimeIndex
-        title: Plot-Titel
-        output_path: Pfad zum Speichern (PNG)
-        figsize: Figure-Größe
+def _save_and_close(fig: Any, output_path: Path) -> None:
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        plt.savefig(output_path, dpi=150, bbox_inches="tight")
+    finally:
+        plt.close(fig)
 
-    Returns:
-        Pfad zur gespeicherten PNG-Datei oder None
-    """
-    if not MATPLOTLIB_AVAILABLE or equity is None or len(equity) == 0:
-        return None
 
+def _render_equity_curve(
+    *, output_path: Path, equity: pd.Series, title: str, figsize: tuple
+) -> None:
     fig, ax = plt.subplots(figsize=figsize)
 
     ax.plot(equity.index, equity.values, color="#0d6efd", linewidth=1.5, label="Equity")
@@ -539,38 +533,42 @@ def plot_equity_curve(
         plt.xticks(rotation=45)
 
     plt.tight_layout()
-
-    if output_path:
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        plt.savefig(output_path, dpi=150, bbox_inches="tight")
-        plt.close(fig)
-        return output_path
-
-    plt.close(fig)
-    return None
+    _save_and_close(fig, output_path)
 
 
-def plot_drawdown(
+def plot_equity_curve(
     equity: pd.Series,
-    title: str = "Drawdown",
+    title: str = "Equity Curve",
     output_path: Optional[Path] = None,
-    figsize: tuple = (12, 4),
+    figsize: tuple = (12, 6),
+    figure_pipeline: Optional[FigurePipeline] = None,
 ) -> Optional[Path]:
     """
-    Erstellt einen Drawdown-Plot.
+    Erstellt einen Equity-Kurven-Plot.
 
     Args:
         equity: Equity-Series mit DatetimeIndex
         title: Plot-Titel
         output_path: Pfad zum Speichern (PNG)
         figsize: Figure-Größe
+        figure_pipeline: Optional: Plot nur anmelden (Datei entsteht mit ``run()``)
 
     Returns:
-        Pfad zur gespeicherten PNG-Datei oder None
+        Pfad zur (ggf. angemeldeten) PNG-Datei oder None
     """
-    if not MATPLOTLIB_AVAILABLE or equity is None or len(equity) == 0:
+    if not MATPLOTLIB_AVAILABLE or equity is None or len(equity) == 0 or output_path is None:
         return None
+    return render_figure(
+        figure_pipeline,
+        _render_equity_curve,
+        output_path,
+        equity=equity,
+        title=title,
+        figsize=figsize,
+    )
+
 
+def _render_drawdown(*, output_path: Path, equity: pd.Series, title: str, figsize: tuple) -> None:
     # Drawdown berechnen
     running_max = equity.cummax()
     drawdown = (equity - running_max) / running_max
@@ -593,15 +591,66 @@ def plot_drawdown(
         plt.xticks(rotation=45)
 
     plt.tight_layout()
+    _save_and_close(fig, output_path)
 
-    if output_path:
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        plt.savefig(output_path, dpi=150, bbox_inches="tight")
-        plt.close(fig)
-        return output_path
 
-    plt.close(fig)
-    return None
+def plot_drawdown(
+    equity: pd.Series,
+    title: str = "Drawdown",
+    output_path: Optional[Path] = None,
+    figsize: tuple = (12, 4),
+    figure_pipeline: Optional[FigurePipeline] = None,
+) -> Optional[Path]:
+    """
+    Erstellt einen Drawdown-Plot.
+
+    Args:
+        equity: Equity-Series mit DatetimeIndex
+        title: Plot-Titel
+        output_path: Pfad zum Speichern (PNG)
+        figsize: Figure-Größe
+        figure_pipeline: Optional: Plot nur anmelden (Datei entsteht mit ``run()``)
+
+    Returns:
+        Pfad zur (ggf. angemeldeten) PNG-Datei oder None
+    """
+    if not MATPLOTLIB_AVAILABLE or equity is None or len(equity) == 0 or output_path is None:
+        return None
+    return render_figure(
+        figure_pipeline,
+        _render_drawdown,
+        output_path,
+        equity=equity,
+        title=title,
+        figsize=figsize,
+    )
+
+
+def _render_metric_distribution(
+    *,
+    output_path: Path,
+    values: List[float],
+    title: str,
+    xlabel: str,
+    figsize: tuple,
+    bins: int,
+) -> None:
+    fig, ax = plt.subplots(figsize=figsize)
+
+    ax.hist(values, bins=bins, edgecolor="black", alpha=0.7, color="#0d6efd")
+
+    # Durchschnitt einzeichnen
+    avg = np.mean(values)
+    ax.axvline(avg, color="#dc3545", linestyle="--", linewidth=2, label=f"Mean: {avg:.3f}")
+
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel("Frequency")
+    ax.set_title(title)
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+    _save_and_close(fig, output_path)
 
 
 def plot_metric_distribution(
@@ -611,6 +660,7 @@ def plot_metric_distribution(
     output_path: Optional[Path] = None,
     figsize: tuple = (10, 5),
     bins: int = 20,
+    figure_pipeline: Optional[FigurePipeline] = None,
 ) -> Optional[Path]:
     """
     Erstellt ein Histogramm für eine Metrik-Verteilung.
@@ -622,37 +672,46 @@ def plot_metric_distribution(
         output_path: Pfad zum Speichern (PNG)
         figsize: Figure-Größe
         bins: Anzahl Bins
+        figure_pipeline: Optional: Plot nur anmelden (Datei entsteht mit ``run()``)
 
     Returns:
-        Pfad zur gespeicherten PNG-Datei oder None
+        Pfad zur (ggf. angemeldeten) PNG-Datei oder None
     """
-    if not MATPLOTLIB_AVAILABLE or not values:
+    if not MATPLOTLIB_AVAILABLE or not values or output_path is None:
         return None
+    return render_figure(
+        figure_pipeline,
+        _render_metric_distribution,
+        output_path,
+        values=list(values),
+        title=title,
+        xlabel=xlabel,
+        figsize=figsize,
+        bins=bins,
+    )
 
-    fig, ax = plt.subplots(figsize=figsize)
 
-    ax.hist(values, bins=bins, edgecolor="black", alpha=0.7, color="#0d6efd")
+def _render_sweep_scatter(
+    *,
+    output_path: Path,
+    x_values: List[float],
+    y_values: List[float],
+    x_label: str,
+    y_label: str,
+    title: str,
+    figsize: tuple,
+) -> None:
+    fig, ax = plt.subplots(figsize=figsize)
 
-    # Durchschnitt einzeichnen
-    avg = np.mean(values)
-    ax.axvline(avg, color="#dc3545", linestyle="--", linewidth=2, label=f"Mean: {avg:.3f}")
+    ax.scatter(x_values, y_values, alpha=0.6, c="#0d6efd", s=50, edgecolors="black", linewidth=0.5)
 
-    ax.set_xlabel(xlabel)
-    ax.set_ylabel("Frequency")
+    ax.set_xlabel(x_label)
+    ax.set_ylabel(y_label)
     ax.set_title(title)
-    ax.legend()
     ax.grid(True, alpha=0.3)
 
     plt.tight_layout()
-
-    if output_path:
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        plt.savefig(output_path, dpi=150, bbox_inches="tight")
-        plt.close(fig)
-        return output_path
-
-    plt.close(fig)
-    return None
+    _save_and_close(fig, output_path)
 
 
 def plot_sweep_scatter(
@@ -663,6 +722,7 @@ def plot_sweep_scatter(
     title: str = "Parameter vs Metric",
     output_path: Optional[Path] = None,
     figsize: tuple = (10, 6),
+    figure_pipeline: Optional[FigurePipeline] = None,
 ) -> Optional[Path]:
     """
     Erstellt einen Scatter-Plot für Parameter vs. Metrik.
@@ -675,32 +735,24 @@ def plot_sweep_scatter(
         title: Plot-Titel
         output_path: Pfad zum Speichern (PNG)
         figsize: Figure-Größe
+        figure_pipeline: Optional: Plot nur anmelden (Datei entsteht mit ``run()``)
 
     Returns:
-        Pfad zur gespeicherten PNG-Datei oder None
+        Pfad zur (ggf. angemeldeten) PNG-Datei oder None
     """
-    if not MATPLOTLIB_AVAILABLE or not x_values or not y_values:
+    if not MATPLOTLIB_AVAILABLE or not x_values or not y_values or output_path is None:
         return None
-
-    fig, ax = plt.subplots(figsize=figsize)
-
-    ax.scatter(x_values, y_values, alpha=0.6, c="#0d6efd", s=50, edgecolors="black", linewidth=0.5)
-
-    ax.set_xlabel(x_label)
-    ax.set_ylabel(y_label)
-    ax.set_title(title)
-    ax.grid(True, alpha=0.3)
-
-    plt.tight_layout()
-
-    if output_path:
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        plt.savefig(output_path, dpi=150, bbox_inches="tight")
-        plt.close(fig)
-        return output_path
-
-    plt.close(fig)
-    return None
+    return render_figure(
+        figure_pipeline,
+        _render_sweep_scatter,
+        output_path,
+        x_values=list(x_values),
+        y_values=list(y_values),
+        x_label=x_label,
+        y_label=y_label,
+        title=title,
+        figsize=figsize,
+    )
 
 
 # =============================================================================
@@ -725,6 +777,7 @@ class HtmlReportBuilder:
         self,
         output_dir: Path = Path("reports"),
         figures_subdir: str = "figures",
+        figure_pipeline: Optional[FigurePipeline] = None,
     ):
         """
         Initialisiert den ReportBuilder.
@@ -732,9 +785,12 @@ class HtmlReportBuilder:
         Args:
             output_dir: Basis-Verzeichnis für Reports
             figures_subdir: Unterverzeichnis für Grafiken
+            figure_pipeline: Optional: Grafiken nur anmelden; die PNGs entstehen erst mit
+                ``figure_pipeline.run()`` (default: sofort rendern)
         """
         self.output_dir = Path(output_dir)
         self.figures_subdir = figures_subdir
+        self.figure_pipeline = figure_pipeline
 
     def _ensure_dirs(self, report_dir: Path) -> Path:
         """Stellt sicher, dass Report-Verzeichnisse existieren."""
@@ -892,7 +948,9 @@ class HtmlReportBuilder:
 
             # Equity-Plot
             equity_path = figures_dir / "equity_curve.png"
-            if plot_equity_curve(equity_curve, "Equity Curve", equity_path):
+            if plot_equity_curve(
+                equity_curve, "Equity Curve", equity_path, figure_pipeline=self.figure_pipeline
+            ):
                 figures.append(
                     ReportFigure(
                         title="Equity Curve",
@@ -903,7 +961,9 @@ class HtmlReportBuilder:
 
             # Drawdown-Plot
             dd_path = figures_dir / "drawdown.png"
-            if plot_drawdown(equity_curve, "Drawdown", dd_path):
+            if plot_drawdown(
+                equity_curve, "Drawdown", dd_path, figure_pipeline=self.figure_pipeline
+            ):
                 figures.append(
                     ReportFigure(
                         title="Drawdown",
@@ -1065,6 +1125,7 @@ class HtmlReportBuilder:
                     f"{metric.capitalize()} Distribution",
                     metric.capitalize(),
                     dist_path,
+                    figure_pipeline=self.figure_pipeline,
                 ):
                     figures.append(
                         ReportFigure(
@@ -31,6 +31,7 @@ from typing import Dict, Literal, Optional
 import pandas as pd
 
 from .base import Report, ReportSection, df_to_markdown, format_metric
+from .figure_pipeline import FigurePipeline, render_figure
 from .plots import save_histogram
 
 try:
@@ -52,6 +53,7 @@ def build_monte_carlo_report(
     title: str,
     output_dir: Path,
     format: Literal["md", "html", "both"] = "both",
+    figure_pipeline: Optional[FigurePipeline] = None,
 ) -> Dict[str, Path]:
     """
     Erzeugt einen Monte-Carlo-Report mit Kennzahlen-Tabellen und Quantilen.
@@ -61,6 +63,8 @@ def build_monte_carlo_report(
         title: Report-Titel
         output_dir: Zielverzeichnis für Reports und Plots
         format: Output-Format ("md", "html", oder "both")
+        figure_pipeline: Optional: Histogramme nur anmelden, gerendert wird mit
+            ``figure_pipeline.run()`` (default: sofort rendern)
 
     Returns:
         Dict mit Pfaden, z.B. {"md": path_to_md, "html": path_to_html}
@@ -151,9 +155,11 @@ def build_monte_carlo_report(
                 hist_path = output_dir / f"{metric_name}_distribution.png"
 
                 try:
-                    save_histogram(
-                        dist.tolist(),
+                    render_figure(
+                        figure_pipeline,
+                        save_histogram,
                         hist_path,
+                        values=dist.tolist(),
                         title=f"{metric_name.title()} Distribution (n={summary.num_runs})",
                         xlabel=metric_name,
                         ylabel="Frequency",
@@ -11,6 +11,11 @@ Komponenten:
 - create_drawdown_heatmap: 2D-Heatmap speziell für Drawdown-Metriken
 - create_standard_2x2_heatmap: Standard-Template mit 2 Parametern × 2 Metriken (zwei Heatmaps)
 - generate_default_sweep_plots: Standardkollektion von Plots
+- generate_sweep_plots_batch: Standardplots mehrerer Sweeps in einem Render-Durchlauf
+
+Alle Plot-Funktionen akzeptieren optional eine ``FigurePipeline``
+(src.reporting.figure_pipeline): die Figures werden dann nur angemeldet und
+gebündelt gerendert (Prozess-Pool, Content-Cache, inkrementell).
 
 Usage:
     from src.reporting.sweep_visualization import generate_default_sweep_plots
@@ -26,11 +31,12 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
 
 import pandas as pd
 import numpy as np
 
+from .figure_pipeline import FigurePipeline, render_figure
 from .plots import save_heatmap, save_scatter_plot, MATPLOTLIB_AVAILABLE
 
 logger = logging.getLogger(__name__)
@@ -48,6 +54,7 @@ def plot_metric_vs_single_param(
     *,
     sweep_name: str,
     output_dir: Path,
+    figure_pipeline: Optional[FigurePipeline] = None,
 ) -> Optional[Path]:
     """
     Erzeugt einen Line/Scatter-Plot einer Metrik gegen einen Parameter.
@@ -58,6 +65,7 @@ def plot_metric_vs_single_param(
         metric_name: Name der Metrik (mit oder ohne "metric_" Prefix)
         sweep_name: Name des Sweeps (für Dateinamen)
         output_dir: Ausgabe-Verzeichnis
+        figure_pipeline: Optional: Figure nur anmelden (Datei entsteht mit ``run()``)
 
     Returns:
         Pfad zur erzeugten PNG-Datei oder None bei Fehler
@@ -99,7 +107,9 @@ def plot_metric_vs_single_param(
         df_sorted = df_valid.sort_values(param_col)
 
         # Scatter-Plot mit Trendlinie
-        save_scatter_plot(
+        render_figure(
+            figure_pipeline,
+            save_scatter_plot,
             x_values=df_sorted[param_col].tolist(),
             y_values=df_sorted[metric_col].tolist(),
             output_path=output_path,
@@ -130,6 +140,7 @@ def plot_metric_heatmap_two_params(
     *,
     sweep_name: str,
     output_dir: Path,
+    figure_pipeline: Optional[FigurePipeline] = None,
 ) -> Optional[Path]:
     """
     Erzeugt eine 2D-Heatmap einer Metrik über zwei Parameter.
@@ -141,6 +152,7 @@ def plot_metric_heatmap_two_params(
         metric_name: Name der Metrik (mit oder ohne "metric_" Prefix)
         sweep_name: Name des Sweeps (für Dateinamen)
         output_dir: Ausgabe-Verzeichnis
+        figure_pipeline: Optional: Figure nur anmelden (Datei entsteht mit ``run()``)
 
     Returns:
         Pfad zur erzeugten PNG-Datei oder None bei Fehler
@@ -198,7 +210,9 @@ def plot_metric_heatmap_two_params(
         param_x_display = param_x_clean.replace("_", " ").title()
         param_y_display = param_y_clean.replace("_", " ").title()
 
-        save_heatmap(
+        render_figure(
+            figure_pipeline,
+            save_heatmap,
             pivot_df=pivot,
             output_path=output_path,
             title=f"{metric_clean_display} Heatmap: {param_x_display} × {param_y_display}",
@@ -231,6 +245,7 @@ def create_drawdown_heatmap(
     output_path: Optional[Path] = None,
     sweep_name: Optional[str] = None,
     output_dir: Optional[Path] = None,
+    figure_pipeline: Optional[FigurePipeline] = None,
 ) -> Optional[Path]:
     """
     Erzeugt eine 2D-Heatmap für eine Drawdown-Metrik (z. B. Max-Drawdown) über zwei Parameterachsen.
@@ -246,6 +261,7 @@ def create_drawdown_heatmap(
             anhand von param_x, param_y und metric_col konstruiert.
         sweep_name: Name des Sweeps (für Dateinamen, falls output_path None ist).
         output_dir: Ausgabe-Verzeichnis (für Dateinamen, falls output_path None ist).
+        figure_pipeline: Optional: Figure nur anmelden (Datei entsteht mit ``run()``).
 
     Returns:
         Pfad zur erzeugten Plot-Datei oder None bei Fehler.
@@ -316,7 +332,9 @@ def create_drawdown_heatmap(
         param_y_display = param_y.replace("param_", "").replace("_", " ").title()
         metric_display = metric_col_normalized.replace("metric_", "").replace("_", " ").title()
 
-        save_heatmap(
+        render_figure(
+            figure_pipeline,
+            save_heatmap,
             pivot_df=pivot,
             output_path=output_path,
             title=title,
@@ -350,6 +368,7 @@ def create_standard_2x2_heatmap(
     sweep_name: str,
     output_dir: Path,
     fill_missing: Optional[float] = None,
+    figure_pipeline: Optional[FigurePipeline] = None,
 ) -> Dict[str, Path]:
     """
     Standard 2×2 heatmap template: two heatmaps (metric_a, metric_b) over the same
@@ -368,6 +387,7 @@ def create_standard_2x2_heatmap(
         sweep_name: Sweep identifier for filenames and logging.
         output_dir: Directory for output PNGs.
         fill_missing: Optional value to fill missing (x, y) cells before plotting.
+        figure_pipeline: Optional pipeline; figures are only submitted and written by ``run()``.
 
     Returns:
         Dict with keys "metric_a" and "metric_b" mapping to the created PNG paths.
@@ -447,7 +467,9 @@ def create_standard_2x2_heatmap(
         cbar_label = metric_col.replace("metric_", "").replace("_", " ").title()
 
         try:
-            save_heatmap(
+            render_figure(
+                figure_pipeline,
+                save_heatmap,
                 pivot_df=pivot,
                 output_path=out_path,
                 title=title,
@@ -476,6 +498,7 @@ def generate_default_sweep_plots(
     param_candidates: Optional[Sequence[str]] = None,
     metric_primary: str = "metric_sharpe_ratio",
     metric_fallback: str = "metric_total_return",
+    figure_pipeline: Optional[FigurePipeline] = None,
 ) -> Dict[str, Path]:
     """
     Erzeugt eine Standardkollektion von Plots für Sweep-Ergebnisse.
@@ -487,10 +510,103 @@ def generate_default_sweep_plots(
         param_candidates: Liste von Parametern für Plots (optional, wird automatisch erkannt)
         metric_primary: Primäre Metrik für Plots
         metric_fallback: Fallback-Metrik falls primary fehlt
+        figure_pipeline: Optionale FigurePipeline (Pool/Cache/inkrementell);
+            default: sequentiell ohne Cache
 
     Returns:
         Dictionary mit Plot-Namen -> Pfad (z.B. {"param_vs_metric": Path(...), "heatmap": Path(...)})
     """
+    return _generate_sweep_plots(
+        {sweep_name: (df, output_dir)},
+        param_candidates=param_candidates,
+        metric_primary=metric_primary,
+        metric_fallback=metric_fallback,
+        figure_pipeline=figure_pipeline,
+    )[sweep_name]
+
+
+def generate_sweep_plots_batch(
+    sweeps: Mapping[str, pd.DataFrame],
+    output_dir: Path,
+    *,
+    param_candidates: Optional[Sequence[str]] = None,
+    metric_primary: str = "metric_sharpe_ratio",
+    metric_fallback: str = "metric_total_return",
+    figure_pipeline: Optional[FigurePipeline] = None,
+) -> Dict[str, Dict[str, Path]]:
+    """
+    Erzeugt die Standardplots mehrerer Sweeps in einem gemeinsamen Render-Durchlauf.
+
+    Alle Figures werden zuerst angemeldet und dann zusammen gerendert, sodass
+    ein Prozess-Pool über Sweep-Grenzen hinweg ausgelastet wird; mit Cache bzw.
+    ``incremental`` werden nur Plots geänderter Sweeps neu gerendert.
+
+    Args:
+        sweeps: Sweep-Name -> DataFrame mit Sweep-Ergebnissen
+        output_dir: Basis-Verzeichnis; jeder Sweep schreibt nach ``output_dir / <sweep_name>``
+            (nicht jeder Dateiname enthält den Sweep-Namen)
+        param_candidates: Wie bei generate_default_sweep_plots
+        metric_primary: Primäre Metrik für Plots
+        metric_fallback: Fallback-Metrik falls primary fehlt
+        figure_pipeline: Optionale FigurePipeline (default: sequentiell ohne Cache)
+
+    Returns:
+        Sweep-Name -> (Plot-Name -> Pfad); fehlgeschlagene Plots fehlen
+    """
+    output_dir = Path(output_dir)
+    return _generate_sweep_plots(
+        {name: (df, output_dir / name) for name, df in sweeps.items()},
+        param_candidates=param_candidates,
+        metric_primary=metric_primary,
+        metric_fallback=metric_fallback,
+        figure_pipeline=figure_pipeline,
+    )
+
+
+def _generate_sweep_plots(
+    jobs: Mapping[str, Tuple[pd.DataFrame, Path]],
+    *,
+    param_candidates: Optional[Sequence[str]],
+    metric_primary: str,
+    metric_fallback: str,
+    figure_pipeline: Optional[FigurePipeline],
+) -> Dict[str, Dict[str, Path]]:
+    """Meldet die Plots aller Sweeps an, rendert einmal und filtert Fehlschläge."""
+    pipeline = figure_pipeline if figure_pipeline is not None else FigurePipeline()
+    submitted = {
+        name: _submit_default_sweep_plots(
+            df,
+            name,
+            sweep_dir,
+            pipeline,
+            param_candidates=param_candidates,
+            metric_primary=metric_primary,
+            metric_fallback=metric_fallback,
+        )
+        for name, (df, sweep_dir) in jobs.items()
+    }
+    results = pipeline.run()
+
+    out: Dict[str, Dict[str, Path]] = {}
+    for name, plots in submitted.items():
+        out[name] = {
+            key: path for key, path in plots.items() if path not in results or results[path].ok
+        }
+        logger.info(f"Erstellt: {len(out[name])} Plots für Sweep '{name}'")
+    return out
+
+
+def _submit_default_sweep_plots(
+    df: pd.DataFrame,
+    sweep_name: str,
+    output_dir: Path,
+    pipeline: FigurePipeline,
+    *,
+    param_candidates: Optional[Sequence[str]],
+    metric_primary: str,
+    metric_fallback: str,
+) -> Dict[str, Path]:
+    """Meldet die Standardplots eines Sweeps bei ``pipeline`` an (ohne zu rendern)."""
     plots: Dict[str, Path] = {}
 
     # Extrahiere Param- und Metrik-Spalten
@@ -537,6 +653,7 @@ def generate_default_sweep_plots(
                 metric_name=metric_used,
                 sweep_name=sweep_name,
                 output_dir=output_dir,
+                figure_pipeline=pipeline,
             )
             if plot_path:
                 param_clean = param_col.replace("param_", "")
@@ -561,6 +678,7 @@ def generate_default_sweep_plots(
                 metric_name=metric_used,
                 sweep_name=sweep_name,
                 output_dir=output_dir,
+                figure_pipeline=pipeline,
             )
             if heatmap_path:
                 plots["heatmap_2d"] = heatmap_path
@@ -588,6 +706,7 @@ def generate_default_sweep_plots(
                     metric_col=drawdown_metric,
                     sweep_name=sweep_name,
                     output_dir=output_dir,
+                    figure_pipeline=pipeline,
                 )
                 if drawdown_heatmap_path:
                     param_x_clean = param_x.replace("param_", "")
@@ -598,5 +717,4 @@ def generate_default_sweep_plots(
             except Exception as e:
                 logger.warning(f"Fehler beim Erstellen der Drawdown-Heatmap: {e}")
 
-    logger.info(f"Erstellt: {len(plots)} Plots für Sweep '{sweep_name}'")
     return plots
@@ -37,6 +37,7 @@ from src.research.cross_sectional_futures_pairwise_lead_lag_spillover_v1_score_v
     MIN_ELIGIBLE_MEMBERS,
     SCORE_FORMULA_VERSION,
     InstrumentNetSpilloverScoreResultV0,
+    compute_instrument_net_spillover_scores_all_epochs_v0,
     compute_instrument_net_spillover_scores_v0,
     compute_panel_pairwise_spillover_scores_v0,
     rank_instrument_net_spillover_scores_deterministic_v0,
@@ -1798,25 +1799,25 @@ def _run_pairwise_spillover_single_slot_orchestrator_v0(
     switch_delay = _resolve_pairwise_spillover_switch_entry_delay_v0(versioned_binding)
     state = _SlotState()
     epoch_results: list[OrchestratorEpochResultV0] = []
+    scores_by_epoch = compute_instrument_net_spillover_scores_all_epochs_v0(
+        instrument_closes,
+        lag_window_l=lag_window_l,
+        signal_lag_bars=signal_lag_bars,
+        forward_lag_bars=forward_lag_bars,
+        epoch_count=bar_count,
+    )
 
     for epoch_index in range(bar_count):
         timestamp_utc = reference_series.bars[epoch_index].timestamp_utc
-        pair_scores = compute_panel_pairwise_spillover_scores_v0(
-            instrument_closes,
-            lag_window_l=lag_window_l,
-            signal_lag_bars=signal_lag_bars,
-            forward_lag_bars=forward_lag_bars,
-            epoch_index=epoch_index,
-        )
+        instrument_scores = scores_by_epoch[epoch_index]
         error_codes: list[str] = []
-        if pair_scores is None:
+        if instrument_scores is None:
             target_side = SlotSide.FLAT
             target_instrument_id = None
             top_score = None
             ranked_ids: tuple[str, ...] = ()
             error_codes.append("INSUFFICIENT_ELIGIBLE_MEMBERS")
         else:
-            instrument_scores = compute_instrument_net_spillover_scores_v0(pair_scores)
             ranked_instruments = rank_instrument_net_spillover_scores_deterministic_v0(
                 instrument_scores
             )
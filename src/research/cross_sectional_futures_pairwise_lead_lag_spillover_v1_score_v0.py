@@ -11,6 +11,17 @@ import math
 from dataclasses import dataclass
 from typing import Sequence
 
+import numpy as np
+
+from src.research.cross_sectional_panel_arrays_v0 import (
+    DEFAULT_EPOCH_CHUNK,
+    PanelArraysV0,
+    future_log_returns_v0,
+    lagged_log_returns_v0,
+    pairwise_inbound_outbound_v0,
+    pairwise_products_v0,
+)
+
 PACKAGE_MARKER = "CROSS_SECTIONAL_FUTURES_PAIRWISE_LEAD_LAG_SPILLOVER_V1_SCORE_V0=true"
 
 SCORE_FORMULA_VERSION = "pairwise_spillover_graph_v1"
@@ -227,3 +238,64 @@ def rank_instrument_net_spillover_scores_deterministic_v0(
     scores: Sequence[InstrumentNetSpilloverScoreResultV0],
 ) -> tuple[InstrumentNetSpilloverScoreResultV0, ...]:
     return tuple(sorted(scores, key=lambda item: (-item.score, item.instrument_id)))
+
+
+def compute_instrument_net_spillover_scores_all_epochs_v0(
+    instrument_closes: dict[str, Sequence[float]],
+    *,
+    lag_window_l: int,
+    signal_lag_bars: int,
+    forward_lag_bars: int,
+    epoch_count: int | None = None,
+    epoch_chunk: int = DEFAULT_EPOCH_CHUNK,
+) -> tuple[tuple[InstrumentNetSpilloverScoreResultV0, ...] | None, ...]:
+    """Net spillover scores for epochs ``0..epoch_count-1`` in one array pass.
+
+    Entry ``t`` equals ``compute_instrument_net_spillover_scores_v0`` applied to
+    ``compute_panel_pairwise_spillover_scores_v0(..., epoch_index=t)``, or ``None`` where
+    that returns ``None``.
+    """
+    eligible_ids = [
+        instrument_id
+        for instrument_id in sorted(instrument_closes)
+        if not _is_bitcoin_instrument(instrument_id)
+    ]
+    if epoch_count is None:
+        epoch_count = max((len(v) for v in instrument_closes.values()), default=0)
+    if len(eligible_ids) < MIN_ELIGIBLE_MEMBERS:
+        return (None,) * epoch_count
+    # Forward returns near the end read closes past epoch_count, so the panel keeps the
+    # full series; only epochs < epoch_count are scored.
+    panel = PanelArraysV0.from_sequences(
+        instrument_closes,
+        instrument_ids=eligible_ids,
+        epoch_count=max(epoch_count, max(len(instrument_closes[i]) for i in eligible_ids)),
+    )
+    leader = lagged_log_returns_v0(panel, window=lag_window_l, signal_lag_bars=signal_lag_bars)
+    follower = future_log_returns_v0(panel, forward_lag_bars=forward_lag_bars)
+    results: list[tuple[InstrumentNetSpilloverScoreResultV0, ...] | None] = []
+    for start in range(0, epoch_count, max(1, epoch_chunk)):
+        stop = min(epoch_count, start + max(1, epoch_chunk))
+        products = pairwise_products_v0(leader[:, start:stop], follower[:, start:stop])
+        inbound, outbound, participates = pairwise_inbound_outbound_v0(products)
+        net = inbound - outbound
+        keep = participates & np.isfinite(net)
+        any_pair = participates.any(axis=0)
+        for offset in range(stop - start):
+            if not any_pair[offset]:
+                results.append(None)
+                continue
+            rows = np.flatnonzero(keep[:, offset]).tolist()
+            results.append(
+                tuple(
+                    InstrumentNetSpilloverScoreResultV0(
+                        instrument_id=eligible_ids[row],
+                        score=float(net[row, offset]),
+                        inbound_spillover_sum=float(inbound[row, offset]),
+                        outbound_spillover_sum=float(outbound[row, offset]),
+                        warmup_complete=True,
+                    )
+                    for row in rows
+                )
+            )
+    return tuple(results)
@@ -0,0 +1,233 @@
+"""Array-backed cross-sectional panel primitives (instruments x epochs).
+
+Pure offline helpers shared by the ``cross_sectional_*`` research family. A panel is a
+dense ``(n_instruments, n_epochs)`` float64 matrix with NaN past each series end, and every
+primitive evaluates all epochs in one pass, returning NaN where the per-epoch scalar
+function would return ``None``. Log returns use ``math.log`` per element so values are
+bit-identical to the scalar score modules. Research-only; no runtime, order, or authority
+effect.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Mapping, Sequence
+
+import numpy as np
+
+PACKAGE_MARKER = "CROSS_SECTIONAL_PANEL_ARRAYS_V0=true"
+
+DEFAULT_EPOCH_CHUNK = 256
+
+
+@dataclass(frozen=True)
+class PanelArraysV0:
+    instrument_ids: tuple[str, ...]
+    values: np.ndarray
+    lengths: np.ndarray
+
+    @classmethod
+    def from_sequences(
+        cls,
+        series_by_id: Mapping[str, Sequence[float]],
+        *,
+        instrument_ids: Sequence[str] | None = None,
+        epoch_count: int | None = None,
+    ) -> "PanelArraysV0":
+        ids = tuple(sorted(series_by_id) if instrument_ids is None else instrument_ids)
+        lengths = np.array([len(series_by_id[iid]) for iid in ids], dtype=np.int64)
+        if epoch_count is None:
+            epoch_count = int(lengths.max()) if ids else 0
+        # Series longer than the panel are truncated; offsets past the panel are invalid
+        lengths = np.minimum(lengths, epoch_count)
+        values = np.full((len(ids), epoch_count), np.nan, dtype=np.float64)
+        for row, iid in enumerate(ids):
+            series = series_by_id[iid]
+            take = min(len(series), epoch_count)
+            if take:
+                values[row, :take] = np.fromiter(series[:take], dtype=np.float64, count=take)
+        return cls(instrument_ids=ids, values=values, lengths=lengths)
+
+    @property
+    def instrument_count(self) -> int:
+        return len(self.instrument_ids)
+
+    @property
+    def epoch_count(self) -> int:
+        return int(self.values.shape[1])
+
+    @property
+    def mask(self) -> np.ndarray:
+        """True where the epoch lies inside the instrument's series."""
+        return np.arange(self.epoch_count)[None, :] < self.lengths[:, None]
+
+
+def exact_log_v0(values: np.ndarray) -> np.ndarray:
+    """Elementwise ``math.log`` for finite positive entries, NaN elsewhere."""
+    values = np.asarray(values, dtype=np.float64)
+    out = np.full(values.shape, np.nan, dtype=np.float64)
+    ok = np.isfinite(values) & (values > 0)
+    flat = values[ok]
+    out[ok] = np.fromiter(map(math.log, flat.tolist()), dtype=np.float64, count=flat.size)
+    return out
+
+
+def _shifted(panel: PanelArraysV0, offset: np.ndarray) -> np.ndarray:
+    """Gather ``values[i, offset[t]]``; NaN where the offset is outside the series."""
+    valid = (offset[None, :] >= 0) & (offset[None, :] < panel.lengths[:, None])
+    clipped = np.clip(offset, 0, max(panel.epoch_count - 1, 0))
+    gathered = panel.values[:, clipped] if panel.epoch_count else panel.values
+    return np.where(valid, gathered, np.nan)
+
+
+def _log_ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    ok = (numerator > 0) & (denominator > 0)
+    ratio = np.full(numerator.shape, np.nan, dtype=np.float64)
+    np.divide(numerator, denominator, out=ratio, where=ok)
+    out = exact_log_v0(ratio)
+    out[~np.isfinite(out)] = np.nan
+    return out
+
+
+def lagged_log_returns_v0(
+    panel: PanelArraysV0,
+    *,
+    window: int,
+    signal_lag_bars: int,
+) -> np.ndarray:
+    """``ln(x[t - lag] / x[t - lag - window])`` for every instrument and epoch."""
+    epochs = np.arange(panel.epoch_count, dtype=np.int64)
+    lag_idx = epochs - signal_lag_bars
+    base_idx = lag_idx - window
+    current = _shifted(panel, lag_idx)
+    base = _shifted(panel, base_idx)
+    return _log_ratio(current, base)
+
+
+def future_log_returns_v0(panel: PanelArraysV0, *, forward_lag_bars: int) -> np.ndarray:
+    """``ln(x[t + forward] / x[t])`` for every instrument and epoch."""
+    epochs = np.arange(panel.epoch_count, dtype=np.int64)
+    base = _shifted(panel, epochs)
+    future = _shifted(panel, epochs + forward_lag_bars)
+    return _log_ratio(future, base)
+
+
+def pairwise_products_v0(leader: np.ndarray, follower: np.ndarray) -> np.ndarray:
+    """Directed ``leader[i, t] * follower[j, t]`` as ``(n, n, t)``; NaN on the diagonal."""
+    products = leader[:, None, :] * follower[None, :, :]
+    products[~np.isfinite(products)] = np.nan
+    idx = np.arange(leader.shape[0])
+    products[idx, idx, :] = np.nan
+    return products
+
+
+def pairwise_inbound_outbound_v0(
+    products: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Per-instrument inbound/outbound sums of valid pair products.
+
+    Sums accumulate in row-major pair order (leader, then follower), matching a Python
+    loop over sorted ids term by term. Returns ``(inbound, outbound, participates)``
+    where ``participates`` marks instruments that appear in at least one valid pair.
+    """
+    valid = ~np.isnan(products)
+    terms = np.where(valid, products, 0.0)
+    n = products.shape[0]
+    inbound = np.zeros(products.shape[1:], dtype=np.float64)
+    outbound = np.zeros(products.shape[1:], dtype=np.float64)
+    for i in range(n):
+        inbound += terms[i]
+        outbound += terms[:, i]
+    participates = valid.any(axis=1) | valid.any(axis=0)
+    return inbound, outbound, participates
+
+
+def rolling_correlation_v0(x: np.ndarray, y: np.ndarray, *, window: int) -> np.ndarray:
+    """Trailing Pearson correlation over ``window`` epochs (inclusive of ``t``).
+
+    ``x`` and ``y`` broadcast to ``(n, T)``; windows with any NaN or zero variance are NaN.
+    """
+    x, y = np.broadcast_arrays(np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64))
+    cov, var_x, var_y = _rolling_moments(x, y, window)
+    denom = np.sqrt(var_x * var_y)
+    out = np.full(cov.shape, np.nan, dtype=np.float64)
+    np.divide(cov, denom, out=out, where=denom > 0)
+    return out
+
+
+def rolling_lead_lag_beta_v0(
+    leader: np.ndarray,
+    follower: np.ndarray,
+    *,
+    window: int,
+    lag_bars: int,
+) -> np.ndarray:
+    """Trailing OLS beta of ``follower[t]`` on ``leader[t - lag_bars]`` over ``window``."""
+    leader = np.asarray(leader, dtype=np.float64)
+    follower = np.asarray(follower, dtype=np.float64)
+    lagged = np.full(leader.shape, np.nan, dtype=np.float64)
+    if lag_bars < leader.shape[-1]:
+        lagged[..., lag_bars:] = leader[..., : leader.shape[-1] - lag_bars]
+    lagged, follower = np.broadcast_arrays(lagged, follower)
+    cov, var_x, _ = _rolling_moments(lagged, follower, window)
+    out = np.full(cov.shape, np.nan, dtype=np.float64)
+    np.divide(cov, var_x, out=out, where=var_x > 0)
+    return out
+
+
+def _rolling_moments(
+    x: np.ndarray, y: np.ndarray, window: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    if window < 2:
+        raise ValueError(f"window must be >= 2, got {window}")
+    shape = x.shape
+    cov = np.full(shape, np.nan, dtype=np.float64)
+    var_x = np.full(shape, np.nan, dtype=np.float64)
+    var_y = np.full(shape, np.nan, dtype=np.float64)
+    if shape[-1] < window:
+        return cov, var_x, var_y
+    wx = np.lib.stride_tricks.sliding_window_view(x, window, axis=-1)
+    wy = np.lib.stride_tricks.sliding_window_view(y, window, axis=-1)
+    dx = wx - wx.mean(axis=-1, keepdims=True)
+    dy = wy - wy.mean(axis=-1, keepdims=True)
+    cov[..., window - 1 :] = (dx * dy).mean(axis=-1)
+    var_x[..., window - 1 :] = (dx * dx).mean(axis=-1)
+    var_y[..., window - 1 :] = (dy * dy).mean(axis=-1)
+    return cov, var_x, var_y
+
+
+def cross_sectional_rank_order_v0(
+    scores: np.ndarray,
+    instrument_ids: Sequence[str],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Per-epoch ranking by descending score, ties broken by ascending instrument id.
+
+    Returns ``(order, counts)``: ``order[:, t]`` lists row indices best-first with NaN
+    scores last, and ``counts[t]`` is the number of finite scores at epoch ``t``.
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    id_rank = np.empty(len(instrument_ids), dtype=np.int64)
+    id_rank[np.argsort(np.array(instrument_ids, dtype=object), kind="stable")] = np.arange(
+        len(instrument_ids)
+    )
+    finite = np.isfinite(scores)
+    neg = np.where(finite, -scores, 0.0)
+    tie = np.broadcast_to(id_rank[:, None], scores.shape)
+    order = np.lexsort((tie, neg, ~finite), axis=0)
+    return order, finite.sum(axis=0)
+
+
+def cross_sectional_zscore_v0(scores: np.ndarray) -> np.ndarray:
+    """Per-epoch (population) z-score across finite instruments; NaN elsewhere."""
+    scores = np.asarray(scores, dtype=np.float64)
+    finite = np.isfinite(scores)
+    count = finite.sum(axis=0)
+    safe = np.where(finite, scores, 0.0)
+    mean = np.divide(safe.sum(axis=0), count, out=np.zeros(count.shape), where=count > 0)
+    dev = np.where(finite, scores - mean, 0.0)
+    var = np.divide((dev * dev).sum(axis=0), count, out=np.zeros(count.shape), where=count > 0)
+    std = np.sqrt(var)
+    out = np.full(scores.shape, np.nan, dtype=np.float64)
+    np.divide(dev, std, out=out, where=finite & (std > 0))
+    return out
@@ -11,7 +11,11 @@ from .contracts import (
     LinearModelEvidenceV1,
 )
 from .cost_model import build_cost_model_calibration_evidence
-from .feature_matrix import build_feature_matrix_binding
+from .feature_matrix import (
+    build_feature_matrix_binding,
+    build_feature_matrix_binding_from_frame,
+    build_feature_matrix_binding_from_store,
+)
 from .fitters import fit_ols_lstsq
 
 __all__ = [
@@ -21,5 +25,7 @@ __all__ = [
     "LinearModelEvidenceV1",
     "build_cost_model_calibration_evidence",
     "build_feature_matrix_binding",
+    "build_feature_matrix_binding_from_frame",
+    "build_feature_matrix_binding_from_store",
     "fit_ols_lstsq",
 ]
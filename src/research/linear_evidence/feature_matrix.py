@@ -3,12 +3,16 @@ from __future__ import annotations
 import hashlib
 import json
 from collections.abc import Mapping, Sequence
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
+import pandas as pd
 
 from .contracts import FeatureMatrixBindingV1
 
+if TYPE_CHECKING:
+    from src.features.offline_feature_store_v1 import FeatureStoreBindingV1
+
 
 def _stable_digest(payload: Any) -> str:
     encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode()
@@ -54,11 +58,14 @@ def build_feature_matrix_binding(
 
     for row in ordered:
         try:
-            xs.append([_as_float(row.get(name), field_name=name) for name in feature_names])
-            ys.append(_as_float(row.get(target_name), field_name=target_name))
-            kept_rows.append(row)
+            features = [_as_float(row.get(name), field_name=name) for name in feature_names]
+            target = _as_float(row.get(target_name), field_name=target_name)
         except ValueError as exc:
             dropped[str(exc)] = dropped.get(str(exc), 0) + 1
+            continue
+        xs.append(features)
+        ys.append(target)
+        kept_rows.append(row)
 
     if not xs:
         raise ValueError("INSUFFICIENT_DATA")
@@ -81,3 +88,51 @@ def build_feature_matrix_binding(
         dropped_rows_by_reason=dropped,
     )
     return x, y, binding
+
+
+def build_feature_matrix_binding_from_frame(
+    frame: pd.DataFrame,
+    *,
+    feature_names: Sequence[str],
+    target_name: str,
+    time_name: str = "decision_time",
+    validation_policy: str = "TIME_ORDERED",
+) -> tuple[np.ndarray, np.ndarray, FeatureMatrixBindingV1]:
+    """Bind a time-indexed frame (e.g. an offline feature store as-of join)."""
+    if not isinstance(frame.index, pd.DatetimeIndex):
+        raise ValueError("TARGET_BINDING_MISSING")
+    columns = [*feature_names, target_name]
+    missing = [name for name in columns if name not in frame.columns]
+    if missing:
+        raise ValueError(f"FEATURE_COLUMNS_MISSING:{','.join(missing)}")
+    times = frame.index.map(lambda ts: ts.isoformat())
+    records = frame.loc[:, columns].to_dict(orient="records")
+    rows = [{**record, time_name: time} for record, time in zip(records, times)]
+    return build_feature_matrix_binding(
+        rows,
+        feature_names=feature_names,
+        target_name=target_name,
+        time_name=time_name,
+        validation_policy=validation_policy,
+    )
+
+
+def build_feature_matrix_binding_from_store(
+    store_binding: FeatureStoreBindingV1,
+    bars: pd.DataFrame,
+    *,
+    symbol: str,
+    target_name: str,
+    feature_names: Sequence[str] | None = None,
+    time_name: str = "decision_time",
+    validation_policy: str = "TIME_ORDERED",
+) -> tuple[np.ndarray, np.ndarray, FeatureMatrixBindingV1]:
+    """Materialize/join store features onto ``bars`` (which carry the target) and bind them."""
+    frame = store_binding.join(bars, symbol=symbol)
+    return build_feature_matrix_binding_from_frame(
+        frame,
+        feature_names=tuple(feature_names or store_binding.feature_columns),
+        target_name=target_name,
+        time_name=time_name,
+        validation_policy=validation_policy,
+    )
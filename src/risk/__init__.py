@@ -11,96 +11,105 @@ v1 Risk Layer:
 - Component VaR (Parametric Attribution via Euler Allocation)
 """
 
-# Legacy Position Sizing & Limits
-from .position_sizer import (
-    PositionSizer,
-    PositionSizerConfig,
-    PositionRequest,
-    PositionResult,
-    calc_position_size,
-)
-from .limits import RiskLimits, RiskLimitsConfig
-
-# v1 Risk Layer
-from .types import (
-    PositionSnapshot,
-    PortfolioSnapshot,
-    RiskBreach,
-    RiskDecision,
-    BreachSeverity,
-)
-from .portfolio import (
-    compute_position_notional,
-    compute_gross_exposure,
-    compute_net_exposure,
-    compute_weights,
-    correlation_matrix,
-    portfolio_returns,
-)
-from .var import (
-    historical_var,
-    historical_cvar,
-    parametric_var,
-    parametric_cvar,
-    cornish_fisher_var,
-    cornish_fisher_cvar,
-    ewma_var,
-    ewma_cvar,
-)
-from .stress import (
-    StressScenario,
-    apply_scenario_to_returns,
-    run_stress_suite,
-)
-from .stress_tester import (
-    StressTester,
-    StressScenarioData,
-    StressTestResult,
-    ReverseStressResult,
-)
-from .enforcement import (
-    RiskLimitsV2,
-    RiskEnforcer,
-)
-
-# Component VaR (Parametric Attribution)
-from .covariance import (
-    CovarianceEstimator,
-    CovarianceEstimatorConfig,
-    CovarianceMethod,
-)
-from .parametric_var import (
-    ParametricVaR,
-    ParametricVaRConfig,
-    z_score,
-    portfolio_sigma_from_cov,
-)
-from .component_var import (
-    ComponentVaRCalculator,
-    ComponentVaRResult,
-    IncrementalVaRResult,
-    DiversificationBenefitResult,
-    calculate_incremental_var,
-    calculate_diversification_benefit,
-)
-
-# Monte Carlo VaR (Risk Layer v1.0)
-from .monte_carlo import (
-    MonteCarloVaRCalculator,
-    MonteCarloVaRConfig,
-    MonteCarloVaRResult,
-    EquityPathResult,
-    MonteCarloMethod,
-    CopulaType,
-    build_monte_carlo_var_from_config,
-)
+from src.core.lazy_imports import install_lazy_exports, lazy_exports
 
-# Risk Layer Manager v1.0 (Integration)
-from .risk_layer_manager import (
-    RiskLayerManager,
-    RiskAssessmentResult,
-    build_risk_layer_manager_from_config,
+# Re-Exports werden lazy (PEP 562) beim ersten Zugriff geladen, damit
+# ``import src.risk`` keine VaR-/Monte-Carlo-/Stress-Module (scipy, pandas) zieht.
+_LAZY_EXPORTS = lazy_exports(
+    __name__,
+    {
+        # Legacy Position Sizing & Limits
+        ".position_sizer": (
+            "PositionSizer",
+            "PositionSizerConfig",
+            "PositionRequest",
+            "PositionResult",
+            "calc_position_size",
+        ),
+        ".limits": (
+            "RiskLimits",
+            "RiskLimitsConfig",
+        ),
+        # v1 Risk Layer
+        ".types": (
+            "PositionSnapshot",
+            "PortfolioSnapshot",
+            "RiskBreach",
+            "RiskDecision",
+            "BreachSeverity",
+        ),
+        ".portfolio": (
+            "compute_position_notional",
+            "compute_gross_exposure",
+            "compute_net_exposure",
+            "compute_weights",
+            "correlation_matrix",
+            "portfolio_returns",
+        ),
+        ".var": (
+            "historical_var",
+            "historical_cvar",
+            "parametric_var",
+            "parametric_cvar",
+            "cornish_fisher_var",
+            "cornish_fisher_cvar",
+            "ewma_var",
+            "ewma_cvar",
+        ),
+        ".stress": (
+            "StressScenario",
+            "apply_scenario_to_returns",
+            "run_stress_suite",
+        ),
+        ".stress_tester": (
+            "StressTester",
+            "StressScenarioData",
+            "StressTestResult",
+            "ReverseStressResult",
+        ),
+        ".enforcement": (
+            "RiskLimitsV2",
+            "RiskEnforcer",
+        ),
+        # Component VaR (Parametric Attribution)
+        ".covariance": (
+            "CovarianceEstimator",
+            "CovarianceEstimatorConfig",
+            "CovarianceMethod",
+        ),
+        ".parametric_var": (
+            "ParametricVaR",
+            "ParametricVaRConfig",
+            "z_score",
+            "portfolio_sigma_from_cov",
+        ),
+        ".component_var": (
+            "ComponentVaRCalculator",
+            "ComponentVaRResult",
+            "IncrementalVaRResult",
+            "DiversificationBenefitResult",
+            "calculate_incremental_var",
+            "calculate_diversification_benefit",
+        ),
+        # Monte Carlo VaR (Risk Layer v1.0)
+        ".monte_carlo": (
+            "MonteCarloVaRCalculator",
+            "MonteCarloVaRConfig",
+            "MonteCarloVaRResult",
+            "EquityPathResult",
+            "MonteCarloMethod",
+            "CopulaType",
+            "build_monte_carlo_var_from_config",
+        ),
+        # Risk Layer Manager v1.0 (Integration)
+        ".risk_layer_manager": (
+            "RiskLayerManager",
+            "RiskAssessmentResult",
+            "build_risk_layer_manager_from_config",
+        ),
+    },
 )
+install_lazy_exports(globals(), _LAZY_EXPORTS)
 
 __all__ = [
     # Legacy Position Sizing
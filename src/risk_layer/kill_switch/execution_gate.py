@@ -3,11 +3,19 @@
 Provides the gate interface that blocks trading when kill switch is active.
 """
 
-from typing import Protocol
+from typing import Optional, Protocol
 
 from .core import KillSwitch, TradingBlockedError
 
 
+class PersistedStateReaderProtocol(Protocol):
+    """Reader for the persisted kill-switch state (e.g. ``KillSwitchStateReader``)."""
+
+    def is_blocking(self) -> bool:
+        """Return True if the persisted state is KILLED/RECOVERING."""
+        ...
+
+
 class ExecutionGateProtocol(Protocol):
     """Protocol for execution gate.
 
@@ -47,13 +55,27 @@ class ExecutionGate:
         ...     # Execute order...
     """
 
-    def __init__(self, kill_switch: KillSwitch):
+    def __init__(
+        self,
+        kill_switch: KillSwitch,
+        state_reader: Optional[PersistedStateReaderProtocol] = None,
+    ):
         """Initialize execution gate.
 
         Args:
             kill_switch: KillSwitch instance
+            state_reader: Optional reader for the persisted state file, e.g.
+                ``src.ops.gates.kill_switch_state_reader.get_kill_switch_state_reader()``.
+                When set, a KILLED/RECOVERING state written by another process
+                also blocks (at most one ``stat`` per check).
         """
         self._kill_switch = kill_switch
+        self._state_reader = state_reader
+
+    def _persisted_blocking(self) -> bool:
+        if self._state_reader is None:
+            return False
+        return self._state_reader.is_blocking()
 
     def check_can_execute(self) -> bool:
         """Check if execution is allowed.
@@ -68,6 +90,8 @@ class ExecutionGate:
             raise TradingBlockedError(
                 f"Trading blocked: Kill Switch is {self._kill_switch.state.name}"
             )
+        if self._persisted_blocking():
+            raise TradingBlockedError("Trading blocked: persisted Kill Switch state is blocking")
 
         return True
 
@@ -93,7 +117,7 @@ class ExecutionGate:
         Returns:
             True if blocked, False if allowed
         """
-        return self._kill_switch.check_and_block()
+        return self._kill_switch.check_and_block() or self._persisted_blocking()
 
     def get_block_reason(self) -> str:
         """Get reason for block.
@@ -101,7 +125,10 @@ class ExecutionGate:
         Returns:
             Human-readable block reason
         """
-        if not self.is_blocked():
+        # check_and_block() may advance the state machine: evaluate it exactly once.
+        if not self._kill_switch.check_and_block():
+            if self._persisted_blocking():
+                return "Kill Switch blocked by persisted state file"
             return "Not blocked"
 
         status = self._kill_switch.get_status()
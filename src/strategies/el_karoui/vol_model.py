@@ -32,6 +32,8 @@ from typing import Any, Dict, Optional, Union
 import numpy as np
 import pandas as pd
 
+from src.utils.rolling_stats import rolling_fraction_below
+
 
 # =============================================================================
 # VOL REGIME ENUM
@@ -329,29 +331,15 @@ class ElKarouiVolModel:
         lookback = self.config.lookback_window
         min_periods = self.config.vol_window
 
-        # Match pandas rolling().apply() window semantics (including +/-inf -> NaN).
-        values = vol_series.to_numpy(dtype=np.float64, copy=True)
-        values[np.isinf(values)] = np.nan
-        n = len(values)
-        out = np.full(n, np.nan, dtype=np.float64)
-
-        for end in range(n):
-            start = max(0, end - lookback + 1)
-            win = values[start : end + 1]
-            if np.count_nonzero(~np.isnan(win)) < min_periods:
-                continue
-            if len(win) < 2 or np.isnan(win[-1]):
-                continue
-            win_series = pd.Series(win)
-            current = win_series.iloc[-1]
-            out[end] = (win_series < current).mean()
-
-        return pd.Series(
-            out,
-            index=vol_series.index,
-            dtype=np.float64,
-            name=vol_series.name,
-        )
+        # Anteil der Fensterwerte unter dem aktuellen Wert; Fenstersemantik wie
+        # rolling().apply() (inkl. +/-inf -> NaN), siehe src.utils.rolling_stats
+        percentiles = rolling_fraction_below(vol_series, lookback, min_periods)
+
+        # Kein Perzentil bei ungültigem aktuellem Wert und im ersten Fenster (nur ein Bar)
+        undefined = ~np.isfinite(vol_series.to_numpy(dtype=np.float64))
+        undefined[:1] = True
+
+        return percentiles.mask(undefined)
 
     def regime_for_percentile(self, percentile: float) -> VolRegime:
         """
@@ -518,30 +506,27 @@ class ElKarouiVolModel:
         vol = self.calculate_realized_vol(returns)
         percentiles = self.calculate_vol_percentile(vol)
 
-        def calc_scaling(row_idx: int) -> float:
-            """Berechnet Scaling für einen Zeitpunkt."""
-            if row_idx < self.config.vol_window:
-                return 0.5
-
-            pct = percentiles.iloc[row_idx]
-            regime = self.regime_for_percentile(pct)
-            regime_mult = self.multiplier_for_regime(regime)
-
-            current_vol = vol.iloc[row_idx]
-            if pd.isna(current_vol) or current_vol <= 0:
-                vol_scale = 1.0
-            else:
-                vol_scale = self.config.vol_target / current_vol
-                vol_scale = max(0.2, min(2.0, vol_scale))
+        # Regime-Multiplier (fehlende Perzentile -> MEDIUM, wie regime_for_percentile)
+        pct = percentiles.to_numpy(dtype=np.float64)
+        regime_mult = np.select(
+            [pct < self.config.low_threshold, pct > self.config.high_threshold],
+            [
+                self.multiplier_for_regime(VolRegime.LOW),
+                self.multiplier_for_regime(VolRegime.HIGH),
+            ],
+            default=self.multiplier_for_regime(VolRegime.MEDIUM),
+        )
 
-            return regime_mult * vol_scale
+        # Vol-Target-Scaling, gecapped bei 0.2 bis 2.0
+        vol_values = vol.to_numpy(dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            vol_scale = np.clip(self.config.vol_target / vol_values, 0.2, 2.0)
+        vol_scale = np.where(np.isnan(vol_values) | (vol_values <= 0), 1.0, vol_scale)
 
-        scaling = pd.Series(
-            [calc_scaling(i) for i in range(len(returns))],
-            index=returns.index,
-        )
+        scaling = regime_mult * vol_scale
+        scaling[: self.config.vol_window] = 0.5  # Konservativer Default
 
-        return scaling
+        return pd.Series(scaling, index=returns.index, dtype=np.float64)
 
     def get_vol_analysis(
         self,
@@ -21,6 +21,7 @@ from typing import Any, Dict, Optional
 import pandas as pd
 import numpy as np
 
+from ..utils.rolling_stats import expanding_fraction_at_or_above
 from .base import BaseStrategy, StrategyMetadata
 
 
@@ -207,28 +208,10 @@ class MeanReversionStrategy(BaseStrategy):
         vol = returns.rolling(window=self.vol_window).std()
 
         # Expanding Percentile der Volatilität (<= mean semantics, 0-100 scale).
-        # Matches legacy vol.expanding().apply(lambda ...) including NaN/inf edge cases.
-        n = len(vol)
-        out = np.full(n, np.nan, dtype=np.float64)
-        for end in range(n):
-            prefix = vol.iloc[: end + 1]
-            if len(prefix) == 0:
-                out[end] = 50.0
-                continue
-            current = prefix.iloc[-1]
-            if pd.isna(current):
-                if prefix.isna().all():
-                    out[end] = np.nan
-                else:
-                    out[end] = (current <= prefix).mean() * 100.0
-                continue
-            if np.isinf(current):
-                out[end] = 0.0
-                continue
-            comp = [False if np.isinf(val) else (current <= val) for val in prefix]
-            out[end] = np.mean(comp) * 100.0
-
-        vol_percentile = pd.Series(out, index=vol.index, dtype=np.float64, name=vol.name)
+        # Matches legacy vol.expanding().apply(lambda ...) including NaN/inf edge cases;
+        # solange nur +/-inf bekannt ist, ist das Perzentil 0 statt NaN.
+        vol_percentile = expanding_fraction_at_or_above(vol) * 100.0
+        vol_percentile = vol_percentile.mask(vol.notna().cummax() & vol_percentile.isna(), 0.0)
 
         # Filter: Nur wenn Volatilität unter Schwelle
         return vol_percentile <= self.max_vol_percentile
@@ -8,40 +8,51 @@ Zentrale Registry aller verfügbaren Strategien mit einheitlichem Zugriff.
 from __future__ import annotations
 
 import hashlib
+import importlib
+import importlib.util
 import json
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
-from typing import Any, Dict, Mapping, Optional, Tuple, Type
-
-from .base import BaseStrategy
-from .ma_crossover import MACrossoverStrategy
-from .rsi_reversion import RsiReversionStrategy
-from .breakout_donchian import DonchianBreakoutStrategy
-from .momentum import MomentumStrategy
-from .bollinger import BollingerBandsStrategy
-from .macd import MACDStrategy
-from .trend_following import TrendFollowingStrategy
-from .mean_reversion import MeanReversionStrategy
-from .my_strategy import MyStrategy
-
-# Phase 40: Strategy Library Erweiterungen
-from .breakout import BreakoutStrategy
-from .vol_regime_filter import VolRegimeFilter
-from .composite import CompositeStrategy
-from .regime_aware_portfolio import RegimeAwarePortfolioStrategy
-
-# Research-Track: Armstrong & El-Karoui Strategien (R&D-Only)
-from .armstrong import ArmstrongCycleStrategy
-from .el_karoui import ElKarouiVolatilityStrategy, ElKarouiVolModelStrategy
-
-# Research-Track: Ehlers & López de Prado Strategien (R&D-Only)
-from .ehlers import EhlersCycleFilterStrategy
-from .lopez_de_prado import MetaLabelingStrategy
-
-# Research-Track: Bouchaud (OHLCV-Proxy) & Gatheral/Cont (Skeleton)
-from .bouchaud import BouchaudMicrostructureStrategy
-from .gatheral_cont import VolRegimeOverlayStrategy
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from .base import BaseStrategy
+
+
+@dataclass(frozen=True)
+class StrategyClassRef:
+    """
+    Lazy Verweis auf eine Strategieklasse.
+
+    Das Strategiemodul (und damit pandas/numpy) wird erst bei ``load()``
+    importiert, d.h. beim ersten Zugriff auf die Spec über die Registry.
+    """
+
+    module: str
+    name: str
+
+    @property
+    def qualified_name(self) -> str:
+        return f"{self.module}.{self.name}"
+
+    def load(self) -> Type[BaseStrategy]:
+        return getattr(importlib.import_module(self.module), self.name)
+
+
+def _lazy_cls(module: str, name: str) -> StrategyClassRef:
+    return StrategyClassRef(importlib.util.resolve_name(module, __package__), name)
 
 
 @dataclass(frozen=True)
@@ -51,7 +62,9 @@ class StrategySpec:
 
     Attributes:
         key: Eindeutiger Kurzname (z.B. "ma_crossover")
-        cls: Strategieklasse (muss von BaseStrategy erben)
+        cls: Strategieklasse (muss von BaseStrategy erben); in der eingebauten
+            Registry zunächst ein ``StrategyClassRef``, der beim Zugriff über
+            ``_STRATEGY_REGISTRY[key]`` aufgelöst wird
         config_section: TOML-Section für Config (z.B. "strategy.ma_crossover")
         description: Optionale Beschreibung
         is_live_ready: Ob Strategie für Live-Trading freigegeben ist (Default: True)
@@ -60,7 +73,7 @@ class StrategySpec:
     """
 
     key: str
-    cls: Type[BaseStrategy]
+    cls: Union[Type[BaseStrategy], StrategyClassRef]
     config_section: str
     description: str = ""
     is_live_ready: bool = True
@@ -74,159 +87,211 @@ class StrategySpec:
     )
 
 
-# Zentrale Registry aller verfügbaren Strategien
-_STRATEGY_REGISTRY: Dict[str, StrategySpec] = {
-    "ma_crossover": StrategySpec(
-        key="ma_crossover",
-        cls=MACrossoverStrategy,
-        config_section="strategy.ma_crossover",
-        description="Moving Average Crossover (Trend-Following)",
-        allowed_environments=("backtest", "offline_backtest", "paper", "testnet", "live"),
-    ),
-    "rsi_reversion": StrategySpec(
-        key="rsi_reversion",
-        cls=RsiReversionStrategy,
-        config_section="strategy.rsi_reversion",
-        description="RSI Mean-Reversion (Oversold/Overbought)",
-    ),
-    "breakout_donchian": StrategySpec(
-        key="breakout_donchian",
-        cls=DonchianBreakoutStrategy,
-        config_section="strategy.breakout_donchian",
-        description="Donchian Channel Breakout (Trend-Following)",
-    ),
-    "momentum_1h": StrategySpec(
-        key="momentum_1h",
-        cls=MomentumStrategy,
-        config_section="strategy.momentum_1h",
-        description="Momentum-basierte Trend-Following-Strategie",
-    ),
-    "bollinger_bands": StrategySpec(
-        key="bollinger_bands",
-        cls=BollingerBandsStrategy,
-        config_section="strategy.bollinger_bands",
-        description="Bollinger Bands Mean-Reversion",
-    ),
-    "macd": StrategySpec(
-        key="macd",
-        cls=MACDStrategy,
-        config_section="strategy.macd",
-        description="MACD Trend-Following",
-    ),
-    "trend_following": StrategySpec(
-        key="trend_following",
-        cls=TrendFollowingStrategy,
-        config_section="strategy.trend_following",
-        description="ADX-basierte Trend-Following-Strategie (Phase 18)",
-    ),
-    "mean_reversion": StrategySpec(
-        key="mean_reversion",
-        cls=MeanReversionStrategy,
-        config_section="strategy.mean_reversion",
-        description="Z-Score Mean-Reversion-Strategie (Phase 18)",
-    ),
-    "my_strategy": StrategySpec(
-        key="my_strategy",
-        cls=MyStrategy,
-        config_section="strategy.my_strategy",
-        description="ATR-basierte Volatility-Breakout-Strategie",
-    ),
-    # Phase 40: Strategy Library Erweiterungen
-    "breakout": StrategySpec(
-        key="breakout",
-        cls=BreakoutStrategy,
-        config_section="strategy.breakout",
-        description="Breakout/Momentum-Strategie mit SL/TP (Phase 40)",
-    ),
-    "vol_regime_filter": StrategySpec(
-        key="vol_regime_filter",
-        cls=VolRegimeFilter,
-        config_section="strategy.vol_regime_filter",
-        description="Volatilitäts-Regime-Filter (Phase 40)",
-    ),
-    "composite": StrategySpec(
-        key="composite",
-        cls=CompositeStrategy,
-        config_section="strategy.composite",
-        description="Multi-Strategy Composite (Phase 40)",
-    ),
-    "regime_aware_portfolio": StrategySpec(
-        key="regime_aware_portfolio",
-        cls=RegimeAwarePortfolioStrategy,
-        config_section="portfolio.regime_aware_breakout_rsi",
-        description="Regime-Aware Portfolio Strategy (Breakout + RSI + Vol-Regime)",
-    ),
-    # ==========================================================================
-    # Research-Track: R&D-Only Strategien (NICHT FÜR LIVE-TRADING)
-    # ==========================================================================
-    "armstrong_cycle": StrategySpec(
-        key="armstrong_cycle",
-        cls=ArmstrongCycleStrategy,
-        config_section="strategy.armstrong_cycle",
-        description=(
-            "Armstrong ECM Cycle Strategy (R&D-Only, Non-Authority, "
-            "CYCLE_INFORMATION research; nicht live / nicht kanonisch gebunden)"
+def _spec_class_ref(spec: StrategySpec) -> Tuple[str, str]:
+    """(Modul, Klassenname) einer Spec, ohne das Strategiemodul zu importieren."""
+    if isinstance(spec.cls, StrategyClassRef):
+        return spec.cls.module, spec.cls.name
+    return spec.cls.__module__, spec.cls.__name__
+
+
+class _LazyStrategyRegistry(MutableMapping[str, StrategySpec]):
+    """
+    Dict-kompatible Strategy-Registry mit lazy Klassenauflösung.
+
+    ``registry[key]`` / ``registry.get(key)`` liefern immer eine Spec mit
+    aufgelöster Klasse (Import beim ersten Zugriff, danach gecacht).
+    ``peek(key)`` liefert die Spec ohne Import (für Metadaten/Digests).
+    """
+
+    def __init__(self, specs: Mapping[str, StrategySpec]) -> None:
+        self._specs: Dict[str, StrategySpec] = dict(specs)
+
+    def __getitem__(self, key: str) -> StrategySpec:
+        spec = self._specs[key]
+        if isinstance(spec.cls, StrategyClassRef):
+            spec = replace(spec, cls=spec.cls.load())
+            self._specs[key] = spec
+        return spec
+
+    def __setitem__(self, key: str, spec: StrategySpec) -> None:
+        self._specs[key] = spec
+
+    def __delitem__(self, key: str) -> None:
+        del self._specs[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._specs)
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._specs
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({sorted(self._specs)!r})"
+
+    def peek(self, key: str) -> StrategySpec:
+        return self._specs[key]
+
+
+# Zentrale Registry aller verfügbaren Strategien (Klassen werden lazy geladen)
+_STRATEGY_REGISTRY: _LazyStrategyRegistry = _LazyStrategyRegistry(
+    {
+        "ma_crossover": StrategySpec(
+            key="ma_crossover",
+            cls=_lazy_cls(".ma_crossover", "MACrossoverStrategy"),
+            config_section="strategy.ma_crossover",
+            description="Moving Average Crossover (Trend-Following)",
+            allowed_environments=("backtest", "offline_backtest", "paper", "testnet", "live"),
         ),
-        is_live_ready=False,  # AUTH-005: align class + strategy_tiering.toml
-        tier="r_and_d",
-        allowed_environments=("offline_backtest", "research"),
-    ),
-    "el_karoui_vol_model": StrategySpec(
-        key="el_karoui_vol_model",
-        cls=ElKarouiVolModelStrategy,
-        config_section="strategy.el_karoui_vol_model",
-        description=(
-            "El Karoui Vol Regime Model (R&D-Only, Non-Authority, "
-            "REGIME_INFORMATION research; nicht live / nicht kanonisch gebunden)"
+        "rsi_reversion": StrategySpec(
+            key="rsi_reversion",
+            cls=_lazy_cls(".rsi_reversion", "RsiReversionStrategy"),
+            config_section="strategy.rsi_reversion",
+            description="RSI Mean-Reversion (Oversold/Overbought)",
         ),
-        is_live_ready=False,  # AUTH-005: align class + strategy_tiering.toml
-        tier="r_and_d",
-        allowed_environments=("offline_backtest", "research"),
-    ),
-    "ehlers_cycle_filter": StrategySpec(
-        key="ehlers_cycle_filter",
-        cls=EhlersCycleFilterStrategy,
-        config_section="strategy.ehlers_cycle_filter",
-        description=(
-            "Ehlers DSP Cycle Filter (R&D-Only, Non-Authority, "
-            "STRATEGY_INTENT research Long/Flat; nicht live / nicht kanonisch gebunden)"
+        "breakout_donchian": StrategySpec(
+            key="breakout_donchian",
+            cls=_lazy_cls(".breakout_donchian", "DonchianBreakoutStrategy"),
+            config_section="strategy.breakout_donchian",
+            description="Donchian Channel Breakout (Trend-Following)",
         ),
-        is_live_ready=False,  # NICHT live-ready
-        tier="r_and_d",
-        allowed_environments=("backtest", "offline_backtest", "research"),
-    ),
-    "meta_labeling": StrategySpec(
-        key="meta_labeling",
-        cls=MetaLabelingStrategy,
-        config_section="strategy.meta_labeling",
-        description="Meta-Labeling nach López de Prado (R&D-Only, ML-Layer)",
-        is_live_ready=False,  # NICHT live-ready
-        tier="r_and_d",
-        allowed_environments=("backtest", "offline_backtest", "research"),
-    ),
-    # Research-Strategien (teilweise OHLCV-Proxy-Slices)
-    "bouchaud_microstructure": StrategySpec(
-        key="bouchaud_microstructure",
-        cls=BouchaudMicrostructureStrategy,
-        config_section="strategy.bouchaud_microstructure",
-        description=(
-            "Bouchaud Microstructure (R&D-Only, Non-Authority, OHLCV-Proxy "
-            "STRATEGY_INTENT Long/Flat; HIGH proxy-data risk; nicht live / nicht kanonisch gebunden)"
+        "momentum_1h": StrategySpec(
+            key="momentum_1h",
+            cls=_lazy_cls(".momentum", "MomentumStrategy"),
+            config_section="strategy.momentum_1h",
+            description="Momentum-basierte Trend-Following-Strategie",
         ),
-        is_live_ready=False,  # NICHT live-ready
-        tier="r_and_d",
-        allowed_environments=("backtest", "offline_backtest", "research"),
-    ),
-    "vol_regime_overlay": StrategySpec(
-        key="vol_regime_overlay",
-        cls=VolRegimeOverlayStrategy,
-        config_section="strategy.vol_regime_overlay",
-        description="Gatheral & Cont Vol-Regime-Overlay (R&D, realized-vol/Quantil-Proxy)",
-        is_live_ready=False,  # NICHT live-ready
-        tier="r_and_d",
-        allowed_environments=("backtest", "offline_backtest", "research"),
-    ),
-}
+        "bollinger_bands": StrategySpec(
+            key="bollinger_bands",
+            cls=_lazy_cls(".bollinger", "BollingerBandsStrategy"),
+            config_section="strategy.bollinger_bands",
+            description="Bollinger Bands Mean-Reversion",
+        ),
+        "macd": StrategySpec(
+            key="macd",
+            cls=_lazy_cls(".macd", "MACDStrategy"),
+            config_section="strategy.macd",
+            description="MACD Trend-Following",
+        ),
+        "trend_following": StrategySpec(
+            key="trend_following",
+            cls=_lazy_cls(".trend_following", "TrendFollowingStrategy"),
+            config_section="strategy.trend_following",
+            description="ADX-basierte Trend-Following-Strategie (Phase 18)",
+        ),
+        "mean_reversion": StrategySpec(
+            key="mean_reversion",
+            cls=_lazy_cls(".mean_reversion", "MeanReversionStrategy"),
+            config_section="strategy.mean_reversion",
+            description="Z-Score Mean-Reversion-Strategie (Phase 18)",
+        ),
+        "my_strategy": StrategySpec(
+            key="my_strategy",
+            cls=_lazy_cls(".my_strategy", "MyStrategy"),
+            config_section="strategy.my_strategy",
+            description="ATR-basierte Volatility-Breakout-Strategie",
+        ),
+        # Phase 40: Strategy Library Erweiterungen
+        "breakout": StrategySpec(
+            key="breakout",
+            cls=_lazy_cls(".breakout", "BreakoutStrategy"),
+            config_section="strategy.breakout",
+            description="Breakout/Momentum-Strategie mit SL/TP (Phase 40)",
+        ),
+        "vol_regime_filter": StrategySpec(
+            key="vol_regime_filter",
+            cls=_lazy_cls(".vol_regime_filter", "VolRegimeFilter"),
+            config_section="strategy.vol_regime_filter",
+            description="Volatilitäts-Regime-Filter (Phase 40)",
+        ),
+        "composite": StrategySpec(
+            key="composite",
+            cls=_lazy_cls(".composite", "CompositeStrategy"),
+            config_section="strategy.composite",
+            description="Multi-Strategy Composite (Phase 40)",
+        ),
+        "regime_aware_portfolio": StrategySpec(
+            key="regime_aware_portfolio",
+            cls=_lazy_cls(".regime_aware_portfolio", "RegimeAwarePortfolioStrategy"),
+            config_section="portfolio.regime_aware_breakout_rsi",
+            description="Regime-Aware Portfolio Strategy (Breakout + RSI + Vol-Regime)",
+        ),
+        # ==========================================================================
+        # Research-Track: R&D-Only Strategien (NICHT FÜR LIVE-TRADING)
+        # ==========================================================================
+        "armstrong_cycle": StrategySpec(
+            key="armstrong_cycle",
+            cls=_lazy_cls(".armstrong.armstrong_cycle_strategy", "ArmstrongCycleStrategy"),
+            config_section="strategy.armstrong_cycle",
+            description=(
+                "Armstrong ECM Cycle Strategy (R&D-Only, Non-Authority, "
+                "CYCLE_INFORMATION research; nicht live / nicht kanonisch gebunden)"
+            ),
+            is_live_ready=False,  # AUTH-005: align class + strategy_tiering.toml
+            tier="r_and_d",
+            allowed_environments=("offline_backtest", "research"),
+        ),
+        "el_karoui_vol_model": StrategySpec(
+            key="el_karoui_vol_model",
+            cls=_lazy_cls(".el_karoui.el_karoui_vol_model_strategy", "ElKarouiVolatilityStrategy"),
+            config_section="strategy.el_karoui_vol_model",
+            description=(
+                "El Karoui Vol Regime Model (R&D-Only, Non-Authority, "
+                "REGIME_INFORMATION research; nicht live / nicht kanonisch gebunden)"
+            ),
+            is_live_ready=False,  # AUTH-005: align class + strategy_tiering.toml
+            tier="r_and_d",
+            allowed_environments=("offline_backtest", "research"),
+        ),
+        "ehlers_cycle_filter": StrategySpec(
+            key="ehlers_cycle_filter",
+            cls=_lazy_cls(".ehlers.ehlers_cycle_filter_strategy", "EhlersCycleFilterStrategy"),
+            config_section="strategy.ehlers_cycle_filter",
+            description=(
+                "Ehlers DSP Cycle Filter (R&D-Only, Non-Authority, "
+                "STRATEGY_INTENT research Long/Flat; nicht live / nicht kanonisch gebunden)"
+            ),
+            is_live_ready=False,  # NICHT live-ready
+            tier="r_and_d",
+            allowed_environments=("backtest", "offline_backtest", "research"),
+        ),
+        "meta_labeling": StrategySpec(
+            key="meta_labeling",
+            cls=_lazy_cls(".lopez_de_prado.meta_labeling_strategy", "MetaLabelingStrategy"),
+            config_section="strategy.meta_labeling",
+            description="Meta-Labeling nach López de Prado (R&D-Only, ML-Layer)",
+            is_live_ready=False,  # NICHT live-ready
+            tier="r_and_d",
+            allowed_environments=("backtest", "offline_backtest", "research"),
+        ),
+        # Research-Strategien (teilweise OHLCV-Proxy-Slices)
+        "bouchaud_microstructure": StrategySpec(
+            key="bouchaud_microstructure",
+            cls=_lazy_cls(
+                ".bouchaud.bouchaud_microstructure_strategy", "BouchaudMicrostructureStrategy"
+            ),
+            config_section="strategy.bouchaud_microstructure",
+            description=(
+                "Bouchaud Microstructure (R&D-Only, Non-Authority, OHLCV-Proxy "
+                "STRATEGY_INTENT Long/Flat; HIGH proxy-data risk; nicht live / nicht kanonisch gebunden)"
+            ),
+            is_live_ready=False,  # NICHT live-ready
+            tier="r_and_d",
+            allowed_environments=("backtest", "offline_backtest", "research"),
+        ),
+        "vol_regime_overlay": StrategySpec(
+            key="vol_regime_overlay",
+            cls=_lazy_cls(".gatheral_cont.vol_regime_overlay_strategy", "VolRegimeOverlayStrategy"),
+            config_section="strategy.vol_regime_overlay",
+            description="Gatheral & Cont Vol-Regime-Overlay (R&D, realized-vol/Quantil-Proxy)",
+            is_live_ready=False,  # NICHT live-ready
+            tier="r_and_d",
+            allowed_environments=("backtest", "offline_backtest", "research"),
+        ),
+    }
+)
 
 REGISTRY_SCHEMA_VERSION = "strategy_registry_v1"
 REGISTRY_POLICY_VERSION = "strategy_registry_policy_v1"
@@ -376,7 +441,8 @@ def _entry_capability_tags(spec: StrategySpec) -> Tuple[str, ...]:
 
 def _implementation_ref_for(strategy_id: str, spec: Optional[StrategySpec]) -> str:
     if spec is not None:
-        return f"{spec.cls.__module__}.{spec.cls.__name__}"
+        module, name = _spec_class_ref(spec)
+        return f"{module}.{name}"
     loader = _LOADER_MODULE_REFS[strategy_id]
     return f"src.strategies.{loader}"
 
@@ -386,7 +452,8 @@ def _build_canonical_entry(
 ) -> StrategyRegistryEntryV1:
     loader_ref = _LOADER_MODULE_REFS[strategy_id]
     if spec is not None:
-        factory_ref = f"oop:{spec.cls.__module__}.{spec.cls.__name__}"
+        module, name = _spec_class_ref(spec)
+        factory_ref = f"oop:{module}.{name}"
         capability_tags = _entry_capability_tags(spec)
     else:
         factory_ref = f"functional:src.strategies.{loader_ref}.generate_signals"
@@ -435,7 +502,10 @@ def _all_canonical_strategy_ids() -> Tuple[str, ...]:
 
 
 _CANONICAL_ENTRIES: Tuple[StrategyRegistryEntryV1, ...] = tuple(
-    _build_canonical_entry(strategy_id, _STRATEGY_REGISTRY.get(strategy_id))
+    _build_canonical_entry(
+        strategy_id,
+        _STRATEGY_REGISTRY.peek(strategy_id) if strategy_id in _STRATEGY_REGISTRY else None,
+    )
     for strategy_id in _all_canonical_strategy_ids()
 )
 _CANONICAL_ENTRY_BY_ID: Dict[str, StrategyRegistryEntryV1] = {
@@ -709,7 +779,7 @@ def list_strategies(verbose: bool = False) -> None:
     """
     print("Available Strategies:")
     for key in sorted(get_available_strategy_keys()):
-        spec = _STRATEGY_REGISTRY[key]
+        spec = _STRATEGY_REGISTRY.peek(key)
         if verbose and spec.description:
             print(f"  - {key}: {spec.description}")
         else:
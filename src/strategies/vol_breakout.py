@@ -19,8 +19,8 @@ from __future__ import annotations
 from typing import Any, Dict, Optional
 
 import pandas as pd
-import numpy as np
 
+from ..utils.rolling_stats import rolling_last_pct_rank
 from .base import BaseStrategy, StrategyMetadata
 
 
@@ -31,20 +31,10 @@ def _rolling_last_pct_rank(
 ) -> pd.Series:
     """Rolling percentile rank (0-100) of the last value in each window.
 
-    Semantics match ``Series.rolling(...).apply(lambda x: pd.Series(x).rank(pct=True).iloc[-1] * 100)``.
+    Semantics match ``Series.rolling(...).apply(lambda x: pd.Series(x).rank(pct=True).iloc[-1] * 100)``;
+    see :func:`src.utils.rolling_stats.rolling_last_pct_rank`.
     """
-    values = series.to_numpy(dtype=np.float64, copy=False)
-    n = len(values)
-    out = np.full(n, np.nan, dtype=np.float64)
-
-    for end in range(n):
-        start = max(0, end - window + 1)
-        win = values[start : end + 1]
-        if np.count_nonzero(~np.isnan(win)) < min_periods:
-            continue
-        out[end] = pd.Series(win).rank(pct=True).iloc[-1] * 100.0
-
-    return pd.Series(out, index=series.index, dtype=np.float64)
+    return rolling_last_pct_rank(series, window, min_periods).rename(None)
 
 
 class VolBreakoutStrategy(BaseStrategy):
@@ -0,0 +1,416 @@
+# src/trading/master_v2/integrated_offline_replay_stage_profiler_v1.py
+"""
+Opt-in per-stage profiling for the integrated offline trading logic replay v1.
+
+Observation only: records wall time, call counts and net allocated blocks per
+replay stage and cycle; never reads or alters replay inputs, outputs or digests.
+
+Disabled by default. While no profiler is active the replay pays one context
+lookup per cycle and a no-op call per stage checkpoint.
+
+Usage:
+    with profile_integrated_offline_replay_v1() as profiler:
+        run_mv2_research_backtest_wiring_v1(...)
+    print(profiler.report().render_text())
+
+Stages are sequential checkpoints ("laps"): each checkpoint attributes the time
+since the previous one to the named stage. Time after the last checkpoint and on
+early fail-closed returns stays unattributed (cycle total minus stage totals).
+"""
+
+from __future__ import annotations
+
+import bisect
+import functools
+import importlib
+import sys
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, Mapping, Optional, Sequence, TypeVar
+
+INTEGRATED_OFFLINE_REPLAY_STAGE_PROFILER_LAYER_VERSION = "v1"
+
+# Checkpoint names in chain order (STEP 29B–29H).
+REPLAY_STAGES_V1: tuple[str, ...] = (
+    "input_guards",
+    "market_context_binding",
+    "typed_volatility_gate",
+    "scope_resolution",
+    "scope_event",
+    "directional_confirmation",
+    "survival",
+    "suitability",
+    "composition",
+    "state_switch",
+    "entry_exit",
+    "decision_evidence",
+)
+
+DEFAULT_STAGE_HISTOGRAM_BUCKETS_S: tuple[float, ...] = (
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    1.0,
+)
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+@dataclass(frozen=True)
+class ReplayStageStatsV1:
+    """Aggregated timings of one stage; ``bucket_counts[-1]`` counts samples above the last bound."""
+
+    stage: str
+    calls: int
+    total_seconds: float
+    min_seconds: float
+    max_seconds: float
+    allocated_blocks: int
+    bucket_upper_bounds: tuple[float, ...]
+    bucket_counts: tuple[int, ...]
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+    def quantile_seconds(self, q: float) -> float:
+        """Upper bucket bound containing quantile ``q`` (``max_seconds`` for the overflow bucket)."""
+        if not 0.0 <= q <= 1.0:
+            raise ValueError(f"quantile_out_of_range:{q}")
+        if not self.calls:
+            return 0.0
+        rank = q * self.calls
+        seen = 0
+        for bound, count in zip(self.bucket_upper_bounds, self.bucket_counts):
+            seen += count
+            if count and seen >= rank:
+                return bound
+        return self.max_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "stage": self.stage,
+            "calls": self.calls,
+            "total_seconds": self.total_seconds,
+            "mean_seconds": self.mean_seconds,
+            "min_seconds": self.min_seconds,
+            "max_seconds": self.max_seconds,
+            "p50_seconds": self.quantile_seconds(0.5),
+            "p99_seconds": self.quantile_seconds(0.99),
+            "allocated_blocks": self.allocated_blocks,
+            "histogram": {
+                "le": [*self.bucket_upper_bounds, "+Inf"],
+                "counts": list(self.bucket_counts),
+            },
+        }
+
+
+@dataclass(frozen=True)
+class ReplayCycleStageProfileV1:
+    """Per-stage wall time, checkpoint calls and net allocated blocks of one replay cycle."""
+
+    trading_epoch: int
+    wall_seconds: float
+    stage_seconds: Mapping[str, float] = field(default_factory=dict)
+    stage_calls: Mapping[str, int] = field(default_factory=dict)
+    stage_allocated_blocks: Mapping[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "trading_epoch": self.trading_epoch,
+            "wall_seconds": self.wall_seconds,
+            "stage_seconds": dict(self.stage_seconds),
+            "stage_calls": dict(self.stage_calls),
+            "stage_allocated_blocks": dict(self.stage_allocated_blocks),
+        }
+
+
+@dataclass(frozen=True)
+class ReplayStageProfileReportV1:
+    """Profiling report; ``stages`` sorted by total time, descending."""
+
+    cycles: int
+    cycle_total_seconds: float
+    stages: tuple[ReplayStageStatsV1, ...]
+    cycle_records: tuple[ReplayCycleStageProfileV1, ...] = ()
+    layer_version: str = INTEGRATED_OFFLINE_REPLAY_STAGE_PROFILER_LAYER_VERSION
+
+    @property
+    def unattributed_seconds(self) -> float:
+        return self.cycle_total_seconds - sum(s.total_seconds for s in self.stages)
+
+    def stage(self, name: str) -> Optional[ReplayStageStatsV1]:
+        for stats in self.stages:
+            if stats.stage == name:
+                return stats
+        return None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "layer_version": self.layer_version,
+            "cycles": self.cycles,
+            "cycle_total_seconds": self.cycle_total_seconds,
+            "unattributed_seconds": self.unattributed_seconds,
+            "stages": [s.to_dict() for s in self.stages],
+            "cycle_records": [c.to_dict() for c in self.cycle_records],
+        }
+
+    def render_text(self) -> str:
+        total = self.cycle_total_seconds
+        lines = [
+            f"integrated offline replay stage profile: {self.cycles} cycles, {total:.4f}s",
+            f"{'stage':<26} {'calls':>8} {'total_s':>10} {'share':>7} "
+            f"{'mean_us':>9} {'p99_us':>9} {'blocks':>9}",
+        ]
+        for s in self.stages:
+            share = s.total_seconds / total if total > 0 else 0.0
+            lines.append(
+                f"{s.stage:<26} {s.calls:>8} {s.total_seconds:>10.4f} {share:>7.1%} "
+                f"{s.mean_seconds * 1e6:>9.1f} {s.quantile_seconds(0.99) * 1e6:>9.1f} "
+                f"{s.allocated_blocks:>9}"
+            )
+        unattributed = self.unattributed_seconds
+        share = unattributed / total if total > 0 else 0.0
+        lines.append(f"{'(unattributed)':<26} {'':>8} {unattributed:>10.4f} {share:>7.1%}")
+        return "\n".join(lines)
+
+
+class _StageAccumulatorV1:
+    __slots__ = ("calls", "total", "min", "max", "blocks", "buckets")
+
+    def __init__(self, n_buckets: int) -> None:
+        self.calls = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self.blocks = 0
+        self.buckets = [0] * (n_buckets + 1)
+
+
+class _ReplayCycleLapsV1:
+    """Checkpoint callable of one open cycle (see module docstring)."""
+
+    __slots__ = ("_profiler", "_last", "_last_blocks")
+
+    def __init__(self, profiler: "ReplayStageProfilerV1") -> None:
+        self._profiler = profiler
+        self._last_blocks = profiler._allocated_blocks()
+        self._last = profiler._clock()
+
+    def __call__(self, stage: str) -> None:
+        profiler = self._profiler
+        now = profiler._clock()
+        blocks = profiler._allocated_blocks()
+        profiler._record(stage, now - self._last, blocks - self._last_blocks)
+        self._last_blocks = profiler._allocated_blocks()
+        self._last = profiler._clock()
+
+
+class ReplayStageProfilerV1:
+    """
+    Collects per-stage replay timings.
+
+    Args:
+        buckets: Histogram upper bounds in seconds (ascending)
+        record_cycles: Keep the last N per-cycle records (0: aggregates only)
+        track_allocations: Record net allocated blocks (``sys.getallocatedblocks``)
+        export_prometheus: Also observe each stage/cycle in the ``src.obs`` replay metrics
+    """
+
+    def __init__(
+        self,
+        *,
+        buckets: Sequence[float] = DEFAULT_STAGE_HISTOGRAM_BUCKETS_S,
+        record_cycles: int = 0,
+        track_allocations: bool = True,
+        export_prometheus: bool = False,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        bounds = tuple(float(b) for b in buckets)
+        if not bounds or list(bounds) != sorted(set(bounds)):
+            raise ValueError("stage_histogram_buckets_must_be_strictly_ascending")
+        if record_cycles < 0:
+            raise ValueError("record_cycles_must_be_non_negative")
+        self.buckets = bounds
+        self.track_allocations = track_allocations
+        self.export_prometheus = export_prometheus
+        self._clock = clock
+        self._stages: dict[str, _StageAccumulatorV1] = {}
+        self._cycles = 0
+        self._cycle_total = 0.0
+        self._cycle_records: deque[ReplayCycleStageProfileV1] = deque(maxlen=record_cycles)
+        self._record_cycles = record_cycles
+        self._laps: Optional[_ReplayCycleLapsV1] = None
+        self._cycle_seconds: dict[str, float] = {}
+        self._cycle_calls: dict[str, int] = {}
+        self._cycle_blocks: dict[str, int] = {}
+
+    def _allocated_blocks(self) -> int:
+        return sys.getallocatedblocks() if self.track_allocations else 0
+
+    def _record(self, stage: str, seconds: float, blocks: int) -> None:
+        acc = self._stages.get(stage)
+        if acc is None:
+            acc = self._stages[stage] = _StageAccumulatorV1(len(self.buckets))
+        acc.calls += 1
+        acc.total += seconds
+        acc.min = min(acc.min, seconds)
+        acc.max = max(acc.max, seconds)
+        acc.blocks += blocks
+        acc.buckets[bisect.bisect_left(self.buckets, seconds)] += 1
+        if self._record_cycles:
+            self._cycle_seconds[stage] = self._cycle_seconds.get(stage, 0.0) + seconds
+            self._cycle_calls[stage] = self._cycle_calls.get(stage, 0) + 1
+            self._cycle_blocks[stage] = self._cycle_blocks.get(stage, 0) + blocks
+        if self.export_prometheus:
+            from src.obs import replay_stage_telemetry
+
+            replay_stage_telemetry.observe_replay_stage(stage=stage, seconds=seconds)
+
+    @contextmanager
+    def cycle(self, trading_epoch: int) -> Iterator[_ReplayCycleLapsV1]:
+        """Open one replay cycle; nested cycles reuse the outer one."""
+        if self._laps is not None:
+            yield self._laps
+            return
+        self._cycle_seconds, self._cycle_calls, self._cycle_blocks = {}, {}, {}
+        start = self._clock()
+        self._laps = _ReplayCycleLapsV1(self)
+        try:
+            yield self._laps
+        finally:
+            self._laps = None
+            wall = self._clock() - start
+            self._cycles += 1
+            self._cycle_total += wall
+            if self._record_cycles:
+                self._cycle_records.append(
+                    ReplayCycleStageProfileV1(
+                        trading_epoch=int(trading_epoch),
+                        wall_seconds=wall,
+                        stage_seconds=self._cycle_seconds,
+                        stage_calls=self._cycle_calls,
+                        stage_allocated_blocks=self._cycle_blocks,
+                    )
+                )
+            if self.export_prometheus:
+                from src.obs import replay_stage_telemetry
+
+                replay_stage_telemetry.observe_replay_cycle(seconds=wall)
+
+    def lap(self, stage: str) -> None:
+        """Checkpoint ``stage`` in the open cycle (no-op outside a cycle)."""
+        if self._laps is not None:
+            self._laps(stage)
+
+    def report(self) -> ReplayStageProfileReportV1:
+        stages = tuple(
+            ReplayStageStatsV1(
+                stage=name,
+                calls=acc.calls,
+                total_seconds=acc.total,
+                min_seconds=acc.min if acc.calls else 0.0,
+                max_seconds=acc.max,
+                allocated_blocks=acc.blocks,
+                bucket_upper_bounds=self.buckets,
+                bucket_counts=tuple(acc.buckets),
+            )
+            for name, acc in self._stages.items()
+        )
+        return ReplayStageProfileReportV1(
+            cycles=self._cycles,
+            cycle_total_seconds=self._cycle_total,
+            stages=tuple(sorted(stages, key=lambda s: (-s.total_seconds, s.stage))),
+            cycle_records=tuple(self._cycle_records),
+        )
+
+    def reset(self) -> None:
+        self._stages.clear()
+        self._cycles = 0
+        self._cycle_total = 0.0
+        self._cycle_records.clear()
+
+
+_ACTIVE_REPLAY_STAGE_PROFILER_V1: ContextVar[Optional[ReplayStageProfilerV1]] = ContextVar(
+    "integrated_offline_replay_stage_profiler_v1", default=None
+)
+if __name__.startswith("src."):
+    # Share the active-profiler slot with the ``trading.master_v2`` import path the replay uses.
+    _ACTIVE_REPLAY_STAGE_PROFILER_V1 = importlib.import_module(
+        __name__[len("src.") :]
+    )._ACTIVE_REPLAY_STAGE_PROFILER_V1
+
+
+def _noop_lap_v1(stage: str) -> None:  # noqa: ARG001
+    return None
+
+
+def active_integrated_offline_replay_stage_profiler_v1() -> Optional[ReplayStageProfilerV1]:
+    return _ACTIVE_REPLAY_STAGE_PROFILER_V1.get()
+
+
+def replay_stage_lap_v1() -> Callable[[str], None]:
+    """Checkpoint callable for the current replay cycle (no-op while profiling is off)."""
+    profiler = _ACTIVE_REPLAY_STAGE_PROFILER_V1.get()
+    if profiler is None or profiler._laps is None:
+        return _noop_lap_v1
+    return profiler._laps
+
+
+def profiled_replay_cycle_v1(fn: _F) -> _F:
+    """Decorator: one profiler cycle per replay call while a profiler is active."""
+
+    @functools.wraps(fn)
+    def _wrapper(inp: Any, *args: Any, **kwargs: Any) -> Any:
+        profiler = _ACTIVE_REPLAY_STAGE_PROFILER_V1.get()
+        if profiler is None:
+            return fn(inp, *args, **kwargs)
+        with profiler.cycle(getattr(inp, "trading_epoch", -1)):
+            return fn(inp, *args, **kwargs)
+
+    return _wrapper  # type: ignore[return-value]
+
+
+@contextmanager
+def profile_integrated_offline_replay_v1(
+    profiler: Optional[ReplayStageProfilerV1] = None,
+    **profiler_kwargs: Any,
+) -> Iterator[ReplayStageProfilerV1]:
+    """Activate stage profiling for replays in this context (restores the previous profiler)."""
+    if profiler is not None and profiler_kwargs:
+        raise ValueError("profiler_and_profiler_kwargs_are_exclusive")
+    active = profiler if profiler is not None else ReplayStageProfilerV1(**profiler_kwargs)
+    token = _ACTIVE_REPLAY_STAGE_PROFILER_V1.set(active)
+    try:
+        yield active
+    finally:
+        _ACTIVE_REPLAY_STAGE_PROFILER_V1.reset(token)
+
+
+__all__ = [
+    "DEFAULT_STAGE_HISTOGRAM_BUCKETS_S",
+    "INTEGRATED_OFFLINE_REPLAY_STAGE_PROFILER_LAYER_VERSION",
+    "REPLAY_STAGES_V1",
+    "ReplayCycleStageProfileV1",
+    "ReplayStageProfileReportV1",
+    "ReplayStageProfilerV1",
+    "ReplayStageStatsV1",
+    "active_integrated_offline_replay_stage_profiler_v1",
+    "profile_integrated_offline_replay_v1",
+    "profiled_replay_cycle_v1",
+    "replay_stage_lap_v1",
+]
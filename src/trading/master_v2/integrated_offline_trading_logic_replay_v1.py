@@ -170,6 +170,10 @@ from trading.master_v2.survival_assessment_v1 import (
     SurvivalResultV1,
     evaluate_survival_assessment_v1,
 )
+from trading.master_v2.integrated_offline_replay_stage_profiler_v1 import (
+    profiled_replay_cycle_v1,
+    replay_stage_lap_v1,
+)
 from trading.master_v2.canonical_volatility_default_quarantine_v1 import (
     admit_positive_volatility_without_strategy_floor_v1,
     quarantine_explicit_replay_default_volatility_v1,
@@ -1235,10 +1239,13 @@ def resolve_integrated_reversal_preparation_entry_exit_binding_v0(
     return composition_for_policy, existing_position_side, position_state, venue_flat
 
 
+@profiled_replay_cycle_v1
 def run_integrated_offline_trading_logic_replay_v1(
     inp: IntegratedOfflineReplayInputV1,
 ) -> IntegratedOfflineReplayResultV1:
     """Execute the canonical STEP 29B–29H offline replay chain fail-closed."""
+    # Stage checkpoints are no-ops unless a stage profiler is active (observation only).
+    lap = replay_stage_lap_v1()
     fail_reasons: list[str] = []
     regime_bull_bear_switch_evidence_readmodel: Optional[object] = None
 
@@ -1270,6 +1277,7 @@ def run_integrated_offline_trading_logic_replay_v1(
 
     contract_errors = _validate_contract_versions(inp)
     fail_reasons.extend(contract_errors)
+    lap("input_guards")
 
     if fail_reasons:
         evidence = _blocked_evidence(inp, fail_reasons=tuple(fail_reasons))
@@ -1305,6 +1313,7 @@ def run_integrated_offline_trading_logic_replay_v1(
         return IntegratedOfflineReplayResultV1(False, ("missing_market_context_output",), evidence)
 
     bound_context = binding.context
+    lap("market_context_binding")
 
     if inp.require_productive_typed_volatility_presence_gate:
         from trading.master_v2.double_play_runtime_typed_volatility_presence_gate_v1 import (
@@ -1395,6 +1404,7 @@ def run_integrated_offline_trading_logic_replay_v1(
                 decision_outcome="blocked",
             )
             return IntegratedOfflineReplayResultV1(False, reasons, evidence)
+        lap("typed_volatility_gate")
 
     scope_init = initialize_canonical_scope(
         bound_context,
@@ -1442,6 +1452,7 @@ def run_integrated_offline_trading_logic_replay_v1(
         inp.side_state,
         fallback=inp.scope_direction_state,
     )
+    lap("scope_resolution")
 
     scope_event_inp = ScopeEventGeneratorInputV1(
         instrument_id=inp.instrument_id,
@@ -1475,6 +1486,7 @@ def run_integrated_offline_trading_logic_replay_v1(
     scope_chop_policy_active = bool(runtime_scope_pre.chop_latched) or (
         mapped_event is ScopeEvent.CHOP_DETECTED
     )
+    lap("scope_event")
 
     scope_event_ref = _scope_event_ref_from_evidence(scope_event)
     bull_inp = _directional_input_for_side(inp, DirectionalAssessmentSide.LONG, scope_event_ref)
@@ -1503,6 +1515,7 @@ def run_integrated_offline_trading_logic_replay_v1(
     )
     bull_assessment = bull_c3.assessment
     bear_assessment = bear_c3.assessment
+    lap("directional_confirmation")
 
     # C4: post-C3 Survival → Suitability → Composition binding.
     # Survival/Suitability consume C3 assessments only; Composition remains the sole
@@ -1517,6 +1530,7 @@ def run_integrated_offline_trading_logic_replay_v1(
         _survival_input_for_assessment(inp, bear_assessment),
         inp.policies.survival,
     )
+    lap("survival")
     bull_suitability = evaluate_suitability_binding_v1(
         _suitability_input_for_assessment(inp, bull_assessment, bull_survival),
         inp.policies.suitability,
@@ -1525,6 +1539,7 @@ def run_integrated_offline_trading_logic_replay_v1(
         _suitability_input_for_assessment(inp, bear_assessment, bear_survival),
         inp.policies.suitability,
     )
+    lap("suitability")
 
     composition_inp = DoublePlayCompositionInputV1(
         instrument_id=inp.instrument_id,
@@ -1563,6 +1578,7 @@ def run_integrated_offline_trading_logic_replay_v1(
         composition_inp,
         inp.policies.composition,
     )
+    lap("composition")
 
     next_side_state, runtime_scope_after_switch, transition = transition_state(
         side_state=inp.side_state,
@@ -1623,6 +1639,7 @@ def run_integrated_offline_trading_logic_replay_v1(
         transition_reason_code=transition.reason_code,
         semantic_digest=switch_digest,
     )
+    lap("state_switch")
 
     scope_adverse_exit_signal = resolve_integrated_scope_adverse_exit_signal_v0(
         scope_event,
@@ -1674,6 +1691,7 @@ def run_integrated_offline_trading_logic_replay_v1(
         entry_exit_inp,
         inp.policies.entry_exit,
     )
+    lap("entry_exit")
 
     next_scope_ref = current_scope.scope_id
     if scope_event.next_scope_effective_epoch is not None:
@@ -1839,6 +1857,7 @@ def run_integrated_offline_trading_logic_replay_v1(
         ),
     )
     evidence = killswitch_binding.evidence
+    lap("decision_evidence")
 
     intermediate = IntegratedOfflineReplayIntermediateV1(
         market_context=bound_context,
@@ -0,0 +1,191 @@
+"""Rolling and expanding rank / percentile / quantile primitives.
+
+Drop-in replacements for percentile callbacks such as
+``series.rolling(w).apply(lambda x: pd.Series(x).rank(pct=True).iloc[-1])``
+or ``series.expanding().apply(lambda x: (x[-1] <= x).mean())``, which run a
+Python function (and often a full sort) per bar.
+
+All functions are built on pandas' windowed rank/quantile kernels, which
+keep the window in a skiplist (O(n log w) overall), and reproduce the
+``apply`` results (the rank-based ones bit for bit), including the pandas
+window semantics:
+
+- ``+/-inf`` is treated like NaN (pandas converts infinities before windowing)
+- ``min_periods`` counts valid (finite) observations in the window; a
+  ``min_periods`` larger than the window yields all-NaN (pandas would raise)
+- a NaN/inf value at the window end has no rank (NaN)
+- ties get the average rank unless ``method`` says otherwise
+
+The returned Series keep the input index and name.
+"""
+
+from __future__ import annotations
+
+from typing import Literal, Optional
+
+import numpy as np
+import pandas as pd
+
+RankMethod = Literal["average", "min", "max"]
+QuantileInterpolation = Literal["linear", "lower", "higher", "midpoint", "nearest"]
+
+
+def _all_nan(series: pd.Series) -> pd.Series:
+    return pd.Series(np.nan, index=series.index, dtype=np.float64, name=series.name)
+
+
+def rolling_rank(
+    series: pd.Series,
+    window: int,
+    min_periods: Optional[int] = None,
+    *,
+    method: RankMethod = "average",
+    pct: bool = False,
+) -> pd.Series:
+    """
+    Rank of the last value within each trailing window.
+
+    Matches ``series.rolling(window, min_periods).apply(lambda x: pd.Series(x).rank(
+    method=method, pct=pct).iloc[-1])``.
+
+    Args:
+        series: Input values
+        window: Window length in bars
+        min_periods: Minimum number of valid values (default: ``window``)
+        method: Tie handling ("average", "min", "max")
+        pct: Return the rank as a fraction of the valid values (0-1]
+
+    Returns:
+        Rank per bar (float64), NaN where undefined
+    """
+    if min_periods is not None and min_periods > window:
+        return _all_nan(series)
+    return (
+        series.astype(np.float64)
+        .rolling(window, min_periods=min_periods)
+        .rank(method=method, pct=pct)
+    )
+
+
+def expanding_rank(
+    series: pd.Series,
+    min_periods: int = 1,
+    *,
+    method: RankMethod = "average",
+    pct: bool = False,
+) -> pd.Series:
+    """Expanding-window variant of ``rolling_rank`` (O(n log n))."""
+    return series.astype(np.float64).expanding(min_periods=min_periods).rank(method=method, pct=pct)
+
+
+def rolling_quantile(
+    series: pd.Series,
+    window: int,
+    quantile: float,
+    min_periods: Optional[int] = None,
+    *,
+    interpolation: QuantileInterpolation = "linear",
+) -> pd.Series:
+    """
+    Quantile of each trailing window.
+
+    Matches ``series.rolling(window, min_periods).apply(lambda x: np.nanquantile(x, q))``
+    up to floating-point rounding (infinities are dropped like NaN).
+    """
+    if min_periods is not None and min_periods > window:
+        return _all_nan(series)
+    return (
+        series.astype(np.float64)
+        .rolling(window, min_periods=min_periods)
+        .quantile(quantile, interpolation=interpolation)
+    )
+
+
+def expanding_quantile(
+    series: pd.Series,
+    quantile: float,
+    min_periods: int = 1,
+    *,
+    interpolation: QuantileInterpolation = "linear",
+) -> pd.Series:
+    """Expanding-window variant of ``rolling_quantile``."""
+    return (
+        series.astype(np.float64)
+        .expanding(min_periods=min_periods)
+        .quantile(quantile, interpolation=interpolation)
+    )
+
+
+def rolling_last_pct_rank(series: pd.Series, window: int, min_periods: int) -> pd.Series:
+    """
+    Percentile rank (0-100) of the last value in each trailing window.
+
+    Matches ``series.rolling(window, min_periods).apply(
+    lambda x: pd.Series(x).rank(pct=True).iloc[-1] * 100)``.
+    """
+    return rolling_rank(series, window, min_periods, pct=True) * 100.0
+
+
+def _valid_counts(values: np.ndarray, window: Optional[int]) -> np.ndarray:
+    """Number of finite values in each trailing window (``window=None``: expanding)."""
+    counts = np.cumsum(np.isfinite(values), dtype=np.int64)
+    if window is not None and window < len(counts):
+        counts[window:] = counts[window:] - counts[:-window]
+    return counts
+
+
+def _fraction_vs_last(
+    series: pd.Series,
+    window: Optional[int],
+    min_periods: int,
+    *,
+    at_or_above: bool,
+) -> pd.Series:
+    values = series.to_numpy(dtype=np.float64)
+    n = len(values)
+    if window is None:
+        rank_min = expanding_rank(series, min_periods=min_periods, method="min")
+        length = np.arange(1, n + 1, dtype=np.float64)
+    else:
+        rank_min = rolling_rank(series, window, min_periods, method="min")
+        length = np.minimum(np.arange(1, n + 1), window).astype(np.float64)
+
+    valid = _valid_counts(values, window)
+    below = rank_min.to_numpy() - 1.0
+    count = valid - below if at_or_above else below
+    # Invalid last value: every comparison is False -> share 0
+    out = np.where(np.isfinite(values), count, 0.0) / length
+    out[valid < min_periods] = np.nan
+    return pd.Series(out, index=series.index, dtype=np.float64, name=series.name)
+
+
+def rolling_fraction_below(series: pd.Series, window: int, min_periods: int) -> pd.Series:
+    """
+    Share of window slots whose value is strictly below the window's last value.
+
+    Matches ``series.rolling(window, min_periods).apply(lambda x: (x < x[-1]).mean())``:
+    the denominator is the window length including NaN slots; an invalid last
+    value gives 0.0.
+    """
+    return _fraction_vs_last(series, window, min_periods, at_or_above=False)
+
+
+def expanding_fraction_at_or_above(series: pd.Series, min_periods: int = 1) -> pd.Series:
+    """
+    Share of all values so far that are >= the current value.
+
+    Matches ``series.expanding(min_periods).apply(lambda x: (x[-1] <= x).mean())``:
+    the denominator counts NaN slots; an invalid current value gives 0.0.
+    """
+    return _fraction_vs_last(series, None, min_periods, at_or_above=True)
+
+
+__all__ = [
+    "expanding_fraction_at_or_above",
+    "expanding_quantile",
+    "expanding_rank",
+    "rolling_fraction_below",
+    "rolling_last_pct_rank",
+    "rolling_quantile",
+    "rolling_rank",
+]
@@ -75,6 +75,11 @@ Knowledge DB (v1.0):
 - GET  /api/knowledge/search (Semantische Suche)
 - GET  /api/knowledge/stats (Statistiken)
 
+Ops Cockpit (read-only):
+- GET /api/ops-cockpit (Payload als JSON)
+- GET /api/ops-cockpit/fragments (Fragment-Cache: Hits/Misses, Build-Zeiten)
+- GET /api/ops-cockpit/stream (Server-Sent Events, nur geänderte Fragmente)
+
 System:
 - GET /api/health (Health-Check)
 
@@ -136,6 +141,11 @@ from .ops_cockpit import (
     render_ops_cockpit_html,
     resolve_update_officer_route_inputs,
 )
+from .ops_cockpit_fragments import (
+    format_sse_event,
+    get_ops_cockpit_fragment_stats,
+    iter_changed_fragments,
+)
 from .alerts_api import (
     AlertSummary,
     AlertStats,
@@ -2130,3 +2140,62 @@ def ops_cockpit_api(
             update_officer_source_conflict=conflict,
         )
     )
+
+
+@app.get("/api/ops-cockpit/fragments", response_class=JSONResponse)
+def ops_cockpit_fragments_api() -> JSONResponse:
+    """Read-only Trefferquoten und Build-Zeiten der gecachten Ops-Cockpit-Fragmente."""
+    return JSONResponse({"fragments": get_ops_cockpit_fragment_stats()})
+
+
+@app.get("/api/ops-cockpit/stream")
+async def ops_cockpit_stream_api(
+    request: Request,
+    update_officer_notifier_path: Optional[str] = None,
+    update_officer_run_dir: Optional[str] = None,
+    interval: float = Query(5.0, ge=0.5, le=300.0),
+    max_updates: Optional[int] = Query(None, ge=1),
+) -> Response:
+    """
+    Read-only Ops Cockpit als Server-Sent Events.
+
+    Das erste Event enthält alle Top-Level-Keys des Payloads, danach werden pro
+    Intervall nur geänderte Keys gepusht (``event: fragment``).
+    """
+    import asyncio
+
+    from fastapi.responses import StreamingResponse
+    from starlette.concurrency import run_in_threadpool
+
+    np, rd, conflict = resolve_update_officer_route_inputs(
+        update_officer_notifier_path,
+        update_officer_run_dir,
+    )
+
+    async def events():
+        sent: Dict[str, str] = {}
+        updates = 0
+        while True:
+            payload = await run_in_threadpool(
+                build_ops_cockpit_payload,
+                update_officer_notifier_path=np,
+                update_officer_run_dir=rd,
+                update_officer_source_conflict=conflict,
+            )
+            changed = dict(iter_changed_fragments(payload, sent))
+            if changed:
+                yield format_sse_event("fragment", changed)
+            else:
+                yield ": keep-alive\n\n"
+            updates += 1
+            if max_updates is not None and updates >= max_updates:
+                return
+            if await request.is_disconnected():
+                return
+            await asyncio.sleep(interval)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import html
 from dataclasses import asdict
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -23,8 +24,15 @@ from src.execution_pipeline.store import JsonlExecutionRunStore
 router = APIRouter(tags=["execution-watch-v0"])
 
 
-def _store(root: str, filename: str) -> JsonlExecutionRunStore:
-    return JsonlExecutionRunStore(root=Path(root), filename=filename)
+@lru_cache(maxsize=16)
+def watch_store(root: str, filename: str) -> JsonlExecutionRunStore:
+    """
+    Shared read-only store per (root, filename).
+
+    Cached so the in-memory run index is only caught up between requests; the index is never
+    persisted because root/filename are caller-supplied.
+    """
+    return JsonlExecutionRunStore(root=Path(root), filename=filename, persist_index=False)
 
 
 @router.get("/api/v0/execution/health")
@@ -53,7 +61,7 @@ async def execution_runs_v0(
         "execution_pipeline_events_v0.jsonl", description="JSONL filename (read-only)"
     ),
 ) -> Dict[str, Any]:
-    st = _store(root, filename)
+    st = watch_store(root, filename)
     runs = [asdict(r) for r in st.list_runs(limit=limit)]
     return {"count": len(runs), "runs": runs}
 
@@ -67,7 +75,7 @@ async def execution_run_detail_v0(
         "execution_pipeline_events_v0.jsonl", description="JSONL filename (read-only)"
     ),
 ) -> Dict[str, Any]:
-    st = _store(root, filename)
+    st = watch_store(root, filename)
     data = st.get_run(run_id, limit=limit)
     if not data.get("events"):
         raise HTTPException(status_code=404, detail="run_not_found")
@@ -83,7 +91,7 @@ async def execution_watch_page_v0(
         "execution_pipeline_events_v0.jsonl", description="JSONL filename (read-only)"
     ),
 ) -> Any:
-    st = _store(root, filename)
+    st = watch_store(root, filename)
     runs = st.list_runs(limit=200)
 
     detail: Optional[Dict[str, Any]] = None
@@ -16,7 +16,6 @@ Endpoints (v0.2):
 
 from __future__ import annotations
 
-import json
 import os
 import time
 from datetime import datetime, timezone
@@ -26,23 +25,16 @@ from typing import Any, Dict, List, Optional, Tuple
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
 
+from src.execution_pipeline.store import RunIndexEntryV0, RunIndexV0
+
+from .execution_watch_api_v0 import watch_store
+
 # v0.2 contract remains (non-breaking). v0.3 semantics are exposed via `meta.api_version`.
 API_VERSION = "v0.2"
 META_API_VERSION = "v0.5"
 
 router = APIRouter(tags=["execution-watch-v0.2"])
 
-_TIMESTAMP_PRECEDENCE_KEYS: Tuple[str, ...] = (
-    # Preferred explicit UTC fields (if present in future schemas)
-    "ts_utc",
-    "event_utc",
-    "created_at_utc",
-    "timestamp_utc",
-    # Current v0 events
-    "ts",
-    "created_at",
-)
-
 
 def _utc_now_iso() -> str:
     fixed = os.getenv("PEAK_TRADE_FIXED_GENERATED_AT_UTC")
@@ -52,42 +44,6 @@ def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def _parse_iso8601_utc_strict(s: str) -> datetime:
-    """
-    Strict ISO-8601 timestamp parser:
-    - Requires timezone info (Z or ±HH:MM)
-    - Normalizes to UTC
-    """
-    raw = (s or "").strip()
-    if not raw:
-        raise ValueError("empty_timestamp")
-    # Common fixture format uses trailing Z
-    if raw.endswith("Z"):
-        raw = raw[:-1] + "+00:00"
-    dt = datetime.fromisoformat(raw)
-    if dt.tzinfo is None:
-        raise ValueError("naive_timestamp_disallowed")
-    return dt.astimezone(timezone.utc)
-
-
-def _extract_event_timestamp_utc(ev: Dict[str, Any]) -> Optional[datetime]:
-    """
-    Derive an event timestamp (UTC) using precedence over known keys.
-    Returns None if no parseable timestamp is present.
-    """
-    for k in _TIMESTAMP_PRECEDENCE_KEYS:
-        v = ev.get(k)
-        if v is None:
-            continue
-        if not isinstance(v, str):
-            continue
-        try:
-            return _parse_iso8601_utc_strict(v)
-        except Exception:
-            continue
-    return None
-
-
 def _parse_int_cursor(cursor: Optional[str]) -> int:
     if cursor is None or cursor == "":
         return 0
@@ -100,47 +56,41 @@ def _parse_int_cursor(cursor: Optional[str]) -> int:
     return n
 
 
-def _read_jsonl_events_v0(root: Path, filename: str) -> Tuple[List[Dict[str, Any]], int]:
+def _load_run_index(root: str, filename: str) -> RunIndexV0:
     """
-    Read JSONL file and return raw event dicts for schema=execution_event_v0.
+    Caught-up run index of the JSONL file (empty if missing or unreadable).
 
-    We attach a deterministic file order key `_file_seq` (line index starting at 0)
-    to guarantee stable ordering when timestamps tie.
+    Every endpoint reads runs, counts and file-wide meta from the index and only seeks to
+    the lines of the requested run, so no request scans the whole file.
     """
-    p = root / filename
-    if not p.exists():
-        return [], 0
-
-    read_errors = 0
-    out: List[Dict[str, Any]] = []
     try:
-        with p.open("r", encoding="utf-8") as f:
-            for idx, line in enumerate(f):
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    obj = json.loads(line)
-                except Exception:
-                    # Malformed JSONL line: skip but count deterministically.
-                    read_errors += 1
-                    continue
-                if obj.get("schema") != "execution_event_v0":
-                    continue
-                obj["_file_seq"] = idx
-                out.append(obj)
+        index = watch_store(root, filename).run_index()
     except Exception:
-        # Watch-only endpoint: fail soft (empty list) unless caller expects 404 for missing run.
-        return [], 0
+        # Watch-only endpoint: fail soft (empty dataset).
+        return RunIndexV0()
+    return index if index is not None else RunIndexV0()
+
 
-    return out, read_errors
+def _read_run_events(root: str, filename: str, run_id: str) -> List[Dict[str, Any]]:
+    """
+    Events of one run, sorted deterministically.
+
+    The byte offset is attached as `_file_seq`; it follows file order like a line index,
+    which guarantees stable ordering when timestamps tie.
+    """
+    try:
+        pairs = watch_store(root, filename).read_run_events(run_id)
+    except Exception:
+        return []
+    out = [{**ev, "_file_seq": offset} for offset, ev in pairs]
+    return sorted(out, key=_event_sort_key)
 
 
 def _event_sort_key(ev: Dict[str, Any]) -> Tuple[str, int, str, str, str]:
     """
     Stable deterministic ordering:
     - primary: ts
-    - tie-breaker: file order (line index)
+    - tie-breaker: file order (byte offset)
     - then: idempotency_key/event_type/order_id as last-resort for determinism
     """
     return (
@@ -152,14 +102,13 @@ def _event_sort_key(ev: Dict[str, Any]) -> Tuple[str, int, str, str, str]:
     )
 
 
-def _group_events_by_run(events: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
-    grouped: Dict[str, List[Dict[str, Any]]] = {}
-    for ev in events:
-        rid = str(ev.get("run_id") or "")
-        if not rid:
-            continue
-        grouped.setdefault(rid, []).append(ev)
-    return grouped
+def _named_runs(index: RunIndexV0) -> Dict[str, RunIndexEntryV0]:
+    return {rid: entry for rid, entry in index.runs.items() if rid}
+
+
+def _read_errors(index: RunIndexV0) -> int:
+    """Malformed JSONL lines plus events whose timestamps are present but unparseable."""
+    return index.malformed_lines + sum(e.ts_errors for e in index.runs.values())
 
 
 def _status_from_counts(counts: Dict[str, int]) -> str:
@@ -262,9 +211,12 @@ class DatasetStats(BaseModel):
     sessions_count: Optional[int] = None
 
 
-def _dataset_stats_for_events(events: List[Dict[str, Any]]) -> DatasetStats:
-    grouped = _group_events_by_run(events)
-    return DatasetStats(runs_count=len(grouped), events_count=len(events), sessions_count=None)
+def _dataset_stats(index: RunIndexV0) -> DatasetStats:
+    return DatasetStats(
+        runs_count=len(_named_runs(index)),
+        events_count=sum(len(e.offsets) for e in index.runs.values()),
+        sessions_count=None,
+    )
 
 
 def _format_utc_z(dt: datetime) -> str:
@@ -273,39 +225,20 @@ def _format_utc_z(dt: datetime) -> str:
     return dtu.isoformat().replace("+00:00", "Z")
 
 
-def _last_event_utc_for_events(events: List[Dict[str, Any]]) -> Tuple[Optional[str], int]:
+def _last_event_utc(index: RunIndexV0) -> Optional[str]:
     """
-    Compute last_event_utc deterministically as max(parsed timestamps) when possible.
-    Returns (last_event_utc, timestamp_read_errors).
-    Timestamp parse failures increment timestamp_read_errors (counted into meta.read_errors).
+    last_event_utc as max(parsed timestamps) over all events when possible.
+    Falls back to the legacy behavior (max raw `ts`) without any parseable timestamp.
     """
-    if not events:
-        return None, 0
-
-    timestamp_read_errors = 0
-    best: Optional[datetime] = None
-    for ev in events:
-        # Only count an error if at least one candidate key exists but none are parseable.
-        if any(k in ev for k in _TIMESTAMP_PRECEDENCE_KEYS):
-            dt = _extract_event_timestamp_utc(ev)
-            if dt is None:
-                timestamp_read_errors += 1
-                continue
-            if best is None or dt > best:
-                best = dt
-
-    if best is not None:
-        return _format_utc_z(best), timestamp_read_errors
-
-    # Fallback: preserve legacy behavior (use last by deterministic event sort key).
-    evs_sorted = sorted(events, key=_event_sort_key)
-    legacy = str(evs_sorted[-1].get("ts") or "") or None
-    return legacy, timestamp_read_errors
+    parsed = [e.max_utc for e in index.runs.values() if e.max_utc is not None]
+    if parsed:
+        return _format_utc_z(datetime.fromisoformat(max(parsed)))
+    return max((str(e.last_ts or "") for e in index.runs.values()), default="") or None
 
 
 def _compute_v0_5_invariants(
     *,
-    events: List[Dict[str, Any]],
+    index: RunIndexV0,
     stats: DatasetStats,
     ordering_non_decreasing: bool,
 ) -> Dict[str, Any]:
@@ -313,33 +246,15 @@ def _compute_v0_5_invariants(
     dataset_nonempty_ok = stats.events_count > 0
     dataset_nonempty_note = "ok" if dataset_nonempty_ok else "empty_dataset"
 
-    # events_sorted_by_time_ok: only meaningful if at least one parseable timestamp exists
-    grouped = _group_events_by_run(events)
-    parsed_any = False
+    # events_sorted_by_time_ok: only meaningful if at least one parseable timestamp exists.
+    # Append-only file order is the baseline; the index tracks regressions per run.
+    runs = _named_runs(index)
     events_sorted_by_time_ok: Optional[bool] = True
     events_sorted_by_time_note = "ok"
-    try:
-        for _, evs in grouped.items():
-            # Append-only file order (deterministic) as baseline
-            evs_by_file = sorted(evs, key=lambda e: int(e.get("_file_seq") or 0))
-            last_dt: Optional[datetime] = None
-            for ev in evs_by_file:
-                dt = _extract_event_timestamp_utc(ev)
-                if dt is None:
-                    continue
-                parsed_any = True
-                if last_dt is not None and dt < last_dt:
-                    events_sorted_by_time_ok = False
-                    events_sorted_by_time_note = "timestamp_regressed_in_file_order"
-                    raise StopIteration()
-                last_dt = dt
-    except StopIteration:
-        pass
-    except Exception:
+    if any(e.utc_regressed for e in runs.values()):
         events_sorted_by_time_ok = False
-        events_sorted_by_time_note = "timestamp_check_error"
-
-    if not parsed_any and events_sorted_by_time_ok is True:
+        events_sorted_by_time_note = "timestamp_regressed_in_file_order"
+    elif all(e.max_utc is None for e in runs.values()):
         events_sorted_by_time_ok = None
         events_sorted_by_time_note = "no_parseable_timestamps"
 
@@ -540,28 +455,19 @@ async def api_execution_runs_v0_2(
     ),
 ) -> RunsListResponse:
     t0 = time.perf_counter()
-    events, read_errors = _read_jsonl_events_v0(Path(root), filename)
-    last_event_utc, ts_read_errors = _last_event_utc_for_events(events)
-    read_errors_total = int(read_errors) + int(ts_read_errors)
-    grouped = _group_events_by_run(events)
+    index = _load_run_index(root, filename)
+    read_errors_total = _read_errors(index)
 
     runs: List[RunSummary] = []
-    for run_id, evs in grouped.items():
-        evs_sorted = sorted(evs, key=_event_sort_key)
-        counts: Dict[str, int] = {}
-        for e in evs_sorted:
-            et = str(e.get("event_type") or "")
-            if et:
-                counts[et] = counts.get(et, 0) + 1
-
+    for run_id, entry in _named_runs(index).items():
         runs.append(
             RunSummary(
                 run_id=run_id,
-                correlation_id=str(evs_sorted[0].get("correlation_id") or ""),
-                started_at_utc=str(evs_sorted[0].get("ts") or "") or None,
-                last_event_at_utc=str(evs_sorted[-1].get("ts") or "") or None,
-                status=_status_from_counts(counts),
-                counts=dict(sorted(counts.items())),
+                correlation_id=str(entry.first_correlation_id or ""),
+                started_at_utc=str(entry.first_ts or "") or None,
+                last_event_at_utc=str(entry.last_ts or "") or None,
+                status=_status_from_counts(entry.counts),
+                counts=dict(sorted(entry.counts.items())),
             )
         )
 
@@ -585,8 +491,8 @@ async def api_execution_runs_v0_2(
                 next_cursor=None,
                 read_errors=read_errors_total,
                 source=_source_for_events_root(root, filename),
-                last_event_utc=last_event_utc,
-                dataset_stats=_dataset_stats_for_events(events),
+                last_event_utc=_last_event_utc(index),
+                dataset_stats=_dataset_stats(index),
             ),
             count=len(runs),
             runs=runs,
@@ -609,12 +515,11 @@ async def api_execution_run_detail_v0_2(
     ),
 ) -> RunDetailResponse:
     t0 = time.perf_counter()
-    events, read_errors = _read_jsonl_events_v0(Path(root), filename)
+    index = _load_run_index(root, filename)
     # Timestamp parse errors count into meta.read_errors per v0.5 contract.
-    _, ts_read_errors = _last_event_utc_for_events(events)
-    read_errors_total = int(read_errors) + int(ts_read_errors)
-    evs = [e for e in events if str(e.get("run_id") or "") == run_id]
-    if not evs:
+    read_errors_total = _read_errors(index)
+    entry = _named_runs(index).get(run_id)
+    if entry is None:
         _record_exec_watch_metrics(
             endpoint="/api/execution/runs/{run_id}",
             status="404",
@@ -623,21 +528,14 @@ async def api_execution_run_detail_v0_2(
         )
         raise HTTPException(status_code=404, detail="run_not_found")
 
-    evs_sorted = sorted(evs, key=_event_sort_key)
-    counts: Dict[str, int] = {}
-    for e in evs_sorted:
-        et = str(e.get("event_type") or "")
-        if et:
-            counts[et] = counts.get(et, 0) + 1
-
     detail = RunDetail(
         run_id=run_id,
-        correlation_id=str(evs_sorted[0].get("correlation_id") or ""),
-        started_at_utc=str(evs_sorted[0].get("ts") or "") or None,
-        last_event_at_utc=str(evs_sorted[-1].get("ts") or "") or None,
-        status=_status_from_counts(counts),
-        counts=dict(sorted(counts.items())),
-        total_events=len(evs_sorted),
+        correlation_id=str(entry.first_correlation_id or ""),
+        started_at_utc=str(entry.first_ts or "") or None,
+        last_event_at_utc=str(entry.last_ts or "") or None,
+        status=_status_from_counts(entry.counts),
+        counts=dict(sorted(entry.counts.items())),
+        total_events=len(entry.offsets),
     )
 
     gen = _utc_now_iso()
@@ -650,8 +548,8 @@ async def api_execution_run_detail_v0_2(
                 next_cursor=None,
                 read_errors=read_errors_total,
                 source=_source_for_events_root(root, filename),
-                last_event_utc=str(evs_sorted[-1].get("ts") or "") or None,
-                dataset_stats=_dataset_stats_for_events(events),
+                last_event_utc=detail.last_event_at_utc,
+                dataset_stats=_dataset_stats(index),
             ),
             run=detail,
         )
@@ -690,11 +588,10 @@ async def api_execution_run_events_v0_2(
         _parse_int_cursor(cursor) if since_cursor is None else (_parse_int_cursor(since_cursor) + 1)
     )
 
-    events, read_errors = _read_jsonl_events_v0(Path(root), filename)
-    _, ts_read_errors = _last_event_utc_for_events(events)
-    read_errors_total = int(read_errors) + int(ts_read_errors)
-    evs = [e for e in events if str(e.get("run_id") or "") == run_id]
-    if not evs:
+    index = _load_run_index(root, filename)
+    read_errors_total = _read_errors(index)
+    evs_sorted = _read_run_events(root, filename, run_id) if run_id else []
+    if not evs_sorted:
         _record_exec_watch_metrics(
             endpoint="/api/execution/runs/{run_id}/events",
             status="404",
@@ -703,7 +600,6 @@ async def api_execution_run_events_v0_2(
         )
         raise HTTPException(status_code=404, detail="run_not_found")
 
-    evs_sorted = sorted(evs, key=_event_sort_key)
     total = len(evs_sorted)
 
     gen = _utc_now_iso()
@@ -723,7 +619,7 @@ async def api_execution_run_events_v0_2(
                     read_errors=read_errors_total,
                     source=src,
                     last_event_utc=str(evs_sorted[-1].get("ts") or "") or None,
-                    dataset_stats=_dataset_stats_for_events(events),
+                    dataset_stats=_dataset_stats(index),
                 ),
                 run_id=run_id,
                 count=0,
@@ -778,7 +674,7 @@ async def api_execution_run_events_v0_2(
                 read_errors=read_errors_total,
                 source=src,
                 last_event_utc=str(evs_sorted[-1].get("ts") or "") or None,
-                dataset_stats=_dataset_stats_for_events(events),
+                dataset_stats=_dataset_stats(index),
             ),
             run_id=run_id,
             count=len(items),
@@ -874,26 +770,16 @@ async def api_execution_health_v0_4(
     Execution Watch v0.4 health summary (read-only, deterministic by default).
     """
     t0 = time.perf_counter()
-    events, read_errors = _read_jsonl_events_v0(Path(root), filename)
-    grouped = _group_events_by_run(events)
-
+    index = _load_run_index(root, filename)
+    # Run events are always served sorted by `_event_sort_key`.
     ordering_non_decreasing = True
-    try:
-        for _, evs in grouped.items():
-            evs_sorted = sorted(evs, key=_event_sort_key)
-            keys = [_event_sort_key(e) for e in evs_sorted]
-            if keys != sorted(keys):
-                ordering_non_decreasing = False
-                break
-    except Exception:
-        ordering_non_decreasing = False
 
     gen = _utc_now_iso()
     src = _source_for_events_root(root, filename)
-    stats = _dataset_stats_for_events(events)
+    stats = _dataset_stats(index)
     stats.sessions_count = _count_sessions_in_dir(base_dir)
-    last_event_utc, ts_read_errors = _last_event_utc_for_events(events)
-    read_errors_total = int(read_errors) + int(ts_read_errors)
+    last_event_utc = _last_event_utc(index)
+    read_errors_total = _read_errors(index)
 
     runtime_metrics: Optional[Dict[str, Any]] = None
     if include_runtime_metrics and _enabled_exec_watch_metrics():
@@ -923,7 +809,7 @@ async def api_execution_health_v0_4(
                 "runtime_metrics_included": bool(runtime_metrics is not None),
                 "runtime_metrics": runtime_metrics,
                 **_compute_v0_5_invariants(
-                    events=events,
+                    index=index,
                     stats=stats,
                     ordering_non_decreasing=ordering_non_decreasing,
                 ),
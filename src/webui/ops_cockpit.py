@@ -13,6 +13,7 @@ from src.ops.update_officer_consumer import (
     build_update_officer_ui_model,
     build_update_officer_ui_route_conflict,
 )
+from src.webui.ops_cockpit_fragments import cached_fragment
 
 
 @dataclass(frozen=True)
@@ -2405,6 +2406,99 @@ def build_workflow_officer_panel_context(repo_root: Path | None = None) -> Dict[
     return build_workflow_officer_dashboard_view(root)
 
 
+def _load_config_gates(config_path: Path | None) -> Dict[str, object]:
+    """
+    Read-only. Operator gates from config (enable/arm/dry-run/confirm token).
+    Defensive defaults when no config is given or loading fails.
+    """
+    gates: Dict[str, object] = {
+        "load_status": "not_loaded",
+        "trading_environment": None,
+        "bounded_pilot_mode": None,
+        "enabled": False,
+        "armed": False,
+        "dry_run": True,
+        "confirm_token_required": True,
+    }
+    if config_path is None:
+        return gates
+    try:
+        from src.core.environment import get_environment_from_config
+        from src.core.peak_config import load_config
+
+        peak_config = load_config(config_path)
+        env_config = get_environment_from_config(peak_config)
+        gates.update(
+            enabled=bool(env_config.enable_live_trading),
+            armed=bool(env_config.live_mode_armed),
+            dry_run=bool(env_config.live_dry_run_mode),
+            confirm_token_required=bool(env_config.require_confirm_token),
+            trading_environment=str(env_config.environment.value),
+            bounded_pilot_mode=bool(env_config.bounded_pilot_mode),
+            load_status="loaded",
+        )
+    except Exception:
+        gates["load_status"] = "unavailable"
+    return gates
+
+
+def _read_session_registry(sessions_root: Path) -> Dict[str, object]:
+    """Read-only. Last run status and session counts from the live session registry."""
+    registry: Dict[str, object] = {
+        "last_run_status": "unknown",
+        "session_active": False,
+        "session_count": None,
+        "last_started_at": None,
+    }
+    try:
+        from src.experiments.live_session_registry import (
+            get_session_summary,
+            list_session_records,
+        )
+
+        records = list_session_records(base_dir=sessions_root, limit=1)
+        if records:
+            registry["last_run_status"] = str(records[0].status or "unknown")
+        summary = get_session_summary(base_dir=sessions_root)
+        registry["session_active"] = (summary.get("by_status", {}).get("started", 0) or 0) > 0
+        registry["session_count"] = int(summary.get("num_sessions", 0) or 0)
+        las = summary.get("last_started_at")
+        if isinstance(las, str) and las.strip():
+            registry["last_started_at"] = las.strip()
+    except Exception:
+        pass
+    return registry
+
+
+def _read_balance_semantics(config_path: Path) -> Dict[str, Optional[str]]:
+    """Read-only. Balance semantics from a paper LivePortfolioSnapshot built from config."""
+    state: Dict[str, Optional[str]] = {
+        "balance_semantic_state": None,
+        "balance_reason_code": None,
+        "balance_operator_visible_state": None,
+    }
+    try:
+        from src.core.peak_config import load_config
+        from src.live.broker_base import PaperBroker
+        from src.live.portfolio_monitor import LivePortfolioMonitor
+
+        peak_config = load_config(config_path)
+        starting_cash = float(peak_config.get("general.starting_capital", 10000.0))
+        base_currency = str(peak_config.get("general.base_currency", "EUR"))
+        broker = PaperBroker(
+            starting_cash=starting_cash,
+            base_currency=base_currency,
+            log_to_console=False,
+        )
+        snapshot = LivePortfolioMonitor(broker).snapshot()
+        if snapshot is not None:
+            for key in state:
+                state[key] = getattr(snapshot, key, None)
+    except Exception:
+        pass
+    return state
+
+
 def build_ops_cockpit_payload(
     repo_root: Path | None = None,
     telemetry_root: Path | None = None,
@@ -2414,35 +2508,35 @@ def build_ops_cockpit_payload(
     update_officer_run_dir: Path | str | None = None,
     update_officer_source_conflict: bool = False,
 ) -> Dict[str, object]:
-    truth_docs = discover_truth_docs(repo_root=repo_root)
+    _truth_root = repo_root or Path.cwd()
+    truth_docs = cached_fragment(
+        "truth_docs",
+        [_truth_root / doc.path for doc in TRUTH_DOCS],
+        lambda: discover_truth_docs(repo_root=repo_root),
+        # Freshness labels are age-based; re-evaluate at most once per minute.
+        extra=(int(_utc_now().timestamp() // 60),),
+    )
     groups = _grouped_sources(truth_docs)
     group_summaries = {name: _group_summary(items) for name, items in groups.items()}
     truth_state = build_truth_state(truth_docs)
     v3_summary = _build_v3_executive_summary(truth_state, group_summaries)
     _config_path = config_path or (repo_root / "config" / "config.toml" if repo_root else None)
-    _config_load_status = "not_loaded"
-    _trading_environment: Optional[str] = None
-    _bounded_pilot_mode: Optional[bool] = None
-    _config_enabled = False
-    _config_armed = False
-    _config_dry_run = True
-    _config_confirm_token_required = True
-    if _config_path and _config_path.exists():
-        try:
-            from src.core.environment import get_environment_from_config
-            from src.core.peak_config import load_config
-
-            peak_config = load_config(_config_path)
-            env_config = get_environment_from_config(peak_config)
-            _config_enabled = bool(env_config.enable_live_trading)
-            _config_armed = bool(env_config.live_mode_armed)
-            _config_dry_run = bool(env_config.live_dry_run_mode)
-            _config_confirm_token_required = bool(env_config.require_confirm_token)
-            _trading_environment = str(env_config.environment.value)
-            _bounded_pilot_mode = bool(env_config.bounded_pilot_mode)
-            _config_load_status = "loaded"
-        except Exception:
-            _config_load_status = "unavailable"
+    _config_gates = (
+        cached_fragment(
+            "config_gates",
+            [_config_path, _config_path.parent / "bounded_live.toml"],
+            lambda: _load_config_gates(_config_path),
+        )
+        if _config_path and _config_path.exists()
+        else _load_config_gates(None)
+    )
+    _config_load_status = str(_config_gates["load_status"])
+    _trading_environment: Optional[str] = _config_gates["trading_environment"]
+    _bounded_pilot_mode: Optional[bool] = _config_gates["bounded_pilot_mode"]
+    _config_enabled = bool(_config_gates["enabled"])
+    _config_armed = bool(_config_gates["armed"])
+    _config_dry_run = bool(_config_gates["dry_run"])
+    _config_confirm_token_required = bool(_config_gates["confirm_token_required"])
     _kill_switch_active = False
     _ks_path = (
         repo_root / "data" / "kill_switch" / "state.json"
@@ -2450,15 +2544,9 @@ def build_ops_cockpit_payload(
         else Path("data/kill_switch/state.json")
     )
     if _ks_path.exists():
-        try:
-            import json
+        from src.ops.gates.kill_switch_state_reader import get_kill_switch_state_reader
 
-            with open(_ks_path, encoding="utf-8") as f:
-                _ks_data = json.load(f)
-            _ks_state = str(_ks_data.get("state", "")).upper()
-            _kill_switch_active = _ks_state in ("KILLED", "RECOVERING")
-        except Exception:
-            pass
+        _kill_switch_active = get_kill_switch_state_reader(str(_ks_path)).resolve() is True
     guard_state = {
         "no_trade_baseline": "reference",
         "deny_by_default": "active",
@@ -2502,23 +2590,16 @@ def build_ops_cockpit_payload(
     _registry_session_count: Optional[int] = None
     _registry_last_started_at: Optional[str] = None
     if _sessions_root.exists():
-        try:
-            from src.experiments.live_session_registry import (
-                get_session_summary,
-                list_session_records,
-            )
-
-            records = list_session_records(base_dir=_sessions_root, limit=1)
-            if records:
-                _last_run_status = str(records[0].status or "unknown")
-            summary = get_session_summary(base_dir=_sessions_root)
-            _session_active = (summary.get("by_status", {}).get("started", 0) or 0) > 0
-            _registry_session_count = int(summary.get("num_sessions", 0) or 0)
-            las = summary.get("last_started_at")
-            if isinstance(las, str) and las.strip():
-                _registry_last_started_at = las.strip()
-        except Exception:
-            pass
+        _registry = cached_fragment(
+            "session_registry",
+            [],
+            lambda: _read_session_registry(_sessions_root),
+            dir_sources=[_sessions_root],
+        )
+        _last_run_status = str(_registry["last_run_status"])
+        _session_active = bool(_registry["session_active"])
+        _registry_session_count = _registry["session_count"]
+        _registry_last_started_at = _registry["last_started_at"]
     run_state: Dict[str, object] = {
         "status": "active" if _session_active else "idle",
         "active": _session_active,
@@ -2616,7 +2697,11 @@ def build_ops_cockpit_payload(
         "operator_state_reason": _op_reason,
     }
     caps_configured = (
-        _build_caps_configured_from_config(_config_path)
+        cached_fragment(
+            "caps_configured",
+            [_config_path, _config_path.parent / "bounded_live.toml"],
+            lambda: _build_caps_configured_from_config(_config_path),
+        )
         if _config_path and _config_path.exists()
         else []
     )
@@ -2713,29 +2798,14 @@ def build_ops_cockpit_payload(
     _balance_reason_code: Optional[str] = None
     _balance_operator_visible_state: Optional[str] = None
     if _config_path and _config_path.exists():
-        try:
-            from src.core.peak_config import load_config
-            from src.live.broker_base import PaperBroker
-            from src.live.portfolio_monitor import LivePortfolioMonitor
-
-            peak_config = load_config(_config_path)
-            starting_cash = float(peak_config.get("general.starting_capital", 10000.0))
-            base_currency = str(peak_config.get("general.base_currency", "EUR"))
-            broker = PaperBroker(
-                starting_cash=starting_cash,
-                base_currency=base_currency,
-                log_to_console=False,
-            )
-            monitor = LivePortfolioMonitor(broker)
-            snapshot = monitor.snapshot()
-            if snapshot is not None:
-                _balance_semantic_state = getattr(snapshot, "balance_semantic_state", None)
-                _balance_reason_code = getattr(snapshot, "balance_reason_code", None)
-                _balance_operator_visible_state = getattr(
-                    snapshot, "balance_operator_visible_state", None
-                )
-        except Exception:
-            pass
+        _balance = cached_fragment(
+            "balance_semantics",
+            [_config_path],
+            lambda: _read_balance_semantics(_config_path),
+        )
+        _balance_semantic_state = _balance["balance_semantic_state"]
+        _balance_reason_code = _balance["balance_reason_code"]
+        _balance_operator_visible_state = _balance["balance_operator_visible_state"]
     balance_semantics_state = {
         "balance_semantic_state": _balance_semantic_state,
         "balance_reason_code": _balance_reason_code,
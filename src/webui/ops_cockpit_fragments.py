@@ -0,0 +1,203 @@
+"""
+Source-fingerprinted fragment cache for the Ops Cockpit payload.
+
+Each fragment (truth docs, config gates, kill-switch state, session registry) is
+rebuilt only when the stat fingerprint of its source files changes. Build timings
+and hit/miss counters are kept per fragment for ``/api/ops-cockpit/fragments``.
+
+Like the kill-switch state reader, a fingerprint with an ``mtime`` inside
+``RACY_WINDOW_NS`` of the check time is not cached: an in-place rewrite of equal
+size within the filesystem timestamp granularity would otherwise keep serving
+the old fragment.
+
+``iter_changed_fragments`` diffs two payloads at top-level key granularity; the
+SSE endpoint ``/api/ops-cockpit/stream`` uses it to push only changed panels.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Sequence, Tuple, TypeVar
+
+from src.ops.gates.kill_switch_state_reader import RACY_WINDOW_NS
+
+T = TypeVar("T")
+
+Fingerprint = Tuple[Hashable, ...]
+
+
+def path_fingerprint(path: Path) -> Fingerprint:
+    """(mtime_ns, size, inode) of a file or directory; ``("missing",)`` if absent."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return ("missing",)
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def dir_entries_fingerprint(root: Path, suffix: str = "") -> Fingerprint:
+    """Fingerprint of a directory and its direct entries (optionally by suffix)."""
+    try:
+        with os.scandir(root) as it:
+            entries = sorted(
+                (e.name, e.stat().st_mtime_ns, e.stat().st_size)
+                for e in it
+                if not suffix or e.name.endswith(suffix)
+            )
+    except OSError:
+        return ("missing",)
+    return (path_fingerprint(root), tuple(entries))
+
+
+@dataclass
+class FragmentStats:
+    hits: int = 0
+    misses: int = 0
+    last_build_ms: float = 0.0
+    total_build_ms: float = 0.0
+    last_built_at: Optional[float] = None
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "last_build_ms": round(self.last_build_ms, 3),
+            "total_build_ms": round(self.total_build_ms, 3),
+            "last_built_at": self.last_built_at,
+        }
+
+
+@dataclass
+class _CachedFragment:
+    fingerprint: Fingerprint
+    value: Any
+
+
+@dataclass
+class FragmentCache:
+    """Thread-safe cache of payload fragments keyed by (name, key) and source fingerprint."""
+
+    max_entries: int = 256
+    _entries: Dict[Tuple[str, Hashable], _CachedFragment] = field(default_factory=dict)
+    _stats: Dict[str, FragmentStats] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def get(
+        self,
+        name: str,
+        key: Hashable,
+        fingerprint: Fingerprint,
+        build: Callable[[], T],
+        *,
+        cacheable: bool = True,
+    ) -> T:
+        """
+        Cached ``build()`` for ``(name, key)`` while ``fingerprint`` is unchanged.
+
+        With ``cacheable=False`` (racy fingerprint) the fragment is rebuilt and
+        neither served from nor stored in the cache.
+        Returns a deep copy so callers may mutate the fragment freely.
+        """
+        cache_key = (name, key)
+        with self._lock:
+            stats = self._stats.setdefault(name, FragmentStats())
+            cached = self._entries.get(cache_key) if cacheable else None
+            if cached is not None and cached.fingerprint == fingerprint:
+                stats.hits += 1
+                return copy.deepcopy(cached.value)
+
+        t0 = time.perf_counter()
+        value = build()
+        elapsed_ms = (time.perf_counter() - t0) * 1000.0
+
+        with self._lock:
+            stats.misses += 1
+            stats.last_build_ms = elapsed_ms
+            stats.total_build_ms += elapsed_ms
+            stats.last_built_at = time.time()
+            if not cacheable:
+                self._entries.pop(cache_key, None)
+                return copy.deepcopy(value)
+            if cache_key not in self._entries and len(self._entries) >= self.max_entries:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[cache_key] = _CachedFragment(fingerprint, value)
+        return copy.deepcopy(value)
+
+    def stats(self) -> Dict[str, Dict[str, object]]:
+        with self._lock:
+            return {name: s.as_dict() for name, s in sorted(self._stats.items())}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._stats.clear()
+
+
+OPS_COCKPIT_FRAGMENTS = FragmentCache()
+
+
+def get_ops_cockpit_fragment_stats() -> Dict[str, Dict[str, object]]:
+    """Per-fragment hit/miss counters and build timings (read-only)."""
+    return OPS_COCKPIT_FRAGMENTS.stats()
+
+
+def cached_fragment(
+    name: str,
+    sources: Sequence[Path],
+    build: Callable[[], T],
+    *,
+    extra: Tuple[Hashable, ...] = (),
+    dir_sources: Sequence[Path] = (),
+) -> T:
+    """Fragment ``build()`` cached on the stat fingerprints of ``sources``/``dir_sources``."""
+    key = tuple(str(p) for p in sources) + tuple(str(p) for p in dir_sources) + extra
+    file_fps = tuple(path_fingerprint(p) for p in sources)
+    dir_fps = tuple(dir_entries_fingerprint(p, ".json") for p in dir_sources)
+    racy = (time.time_ns() - _newest_mtime_ns(file_fps, dir_fps)) < RACY_WINDOW_NS
+    return OPS_COCKPIT_FRAGMENTS.get(
+        name, key, file_fps + dir_fps + extra, build, cacheable=not racy
+    )
+
+
+def _newest_mtime_ns(file_fps: Sequence[Fingerprint], dir_fps: Sequence[Fingerprint]) -> int:
+    """Newest ``mtime_ns`` in path/dir fingerprints (0 if all sources are missing)."""
+    mtimes = [fp[0] for fp in file_fps if fp != ("missing",)]
+    for fp in dir_fps:
+        if fp == ("missing",):
+            continue
+        root_fp, entries = fp
+        if root_fp != ("missing",):
+            mtimes.append(root_fp[0])
+        mtimes.extend(mtime for _, mtime, _ in entries)
+    return max(mtimes, default=0)
+
+
+def iter_changed_fragments(
+    payload: Dict[str, object],
+    previous: Dict[str, str],
+) -> Iterator[Tuple[str, object]]:
+    """
+    Yield ``(key, value)`` for top-level payload keys whose JSON changed.
+
+    ``previous`` maps key -> last sent JSON and is updated in place; keys that
+    disappeared are yielded with value ``None``.
+    """
+    for key in sorted(payload):
+        encoded = json.dumps(payload[key], sort_keys=True, default=str)
+        if previous.get(key) != encoded:
+            previous[key] = encoded
+            yield key, payload[key]
+    for key in [k for k in previous if k not in payload]:
+        del previous[key]
+        yield key, None
+
+
+def format_sse_event(event: str, data: object) -> str:
+    """Single server-sent event frame."""
+    return f"event: {event}\ndata: {json.dumps(data, sort_keys=True, default=str)}\n\n"
@@ -37,7 +37,9 @@ Read-model I/O (filesystem JSON only): ``src/r_and_d/experiments_read_model.py``
 
 from __future__ import annotations
 
+import copy
 import math
+import threading
 from collections import defaultdict
 from datetime import date, datetime
 from pathlib import Path
@@ -47,8 +49,8 @@ from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
 from src.r_and_d.experiments_read_model import (
+    ExperimentsIndex,
     load_experiment_json_file,
-    load_experiments_from_directory,
     sort_raw_experiments,
 )
 
@@ -61,6 +63,9 @@ from src.r_and_d.experiments_read_model import (
 BATCH_MIN_RUN_IDS: int = 2
 BATCH_MAX_RUN_IDS: int = 10
 
+# Mindestabstand zwischen zwei Verzeichnis-Scans des Experiment-Index (0 = jeder Request)
+INDEX_MIN_REFRESH_SECONDS: float = 0.0
+
 
 # =============================================================================
 # TYPE DEFINITIONS
@@ -275,14 +280,74 @@ def load_experiments_from_dir(dir_path: Optional[Path] = None) -> List[Dict[str,
     """
     Lädt alle R&D-Experimente aus dem Verzeichnis.
 
-    Delegiert an :func:`src.r_and_d.experiments_read_model.load_experiments_from_directory`.
+    Gleiches Ergebnis wie
+    :func:`src.r_and_d.experiments_read_model.load_experiments_from_directory`, aber
+    aus dem prozessweiten :class:`ExperimentsIndex` (nur geänderte Dateien werden
+    neu geparst). Die Dicts sind geteilt und read-only zu behandeln.
     """
     experiments_dir = dir_path or get_r_and_d_dir()
-    return load_experiments_from_directory(experiments_dir)
+    return get_experiments_index(experiments_dir).experiments()
+
+
+# Prozessweite Read-Models pro Verzeichnis (inkrementeller Refresh per Fingerprint)
+_INDEXES: Dict[Path, ExperimentsIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_experiments_index(dir_path: Optional[Path] = None) -> ExperimentsIndex:
+    """
+    Liefert das prozessweite :class:`ExperimentsIndex` für ein R&D-Verzeichnis.
+
+    Flache Felder und Aggregate werden pro Datei-Version bzw. Index-Generation
+    gecacht; geänderte Dateien werden beim nächsten Zugriff neu geparst.
+    """
+    experiments_dir = Path(dir_path or get_r_and_d_dir()).resolve()
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(experiments_dir)
+        if index is None:
+            index = ExperimentsIndex(
+                experiments_dir,
+                flatten=_extract_flat_fields_uncached,
+                min_refresh_interval=INDEX_MIN_REFRESH_SECONDS,
+            )
+            _INDEXES[experiments_dir] = index
+        return index
+
+
+def _index_for_snapshot(experiments: List[Dict[str, Any]]) -> Optional[ExperimentsIndex]:
+    """Index, dessen aktuelle (ungefilterte) Liste exakt ``experiments`` ist."""
+    with _INDEXES_LOCK:
+        indexes = list(_INDEXES.values())
+    for index in indexes:
+        if index.is_snapshot(experiments):
+            return index
+    return None
+
+
+def _memoized_aggregate(
+    key: str,
+    experiments: List[Dict[str, Any]],
+    compute: Any,
+) -> Any:
+    index = _index_for_snapshot(experiments)
+    if index is None:
+        return compute(experiments)
+    # Kopie: Aufrufer ergänzen Felder (z.B. stats["today_count"])
+    return copy.deepcopy(index.memo(key, lambda: compute(experiments)))
 
 
 def extract_flat_fields(exp: Dict[str, Any]) -> Dict[str, Any]:
     """Extrahiert flache Felder aus einem Experiment-Dict (v1.1)."""
+    with _INDEXES_LOCK:
+        indexes = list(_INDEXES.values())
+    for index in indexes:
+        cached = index.flat(exp)
+        if cached is not None:
+            return dict(cached)
+    return _extract_flat_fields_uncached(exp)
+
+
+def _extract_flat_fields_uncached(exp: Dict[str, Any]) -> Dict[str, Any]:
     experiment = exp.get("experiment", {})
     results = exp.get("results", {})
     meta = exp.get("meta", {})
@@ -704,7 +769,11 @@ def filter_experiments(
 
 
 def compute_summary(experiments: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Berechnet Summary-Statistiken."""
+    """Berechnet Summary-Statistiken (gecacht pro Index-Generation)."""
+    return _memoized_aggregate("summary", experiments, _compute_summary)
+
+
+def _compute_summary(experiments: List[Dict[str, Any]]) -> Dict[str, Any]:
     by_status: Dict[str, int] = defaultdict(int)
     experiments_with_trades = 0
     experiments_with_dummy = 0
@@ -734,7 +803,11 @@ def compute_summary(experiments: List[Dict[str, Any]]) -> Dict[str, Any]:
 
 
 def compute_preset_stats(experiments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Berechnet Statistiken gruppiert nach Preset."""
+    """Berechnet Statistiken gruppiert nach Preset (gecacht pro Index-Generation)."""
+    return _memoized_aggregate("preset_stats", experiments, _compute_preset_stats)
+
+
+def _compute_preset_stats(experiments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     by_preset: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
 
     for exp in experiments:
@@ -771,7 +844,11 @@ def compute_preset_stats(experiments: List[Dict[str, Any]]) -> List[Dict[str, An
 
 
 def compute_strategy_stats(experiments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Berechnet Statistiken gruppiert nach Strategy."""
+    """Berechnet Statistiken gruppiert nach Strategy (gecacht pro Index-Generation)."""
+    return _memoized_aggregate("strategy_stats", experiments, _compute_strategy_stats)
+
+
+def _compute_strategy_stats(experiments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     by_strategy: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
 
     for exp in experiments:
@@ -806,7 +883,11 @@ def compute_strategy_stats(experiments: List[Dict[str, Any]]) -> List[Dict[str,
 
 
 def compute_global_stats(experiments: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Berechnet globale Statistiken."""
+    """Berechnet globale Statistiken (gecacht pro Index-Generation)."""
+    return _memoized_aggregate("global_stats", experiments, _compute_global_stats)
+
+
+def _compute_global_stats(experiments: List[Dict[str, Any]]) -> Dict[str, Any]:
     if not experiments:
         return {
             "total_experiments": 0,
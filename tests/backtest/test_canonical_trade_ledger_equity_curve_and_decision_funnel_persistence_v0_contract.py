@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import copy
+import hashlib
 import json
+from dataclasses import replace
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -40,12 +42,22 @@ from src.backtest.trade_ledger_equity_curve_persistence_v0 import (
     TRADE_LEDGER_OWNER,
     DrawdownCurveStatus,
     PersistenceContractError,
+    CurveColumnsV0,
+    iter_curve_csv_chunks_v0,
+    iter_trade_ledger_jsonl_chunks_v0,
     materialize_drawdown_curve_v0,
+    materialize_equity_curve_columns_v0,
+    materialize_equity_curve_rows_v0,
     materialize_trade_ledger_row_v0,
     materialize_trade_ledger_rows_v0,
+    read_curve_parquet_v0,
+    serialize_drawdown_curve_csv,
+    serialize_equity_curve_csv,
     serialize_trade_ledger_jsonl,
     validate_drawdown_reconciliation_v0,
     validate_trade_ledger_reconciliation_v0,
+    write_curve_parquet_v0,
+    write_observability_bundle_v0,
 )
 from src.research.cross_sectional_offline_economic_evaluation_decision_funnel_v0 import (
     FUNNEL_OWNER as RESEARCH_FUNNEL_OWNER,
@@ -430,6 +442,94 @@ class TestReconciliationFailClosed:
             )
 
 
+class TestColumnarStreaming:
+    def test_curve_csv_chunks_match_row_serializers(self) -> None:
+        equity = _fixture_equity()
+        columns = materialize_equity_curve_columns_v0(equity)
+        expected = serialize_equity_curve_csv(materialize_equity_curve_rows_v0(equity))
+        for chunk_rows in (1, 3, 8, 100):
+            assert "".join(iter_curve_csv_chunks_v0(columns, chunk_rows=chunk_rows)) == expected
+        assert columns.rows() == materialize_equity_curve_rows_v0(equity)
+
+        drawdown = materialize_drawdown_curve_v0(equity_curve=equity, columnar=True)
+        assert drawdown.rows == () and drawdown.columns is not None
+        row_drawdown = materialize_drawdown_curve_v0(equity_curve=equity)
+        assert "".join(iter_curve_csv_chunks_v0(drawdown.columns, chunk_rows=3)) == (
+            serialize_drawdown_curve_csv(row_drawdown.rows)
+        )
+
+        empty = materialize_equity_curve_columns_v0(pd.Series(dtype=float))
+        assert "".join(iter_curve_csv_chunks_v0(empty)) == serialize_equity_curve_csv(())
+
+    def test_trade_ledger_jsonl_chunks_match_serializer(self) -> None:
+        rows = materialize_trade_ledger_rows_v0(
+            _fixture_trades(include_fees=True), instrument_id="ETH/USDT", run_id="chunks"
+        )
+        expected = serialize_trade_ledger_jsonl(rows)
+        assert "".join(iter_trade_ledger_jsonl_chunks_v0(rows, chunk_rows=2)) == expected
+        assert "".join(iter_trade_ledger_jsonl_chunks_v0(())) == serialize_trade_ledger_jsonl(())
+
+    def test_columnar_bundle_digest_and_files_identical(self, tmp_path: Path) -> None:
+        text_bundle, _ = _materialize_bundle(include_fees=True)
+        columnar_bundle, _ = materialize_observability_bundle_v1(
+            _bundle_inputs(include_fees=True),
+            run_identity={"run_id": "fixture-persistence-v0"},
+            source_refs=["fixture_trade_ledger_equity_curve_decision_funnel_persistence_v0"],
+            columnar_artifacts=True,
+        )
+        assert columnar_bundle.equity_curve_csv is None
+        assert columnar_bundle.trade_ledger_jsonl is None
+        assert columnar_bundle.equity_curve_columns is not None
+        for name, text in (
+            ("EQUITY_CURVE.csv", text_bundle.equity_curve_csv),
+            ("TRADE_LEDGER.jsonl", text_bundle.trade_ledger_jsonl),
+            ("DRAWDOWN_CURVE.csv", text_bundle.drawdown_curve_csv),
+        ):
+            assert columnar_bundle.artifact_text(name) == text == text_bundle.artifact_text(name)
+        assert columnar_bundle.bundle_digest == text_bundle.bundle_digest
+        assert columnar_bundle.artifact_payloads() == text_bundle.artifact_payloads()
+        assert columnar_bundle.artifact_names() == sorted(text_bundle.artifact_payloads())
+
+        text_dir, columnar_dir = tmp_path / "text", tmp_path / "columnar"
+        text_digests = write_observability_bundle_v0(text_bundle, text_dir)
+        columnar_digests = write_observability_bundle_v0(columnar_bundle, columnar_dir)
+        assert columnar_digests == text_digests
+        for name, digest in columnar_digests.items():
+            data = (columnar_dir / name).read_bytes()
+            assert data == (text_dir / name).read_bytes()
+            assert hashlib.sha256(data).hexdigest() == digest
+
+    def test_drawdown_validator_reads_columns_fail_closed(self) -> None:
+        equity = _fixture_equity()
+        drawdown = materialize_drawdown_curve_v0(equity_curve=equity, columnar=True)
+        assert validate_drawdown_reconciliation_v0(equity_curve=equity, drawdown=drawdown)
+
+        values = drawdown.columns.values.copy()
+        values[5] -= 1.0
+        tampered = replace(drawdown, columns=replace(drawdown.columns, values=values))
+        with pytest.raises(PersistenceContractError, match="drawdown_reconstruction_mismatch"):
+            validate_drawdown_reconciliation_v0(equity_curve=equity, drawdown=tampered)
+
+        timestamps = drawdown.columns.timestamps.copy()
+        timestamps[2] = "1970-01-01T00:00:00+00:00"
+        shifted = replace(drawdown, columns=replace(drawdown.columns, timestamps=timestamps))
+        with pytest.raises(PersistenceContractError, match="drawdown_timestamp_mismatch"):
+            validate_drawdown_reconciliation_v0(equity_curve=equity, drawdown=shifted)
+
+    def test_parquet_export_roundtrip_hashes_written_bytes(self, tmp_path: Path) -> None:
+        pytest.importorskip("pyarrow")
+        columns = materialize_equity_curve_columns_v0(_fixture_equity())
+        path = tmp_path / "EQUITY_CURVE.parquet"
+        artifact = write_curve_parquet_v0(path, columns, row_group_rows=3)
+
+        assert artifact.row_count == columns.point_count
+        assert artifact.sha256 == hashlib.sha256(path.read_bytes()).hexdigest()
+        assert artifact.byte_count == path.stat().st_size
+        restored = read_curve_parquet_v0(path)
+        assert isinstance(restored, CurveColumnsV0)
+        assert restored.rows() == columns.rows()
+
+
 def test_manifest_verify_rc_zero(tmp_path: Path) -> None:
     from scripts.ops.primary_evidence_retention_v0 import (
         finalize_durable_bundle_manifest,
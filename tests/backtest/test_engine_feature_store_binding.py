@@ -0,0 +1,51 @@
+"""
+Tests für BacktestEngine + Offline-Feature-Store-Binding
+=======================================================
+run_realistic() joint gespeicherte Features vor der Signal-Generierung an.
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.backtest.engine import BacktestEngine
+from src.features.offline_feature_store_v1 import (
+    LOG_RETURN_V1,
+    FeatureStoreBindingV1,
+    OfflineFeatureStoreV1,
+    PartitionKeyV1,
+)
+
+
+def _sample_data() -> pd.DataFrame:
+    dates = pd.date_range("2023-01-01", periods=100, freq="1h", tz="UTC")
+    close = [100.0 + i * 0.5 + (3.0 if i % 7 == 0 else 0.0) for i in range(100)]
+    return pd.DataFrame(
+        {"open": close, "high": close, "low": close, "close": close, "volume": 1000.0},
+        index=dates,
+    )
+
+
+def test_run_realistic_joins_store_features(tmp_path):
+    df = _sample_data()
+    store = OfflineFeatureStoreV1(tmp_path)
+    binding = FeatureStoreBindingV1(store, (LOG_RETURN_V1,), "1h")
+    seen: list[pd.DataFrame] = []
+
+    def strategy_fn(frame, params):
+        seen.append(frame)
+        return (frame["log_return"] > params["threshold"]).astype(int)
+
+    params = {"threshold": 0.01, "stop_pct": 0.02}
+    engine = BacktestEngine(use_execution_pipeline=False, feature_store_binding=binding)
+    result = engine.run_realistic(df=df, strategy_signal_fn=strategy_fn, strategy_params=params)
+
+    np.testing.assert_allclose(seen[0]["log_return"], np.log(df["close"]).diff(), equal_nan=True)
+    assert "log_return" not in df.columns
+    assert store.load_manifest(PartitionKeyV1("log_return", "v1", "BTC/EUR", "1h")) is not None
+
+    # Same result as a plain engine fed the pre-joined frame.
+    plain = BacktestEngine(use_execution_pipeline=False).run_realistic(
+        df=seen[0], strategy_signal_fn=strategy_fn, strategy_params=params
+    )
+    assert result.stats["total_trades"] == plain.stats["total_trades"]
+    assert (result.equity_curve == plain.equity_curve).all()
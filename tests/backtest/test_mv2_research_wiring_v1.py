@@ -1070,3 +1070,129 @@ def test_c4_research_wiring_run_binds_observation_and_c4_capability() -> None:
     assert wiring.POST_CONFIRMATION_SURVIVAL_SUITABILITY_COMPOSITION_BINDING_CAPABILITY_ID == (
         "POST_CONFIRMATION_SURVIVAL_SUITABILITY_COMPOSITION_BINDING_V1"
     )
+
+
+def _mixed_research_bars(n: int = 16) -> pd.DataFrame:
+    bars = _research_bars(n)
+    bars["decision_time"] = list(bars.index)
+    bars["warmup_status"] = (
+        ["warmup_required"] * 3 + ["in_progress"] + ["warmup_complete"] * (n - 4)
+    )
+    bars["warmup_complete"] = [False] * 2 + [True] * (n - 2)
+    bars["open_interest"] = list(range(n))
+    return bars
+
+
+def _iterrows_reference(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Pre-columnar reference: ``iterrows`` rows, per-bar warm-up and full digests."""
+    monkeypatch.setattr(
+        wiring._MV2BarColumnsV1,
+        "rows",
+        lambda self: (row for _, row in self.bars.iterrows()),
+    )
+    monkeypatch.setattr(
+        wiring._MV2BarColumnsV1,
+        "warmup_statuses",
+        lambda self: [wiring._resolve_warmup_status(row) for _, row in self.bars.iterrows()],
+    )
+    monkeypatch.setattr(
+        wiring._StableDigestTemplateV1,
+        "digest",
+        lambda self, **values: wiring._stable_digest({**self.invariant, **values}),
+    )
+
+
+def test_columnar_bar_rows_match_iterrows_elements() -> None:
+    bars = _mixed_research_bars()
+    bars["bar_interval"] = [None] + ["1m"] * (len(bars) - 1)
+    columns = wiring._MV2BarColumnsV1(bars)
+    for view, (label, row) in zip(columns.rows(), bars.iterrows()):
+        assert view.name == label
+        assert list(view.index) == list(row.index)
+        for column in bars.columns:
+            assert type(view[column]) is type(row[column])
+            assert view.get(column) is row.get(column) or view.get(column) == row.get(column)
+        assert view.get("missing", "fallback") == row.get("missing", "fallback")
+        assert ("missing" in view.index) is ("missing" in row.index)
+        with pytest.raises(KeyError):
+            view["missing"]
+
+
+@pytest.mark.parametrize(
+    "status,complete",
+    [
+        (["WARMUP_REQUIRED", "warmup_invalid", "Warmup_Complete", "other", None], None),
+        (None, [True, False, 0, 1.0, float("nan")]),
+        (["in_progress", "x", "warmup_complete", "x", "warmup_in_progress"], [1, 0, 0, 1, 0]),
+    ],
+)
+def test_vectorized_warmup_statuses_match_per_bar_resolution(
+    status: list[Any] | None, complete: list[Any] | None
+) -> None:
+    bars = _research_bars(5)
+    if status is not None:
+        bars["warmup_status"] = status
+    if complete is not None:
+        bars["warmup_complete"] = complete
+    expected = [wiring._resolve_warmup_status(row) for _, row in bars.iterrows()]
+    assert wiring._MV2BarColumnsV1(bars).warmup_statuses() == expected
+    assert wiring._MV2BarColumnsV1(bars.iloc[:0]).warmup_statuses() == []
+
+
+def test_digest_template_is_byte_identical_to_stable_digest() -> None:
+    invariant = {
+        "registry_input_digest": "abc",
+        "cost_digest": "def",
+        "profile_binding": {"b": [1, 2.5, None], "a": {"z": True, "y": "ü"}},
+        "warmup_skip_reason": "skip",
+    }
+    template = wiring._StableDigestTemplateV1(
+        invariant, ("context_digest", "epoch", "l1_observation_status", "observed_l1_used")
+    )
+    for epoch, observed in [(0, True), (17, False)]:
+        values = {
+            "context_digest": f"ctx-{epoch}",
+            "epoch": epoch,
+            "l1_observation_status": "observed_historical_l1",
+            "observed_l1_used": observed,
+        }
+        assert template.digest(**values) == wiring._stable_digest({**invariant, **values})
+    with pytest.raises(ValueError, match="digest_template_values_mismatch"):
+        template.digest(epoch=1)
+    with pytest.raises(ValueError, match="digest_template_key_overlap"):
+        wiring._StableDigestTemplateV1({"epoch": 1}, ("epoch",))
+
+
+@pytest.mark.parametrize("engine_signal_source", [None, ENGINE_SIGNAL_SOURCE_MV2_REPLAY])
+def test_columnar_replay_loop_parity_with_iterrows_reference(
+    monkeypatch: pytest.MonkeyPatch, engine_signal_source: str | None
+) -> None:
+    def _research_run() -> wiring.MV2ResearchWiringResultV1:
+        return wiring.run_mv2_research_backtest_wiring_v1(
+            bars=_mixed_research_bars(),
+            strategy_id="ma_crossover",
+            cfg=_research_cfg(),
+            profile_binding=_research_profile_binding(),
+            backtest_engine_signal_source=engine_signal_source,
+        )
+
+    columnar = _research_run()
+    with monkeypatch.context() as patched:
+        _iterrows_reference(patched)
+        reference = _research_run()
+
+    # Warm-up contexts carry volatility_estimate=NaN: compare by canonical digest.
+    assert [o.context.input_digest for o in columnar.bar_outcomes] == [
+        o.context.input_digest for o in reference.bar_outcomes
+    ]
+    assert [o.evidence for o in columnar.bar_outcomes] == [
+        o.evidence for o in reference.bar_outcomes
+    ]
+    assert [(o.position_signal, o.fail_reasons) for o in columnar.bar_outcomes] == [
+        (o.position_signal, o.fail_reasons) for o in reference.bar_outcomes
+    ]
+    assert columnar.mv2_replay_signal_digest == reference.mv2_replay_signal_digest
+    assert dict(columnar.block_reason_counts) == dict(reference.block_reason_counts)
+    pd.testing.assert_series_equal(
+        columnar.backtest_result.equity_curve, reference.backtest_result.equity_curve
+    )
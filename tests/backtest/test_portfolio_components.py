@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtest import stats as stats_mod
+from src.backtest.portfolio_components import (
+    ComponentResultCache,
+    PortfolioComponentRunner,
+    data_fingerprint,
+)
+from src.backtest.result import BacktestResult
+
+# Registry-Strategien: nur für Cache-Schlüssel (Parameter), die Backtests sind Stubs.
+STRATEGIES = ["breakout", "ma_crossover"]
+
+# cfg des laufenden Portfolio-Backtests (der Stub liest initial_cash wie die Engine)
+_ACTIVE_CFG: dict[str, Any] = {}
+
+
+def _ohlcv(n: int = 40) -> pd.DataFrame:
+    idx = pd.date_range("2025-01-01", periods=n, freq="h")
+    close = 100.0 + np.arange(n, dtype=float)
+    return pd.DataFrame(
+        {"open": close, "high": close, "low": close, "close": close, "volume": 1.0},
+        index=idx,
+    )
+
+
+def _result(df: pd.DataFrame, initial: float, step: float) -> BacktestResult:
+    equity = pd.Series(initial * (1.0 + step) ** np.arange(len(df)), index=df.index)
+    drawdown = stats_mod.compute_drawdown(equity)
+    return BacktestResult(
+        equity_curve=equity,
+        drawdown=drawdown,
+        trades=None,
+        stats={
+            "total_return": float(equity.iloc[-1] / equity.iloc[0] - 1.0),
+            "sharpe": 1.0,
+            "max_drawdown": 0.0,
+            "total_trades": 1,
+            "win_rate": 0.5,
+            "profit_factor": 1.0,
+            "blocked_trades": 0,
+        },
+        metadata={"mode": "test_stub"},
+    )
+
+
+def _cfg(**portfolio: Any) -> dict[str, Any]:
+    return {
+        "backtest": {"initial_cash": 10000.0},
+        "portfolio": {
+            "enabled": True,
+            "allocation_method": "equal",
+            "total_capital": 10000.0,
+            "max_strategies_active": 10,
+            **portfolio,
+        },
+        "strategies": {"active": [], "available": []},
+    }
+
+
+@pytest.fixture
+def stub_calls(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, int, float]]:
+    from src.backtest import engine as bt_engine
+
+    calls: list[tuple[str, int, float]] = []
+
+    def _stub_run_single(*, df: pd.DataFrame, strategy_name: str, **_kwargs: Any) -> BacktestResult:
+        initial = float(_ACTIVE_CFG["backtest"]["initial_cash"])
+        calls.append((strategy_name, len(df), initial))
+        step = 0.001 if strategy_name == "breakout" else -0.0005
+        return _result(df, initial, step + 0.0001 * (len(df) % 7))
+
+    monkeypatch.setattr(bt_engine, "run_single_strategy_from_registry", _stub_run_single)
+    return calls
+
+
+def _run(cfg: dict[str, Any], df: pd.DataFrame, monkeypatch: pytest.MonkeyPatch, **kwargs: Any):
+    from src.backtest import engine as bt_engine
+
+    monkeypatch.setattr(f"{__name__}._ACTIVE_CFG", cfg)
+    return bt_engine.run_portfolio_from_config(
+        df=df, cfg=cfg, portfolio_name="default", strategy_filter=STRATEGIES, **kwargs
+    )
+
+
+def test_cache_reuses_component_results_across_portfolio_runs(
+    stub_calls: list, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    df = _ohlcv()
+    cfg = _cfg()
+    cache = ComponentResultCache()
+
+    first = _run(cfg, df, monkeypatch, component_cache=cache)
+    assert [c[0] for c in stub_calls] == STRATEGIES
+    assert all(c[2] == 10000.0 for c in stub_calls)
+
+    second = _run(cfg, df, monkeypatch, component_cache=cache)
+    assert len(stub_calls) == 2  # keine neuen Backtests
+    assert cache.hits == 2
+    pd.testing.assert_series_equal(first.combined_equity, second.combined_equity)
+    # Gecachte Ergebnisse sind Kopien
+    assert second.strategy_results["breakout"] is not first.strategy_results["breakout"]
+
+    # Andere Daten -> anderer Fingerprint -> neuer Backtest
+    _run(cfg, _ohlcv(41), monkeypatch, component_cache=cache)
+    assert len(stub_calls) == 4
+
+
+def test_preview_and_final_share_identical_component_runs(
+    stub_calls: list, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    df = _ohlcv(30)
+    cfg = _cfg(allocation_method="risk_parity", allocation_estimation_bars=30)
+
+    result = _run(cfg, df, monkeypatch)
+
+    # Preview-Slice == volle Daten: jede Strategie nur einmal gerechnet
+    assert sorted(c[0] for c in stub_calls) == STRATEGIES
+    assert sum(result.allocation.values()) == pytest.approx(1.0)
+
+
+def test_custom_risk_objects_disable_reuse(
+    stub_calls: list, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from src.risk import PositionSizer, PositionSizerConfig
+
+    df = _ohlcv()
+    cache = ComponentResultCache()
+    sizer = PositionSizer(PositionSizerConfig())
+
+    _run(_cfg(), df, monkeypatch, component_cache=cache, position_sizer=sizer)
+    _run(_cfg(), df, monkeypatch, component_cache=cache, position_sizer=sizer)
+
+    assert len(stub_calls) == 4
+    assert len(cache) == 0
+
+
+def test_process_pool_matches_sequential(stub_calls: list, monkeypatch: pytest.MonkeyPatch) -> None:
+    import src.backtest.portfolio_components as components_mod
+
+    monkeypatch.setattr(components_mod.os, "cpu_count", lambda: 2)
+    df = _ohlcv()
+    cfg = _cfg(allocation_method="risk_parity", allocation_estimation_bars=20)
+
+    sequential = _run(cfg, df, monkeypatch)
+    parallel = _run(cfg, df, monkeypatch, max_workers=2)
+
+    assert parallel.allocation == sequential.allocation
+    pd.testing.assert_series_equal(parallel.combined_equity, sequential.combined_equity)
+
+
+def test_runner_reports_failures_and_fingerprints_data() -> None:
+    runner = PortfolioComponentRunner(cfg=_cfg(), total_capital=10000.0)
+    outcome = runner.run(_ohlcv(), ["does_not_exist"])["does_not_exist"]
+
+    assert not isinstance(outcome, BacktestResult)
+    assert outcome.message
+
+    df = _ohlcv()
+    assert data_fingerprint(df) == data_fingerprint(df.copy())
+    changed = df.copy()
+    changed.iloc[3, 3] += 1e-9
+    assert data_fingerprint(changed) != data_fingerprint(df)
@@ -0,0 +1,110 @@
+"""Contract tests for scripts/ci/import_time_budget.py."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SCRIPT = REPO_ROOT / "scripts" / "ci" / "import_time_budget.py"
+CONFIG = REPO_ROOT / "config" / "ci" / "import_time_budgets.json"
+
+
+def _load_module():
+    spec = importlib.util.spec_from_file_location("import_time_budget", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+budget = _load_module()
+
+
+def test_repo_budget_config_is_valid_and_targets_exist() -> None:
+    repeats, entries = budget.load_budgets(CONFIG)
+    assert repeats >= 1
+    names = {e.name for e in entries}
+    for required in ("src.levelup.cli", "src.sweeps.engine", "scripts/run_backtest.py --help"):
+        assert required in names
+    for entry in entries:
+        if entry.kind == "import":
+            assert importlib.util.find_spec(entry.target) is not None, entry.target
+        else:
+            script = next(a for a in entry.argv if a != "{python}")
+            assert (REPO_ROOT / script).is_file(), script
+
+
+def test_evaluate_uses_median_and_flags_forbidden_modules() -> None:
+    entry = budget.EntrypointBudget(name="x", kind="import", budget_seconds=0.5, target="x")
+    assert budget.evaluate(entry, [0.1, 5.0, 0.2]).status == "PASS"
+    over = budget.evaluate(entry, [0.6, 0.7, 0.1])
+    assert over.status == "FAIL" and "exceeds budget" in over.reason
+    forbidden = budget.evaluate(entry, [0.1], ["pandas", "pandas"])
+    assert forbidden.status == "FAIL" and forbidden.loaded_forbidden == ["pandas"]
+
+
+def test_invalid_config_is_rejected(tmp_path: Path) -> None:
+    path = tmp_path / "budgets.json"
+    path.write_text(
+        json.dumps(
+            {
+                "schema_version": "import_time_budgets_v1",
+                "entrypoints": [{"name": "a", "kind": "import", "budget_seconds": 0}],
+            }
+        )
+    )
+    with pytest.raises(budget.BudgetConfigError, match="budget_seconds"):
+        budget.load_budgets(path)
+
+
+def test_cli_fails_on_regression_and_passes_within_budget(tmp_path: Path) -> None:
+    config = tmp_path / "budgets.json"
+    config.write_text(
+        json.dumps(
+            {
+                "schema_version": "import_time_budgets_v1",
+                "repeats": 1,
+                "entrypoints": [
+                    {
+                        "name": "core",
+                        "kind": "import",
+                        "target": "src.core",
+                        "budget_seconds": 5.0,
+                        "forbidden_modules": ["pandas"],
+                    },
+                    {
+                        "name": "pandas-heavy",
+                        "kind": "import",
+                        "target": "pandas",
+                        "budget_seconds": 5.0,
+                        "forbidden_modules": ["pandas"],
+                    },
+                ],
+            }
+        )
+    )
+    report = tmp_path / "report.json"
+
+    def run(*args: str) -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
+            [sys.executable, str(SCRIPT), "--config", str(config), *args],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+
+    ok = run("--only", "core", "--json-out", str(report))
+    assert ok.returncode == 0, ok.stdout + ok.stderr
+    assert json.loads(report.read_text())["results"][0]["status"] == "PASS"
+
+    failed = run()
+    assert failed.returncode == 1
+    assert "forbidden modules imported: pandas" in failed.stdout
@@ -0,0 +1,154 @@
+"""
+Golden tests for src.core.canonical_json.
+
+Proves byte-identical output against the per-module canonical JSON / digest
+helpers so they can migrate to the shared implementation.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from src.backtest import economic_validity_policy_v1
+from src.core import repro
+from src.core.canonical_json import (
+    CanonicalDigestCache,
+    canonical_json_bytes,
+    canonical_json_file_text,
+    canonical_json_text,
+    canonical_sha256,
+    canonical_sha256_streaming,
+    iter_canonical_json_chunks,
+    sha256_chunks,
+    sha256_file,
+    stable_digest,
+)
+from src.execution.ledger import quantization
+from src.ops.archive_sibling_export_contract_v1 import canonical_digest as archive_digest
+from src.ops.phase_9_2_step_5_productive_session_evidence_seal_and_productive_verifier_v1 import (
+    digest_v1 as seal_digest,
+)
+from src.ops.productive_pure_stack_numeric_policy_shadow_campaign_v1 import reproducibility_v1
+from src.research.cross_sectional_path_efficiency_continuation_v1_development_evaluation_v1 import (
+    binding_v1 as path_efficiency_binding,
+)
+
+PAYLOADS = [
+    {},
+    {"b": 1, "a": [3, 2, 1], "c": {"z": None, "y": True, "x": False}},
+    {"schema": "evidence_v1", "body": {"rows": [{"id": i, "px": i * 0.1} for i in range(5)]}},
+    {"unicode": "Gebühr €", "emoji": "\U0001f680", "ctrl": 'tab\tnl\n"quote"\\'},
+    {"floats": [0.0, -0.0, 1e16, 1e-7, 2.5, 123456789.123456789, -3.0]},
+    {"ints": [0, -1, 2**63, -(2**70)], "nested": [[[]], [{}], [[1, [2, [3]]]]]},
+    {"tuple": (1, "a", None), "1": "string key", "k": "v"},
+]
+
+DEFAULT_STR_PAYLOADS = [
+    {"amount": Decimal("1.2300"), "fee": Decimal("-0.0001")},
+    {"at": datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc), "path": Path("a/b.json")},
+]
+
+
+@pytest.mark.parametrize("payload", PAYLOADS + DEFAULT_STR_PAYLOADS)
+def test_stable_digest_matches_backtest_helper(payload):
+    assert stable_digest(payload) == economic_validity_policy_v1._stable_digest(payload)
+    assert canonical_sha256(payload, default=str) == stable_digest(payload)
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_ascii_digest_matches_ops_and_core_helpers(payload):
+    expected = seal_digest.sha256_canonical_v1(payload)
+    assert canonical_sha256(payload) == expected
+    assert repro.stable_hash_dict(payload, short=False) == expected
+    assert canonical_json_bytes(payload, allow_nan=False) == (
+        reproducibility_v1.canonical_json_bytes(payload)
+    )
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_non_ascii_text_matches_ledger_and_research_helpers(payload):
+    assert canonical_json_text(payload, ensure_ascii=False) == quantization.canonical_json(payload)
+    assert canonical_sha256(payload, ensure_ascii=False) == path_efficiency_binding.stable_digest(
+        payload
+    )
+    assert canonical_json_file_text(
+        payload, ensure_ascii=False, allow_nan=False
+    ) == archive_digest.canonical_json_file_body_v1(payload)
+
+
+def test_golden_digests_are_pinned():
+    payload = {"b": [1, 2.5, None], "a": {"x": "ä", "y": True}}
+    assert canonical_json_text(payload) == '{"a":{"x":"\\u00e4","y":true},"b":[1,2.5,null]}'
+    assert (
+        canonical_sha256(payload)
+        == hashlib.sha256(canonical_json_text(payload).encode("utf-8")).hexdigest()
+    )
+    assert (
+        canonical_json_text(payload, ensure_ascii=False)
+        == '{"a":{"x":"ä","y":true},"b":[1,2.5,null]}'
+    )
+    assert (
+        stable_digest({"amount": Decimal("1.50")})
+        == hashlib.sha256(b'{"amount":"1.50"}').hexdigest()
+    )
+
+
+def test_errors_match_json_dumps():
+    with pytest.raises(TypeError):
+        canonical_json_text({"amount": Decimal("1")})
+    with pytest.raises(ValueError):
+        canonical_json_text({"x": math.nan}, allow_nan=False)
+    with pytest.raises(TypeError):
+        canonical_json_text({1: "a", "b": 2})
+    assert canonical_json_text({"x": math.nan}) == json.dumps(
+        {"x": math.nan}, sort_keys=True, separators=(",", ":")
+    )
+
+
+@pytest.mark.parametrize("payload", PAYLOADS + DEFAULT_STR_PAYLOADS)
+def test_streaming_digest_matches_one_shot(payload):
+    assert "".join(iter_canonical_json_chunks(payload, default=str)) == canonical_json_text(
+        payload, default=str
+    )
+    assert canonical_sha256_streaming(payload, default=str) == stable_digest(payload)
+
+
+def test_sha256_file_and_chunks(tmp_path):
+    path = tmp_path / "artifact.bin"
+    data = bytes(range(256)) * 5000
+    path.write_bytes(data)
+    expected = hashlib.sha256(data).hexdigest()
+    assert sha256_file(path, chunk_size=4096) == expected
+    assert sha256_chunks([data[:10], data[10:]]) == expected
+    assert sha256_chunks(["ä", "b"]) == hashlib.sha256("äb".encode("utf-8")).hexdigest()
+
+
+def test_digest_cache_identity_and_content_keys():
+    cache = CanonicalDigestCache(maxsize=2, default=str)
+    body = {"rows": [Decimal("1.0")]}
+    assert cache.sha256(body) == stable_digest(body)
+    assert cache.sha256(body) == stable_digest(body)
+    assert cache.cache_info()["hits"] == 1
+
+    # Equal content under another identity is recomputed, not confused.
+    twin = {"rows": [Decimal("1.0")]}
+    other = {"rows": [Decimal("2.0")]}
+    assert cache.sha256(other) == stable_digest(other)
+    assert cache.sha256(twin) == stable_digest(twin)
+    assert cache.cache_info()["size"] == 2
+
+    assert cache.sha256(body, key=("run", 1)) == stable_digest(body)
+    assert cache.sha256(twin, key=("run", 1)) == stable_digest(body)
+    assert cache.cache_info() == {"hits": 2, "misses": 4, "size": 2, "maxsize": 2}
+
+    cache.clear()
+    assert cache.cache_info()["size"] == 0
+    with pytest.raises(ValueError):
+        CanonicalDigestCache(maxsize=0)
@@ -0,0 +1,103 @@
+"""Tests for lazy package exports and the lazy strategy registry."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+from src.core.lazy_imports import install_lazy_exports, lazy_exports, resolve_all_exports
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _probe(code: str) -> dict:
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def test_lazy_exports_resolve_relative_modules_and_aliases() -> None:
+    exports = lazy_exports(
+        "src.core",
+        {".errors": ("ConfigError", ("PTError", "PeakTradeError")), "json": ("dumps",)},
+    )
+    assert exports == {
+        "ConfigError": ("src.core.errors", "ConfigError"),
+        "PTError": ("src.core.errors", "PeakTradeError"),
+        "dumps": ("json", "dumps"),
+    }
+    with pytest.raises(ValueError, match="duplicate lazy export"):
+        lazy_exports("pkg", {".a": ("X",), ".b": ("X",)})
+
+
+def test_install_lazy_exports_caches_and_falls_back() -> None:
+    module = types.ModuleType("lazy_probe")
+    install_lazy_exports(
+        module.__dict__,
+        {"dumps": ("json", "dumps")},
+        fallback=lambda name: 42 if name == "answer" else getattr(object, name),
+    )
+    assert "dumps" in dir(module)
+    assert "dumps" not in module.__dict__
+    assert module.dumps is json.dumps
+    assert module.__dict__["dumps"] is json.dumps
+    assert module.answer == 42
+    with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+        module.missing  # noqa: B018
+
+
+def test_core_exports_resolve_without_import_side_effects() -> None:
+    import src.core as core
+    from src.core import config_registry
+
+    exported = resolve_all_exports(core)
+    assert set(exported) == set(core.__all__)
+    assert core.get_registry_config is config_registry.get_config
+    report = _probe(
+        "import json, sys, src.core, src.live, src.risk, src.experiments; "
+        "print(json.dumps({'pandas': 'pandas' in sys.modules, "
+        "'errors': 'src.core.errors' in sys.modules}))"
+    )
+    assert report == {"pandas": False, "errors": False}
+
+
+def test_strategy_registry_loads_strategy_modules_on_first_resolve() -> None:
+    report = _probe(
+        "import json, sys\n"
+        "from src.strategies import registry as r\n"
+        "snap = r.serialize_registry_snapshot(r.build_registry_snapshot())\n"
+        "before = 'src.strategies.macd' in sys.modules or 'pandas' in sys.modules\n"
+        "spec = r.get_strategy_spec('macd')\n"
+        "print(json.dumps({'before': before, 'cls': spec.cls.__name__,\n"
+        "    'loaded': 'src.strategies.macd' in sys.modules,\n"
+        "    'cached': r._STRATEGY_REGISTRY['macd'] is spec,\n"
+        "    'other_loaded': 'src.strategies.bollinger' in sys.modules}))"
+    )
+    assert report == {
+        "before": False,
+        "cls": "MACDStrategy",
+        "loaded": True,
+        "cached": True,
+        "other_loaded": False,
+    }
+
+
+def test_strategy_registry_refs_match_resolved_classes() -> None:
+    from src.strategies.registry import _STRATEGY_REGISTRY, StrategyClassRef
+
+    for key in list(_STRATEGY_REGISTRY):
+        raw = _STRATEGY_REGISTRY.peek(key)
+        spec = _STRATEGY_REGISTRY[key]
+        assert not isinstance(spec.cls, StrategyClassRef)
+        if isinstance(raw.cls, StrategyClassRef):
+            assert (spec.cls.__module__, spec.cls.__name__) == (raw.cls.module, raw.cls.name)
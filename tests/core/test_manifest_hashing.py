@@ -0,0 +1,123 @@
+"""Tests for src.core.manifest_hashing (parallel hashing, manifests)."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+import pytest
+
+from scripts.ops.primary_evidence_retention_v0 import (
+    verify_manifest_sha256,
+    write_manifest_sha256,
+)
+from src.core import manifest_hashing
+from src.core.manifest_hashing import (
+    build_sha256_manifest,
+    hash_files,
+    sha256_file_fast,
+    write_sha256_manifest,
+)
+
+
+def _legacy_manifest(root: Path) -> str:
+    lines = []
+    for path in sorted(p for p in root.rglob("*") if p.is_file()):
+        if path.name == "MANIFEST.sha256":
+            continue
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        lines.append(f"{digest}  {path.relative_to(root).as_posix()}")
+    return "\n".join(lines) + ("\n" if lines else "")
+
+
+def _bundle(root: Path) -> Path:
+    (root / "sub" / "deep").mkdir(parents=True)
+    (root / "a.json").write_text('{"a": 1}', encoding="utf-8")
+    (root / "sub" / "b.txt").write_text("Gebühr €\n", encoding="utf-8")
+    (root / "sub" / "deep" / "c.bin").write_bytes(bytes(range(256)) * 4096)
+    (root / "sub" / "empty").write_bytes(b"")
+    (root / "sub" / "MANIFEST.sha256").write_text("nested manifest is excluded\n")
+    return root
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_manifest_is_byte_identical_to_sequential_writer(tmp_path: Path, max_workers: int) -> None:
+    root = _bundle(tmp_path)
+    expected = _legacy_manifest(root)
+    assert build_sha256_manifest(root, max_workers=max_workers) == expected
+
+    write_manifest_sha256(root)
+    assert (root / "MANIFEST.sha256").read_text(encoding="utf-8") == expected
+    assert verify_manifest_sha256(root) == (True, "")
+
+
+def test_empty_root_writes_empty_manifest(tmp_path: Path) -> None:
+    manifest = write_sha256_manifest(tmp_path)
+    assert manifest.read_text(encoding="utf-8") == ""
+
+
+def test_mmap_and_buffered_paths_agree(tmp_path: Path) -> None:
+    path = tmp_path / "large.bin"
+    data = os.urandom(3 * 65536 + 17)
+    path.write_bytes(data)
+    expected = hashlib.sha256(data).hexdigest()
+    assert sha256_file_fast(path, mmap_threshold=1) == expected
+    assert sha256_file_fast(path, chunk_size=4096, mmap_threshold=1 << 40) == expected
+    (tmp_path / "empty").write_bytes(b"")
+    assert sha256_file_fast(tmp_path / "empty", mmap_threshold=0) == hashlib.sha256().hexdigest()
+
+
+def test_hash_files_keeps_input_order_and_reports_errors(tmp_path: Path) -> None:
+    paths = []
+    for i in reversed(range(8)):
+        path = tmp_path / f"f{i}.txt"
+        path.write_text(str(i))
+        paths.append(path)
+    digests = hash_files(paths, max_workers=4)
+    assert list(digests) == paths
+    assert digests[paths[0]] == hashlib.sha256(b"7").hexdigest()
+
+    missing = tmp_path / "missing"
+    with pytest.raises(FileNotFoundError):
+        hash_files([paths[0], missing], max_workers=2)
+    result = hash_files([paths[0], missing], max_workers=2, return_exceptions=True)
+    assert isinstance(result[missing], FileNotFoundError)
+
+
+def test_small_batches_skip_the_pool_and_large_ones_share_it(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    root = _bundle(tmp_path)
+    files = manifest_hashing.list_manifest_files(root)
+    expected = {p: hashlib.sha256(p.read_bytes()).hexdigest() for p in files}
+
+    def no_pool():
+        raise AssertionError("small batches must be hashed sequentially")
+
+    monkeypatch.setattr(manifest_hashing, "_shared_pool", no_pool)
+    assert hash_files(files) == expected
+    monkeypatch.undo()
+
+    monkeypatch.setattr(manifest_hashing, "PARALLEL_MIN_FILES", 2)
+    monkeypatch.setattr(manifest_hashing, "PARALLEL_MIN_BYTES", 1)
+    assert hash_files(files) == expected
+    pool = manifest_hashing._shared_pool()
+    assert hash_files(files) == expected
+    assert manifest_hashing._shared_pool() is pool
+
+
+def test_verify_reports_first_failure_in_manifest_order(tmp_path: Path) -> None:
+    root = _bundle(tmp_path)
+    write_manifest_sha256(root)
+    manifest = root / "MANIFEST.sha256"
+    lines = manifest.read_text(encoding="utf-8").splitlines()
+
+    (root / "a.json").write_text("tampered", encoding="utf-8")
+    manifest.write_text("\n".join(lines + ["0" * 64 + "  gone.txt", "bogus"]) + "\n")
+    assert verify_manifest_sha256(root) == (False, "checksum mismatch: a.json")
+
+    write_manifest_sha256(root)
+    lines = manifest.read_text(encoding="utf-8").splitlines()
+    manifest.write_text("\n".join(lines + ["bogus"]) + "\n")
+    assert verify_manifest_sha256(root) == (False, "invalid manifest line: 'bogus'")
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import threading
+
+import pandas as pd
+import pytest
+
+from src.core.rate_limiter import RateLimiter
+from src.core.resilience import CircuitBreaker
+from src.data.backfill import BackfillRequest, OhlcvBackfillService, timeframe_to_ms
+from src.data.providers.kraken_ccxt_backend import KrakenCcxtBackend
+
+HOUR_MS = 3_600_000
+START_MS = 1_700_000_000_000 - (1_700_000_000_000 % HOUR_MS)
+
+
+class RateLimitExceeded(Exception):
+    """Same class name as ccxt's rate-limit error."""
+
+
+class ExchangeError(Exception):
+    """Same class name as ccxt's generic exchange error."""
+
+
+class FakeKrakenExchange:
+    """
+    ccxt-shaped fake emulating Kraken OHLC pagination: at most ``max_page`` bars
+    from ``since`` (inclusive), and a rate-limit error every ``rate_limit_every``-th call.
+    """
+
+    def __init__(self, bars: dict[str, int], *, max_page: int = 720, rate_limit_every: int = 0):
+        self.bars = bars
+        self.max_page = max_page
+        self.rate_limit_every = rate_limit_every
+        self.fail_symbols: set[str] = set()
+        self.calls: list[tuple[str, int]] = []
+        self._lock = threading.Lock()
+
+    def fetch_ohlcv(self, symbol, timeframe="1h", since=None, limit=None):
+        with self._lock:
+            self.calls.append((symbol, since))
+            n_calls = len(self.calls)
+        if self.rate_limit_every and n_calls % self.rate_limit_every == 0:
+            raise RateLimitExceeded("EAPI:Rate limit exceeded")
+        if symbol in self.fail_symbols:
+            raise ExchangeError("EGeneral:Internal error")
+        step = timeframe_to_ms(timeframe)
+        first = max(since or START_MS, START_MS)
+        first += (-(first - START_MS)) % step
+        end = START_MS + self.bars[symbol] * step
+        count = min(limit or self.max_page, self.max_page)
+        rows = []
+        ts = first
+        while ts < end and len(rows) < count:
+            price = 100.0 + (ts - START_MS) / step
+            rows.append([ts, price, price + 1, price - 1, price + 0.5, 1.0])
+            ts += step
+        return rows
+
+
+def _service(exchange, tmp_path, **kwargs) -> OhlcvBackfillService:
+    backend = KrakenCcxtBackend(enable_rate_limit=False)
+    backend._exchange_instance = exchange
+    kwargs.setdefault("rate_limiter", RateLimiter(max_requests=10_000, window_seconds=1.0))
+    kwargs.setdefault("sleep", lambda _s: None)
+    return OhlcvBackfillService(backend, tmp_path, **kwargs)
+
+
+def test_timeframe_to_ms():
+    assert timeframe_to_ms("1m") == 60_000
+    assert timeframe_to_ms("4h") == 4 * HOUR_MS
+    with pytest.raises(ValueError):
+        timeframe_to_ms("1M")
+
+
+def test_concurrent_paginated_backfill_writes_cache(tmp_path):
+    exchange = FakeKrakenExchange({"BTC/EUR": 250, "ETH/EUR": 130, "SOL/EUR": 7}, max_page=50)
+    service = _service(exchange, tmp_path, max_workers=3, page_limit=100)
+    end_ms = START_MS + 200 * HOUR_MS
+    report = service.run([BackfillRequest(s, "1h", START_MS, end_ms) for s in exchange.bars])
+
+    assert report.ok
+    rows = {r.symbol: r.rows for r in report.results}
+    assert rows == {"BTC/EUR": 200, "ETH/EUR": 130, "SOL/EUR": 7}
+    df = pd.read_parquet(tmp_path / "BTC_EUR_1h.parquet")
+    assert len(df) == 200
+    assert df.index.is_monotonic_increasing and df.index.is_unique
+    assert str(df.index.tz) == "UTC"
+    assert list(df.columns) == ["open", "high", "low", "close", "volume"]
+    # BTC: 200 bars at the exchange's 50-bar page cap -> 4 pages
+    assert sum(1 for s, _ in exchange.calls if s == "BTC/EUR") == 4
+    assert not (tmp_path / "backfill" / "BTC_EUR_1h").exists()
+
+
+def test_rate_limit_errors_are_retried_with_backoff(tmp_path):
+    exchange = FakeKrakenExchange({"BTC/EUR": 100, "ETH/EUR": 100}, max_page=20, rate_limit_every=3)
+    sleeps: list[float] = []
+    breaker = CircuitBreaker(failure_threshold=100, recovery_timeout=0.0)
+    service = _service(
+        exchange, tmp_path, sleep=sleeps.append, circuit_breaker=breaker, retry_base_delay=0.5
+    )
+    end_ms = START_MS + 100 * HOUR_MS
+    report = service.run([BackfillRequest(s, "1h", START_MS, end_ms) for s in exchange.bars])
+
+    assert report.ok, report.failed
+    assert all(r.rows == 100 for r in report.results)
+    assert 0.5 in sleeps
+    assert len(pd.read_parquet(tmp_path / "ETH_EUR_1h.parquet")) == 100
+
+
+def test_failed_symbol_resumes_from_last_page(tmp_path):
+    exchange = FakeKrakenExchange({"BTC/EUR": 90, "ETH/EUR": 90}, max_page=30)
+    service = _service(exchange, tmp_path, max_workers=1)
+    end_ms = START_MS + 90 * HOUR_MS
+    requests = [BackfillRequest(s, "1h", START_MS, end_ms) for s in ("BTC/EUR", "ETH/EUR")]
+
+    original = exchange.fetch_ohlcv
+
+    def flaky(symbol, timeframe="1h", since=None, limit=None):
+        if symbol == "ETH/EUR" and since is not None and since > START_MS + 59 * HOUR_MS:
+            raise ExchangeError("EGeneral:Internal error")
+        return original(symbol, timeframe, since, limit)
+
+    exchange.fetch_ohlcv = flaky
+    first = service.run(requests)
+    assert [r.status for r in first.results] == ["complete", "failed"]
+    assert first.results[1].rows == 60
+    assert service.load_state(requests[1]).next_since_ms == START_MS + 59 * HOUR_MS + 1
+
+    exchange.fetch_ohlcv = original
+    exchange.calls.clear()
+    second = _service(exchange, tmp_path, max_workers=1).run(requests)
+    assert second.ok
+    assert second.results[1].resumed and second.results[1].rows == 90
+    # Completed symbol is not refetched; ETH continues from its cursor.
+    assert exchange.calls == [("ETH/EUR", START_MS + 59 * HOUR_MS + 1)]
+    df = pd.read_parquet(tmp_path / "ETH_EUR_1h.parquet")
+    assert len(df) == 90 and df.index.is_unique
+
+
+def test_non_retryable_error_fails_without_retry(tmp_path):
+    exchange = FakeKrakenExchange({"BTC/EUR": 10})
+    exchange.fail_symbols.add("BTC/EUR")
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=3600.0)
+    service = _service(exchange, tmp_path, circuit_breaker=breaker, max_retries=3)
+    report = service.run([BackfillRequest("BTC/EUR", "1h", START_MS, START_MS + 10 * HOUR_MS)])
+    assert not report.ok
+    assert "ExchangeError" in report.failed[0].error
+    assert len(exchange.calls) == 1
+
+
+def test_merge_keeps_existing_cache_rows(tmp_path):
+    exchange = FakeKrakenExchange({"BTC/EUR": 20})
+    service = _service(exchange, tmp_path)
+    service.run([BackfillRequest("BTC/EUR", "1h", START_MS, START_MS + 10 * HOUR_MS)])
+    service.run([BackfillRequest("BTC/EUR", "1h", START_MS + 5 * HOUR_MS, START_MS + 20 * HOUR_MS)])
+    df = pd.read_parquet(tmp_path / "BTC_EUR_1h.parquet")
+    assert len(df) == 20 and df.index.is_monotonic_increasing
+
+
+def test_page_without_new_bars_is_not_reported_complete(tmp_path):
+    exchange = FakeKrakenExchange({"BTC/EUR": 90}, max_page=30)
+    original = exchange.fetch_ohlcv
+
+    def stuck(symbol, timeframe="1h", since=None, limit=None):
+        # Ignores ``since`` and keeps serving the first page.
+        return original(symbol, timeframe, START_MS, limit)
+
+    exchange.fetch_ohlcv = stuck
+    service = _service(exchange, tmp_path)
+    request = BackfillRequest("BTC/EUR", "1h", START_MS, START_MS + 90 * HOUR_MS)
+    report = service.run([request])
+
+    assert not report.ok
+    assert report.failed[0].rows == 30
+    assert "did not advance" in report.failed[0].error
+    state = service.load_state(request)
+    assert not state.done and state.next_since_ms == START_MS + 29 * HOUR_MS + 1
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import random
+from decimal import Decimal
+
+import pytest
+
+from src.execution.ledger import (
+    CrossCheckLedgerEngine,
+    FixedPointLedgerEngine,
+    LedgerCrossCheckError,
+    LegacyLedgerEngine,
+    QuantizationPolicy,
+    make_replay_ledger_engine,
+)
+from src.execution.ledger.engine_fixed_point import (
+    legacy_positions_as_strings,
+    to_scaled,
+)
+from src.execution.replay_pack.runner import _replay_events
+
+
+def _fill(i: int, side: str, qty: str, price: str, fee: str = "0", symbol: str = "BTC/EUR"):
+    return {
+        "schema_version": "BETA_EXEC_V1",
+        "event_id": f"evt_{i:06d}",
+        "run_id": "r",
+        "session_id": "s",
+        "intent_id": f"i{i}",
+        "symbol": symbol,
+        "event_type": "FILL",
+        "ts_sim": i,
+        "payload": {"side": side, "quantity": qty, "price": price, "fee": fee},
+    }
+
+
+def _state(eng_dec: LegacyLedgerEngine, eng_fix: FixedPointLedgerEngine):
+    acc_dec = {k: str(v) for k, v in sorted(eng_dec.state.accounts.items())}
+    return (
+        (legacy_positions_as_strings(eng_dec), acc_dec),
+        (eng_fix.positions_as_strings(), eng_fix.accounts_as_strings()),
+    )
+
+
+@pytest.mark.parametrize(
+    "raw",
+    ["1", "0.1", "0.123456785", "-0.123456785", "12.000000004", "7.", ".5", "1E+2", " 3.5 "],
+)
+def test_to_scaled_matches_decimal_quantize(raw):
+    expected = Decimal(raw).quantize(Decimal("0.00000001"), rounding="ROUND_HALF_UP")
+    assert to_scaled(raw, 8) == int(expected.scaleb(8))
+
+
+def test_to_scaled_rejects_float():
+    with pytest.raises(TypeError):
+        to_scaled(1.5, 8)
+
+
+def test_fixed_point_rejects_non_power_of_ten_policy():
+    with pytest.raises(ValueError):
+        FixedPointLedgerEngine(
+            quote_currency="EUR", policy=QuantizationPolicy(price_quant=Decimal("0.05"))
+        )
+
+
+def test_string_formatting_matches_legacy_for_flat_and_flip():
+    events = [
+        _fill(1, "BUY", "1", "100", "0.1"),
+        _fill(2, "SELL", "1", "101", "0.1"),  # flat -> literal zero
+        _fill(3, "SELL", "0.5", "99.5"),  # open short
+        _fill(4, "BUY", "1.25", "98.00000001"),  # flip long
+    ]
+    dec = LegacyLedgerEngine(quote_currency="EUR")
+    fix = FixedPointLedgerEngine(quote_currency="EUR")
+    for ev in events:
+        dec.apply(ev)
+        fix.apply(ev)
+        got_dec, got_fix = _state(dec, fix)
+        assert got_dec == got_fix
+
+
+def test_randomized_parity_with_decimal_engine():
+    rng = random.Random(20260118)
+    dec = LegacyLedgerEngine(quote_currency="EUR")
+    fix = FixedPointLedgerEngine(quote_currency="EUR")
+    symbols = ["BTC/EUR", "ETH/EUR"]
+    for i in range(1, 1500):
+        qty = f"{rng.randint(0, 5)}.{rng.randint(0, 10**9 - 1):09d}"
+        price = f"{rng.randint(1, 90000)}.{rng.randint(0, 10**9 - 1):09d}"
+        fee = f"0.{rng.randint(0, 10**6):06d}"
+        ev = _fill(i, rng.choice(["BUY", "SELL"]), qty, price, fee, rng.choice(symbols))
+        err_dec = err_fix = None
+        try:
+            dec.apply(ev)
+        except AssertionError as ex:
+            err_dec = ex
+        try:
+            fix.apply(ev)
+        except AssertionError as ex:
+            err_fix = ex
+        assert (err_dec is None) == (err_fix is None), ev
+        got_dec, got_fix = _state(dec, fix)
+        assert got_dec == got_fix, ev
+
+
+def test_fixed_point_rejects_duplicate_conflict_and_non_monotonic():
+    fix = FixedPointLedgerEngine(quote_currency="EUR")
+    ev = _fill(5, "BUY", "1", "100")
+    fix.apply(ev)
+    fix.apply(dict(ev))  # identical duplicate is a no-op
+    with pytest.raises(ValueError, match="Conflicting duplicate"):
+        fix.apply({**ev, "payload": {**ev["payload"], "price": "101"}})
+    with pytest.raises(ValueError, match="Non-monotonic"):
+        fix.apply(_fill(4, "BUY", "1", "100"))
+
+
+def test_cross_check_engine_detects_divergence(monkeypatch):
+    eng = CrossCheckLedgerEngine(quote_currency="EUR")
+    eng.apply(_fill(1, "BUY", "1", "100"))
+    assert eng.events_checked == 1
+    eng.fixed.positions["BTC/EUR"].fees += 1
+    with pytest.raises(LedgerCrossCheckError):
+        eng.apply(_fill(2, "BUY", "1", "100"))
+
+
+def test_make_replay_ledger_engine_unknown_backend():
+    with pytest.raises(ValueError):
+        make_replay_ledger_engine("float", quote_currency="EUR")
+
+
+def test_replay_events_backends_produce_identical_results():
+    events = [
+        _fill(i, "BUY" if i % 3 else "SELL", "0.01000000", f"{50000 + i}.5") for i in range(1, 60)
+    ]
+    results = {
+        backend: _replay_events(events, ledger_backend=backend)
+        for backend in ("decimal", "fixed_point", "cross_check")
+    }
+    assert results["decimal"] == results["fixed_point"] == results["cross_check"]
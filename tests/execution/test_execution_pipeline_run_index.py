@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+from src.execution_pipeline.store import JsonlExecutionRunStore
+
+FILENAME = "execution_pipeline_events_v0.jsonl"
+
+
+def _ev(run_id: str, ts: str | None, event_type: str, corr: str = "corr") -> str:
+    return (
+        json.dumps(
+            {
+                "schema": "execution_event_v0",
+                "run_id": run_id,
+                "correlation_id": corr,
+                "ts": ts,
+                "event_type": event_type,
+            },
+            sort_keys=True,
+        )
+        + "\n"
+    )
+
+
+def _seed_lines() -> list[str]:
+    return [
+        _ev("run_a", "2026-01-01T00:00:02", "created", corr="a1"),
+        _ev("run_b", "2026-01-01T00:00:01", "created", corr="b1"),
+        "not json\n",
+        json.dumps({"schema": "other", "run_id": "run_a"}) + "\n",
+        _ev("run_a", "2026-01-01T00:00:01", "validated", corr="a0"),
+        _ev("run_a", "2026-01-01T00:00:01", "submitted", corr="a_tie"),
+        _ev("run_b", "2026-01-01T00:00:05", "failed"),
+        _ev("run_a", "2026-01-01T00:00:09", "filled"),
+        _ev("run_a", "2026-01-01T00:00:09", "filled", corr="late_tie"),
+        _ev("", "2026-01-01T00:00:10", "created"),
+        _ev("run_c", None, "canceled", corr="c_none"),
+    ]
+
+
+def _stores(root: Path) -> tuple[JsonlExecutionRunStore, JsonlExecutionRunStore]:
+    indexed = JsonlExecutionRunStore(root=root, filename=FILENAME)
+    scan = JsonlExecutionRunStore(root=root, filename=FILENAME, use_index=False)
+    return indexed, scan
+
+
+def _assert_parity(root: Path, run_ids: list[str]) -> None:
+    indexed, scan = _stores(root)
+    assert [asdict(s) for s in indexed.list_runs()] == [asdict(s) for s in scan.list_runs()]
+    assert [asdict(s) for s in indexed.list_runs(limit=1)] == [
+        asdict(s) for s in scan.list_runs(limit=1)
+    ]
+    for rid in run_ids:
+        assert indexed.get_run(rid) == scan.get_run(rid)
+        assert indexed.get_run(rid, limit=2) == scan.get_run(rid, limit=2)
+
+
+def test_index_matches_full_scan_and_is_persisted(tmp_path: Path) -> None:
+    (tmp_path / FILENAME).write_text("".join(_seed_lines()), encoding="utf-8")
+
+    _assert_parity(tmp_path, ["run_a", "run_b", "run_c", "missing", ""])
+
+    store = JsonlExecutionRunStore(root=tmp_path, filename=FILENAME)
+    assert store.index_path.exists()
+    payload = json.loads(store.index_path.read_text(encoding="utf-8"))
+    assert payload["schema"] == "execution_run_index_v0"
+    assert payload["indexed_bytes"] == (tmp_path / FILENAME).stat().st_size
+    assert len(payload["runs"]["run_a"]["offsets"]) == 5
+
+    summaries = {s.run_id: s for s in store.list_runs()}
+    assert summaries["run_a"].correlation_id == "a0"
+    assert summaries["run_a"].status == "success"
+    assert summaries["run_b"].status == "failed"
+    assert summaries["run_c"].status == "canceled"
+
+
+def test_appends_and_partial_trailing_line_are_caught_up(tmp_path: Path) -> None:
+    log = tmp_path / FILENAME
+    log.write_text("".join(_seed_lines()), encoding="utf-8")
+    store = JsonlExecutionRunStore(root=tmp_path, filename=FILENAME)
+    assert store.get_run("run_d")["count"] == 0
+
+    partial = _ev("run_d", "2026-01-01T00:01:00", "created")
+    with log.open("a", encoding="utf-8") as f:
+        f.write(_ev("run_b", "2026-01-01T00:00:30", "filled"))
+        f.write(partial[:20])
+
+    assert store.get_run("run_d")["count"] == 0
+    assert store._index is not None and store._index.indexed_bytes < log.stat().st_size
+    _assert_parity(tmp_path, ["run_b", "run_d"])
+
+    with log.open("a", encoding="utf-8") as f:
+        f.write(partial[20:])
+
+    assert store.get_run("run_d")["count"] == 1
+    assert store.list_runs()[0].run_id == "run_d"
+    _assert_parity(tmp_path, ["run_a", "run_b", "run_d"])
+
+
+def test_rewritten_or_truncated_file_triggers_rebuild(tmp_path: Path) -> None:
+    log = tmp_path / FILENAME
+    log.write_text("".join(_seed_lines()), encoding="utf-8")
+    store = JsonlExecutionRunStore(root=tmp_path, filename=FILENAME)
+    assert {s.run_id for s in store.list_runs()} == {"run_a", "run_b", "run_c"}
+
+    # Same size, different content: head fingerprint mismatch.
+    log.write_text(log.read_text(encoding="utf-8").replace("run_a", "run_z"), encoding="utf-8")
+    fresh = JsonlExecutionRunStore(root=tmp_path, filename=FILENAME)
+    assert {s.run_id for s in fresh.list_runs()} == {"run_z", "run_b", "run_c"}
+
+    log.write_text(_ev("run_x", "2026-02-01T00:00:00", "created"), encoding="utf-8")
+    assert [s.run_id for s in store.list_runs()] == ["run_x"]
+    _assert_parity(tmp_path, ["run_x", "run_z"])
+
+    log.unlink()
+    assert store.list_runs() == []
+    assert store.get_run("run_x")["summary"] is None
+
+
+def test_corrupt_index_is_ignored_and_rebuild_index(tmp_path: Path) -> None:
+    (tmp_path / FILENAME).write_text("".join(_seed_lines()), encoding="utf-8")
+    store = JsonlExecutionRunStore(root=tmp_path, filename=FILENAME)
+    store.index_path.write_text("{broken", encoding="utf-8")
+
+    assert len(store.list_runs()) == 3
+    rebuilt = store.rebuild_index()
+    assert rebuilt is not None and set(rebuilt.runs) == {"run_a", "run_b", "run_c", ""}
+    assert json.loads(store.index_path.read_text(encoding="utf-8"))["runs"]
+
+    assert JsonlExecutionRunStore(root=tmp_path / "nope", filename=FILENAME).rebuild_index() is None
+
+
+@pytest.mark.skipif(
+    hasattr(os, "geteuid") and os.geteuid() == 0, reason="root ignores dir permissions"
+)
+def test_read_only_directory_keeps_index_in_memory(tmp_path: Path) -> None:
+    (tmp_path / FILENAME).write_text("".join(_seed_lines()), encoding="utf-8")
+    tmp_path.chmod(0o555)
+    try:
+        store = JsonlExecutionRunStore(root=tmp_path, filename=FILENAME)
+        assert len(store.list_runs()) == 3
+        assert not store.index_path.exists()
+    finally:
+        tmp_path.chmod(0o755)
+
+
+def test_persist_index_disabled_writes_no_sidecar(tmp_path: Path) -> None:
+    (tmp_path / FILENAME).write_text("".join(_seed_lines()), encoding="utf-8")
+    store = JsonlExecutionRunStore(root=tmp_path, filename=FILENAME, persist_index=False)
+    assert store.get_run("run_a")["count"] == 5
+    assert not store.index_path.exists()
+
+
+def test_unchanged_file_does_not_rewrite_index(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    log = tmp_path / FILENAME
+    log.write_text("".join(_seed_lines()), encoding="utf-8")
+    JsonlExecutionRunStore(root=tmp_path, filename=FILENAME).list_runs()
+
+    saves: list[int] = []
+    original = JsonlExecutionRunStore._save_index
+
+    def counting_save(self: JsonlExecutionRunStore, index) -> None:
+        saves.append(index.indexed_bytes)
+        original(self, index)
+
+    monkeypatch.setattr(JsonlExecutionRunStore, "_save_index", counting_save)
+    for _ in range(3):
+        store = JsonlExecutionRunStore(root=tmp_path, filename=FILENAME)
+        store.list_runs()
+        store.get_run("run_a")
+    assert saves == []
+
+    with log.open("a", encoding="utf-8") as f:
+        f.write(_ev("run_b", "2026-01-01T00:00:30", "filled"))
+    store.list_runs()
+    assert saves == [log.stat().st_size]
+
+
+def test_index_tracks_file_wide_aggregates(tmp_path: Path) -> None:
+    lines = _seed_lines() + [
+        json.dumps({"schema": "execution_event_v0", "run_id": "run_d", "ts": "bad"}) + "\n",
+        json.dumps(
+            {
+                "schema": "execution_event_v0",
+                "run_id": "run_d",
+                "ts_utc": "2026-01-01T02:00:00+02:00",
+            }
+        )
+        + "\n",
+        "\n",
+    ]
+    (tmp_path / FILENAME).write_text("".join(lines), encoding="utf-8")
+    store = JsonlExecutionRunStore(root=tmp_path, filename=FILENAME)
+    index = store.run_index()
+    assert index is not None
+    assert index.malformed_lines == 1
+    # Seed timestamps are naive (not strict UTC) and count as timestamp errors.
+    assert index.runs["run_a"].ts_errors == 5
+    assert index.runs["run_a"].max_utc is None
+    assert index.runs["run_d"].ts_errors == 1
+    assert index.runs["run_d"].max_utc == "2026-01-01T00:00:00.000000+00:00"
+    assert [ev["ts"] for _, ev in store.read_run_events("run_b")] == [
+        "2026-01-01T00:00:01",
+        "2026-01-01T00:00:05",
+    ]
+
+    reloaded = JsonlExecutionRunStore(root=tmp_path, filename=FILENAME).run_index()
+    assert reloaded == index
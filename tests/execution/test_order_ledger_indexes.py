@@ -0,0 +1,139 @@
+"""
+OrderLedger secondary indexes: results must equal a full scan over all orders.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from decimal import Decimal
+
+import pytest
+
+from src.execution.contracts import Order, OrderSide, OrderState
+from src.execution.order_ledger import OrderLedger
+
+
+def _order(i: int, symbol: str = "BTC/EUR", state: OrderState = OrderState.CREATED) -> Order:
+    return Order(
+        client_order_id=f"coid_{i:06d}",
+        symbol=symbol,
+        side=OrderSide.BUY,
+        quantity=Decimal("1"),
+        state=state,
+    )
+
+
+def _scan_state(ledger: OrderLedger, state: OrderState):
+    return [o for o in ledger.get_all_orders() if o.state == state]
+
+
+def _scan_counts(ledger: OrderLedger):
+    counts = {}
+    for o in ledger.get_all_orders():
+        counts[o.state] = counts.get(o.state, 0) + 1
+    return counts
+
+
+def test_indexes_match_scan_after_random_transitions():
+    rng = random.Random(7)
+    ledger = OrderLedger()
+    symbols = ["BTC/EUR", "ETH/EUR", "SOL/EUR"]
+    states = list(OrderState)
+    for i in range(400):
+        ledger.add_order(_order(i, rng.choice(symbols)))
+    for step in range(2000):
+        order = ledger.get_order(f"coid_{rng.randrange(400):06d}")
+        order.state = rng.choice(states)  # in-place mutation, as in PaperExecutionEngine
+        if step % 97 == 0:
+            order.symbol = rng.choice(symbols)
+        if step % 5 == 0:
+            order.exchange_order_id = f"ex_{order.client_order_id}"
+        ledger.update_order(order)
+
+    for state in states:
+        assert ledger.get_orders_by_state(state) == _scan_state(ledger, state)
+    for sym in symbols:
+        assert ledger.get_orders_by_symbol(sym) == [
+            o for o in ledger.get_all_orders() if o.symbol == sym
+        ]
+    assert ledger.get_active_orders() == [o for o in ledger.get_all_orders() if o.state.is_active()]
+    assert ledger.get_active_count() == len(ledger.get_active_orders())
+    assert ledger.get_state_counts() == _scan_counts(ledger)
+    assert ledger.to_dict()["active_orders"] == ledger.get_active_count()
+
+
+def test_exchange_id_indexed_on_add_and_update():
+    ledger = OrderLedger()
+    pre_acked = _order(1)
+    pre_acked.exchange_order_id = "ex_1"
+    ledger.add_order(pre_acked)
+    assert ledger.get_order_by_exchange_id("ex_1") is pre_acked
+
+    o = _order(2)
+    ledger.add_order(o)
+    assert ledger.get_order_by_exchange_id("ex_2") is None
+    o.exchange_order_id = "ex_2"
+    ledger.update_order(o, event="ORDER_ACKED")
+    assert ledger.get_order_by_exchange_id("ex_2") is o
+
+
+def test_compact_history_roundtrip():
+    ledger = OrderLedger()
+    o = _order(1)
+    ledger.add_order(o)
+    o.state = OrderState.SUBMITTED
+    ledger.update_order(o, event="ORDER_SUBMITTED")
+    o.state = OrderState.FILLED
+    ledger.update_order(o, event="ORDER_FILLED")
+
+    history = ledger.get_order_history(o.client_order_id)
+    assert [h.event for h in history] == ["ORDER_CREATED", "ORDER_SUBMITTED", "ORDER_FILLED"]
+    assert [h.state for h in history] == [
+        OrderState.CREATED,
+        OrderState.SUBMITTED,
+        OrderState.FILLED,
+    ]
+    assert history[1].snapshot["state"] == OrderState.SUBMITTED
+    assert history[0].timestamp <= history[2].timestamp
+    assert ledger.get_history_length(o.client_order_id) == 3
+    assert ledger.get_order_history("missing") == []
+
+
+def test_reindex_recovers_untracked_mutation():
+    ledger = OrderLedger()
+    o = _order(1)
+    ledger.add_order(o)
+    o.state = OrderState.SUBMITTED  # no update_order call
+    assert ledger.get_active_orders() == []
+    ledger.reindex()
+    assert ledger.get_active_orders() == [o]
+    assert ledger.get_state_counts() == {OrderState.SUBMITTED: 1}
+
+
+@pytest.mark.data_perf
+def test_benchmark_indexed_queries_do_not_scale_with_ledger_size():
+    """Query cost depends on the result size k, not on the number of orders."""
+
+    def _build(n: int) -> OrderLedger:
+        ledger = OrderLedger()
+        for i in range(n):
+            ledger.add_order(_order(i, state=OrderState.FILLED))
+        for i in range(10):
+            o = _order(n + i, symbol="ETH/EUR", state=OrderState.SUBMITTED)
+            ledger.add_order(o)
+        return ledger
+
+    def _time_queries(ledger: OrderLedger) -> float:
+        t0 = time.perf_counter()
+        for _ in range(2000):
+            ledger.get_active_orders()
+            ledger.get_orders_by_state(OrderState.SUBMITTED)
+            ledger.get_orders_by_symbol("ETH/EUR")
+            ledger.get_state_counts()
+        return time.perf_counter() - t0
+
+    small = _time_queries(_build(100))
+    large = _time_queries(_build(20_000))
+    # Full scans would be ~200x slower; allow generous noise.
+    assert large < small * 10 + 0.05
@@ -0,0 +1,247 @@
+"""
+Batch execution parity: vectorized paths must match the scalar per-order paths.
+"""
+
+import random
+import time
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from src.execution.contracts import Order, OrderSide, OrderType
+from src.execution.paper.broker import FillSimulationConfig, PaperBroker
+from src.execution.paper.engine import ExecutionConfig, PaperExecutionEngine
+from src.execution.venue_adapters.batch import simulate_fills
+from src.execution.venue_adapters.fill_models import (
+    DepthAwareFillModel,
+    FixedFeeModel,
+    FixedSlippageModel,
+    ImmediateFillModel,
+    OrderArrays,
+    OrderBookDepth,
+    quantize_e8_guarded,
+)
+from src.execution.venue_adapters.simulated import SimulatedVenueAdapter
+
+PRICES = {
+    "BTC/EUR": Decimal("50000.00"),
+    "ETH/EUR": Decimal("3000.123"),
+    "SOL/EUR": Decimal("101.5"),
+}
+
+
+def _random_orders(n: int, seed: int = 11):
+    rng = random.Random(seed)
+    orders = []
+    for i in range(n):
+        symbol = rng.choice(list(PRICES) + ["XRP/EUR"])  # XRP/EUR → unknown symbol
+        order_type = rng.choice([OrderType.MARKET, OrderType.LIMIT])
+        ref = PRICES.get(symbol, Decimal("1"))
+        price = None
+        if order_type == OrderType.LIMIT:
+            price = (ref * Decimal(rng.randint(990, 1010)) / Decimal(1000)).quantize(
+                Decimal("0.0001")
+            )
+        qty = Decimal(rng.randint(0, 5000)) / Decimal(1000)  # includes zero qty
+        orders.append(
+            Order(
+                client_order_id=f"o{i}",
+                symbol=symbol,
+                side=rng.choice([OrderSide.BUY, OrderSide.SELL]),
+                order_type=order_type,
+                quantity=qty,
+                price=price,
+            )
+        )
+    return orders
+
+
+def _event_view(e):
+    fill = e.fill
+    return (
+        e.event_type,
+        e.order_id,
+        e.exchange_order_id,
+        e.reject_reason,
+        None if fill is None else (fill.quantity, fill.price, fill.fee, fill.fee_currency),
+    )
+
+
+def _depth_model():
+    return DepthAwareFillModel(
+        {
+            "BTC/EUR": OrderBookDepth(
+                bids=(
+                    (Decimal("49999"), Decimal("1.5")),
+                    (Decimal("49990.5"), Decimal("2")),
+                ),
+                asks=(
+                    (Decimal("50001"), Decimal("1")),
+                    (Decimal("50003.25"), Decimal("1.5")),
+                    (Decimal("50010"), Decimal("0.5")),
+                ),
+            ),
+            "SOL/EUR": OrderBookDepth(asks=((Decimal("101.6"), Decimal("100")),)),
+        }
+    )
+
+
+@pytest.mark.parametrize("fill_model_factory", [ImmediateFillModel, _depth_model])
+def test_execute_orders_matches_scalar_path(fill_model_factory):
+    orders = _random_orders(600)
+    keys = [f"k{i % 550}" for i in range(len(orders))]  # includes in-batch duplicates
+
+    scalar = SimulatedVenueAdapter(market_prices=dict(PRICES), fill_model=fill_model_factory())
+    batch = SimulatedVenueAdapter(market_prices=dict(PRICES), fill_model=fill_model_factory())
+
+    expected = [_event_view(scalar.execute_order(o, k)) for o, k in zip(orders, keys)]
+    got = [_event_view(e) for e in batch.execute_orders(orders, keys)]
+    assert got == expected
+
+    # Idempotency cache is shared with the scalar API.
+    again = batch.execute_orders(orders[:3], keys[:3])
+    assert [_event_view(e) for e in again] == expected[:3]
+
+
+def test_execute_orders_ack_only_mode():
+    adapter = SimulatedVenueAdapter(market_prices=dict(PRICES), enable_fills=False)
+    events = adapter.execute_orders(_random_orders(20), [f"k{i}" for i in range(20)])
+    assert {e.event_type for e in events} <= {"ACK", "REJECT"}
+
+
+def test_quantize_e8_guarded_uses_exact_path_for_ties():
+    calls = []
+
+    def exact(i):
+        calls.append(i)
+        return Decimal("0.00000002")
+
+    out, exact_rows = quantize_e8_guarded(np.array([0.000000015, 1.25]), exact)
+    assert calls == [0]
+    assert out.tolist() == [2, 125_000_000]
+    assert exact_rows.tolist() == [True, False]
+
+
+@pytest.mark.parametrize("fill_model_factory", [ImmediateFillModel, _depth_model])
+def test_simulate_fills_arrays_match_scalar_models(fill_model_factory):
+    orders = [o for o in _random_orders(2000, seed=3) if o.symbol in PRICES and o.quantity > 0]
+    fill_model = fill_model_factory()
+    fee_model = FixedFeeModel(fee_rate=Decimal("0.00075"))
+    slip = FixedSlippageModel(slippage_bps=7)
+    market = np.array([float(PRICES[o.symbol]) for o in orders])
+
+    res = simulate_fills(
+        OrderArrays.from_orders(orders),
+        market,
+        fill_model=fill_model,
+        fee_model=fee_model,
+        slippage_model=slip,
+    )
+    prices = res.fill_prices_decimal()
+    fees = res.fees_decimal()
+    for i, o in enumerate(orders):
+        try:
+            expected = fill_model.calculate_fill_price(o, PRICES[o.symbol], 7)
+        except ValueError:
+            assert not res.filled[i]
+            assert res.errors[i].startswith("Insufficient book depth")
+            continue
+        assert res.filled[i]
+        assert prices[i] == expected
+        assert str(prices[i]) == str(expected)
+        assert fees[i] == fee_model.calculate_fee(o.quantity, expected)
+    assert res.fill_price[res.filled].dtype == np.float64
+
+
+def test_depth_model_walks_levels_and_rejects_insufficient_depth():
+    model = _depth_model()
+    order = Order(client_order_id="a", symbol="BTC/EUR", side=OrderSide.BUY, quantity=Decimal("2"))
+    filled, vwap = model.calculate_fill(order, PRICES["BTC/EUR"])
+    assert filled == Decimal("2")
+    assert vwap == (Decimal("50001") + Decimal("50003.25")) / 2
+
+    big = Order(client_order_id="b", symbol="BTC/EUR", side=OrderSide.BUY, quantity=Decimal("5"))
+    assert model.calculate_fill(big, PRICES["BTC/EUR"])[0] == Decimal("3")
+    with pytest.raises(ValueError, match="Insufficient book depth"):
+        model.calculate_fill_price(big, PRICES["BTC/EUR"])
+    _, ok = model.fill_prices_array(
+        OrderArrays.from_orders([order, big]),
+        np.array([50000.0, 50000.0]),
+        np.zeros(2, dtype=np.int64),
+    )
+    assert ok.tolist() == [True, False]
+
+
+def _broker_view(results):
+    return [
+        (state, [(f.quantity, f.price, f.fee, f.metadata) for f in fills])
+        for state, fills in results
+    ]
+
+
+@pytest.mark.parametrize("partial_fill_prob", [0.0, 0.5])
+def test_paper_broker_submit_orders_matches_scalar(partial_fill_prob):
+    orders = [o for o in _random_orders(300) if o.symbol in PRICES]
+    prices = [PRICES[o.symbol] for o in orders]
+    cfg = FillSimulationConfig(
+        slippage_bps=Decimal("7"), fee_bps=Decimal("12"), partial_fill_prob=partial_fill_prob
+    )
+    scalar = PaperBroker(cfg)
+    batch = PaperBroker(cfg)
+    expected = [scalar.submit_order(o, p) for o, p in zip(orders, prices)]
+    assert _broker_view(batch.submit_orders(orders, prices)) == _broker_view(expected)
+    assert batch.get_stats() == scalar.get_stats()
+
+
+def test_paper_engine_submit_orders_matches_scalar():
+    requests = [
+        dict(
+            symbol=o.symbol,
+            side=o.side,
+            quantity=o.quantity,
+            order_type=o.order_type,
+            price=o.price,
+            client_order_id=o.client_order_id,
+        )
+        for o in _random_orders(200)
+    ]
+    engines = []
+    for _ in range(2):
+        eng = PaperExecutionEngine(ExecutionConfig(session_id="s", strategy_id="t"))
+        for sym, px in PRICES.items():
+            eng.update_market_price(sym, px)
+        engines.append(eng)
+
+    scalar_out = [engines[0].submit_order(**r) for r in requests]
+    batch_out = engines[1].submit_orders(requests)
+
+    assert [(o.state, len(f)) for o, f in batch_out] == [(o.state, len(f)) for o, f in scalar_out]
+    assert engines[1].get_stats() == engines[0].get_stats()
+    assert engines[1].order_ledger.get_state_counts() == engines[0].order_ledger.get_state_counts()
+
+
+@pytest.mark.data_perf
+def test_benchmark_array_simulation_faster_than_scalar_models():
+    orders = [o for o in _random_orders(50_000, seed=5) if o.symbol in PRICES]
+    fill_model, fee_model = ImmediateFillModel(), FixedFeeModel()
+    arrays = OrderArrays.from_orders(orders)
+    market = np.array([float(PRICES[o.symbol]) for o in orders])
+
+    t0 = time.perf_counter()
+    for o in orders:
+        price = fill_model.calculate_fill_price(o, PRICES[o.symbol], 5)
+        fee_model.calculate_fee(o.quantity, price)
+    t_scalar = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    simulate_fills(
+        arrays,
+        market,
+        fill_model=fill_model,
+        fee_model=fee_model,
+        slippage_model=FixedSlippageModel(),
+    )
+    t_batch = time.perf_counter() - t0
+
+    assert t_batch * 3 < t_scalar
@@ -0,0 +1,193 @@
+"""Offline feature store v1 tests (partitioning, lineage, incremental, as-of)."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features.canonical_feature_data_contract_layer_v1.catalog_v1 import catalog_entry
+from src.features.canonical_feature_data_contract_layer_v1.constants_v1 import I25_FEATURE_ID
+from src.features.canonical_feature_data_contract_layer_v1.lineage_v1 import (
+    digest_mapping,
+    lineage_sha256,
+)
+from src.features.offline_feature_store_v1 import (
+    LOG_RETURN_V1,
+    VOLATILITY_ESTIMATE_V1,
+    FeatureDefinitionV1,
+    FeatureStoreBindingV1,
+    OfflineFeatureStoreError,
+    OfflineFeatureStoreV1,
+    materialize_and_join_v1,
+)
+from src.research.linear_evidence import (
+    build_feature_matrix_binding_from_frame,
+    build_feature_matrix_binding_from_store,
+)
+
+
+def _bars(n: int = 200, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2026-01-01", periods=n, freq="1min", tz="UTC")
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, n)))
+    return pd.DataFrame({"open": close, "high": close, "low": close, "close": close}, index=index)
+
+
+def test_full_and_incremental_materialization_match(tmp_path) -> None:
+    bars = _bars()
+    full = OfflineFeatureStoreV1(tmp_path / "full")
+    full.materialize(VOLATILITY_ESTIMATE_V1, bars, symbol="BTC/EUR", timeframe="1m")
+
+    inc = OfflineFeatureStoreV1(tmp_path / "inc")
+    first = inc.materialize(
+        VOLATILITY_ESTIMATE_V1, bars.iloc[:120], symbol="BTC/EUR", timeframe="1m"
+    )
+    second = inc.materialize(VOLATILITY_ESTIMATE_V1, bars, symbol="BTC/EUR", timeframe="1m")
+    again = inc.materialize(VOLATILITY_ESTIMATE_V1, bars, symbol="BTC/EUR", timeframe="1m")
+
+    assert (first.rows_written, second.rows_written, again.rows_written) == (120, 80, 0)
+    assert second.part_file == "part-00001.parquet"
+    assert again.lineage_sha256 == second.lineage_sha256 != first.lineage_sha256
+    part_dir = inc.partition_dir(second.key)
+    assert part_dir.relative_to(inc.root).as_posix() == (
+        "volatility_estimate/version=v1/symbol=BTC-EUR/timeframe=1m"
+    )
+
+    expected = full.read(VOLATILITY_ESTIMATE_V1, symbol="BTC/EUR", timeframe="1m")
+    got = inc.read(VOLATILITY_ESTIMATE_V1, symbol="BTC/EUR", timeframe="1m")
+    pd.testing.assert_frame_equal(got, expected, check_freq=False)
+    assert got["volatility_estimate"].isna().sum() == 60
+    reference = np.log(bars["close"]).diff().rolling(60, min_periods=60).std(ddof=0)
+    np.testing.assert_allclose(got["volatility_estimate"], reference, equal_nan=True)
+
+
+def test_short_partition_extends_from_full_history(tmp_path) -> None:
+    bars = _bars()
+    store = OfflineFeatureStoreV1(tmp_path)
+    # Fewer bars than the 60-bar lookback: later appends pass the full history from bar 0
+    store.materialize(VOLATILITY_ESTIMATE_V1, bars.iloc[:50], symbol="BTC/EUR", timeframe="1m")
+    store.materialize(VOLATILITY_ESTIMATE_V1, bars.iloc[:51], symbol="BTC/EUR", timeframe="1m")
+    store.materialize(VOLATILITY_ESTIMATE_V1, bars, symbol="BTC/EUR", timeframe="1m")
+
+    full = OfflineFeatureStoreV1(tmp_path / "full")
+    full.materialize(VOLATILITY_ESTIMATE_V1, bars, symbol="BTC/EUR", timeframe="1m")
+    pd.testing.assert_frame_equal(
+        store.read(VOLATILITY_ESTIMATE_V1, symbol="BTC/EUR", timeframe="1m"),
+        full.read(VOLATILITY_ESTIMATE_V1, symbol="BTC/EUR", timeframe="1m"),
+        check_freq=False,
+    )
+
+    # Without the partition's first bar the context is still insufficient
+    store.materialize(VOLATILITY_ESTIMATE_V1, bars.iloc[:50], symbol="ETH/EUR", timeframe="1m")
+    with pytest.raises(OfflineFeatureStoreError, match="insufficient_lookback_context"):
+        store.materialize(VOLATILITY_ESTIMATE_V1, bars.iloc[5:55], symbol="ETH/EUR", timeframe="1m")
+
+
+def test_partition_manifest_records_catalog_lineage(tmp_path) -> None:
+    store = OfflineFeatureStoreV1(tmp_path)
+    result = store.materialize(VOLATILITY_ESTIMATE_V1, _bars(), symbol="ETH/EUR", timeframe="1m")
+    manifest = store.describe(VOLATILITY_ESTIMATE_V1, symbol="ETH/EUR", timeframe="1m")
+
+    assert manifest["schema_id"] == catalog_entry(I25_FEATURE_ID).schema_id
+    assert manifest["lineage_sha256"] == result.lineage_sha256
+    assert manifest["lineage_sha256"] == lineage_sha256(
+        feature_id=I25_FEATURE_ID,
+        schema_id=manifest["schema_id"],
+        payload_digest=manifest["payload_digest"],
+    )
+    assert manifest["definition_digest"] == digest_mapping(manifest["definition"])
+    assert [part["rows"] for part in manifest["parts"]] == [200]
+
+
+def test_changed_definition_requires_version_bump(tmp_path) -> None:
+    store = OfflineFeatureStoreV1(tmp_path)
+    bars = _bars()
+    store.materialize(LOG_RETURN_V1, bars, symbol="BTC/EUR", timeframe="1m")
+    changed = FeatureDefinitionV1(
+        feature_id="log_return",
+        version="v1",
+        columns=("log_return",),
+        compute=LOG_RETURN_V1.compute,
+        lookback_bars=2,
+    )
+    with pytest.raises(OfflineFeatureStoreError, match="definition_digest_mismatch"):
+        store.materialize(changed, bars, symbol="BTC/EUR", timeframe="1m")
+    with pytest.raises(OfflineFeatureStoreError, match="definition_digest_mismatch"):
+        store.read(changed, symbol="BTC/EUR", timeframe="1m")
+
+    # Appending without enough lookback context fails closed.
+    with pytest.raises(OfflineFeatureStoreError, match="insufficient_lookback_context"):
+        store.materialize(LOG_RETURN_V1, _bars(260).iloc[200:], symbol="BTC/EUR", timeframe="1m")
+
+
+def test_catalog_binding_is_fail_closed() -> None:
+    with pytest.raises(Exception, match="research_feeder_non_catalog_intent|not_justified"):
+        FeatureDefinitionV1(
+            feature_id="macro",
+            version="v1",
+            columns=("macro",),
+            compute=LOG_RETURN_V1.compute,
+            lookback_bars=0,
+            catalog_feature_id="I55_MACRO_REGIMES",
+        )
+
+
+def test_asof_join_never_sees_future_rows(tmp_path) -> None:
+    bars = _bars(30)
+    store = OfflineFeatureStoreV1(tmp_path)
+    joined = materialize_and_join_v1(store, bars, [LOG_RETURN_V1], symbol="BTC/EUR", timeframe="1m")
+    expected = np.log(bars["close"]).diff()
+    np.testing.assert_allclose(joined["log_return"], expected, equal_nan=True)
+
+    # A 90s availability lag exposes each 1m row two bars later.
+    lagged = store.asof_join(
+        bars, [LOG_RETURN_V1], symbol="BTC/EUR", timeframe="1m", availability_lag="90s"
+    )
+    np.testing.assert_allclose(lagged["log_return"], expected.shift(2), equal_nan=True)
+
+    # Off-grid decision times pick the latest row at or before them.
+    decisions = pd.DataFrame(index=bars.index[5:8] + pd.Timedelta("30s"))
+    picked = store.asof_join(decisions, [LOG_RETURN_V1], symbol="BTC/EUR", timeframe="1m")
+    np.testing.assert_allclose(picked["log_return"], expected.iloc[5:8])
+
+    with pytest.raises(OfflineFeatureStoreError, match="feature_column_collision"):
+        store.asof_join(joined, [LOG_RETURN_V1], symbol="BTC/EUR", timeframe="1m")
+
+
+def test_joined_frame_binds_into_linear_evidence(tmp_path) -> None:
+    bars = _bars(120)
+    store = OfflineFeatureStoreV1(tmp_path)
+    frame = materialize_and_join_v1(
+        store,
+        bars,
+        [LOG_RETURN_V1, VOLATILITY_ESTIMATE_V1],
+        symbol="BTC/EUR",
+        timeframe="1m",
+    )
+    frame["target"] = frame["log_return"].shift(-1)
+    x, y, binding = build_feature_matrix_binding_from_frame(
+        frame, feature_names=["log_return", "volatility_estimate"], target_name="target"
+    )
+    assert x.shape == (59, 2) and y.shape == (59,)
+    assert binding.row_count_before_filter == 120
+    assert binding.time_range["start"] == bars.index[60].isoformat()
+
+
+def test_store_binding_builds_linear_evidence_feature_matrix(tmp_path) -> None:
+    bars = _bars(120)
+    bars["target"] = np.log(bars["close"]).diff().shift(-1)
+    binding = FeatureStoreBindingV1(
+        OfflineFeatureStoreV1(tmp_path), (LOG_RETURN_V1, VOLATILITY_ESTIMATE_V1), "1m"
+    )
+    x, y, evidence = build_feature_matrix_binding_from_store(
+        binding, bars, symbol="BTC/EUR", target_name="target"
+    )
+    assert evidence.feature_names == ("log_return", "volatility_estimate")
+    assert x.shape == (59, 2) and y.shape == (59,)
+
+    # Second run reads the materialized partitions and binds the same matrix.
+    again = build_feature_matrix_binding_from_store(
+        binding, bars, symbol="BTC/EUR", target_name="target"
+    )
+    assert again[2] == evidence
@@ -68,3 +68,34 @@ def test_build_deterministic(tmp_path: Path) -> None:
     assert v1.counts == v2.counts
     assert v1.facts["event_count_total"] == 2
     assert v1.counts.get("k1") == 2
+
+
+def test_build_skips_invalid_events_and_hashes_in_same_pass(tmp_path: Path) -> None:
+    import hashlib
+
+    p = tmp_path / "ev.jsonl"
+    p.write_bytes(
+        NormalizedEvent("e1", 5, "s", "k1", "sc", [], "internal", {}).to_json_line().encode()
+        + b"\n  \nnot json\n"
+        + b'{"event_id":"e2","ts_ms":1,"source":"s","kind":"k2","scope":"x","sensitivity":"SECRET"}\n'
+        + b'{"event_id":"e3","ts_ms":"9","source":"s2","kind":"k1","scope":"sc"}'
+    )
+    v = build_feature_view_from_jsonl(str(p), run_id="r1")
+    assert v.counts == {"k1": 2}
+    assert (v.facts["ts_min"], v.facts["ts_max"], v.ts_ms) == (5, 9, 9)
+    assert v.facts["source"] == "s"
+    assert v.artifacts[0].sha256 == hashlib.sha256(p.read_bytes()).hexdigest()
+
+
+def test_parallel_chunked_scan_matches_sequential(tmp_path: Path) -> None:
+    w = JsonlEventWriter(tmp_path / "ev")
+    w.append(
+        NormalizedEvent(f"e{i}", 1000 - i, f"s{i % 3}", f"k{i % 4}", f"sc{i % 2}", [], "public", {})
+        for i in range(400)
+    )
+    w.close()
+    path = str(tmp_path / "ev.jsonl")
+    seq = build_feature_view_from_jsonl(path, run_id="r1")
+    par = build_feature_view_from_jsonl(path, run_id="r1", max_workers=2, chunk_bytes=4096)
+    assert par.to_dict() == seq.to_dict()
+    assert seq.facts["scope"] == "sc0" and seq.facts["ts_min"] == 601
@@ -71,3 +71,40 @@ def test_dumps_disallows_nan():
         assert False, "expected ValueError due to allow_nan=False"
     except ValueError:
         pass
+
+
+def test_jsonl_writer_keeps_handle_and_resyncs_after_external_change(tmp_path: Path):
+    import hashlib
+
+    base = tmp_path / "events" / "stream"
+    with JsonlEventWriter(base) as w:
+        r1 = w.append([NormalizedEvent("e1", 1, "s", "k", "sc", [], "internal", {})])
+        handle = w._fh
+        r2 = w.append([NormalizedEvent("e2", 2, "s", "k", "sc", [], "internal", {})])
+        assert w._fh is handle
+        assert r2.sha256_file == hashlib.sha256(r2.path_jsonl.read_bytes()).hexdigest()
+
+        # A second writer resumes from the manifest; the first one notices the size change.
+        JsonlEventWriter(base).append(
+            [NormalizedEvent("e3", 3, "s", "k", "sc", [], "internal", {})]
+        )
+        r4 = w.append([NormalizedEvent("e4", 4, "s", "k", "sc", [], "internal", {})])
+    assert w._fh is None
+    assert r1.records_written == 1 and r4.records_written == 4
+    assert r4.sha256_file == hashlib.sha256(r4.path_jsonl.read_bytes()).hexdigest()
+    m = json.loads(r4.path_manifest.read_text(encoding="utf-8"))
+    assert [e["i"] for e in m["chain"]] == [1, 2, 3, 4]
+
+
+def test_jsonl_writer_rejects_whole_batch_before_writing(tmp_path: Path):
+    w = JsonlEventWriter(tmp_path / "stream")
+    good = NormalizedEvent("e1", 1, "s", "k", "sc", [], "internal", {})
+    bad = NormalizedEvent("e2", 2, "s", "k", "sc", [], "SECRET", {})
+    try:
+        w.append([good, bad])
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+    assert not w.path_jsonl.exists() or w.path_jsonl.read_bytes() == b""
+    assert w.append([good]).records_written == 1
+    w.close()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 import pytest
@@ -345,3 +346,48 @@ def test_execution_watch_api_v0_4_health_runtime_metrics_opt_in_does_not_crash(
     assert "requests_total" in rm
     assert "latency_avg_seconds" in rm
     assert "read_errors_total" in rm
+
+
+def test_execution_watch_api_v0_5_meta_served_from_run_index_follows_appends(
+    client: TestClient, tmp_path: Path
+) -> None:
+    def ev(run_id: str, **ts: str) -> str:
+        return json.dumps({"schema": "execution_event_v0", "run_id": run_id, **ts}) + "\n"
+
+    p = tmp_path / "events.jsonl"
+    p.write_text(
+        ev("run_a", ts="2026-01-01T00:00:02Z", event_type="created")
+        + ev("run_a", ts="2026-01-01T00:00:01Z", event_type="filled")
+        + "{\n"
+        + ev("run_b", ts="not-a-time", event_type="created")
+        + ev("run_b", ts_utc="2026-01-01T01:00:05+01:00", ts="x", event_type="failed")
+        + ev("", ts="2026-01-01T00:00:09Z", event_type="created"),
+        encoding="utf-8",
+    )
+    q = f"root={tmp_path.as_posix()}&filename={p.name}"
+
+    health = client.get(f"/api/execution/health?{q}").json()
+    assert health["meta"]["read_errors"] == 2  # malformed line + unparseable ts
+    assert health["meta"]["last_event_utc"] == "2026-01-01T00:00:09Z"
+    assert health["meta"]["dataset_stats"]["runs_count"] == 2
+    assert health["meta"]["dataset_stats"]["events_count"] == 5
+    assert health["invariants"]["events_sorted_by_time_ok"] is False
+
+    runs = {r["run_id"]: r for r in client.get(f"/api/execution/runs?{q}").json()["runs"]}
+    assert runs["run_a"]["correlation_id"] == ""
+    assert runs["run_a"]["started_at_utc"] == "2026-01-01T00:00:01Z"
+    assert runs["run_b"]["status"] == "failed"
+
+    with p.open("a", encoding="utf-8") as f:
+        f.write(ev("run_b", ts="2026-01-01T00:00:10Z", event_type="filled", order_id="o9"))
+
+    detail = client.get(f"/api/execution/runs/run_b?{q}").json()
+    assert detail["run"]["total_events"] == 3
+    assert detail["run"]["status"] == "failed"
+    events = client.get(f"/api/execution/runs/run_b/events?{q}").json()
+    # Ordered by raw `ts` (file order on ties), as before.
+    assert [it["ts"] for it in events["items"]] == ["2026-01-01T00:00:10Z", "not-a-time", "x"]
+    assert events["meta"]["dataset_stats"]["events_count"] == 6
+
+    # Watch-only: caller-supplied roots never get an index sidecar.
+    assert sorted(x.name for x in tmp_path.iterdir()) == ["events.jsonl"]
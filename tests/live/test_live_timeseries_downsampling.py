@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.live import timeseries_downsampling
+from src.live.timeseries_downsampling import (
+    TimeseriesTileCache,
+    build_timeseries_pyramid,
+    downsample_indices,
+    load_run_timeseries_pyramid,
+    lttb_indices,
+    minmax_indices,
+    parse_range_bound,
+)
+
+
+def _events(n: int, *, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    equity = 10_000.0 + np.cumsum(rng.normal(0.0, 5.0, n))
+    equity[n // 3] += 900.0  # Ausreißer, den jedes Verfahren behalten muss
+    ts = pd.date_range("2026-01-01", periods=n, freq="min", tz="UTC")
+    return pd.DataFrame(
+        {
+            "step": np.arange(n),
+            "ts_event": [t.isoformat() for t in ts],
+            "equity": equity,
+            "realized_pnl": np.linspace(0.0, 50.0, n),
+        }
+    )
+
+
+def _reference_lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> list[int]:
+    """Lehrbuch-LTTB (Steinarsson) als Referenz."""
+    n = len(y)
+    every = (n - 2) / (n_out - 2)
+    out, a = [0], 0
+    for i in range(n_out - 2):
+        nlo = int(np.floor((i + 1) * every)) + 1
+        nhi = min(int(np.floor((i + 2) * every)) + 1, n)
+        avg_x, avg_y = x[nlo:nhi].mean(), y[nlo:nhi].mean()
+        lo, hi = int(np.floor(i * every)) + 1, int(np.floor((i + 1) * every)) + 1
+        best, best_area = lo, -1.0
+        for j in range(lo, hi):
+            area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
+            if area > best_area:
+                best, best_area = j, area
+        out.append(best)
+        a = best
+    out.append(n - 1)
+    return out
+
+
+def test_lttb_matches_reference_and_keeps_endpoints() -> None:
+    rng = np.random.default_rng(1)
+    x = np.arange(1000, dtype=float)
+    y = np.cumsum(rng.normal(size=1000))
+
+    idx = lttb_indices(x, y, 50)
+    assert idx.tolist() == _reference_lttb(x, y, 50)
+    assert idx[0] == 0 and idx[-1] == 999
+    assert np.all(np.diff(idx) > 0)
+
+    assert lttb_indices(x[:10], y[:10], 50).tolist() == list(range(10))
+    assert lttb_indices(x, y, 2).tolist() == [0, 999]
+
+
+def test_minmax_keeps_envelope() -> None:
+    y = np.sin(np.linspace(0, 40, 10_001))
+    y[1234] = 5.0
+    y[8765] = -5.0
+    idx = minmax_indices(y, 100)
+
+    assert len(idx) <= 100
+    assert np.all(np.diff(idx) > 0)
+    assert {1234, 8765} <= set(idx.tolist())
+    assert minmax_indices(y[:50], 100).tolist() == list(range(50))
+    assert minmax_indices(y, 1).tolist() == [0]
+    assert minmax_indices(y, 0).tolist() == []
+
+
+@pytest.mark.parametrize("method", ["lttb", "minmax"])
+@pytest.mark.parametrize("n_out", [2, 3, 4, 5, 9])
+def test_downsample_respects_small_budgets(method: str, n_out: int) -> None:
+    y = np.sin(np.linspace(0, 40, 1_001))
+    idx = downsample_indices(np.arange(len(y), dtype=float), y, n_out, method)
+
+    assert len(idx) <= n_out
+    assert idx[0] == 0 and idx[-1] == len(y) - 1
+    assert np.all(np.diff(idx) > 0)
+
+
+def test_pyramid_bounds_points_and_uses_coarser_levels() -> None:
+    df = _events(100_000)
+    pyramid = build_timeseries_pyramid(df)
+    levels = pyramid.levels("equity")
+
+    assert len(levels[0]) == len(df)
+    assert len(levels) > 2 and len(levels[-1]) <= 2 * pyramid.min_points
+    spike = len(df) // 3
+    assert all(spike in level for level in levels)
+
+    full = pyramid.query("equity", max_points=800, method="minmax")
+    assert len(full.indices) <= 800
+    assert full.level > 0
+    assert full.source_points == len(df)
+    assert spike in full.indices
+
+    lttb = pyramid.query("equity", max_points=800)
+    assert len(lttb.indices) == 800
+    assert lttb.indices[0] == 0 and lttb.indices[-1] == len(df) - 1
+
+
+def test_range_query_selects_window_at_full_resolution() -> None:
+    df = _events(5_000)
+    pyramid = build_timeseries_pyramid(df)
+    start = parse_range_bound("2026-01-01T01:00:00Z")
+    end = parse_range_bound("2026-01-01T01:59:00+00:00")
+
+    window = pyramid.query("equity", start=start, end=end, max_points=1000)
+    assert window.level == 0
+    assert window.source_points == 60
+    assert window.indices.tolist() == list(range(60, 120))
+    assert pyramid.ts[window.indices[0]] == "2026-01-01T01:00:00+00:00"
+
+    with pytest.raises(ValueError, match="unknown_downsample_method"):
+        pyramid.query("equity", method="avg")
+    with pytest.raises(KeyError):
+        pyramid.query("nope")
+
+
+def test_missing_columns_and_derived_drawdown() -> None:
+    df = pd.DataFrame(
+        {
+            "ts_bar": ["2026-01-01T00:00:00", "2026-01-01T00:01:00", None, "2026-01-01T00:03:00"],
+            "equity": [100.0, 110.0, 120.0, 99.0],
+        }
+    )
+    pyramid = build_timeseries_pyramid(df)
+
+    assert len(pyramid) == 3
+    assert pyramid.x_is_time
+    np.testing.assert_allclose(pyramid.columns["drawdown"], [0.0, 0.0, -0.1])
+    assert len(pyramid.query("unrealized_pnl").indices) == 0
+
+    unparsable = build_timeseries_pyramid(df.assign(ts_bar=["a", "b", "c", "d"]))
+    assert not unparsable.x_is_time
+    with pytest.raises(ValueError, match="range_requires_timestamps"):
+        unparsable.query("equity", start=0)
+
+
+def test_cache_reuses_pyramid_until_events_file_changes(tmp_path: Path) -> None:
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    _events(300).to_csv(run_dir / "events.csv", index=False)
+    cache = TimeseriesTileCache(maxsize=2)
+
+    first = load_run_timeseries_pyramid(run_dir, cache=cache)
+    assert load_run_timeseries_pyramid(run_dir, cache=cache) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    _events(301).to_csv(run_dir / "events.csv", index=False)
+    st = (run_dir / "events.csv").stat()
+    os.utime(run_dir / "events.csv", ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    second = load_run_timeseries_pyramid(run_dir, cache=cache)
+    assert second is not first and len(second) == 301
+
+    with pytest.raises(FileNotFoundError):
+        load_run_timeseries_pyramid(tmp_path / "empty", cache=cache)
+
+
+def test_appended_events_extend_cached_pyramid(tmp_path: Path, monkeypatch) -> None:
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    events_path = run_dir / "events.csv"
+    df = _events(6_000)
+    df.iloc[:2_000].to_csv(events_path, index=False)
+    cache = TimeseriesTileCache(maxsize=4)
+
+    first = load_run_timeseries_pyramid(run_dir, cache=cache)
+    first.levels("equity")
+    first.levels("drawdown")
+
+    def _no_rebuild(*_: object, **__: object) -> None:
+        raise AssertionError("appended rows must not trigger a full rebuild")
+
+    monkeypatch.setattr(timeseries_downsampling, "build_timeseries_pyramid", _no_rebuild)
+    extended = first
+    for stop in (2_001, 2_017, 3_500, 6_000):
+        # RunLogger-Flush: Anhängen ohne Kopfzeile
+        df.iloc[len(extended) : stop].to_csv(events_path, mode="a", header=False, index=False)
+        extended = load_run_timeseries_pyramid(run_dir, cache=cache)
+        assert len(extended) == stop
+    monkeypatch.undo()
+
+    reference = build_timeseries_pyramid(pd.read_csv(events_path))
+    np.testing.assert_array_equal(extended.x, reference.x)
+    np.testing.assert_array_equal(extended.ts, reference.ts)
+    for metric in ("equity", "drawdown", "realized_pnl"):
+        np.testing.assert_array_equal(extended.columns[metric], reference.columns[metric])
+        ext_levels, ref_levels = extended.levels(metric), reference.levels(metric)
+        assert len(ext_levels) == len(ref_levels) > 2
+        for got, want in zip(ext_levels, ref_levels):
+            np.testing.assert_array_equal(got, want)
+
+
+def test_appended_events_out_of_order_rebuild(tmp_path: Path) -> None:
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    events_path = run_dir / "events.csv"
+    df = _events(400)
+    df.iloc[100:].to_csv(events_path, index=False)
+    cache = TimeseriesTileCache()
+    load_run_timeseries_pyramid(run_dir, cache=cache).levels("equity")
+
+    df.iloc[:100].to_csv(events_path, mode="a", header=False, index=False)
+    pyramid = load_run_timeseries_pyramid(run_dir, cache=cache)
+
+    reference = build_timeseries_pyramid(pd.read_csv(events_path))
+    np.testing.assert_array_equal(pyramid.x, reference.x)
+    np.testing.assert_array_equal(pyramid.columns["equity"], reference.columns["equity"])
@@ -126,6 +126,53 @@ def test_api_v0_equity_series(tmp_path: Path) -> None:
     assert "ts" in rows[0]
 
 
+def test_api_v0_timeseries_downsampled_and_ranged(tmp_path: Path) -> None:
+    run_id = "20260115_shadow_demo_BTC-EUR_1m"
+    run_dir = _write_run(tmp_path, run_id=run_id)
+    n = 5000
+    lines = ["step,ts_event,equity,realized_pnl,unrealized_pnl"]
+    for i in range(n):
+        ts = f"2026-01-15T{18 + i // 3600:02d}:{i // 60 % 60:02d}:{i % 60:02d}+00:00"
+        lines.append(f"{i},{ts},{1000.0 + (i % 97) - (i % 13)},{i * 0.01},0.0")
+    (run_dir / "events.csv").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    before = _snapshot_tree(tmp_path)
+
+    client = TestClient(create_app(base_runs_dir=str(tmp_path)))
+
+    r = client.get(f"/api/v0/runs/{run_id}/timeseries?metric=equity&max_points=200")
+    assert r.status_code == 200
+    payload = r.json()
+    assert payload["count"] == len(payload["points"]) == 200
+    assert payload["source_points"] == n
+    assert payload["points"][0]["ts"] == "2026-01-15T18:00:00+00:00"
+
+    r = client.get(
+        f"/api/v0/runs/{run_id}/timeseries",
+        params={
+            "metric": "realized_pnl",
+            "start": "2026-01-15T18:10:00Z",
+            "end": "2026-01-15T18:10:59Z",
+            "method": "minmax",
+        },
+    )
+    assert r.status_code == 200
+    payload = r.json()
+    assert payload["count"] == payload["source_points"] == 60
+    assert payload["level"] == 0
+
+    rows = client.get(f"/api/v0/runs/{run_id}/equity?max_points=300&method=minmax").json()
+    assert 2 < len(rows) <= 300
+    assert rows[-1]["ts"].startswith("2026-01-15T19:23:19")
+    assert rows[0]["drawdown"] == 0.0
+
+    assert client.get(f"/api/v0/runs/{run_id}/timeseries?metric=nope").status_code == 400
+    assert client.get(f"/api/v0/runs/{run_id}/timeseries?method=avg").status_code == 400
+    assert client.get(f"/api/v0/runs/{run_id}/timeseries?start=garbage").status_code == 400
+    assert client.get(f"/api/v0/runs/{run_id}/timeseries?max_points=1").status_code == 422
+    assert client.get("/api/v0/runs/missing/timeseries").status_code == 404
+    assert _snapshot_tree(tmp_path) == before
+
+
 def test_api_v0_trades_not_available(tmp_path: Path) -> None:
     run_id = "20260115_shadow_demo_BTC-EUR_1m"
     _write_run(tmp_path, run_id=run_id)
@@ -0,0 +1,173 @@
+"""Tests for the learning-loop verified-bundle cache v1."""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from scripts.ops.primary_evidence_retention_v0 import (
+    verify_manifest_sha256,
+    write_manifest_sha256,
+)
+from src.meta.learning_loop import verified_bundle_cache_v1 as cache_module
+from src.meta.learning_loop.verified_bundle_cache_v1 import (
+    VerifiedBundleCacheV1,
+    bundle_fingerprint_v1,
+    configure_verified_bundle_cache_v1,
+    get_verified_bundle_cache_v1,
+)
+
+
+def _bundle(root: Path, name: str, body: str = "{}") -> Path:
+    bundle = root / name
+    bundle.mkdir()
+    (bundle / "artifact.json").write_text(body, encoding="utf-8")
+    write_manifest_sha256(bundle)
+    return bundle
+
+
+def _bump(path: Path, body: str) -> None:
+    path.write_text(body, encoding="utf-8")
+    ns = time.time_ns() + 1_000_000_000
+    os.utime(path, ns=(ns, ns))
+
+
+@pytest.fixture
+def settled_clock(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Check time 10 s ahead, so freshly written bundles are outside the racy window."""
+    monkeypatch.setattr(cache_module, "time_ns", lambda: time.time_ns() + 10_000_000_000)
+
+
+class _Checker:
+    def __init__(self, bundle: Path, *, upstream: Path | None = None) -> None:
+        self.bundle = bundle
+        self.upstream = upstream
+        self.calls = 0
+
+    def __call__(self) -> None:
+        self.calls += 1
+        for root in (self.bundle, self.upstream):
+            if root is None:
+                continue
+            ok, msg = verify_manifest_sha256(root)
+            if not ok:
+                raise ValueError(msg)
+
+
+def test_successful_verification_is_reused_until_bundle_changes(
+    tmp_path: Path, settled_clock: None
+) -> None:
+    cache = VerifiedBundleCacheV1()
+    bundle = _bundle(tmp_path, "a")
+    check = _Checker(bundle)
+
+    assert cache.verify("kind", bundle, check) is False
+    assert cache.verify("kind", bundle, check) is True
+    assert check.calls == 1
+    assert cache.stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+    # Tampering invalidates the record and the full check fails closed.
+    _bump(bundle / "artifact.json", '{"tampered":true}')
+    with pytest.raises(ValueError, match="checksum mismatch"):
+        cache.verify("kind", bundle, check)
+    assert cache.stats()["entries"] == 0
+    with pytest.raises(ValueError):
+        cache.verify("kind", bundle, check)
+    assert check.calls == 3
+
+
+def test_upstream_bundle_change_invalidates_downstream_record(
+    tmp_path: Path, settled_clock: None
+) -> None:
+    cache = VerifiedBundleCacheV1()
+    upstream = _bundle(tmp_path, "upstream")
+    downstream = _bundle(tmp_path, "downstream")
+    check = _Checker(downstream, upstream=upstream)
+
+    cache.verify("chain", downstream, check)
+    cache.verify("chain", downstream, check)
+    assert check.calls == 1
+
+    _bump(upstream / "artifact.json", '{"v":2}')
+    with pytest.raises(ValueError):
+        cache.verify("chain", downstream, check)
+    assert check.calls == 2
+
+
+def test_nested_cached_verification_propagates_dependencies(
+    tmp_path: Path, settled_clock: None
+) -> None:
+    cache = VerifiedBundleCacheV1()
+    upstream = _bundle(tmp_path, "upstream")
+    downstream = _bundle(tmp_path, "downstream")
+    inner = _Checker(upstream)
+    cache.verify("inner", upstream, inner)
+
+    def outer() -> None:
+        cache.verify("inner", upstream, inner)  # cache hit inside the outer check
+        ok, msg = verify_manifest_sha256(downstream)
+        assert ok, msg
+
+    cache.verify("outer", downstream, outer)
+    assert inner.calls == 1
+    _bump(upstream / "artifact.json", '{"v":3}')
+    write_manifest_sha256(upstream)
+    assert cache.verify("outer", downstream, outer) is False
+    assert inner.calls == 2
+
+
+def test_kind_is_part_of_the_key(tmp_path: Path, settled_clock: None) -> None:
+    cache = VerifiedBundleCacheV1()
+    bundle = _bundle(tmp_path, "a")
+    check = _Checker(bundle)
+
+    cache.verify("kind", bundle, check)
+    assert cache.verify("kind", bundle, check)
+    assert not cache.verify("other", bundle, check)
+    assert check.calls == 2
+    assert (
+        bundle_fingerprint_v1(bundle)[0]
+        == cache._records[("kind", str(bundle.resolve()))].manifest_digest
+    )
+
+
+def test_racy_in_place_rewrite_is_not_served_from_cache(tmp_path: Path) -> None:
+    cache = VerifiedBundleCacheV1()
+    bundle = _bundle(tmp_path, "a", body='{"v":1}')
+    artifact = bundle / "artifact.json"
+    st = artifact.stat()
+    check = _Checker(bundle)
+
+    assert cache.verify("kind", bundle, check) is False
+    assert cache.stats()["entries"] == 0
+
+    # Same size, mtime restored: only a racy-timestamp guard can catch this.
+    artifact.write_text('{"v":2}', encoding="utf-8")
+    os.utime(artifact, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert artifact.stat().st_size == st.st_size
+    with pytest.raises(ValueError, match="checksum mismatch"):
+        cache.verify("kind", bundle, check)
+    assert check.calls == 2
+
+
+def test_records_persist_on_disk_and_shared_cache_is_configurable(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, settled_clock: None
+) -> None:
+    store = tmp_path / "cache" / "verified_bundles.json"
+    bundle = _bundle(tmp_path, "a")
+    check = _Checker(bundle)
+    VerifiedBundleCacheV1(persist_path=store).verify("kind", bundle, check)
+    assert store.is_file()
+
+    assert VerifiedBundleCacheV1(persist_path=store).verify("kind", bundle, check) is True
+    assert check.calls == 1
+
+    monkeypatch.setattr(cache_module, "_DEFAULT_CACHE", get_verified_bundle_cache_v1())
+    disabled = configure_verified_bundle_cache_v1(enabled=False)
+    assert get_verified_bundle_cache_v1() is disabled
+    disabled.verify("kind", bundle, check)
+    disabled.verify("kind", bundle, check)
+    assert check.calls == 3
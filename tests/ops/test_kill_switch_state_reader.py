@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+
+import pytest
+
+from src.ops.gates.kill_switch_state_reader import (
+    RACY_WINDOW_NS,
+    KillSwitchStateReader,
+    get_kill_switch_state_reader,
+    reset_kill_switch_state_readers,
+)
+
+
+def _write_state(path, state: str, *, age_s: float = 10.0) -> None:
+    path.write_text(json.dumps({"state": state}), encoding="utf-8")
+    # Move mtime out of the racy window so the fingerprint is trusted.
+    ts = time.time() - age_s
+    os.utime(path, (ts, ts))
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_readers():
+    reset_kill_switch_state_readers()
+    yield
+    reset_kill_switch_state_readers()
+
+
+@pytest.mark.parametrize(
+    "state, expected",
+    [("KILLED", True), ("RECOVERING", True), ("ACTIVE", False), ("DISABLED", False)],
+)
+def test_reader_matches_resolver_contract(tmp_path, state, expected):
+    path = tmp_path / "state.json"
+    _write_state(path, state)
+    assert KillSwitchStateReader(str(path)).resolve() is expected
+
+
+def test_reader_missing_file_returns_none(tmp_path):
+    reader = KillSwitchStateReader(str(tmp_path / "missing.json"))
+    assert reader.resolve() is None
+    assert reader.is_blocking() is False
+
+
+def test_reader_parses_once_per_fingerprint(tmp_path):
+    path = tmp_path / "state.json"
+    _write_state(path, "ACTIVE")
+    reader = KillSwitchStateReader(str(path))
+    for _ in range(50):
+        assert reader.resolve() is False
+    st = reader.stats()
+    assert st.calls == 50
+    assert st.reads == 1
+    assert st.stats == 50
+    assert st.cache_hits == 49
+
+
+def test_reader_reparses_on_change(tmp_path):
+    path = tmp_path / "state.json"
+    _write_state(path, "ACTIVE", age_s=20.0)
+    reader = KillSwitchStateReader(str(path))
+    assert reader.resolve() is False
+    # Same size ("KILLED" vs "ACTIVE"); mtime differs.
+    _write_state(path, "KILLED", age_s=10.0)
+    assert reader.resolve() is True
+    assert reader.stats().reads == 2
+
+
+def test_reader_racy_mtime_is_not_cached(tmp_path):
+    path = tmp_path / "state.json"
+    path.write_text(json.dumps({"state": "ACTIVE"}), encoding="utf-8")
+    assert time.time_ns() - os.stat(path).st_mtime_ns < RACY_WINDOW_NS
+    reader = KillSwitchStateReader(str(path))
+    assert reader.resolve() is False
+    assert reader.resolve() is False
+    assert reader.stats().reads == 2
+
+
+def test_reader_invalid_json_is_fail_closed_and_not_cached(tmp_path):
+    path = tmp_path / "state.json"
+    _write_state(path, "KILLED")
+    reader = KillSwitchStateReader(str(path))
+    assert reader.resolve() is True
+    path.write_text("{not json", encoding="utf-8")
+    ts = time.time() - 5
+    os.utime(path, (ts, ts))
+    assert reader.resolve() is None
+    assert reader.resolve() is None
+    assert reader.stats().reads == 3
+
+
+def test_reader_deleted_file_drops_cache(tmp_path):
+    path = tmp_path / "state.json"
+    _write_state(path, "ACTIVE")
+    reader = KillSwitchStateReader(str(path))
+    assert reader.resolve() is False
+    path.unlink()
+    assert reader.resolve() is None
+
+
+def test_reader_bounded_staleness_skips_stat(tmp_path):
+    path = tmp_path / "state.json"
+    _write_state(path, "ACTIVE", age_s=20.0)
+    now = [100.0]
+    reader = KillSwitchStateReader(str(path), max_staleness_s=0.5, clock=lambda: now[0])
+    assert reader.resolve() is False
+    _write_state(path, "KILLED", age_s=10.0)
+    now[0] = 100.4
+    assert reader.resolve() is False  # within staleness bound
+    assert reader.stats().stats == 1
+    now[0] = 100.6
+    assert reader.resolve() is True
+    assert reader.stats().stats == 2
+
+
+def test_reader_rejects_negative_staleness(tmp_path):
+    with pytest.raises(ValueError):
+        KillSwitchStateReader(str(tmp_path / "s.json"), max_staleness_s=-1)
+
+
+def test_shared_reader_is_reused_per_path(tmp_path):
+    p = str(tmp_path / "state.json")
+    assert get_kill_switch_state_reader(p) is get_kill_switch_state_reader(p)
+    assert get_kill_switch_state_reader(p) is not get_kill_switch_state_reader(None)
+
+
+def test_shared_reader_max_staleness_is_keyed(tmp_path):
+    p = str(tmp_path / "state.json")
+    relaxed = get_kill_switch_state_reader(p, max_staleness_s=0.5)
+    assert relaxed.max_staleness_s == 0.5
+    assert relaxed is get_kill_switch_state_reader(p, max_staleness_s=0.5)
+    assert get_kill_switch_state_reader(p).max_staleness_s == 0.0
+    with pytest.raises(ValueError):
+        get_kill_switch_state_reader(p, max_staleness_s=-1)
+
+
+def test_pipeline_blocking_check_uses_shared_reader(tmp_path, monkeypatch):
+    from src.execution.pipeline import _is_kill_switch_blocking
+
+    path = tmp_path / "ks.json"
+    _write_state(path, "KILLED")
+    monkeypatch.setenv("PEAK_KILL_SWITCH_STATE_PATH", str(path))
+    for _ in range(5):
+        assert _is_kill_switch_blocking() is True
+    assert get_kill_switch_state_reader(str(path)).stats().reads == 1
@@ -0,0 +1,140 @@
+"""Tests for the incremental ExperimentsIndex and its web UI wiring."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+import src.r_and_d.experiments_read_model as read_model
+from src.r_and_d.experiments_read_model import ExperimentsIndex, load_experiments_from_directory
+from src.webui import r_and_d_api
+
+
+def _exp(i: int, *, strategy: str = "s", trades: int = 1) -> dict:
+    return {
+        "experiment": {
+            "preset_id": f"p{i % 3}",
+            "strategy": strategy,
+            "symbol": "BTC/EUR",
+            "timeframe": "1h",
+            "tag": "sweep" if i % 2 else "t",
+            "timestamp": f"202401{1 + i % 28:02d}_1200{i % 60:02d}",
+        },
+        "results": {
+            "total_return": 0.01 * i,
+            "sharpe": 0.1 * (i % 7),
+            "max_drawdown": -0.01 * (i % 5),
+            "total_trades": trades,
+            "win_rate": 0.5,
+        },
+        "meta": {},
+    }
+
+
+def _write(path: Path, payload: dict) -> None:
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+@pytest.fixture
+def exp_dir(tmp_path: Path) -> Path:
+    for i in range(12):
+        _write(tmp_path / f"exp_{i:03d}.json", _exp(i))
+    (tmp_path / "broken.json").write_text("{", encoding="utf-8")
+    return tmp_path
+
+
+def test_index_matches_directory_loader(exp_dir: Path) -> None:
+    index = ExperimentsIndex(exp_dir)
+    assert index.experiments() == load_experiments_from_directory(exp_dir)
+    assert len(index) == 12
+
+
+def test_index_reparses_only_changed_files(exp_dir: Path, monkeypatch) -> None:
+    index = ExperimentsIndex(exp_dir)
+    index.experiments()
+    generation = index.generation
+
+    parsed: list[str] = []
+    original = read_model.load_experiment_json_file
+
+    def spy(path: Path):
+        parsed.append(path.name)
+        return original(path)
+
+    monkeypatch.setattr(read_model, "load_experiment_json_file", spy)
+    assert index.refresh() is False
+    assert parsed == [] and index.generation == generation
+
+    target = exp_dir / "exp_003.json"
+    _write(target, _exp(3, strategy="changed"))
+    os.utime(target, ns=(time.time_ns(), time.time_ns() + 1_000_000))
+    (exp_dir / "exp_004.json").unlink()
+    _write(exp_dir / "exp_100.json", _exp(100))
+
+    experiments = index.experiments()
+    assert sorted(parsed) == ["exp_003.json", "exp_100.json"]
+    assert index.generation == generation + 1
+    assert experiments == load_experiments_from_directory(exp_dir)
+    assert "exp_004.json" not in {e["_filename"] for e in experiments}
+
+
+def test_flat_fields_and_aggregates_are_cached_per_generation(exp_dir: Path) -> None:
+    r_and_d_api._INDEXES.clear()
+    experiments = r_and_d_api.load_experiments_from_dir(exp_dir)
+    index = r_and_d_api.get_experiments_index(exp_dir)
+
+    for name, fn in (
+        ("summary", r_and_d_api._compute_summary),
+        ("preset_stats", r_and_d_api._compute_preset_stats),
+        ("strategy_stats", r_and_d_api._compute_strategy_stats),
+        ("global_stats", r_and_d_api._compute_global_stats),
+    ):
+        expected = fn(experiments)
+        public = getattr(r_and_d_api, f"compute_{name}")
+        assert public(experiments) == expected
+        assert name in index._memo
+        # Callers may mutate results without corrupting the cache.
+        mutated = public(experiments)
+        (mutated if isinstance(mutated, dict) else mutated[0])["extra"] = 1
+        assert public(experiments) == expected
+
+    flat = r_and_d_api.extract_flat_fields(experiments[0])
+    assert flat == r_and_d_api._extract_flat_fields_uncached(experiments[0])
+    assert index.flat(experiments[0]) is not None
+
+    # Filtered lists bypass the aggregate cache.
+    subset = experiments[:3]
+    assert r_and_d_api.compute_summary(subset)["total_experiments"] == 3
+
+    _write(exp_dir / "exp_200.json", _exp(200, strategy="new"))
+    refreshed = r_and_d_api.load_experiments_from_dir(exp_dir)
+    stats = r_and_d_api.compute_strategy_stats(refreshed)
+    assert {row["strategy"] for row in stats} == {"s", "new"}
+    r_and_d_api._INDEXES.clear()
+
+
+@pytest.mark.data_perf
+def test_benchmark_incremental_index_at_scale(tmp_path: Path) -> None:
+    """Repeated page loads at 50k experiments are served from memory."""
+    n = int(os.environ.get("PEAK_TRADE_RND_BENCH_N", "50000"))
+    payload = json.dumps(_exp(1))
+    for i in range(n):
+        (tmp_path / f"exp_{i:06d}.json").write_text(payload, encoding="utf-8")
+
+    t0 = time.perf_counter()
+    baseline = load_experiments_from_directory(tmp_path)
+    legacy_s = time.perf_counter() - t0
+
+    index = ExperimentsIndex(tmp_path)
+    index.experiments()  # cold build
+    t0 = time.perf_counter()
+    warm = index.experiments()
+    warm_s = time.perf_counter() - t0
+
+    print(f"\n[r_and_d index] n={n} full_reload={legacy_s:.3f}s warm_refresh={warm_s:.3f}s")
+    assert len(warm) == len(baseline) == n
+    assert warm_s < legacy_s
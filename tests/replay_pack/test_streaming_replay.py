@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.execution.beta_bridge.schema import normalize_beta_exec_v1_event
+from src.execution.determinism import stable_id
+from src.execution.replay_pack.builder import build_replay_pack
+from src.execution.replay_pack import compare as compare_mod
+from src.execution.replay_pack.compare import _fills_diff, generate_compare_report
+from src.execution.replay_pack.contract import ContractViolationError
+from src.execution.replay_pack.loader import load_replay_pack
+from src.execution.replay_pack.runner import _replay_events, replay_bundle
+from src.execution.replay_pack.schema import assert_lf_only_file
+from src.execution.replay_pack.streaming import (
+    IncrementalFillsDiff,
+    NonCanonicalOrderError,
+    replay_bundle_streaming,
+    stream_replay,
+)
+
+_SYMBOLS = ["BTC/EUR", "ETH/EUR", "SOL/EUR"]
+
+
+def _mk_event(i: int, ts_step: int = 1) -> dict:
+    symbol = _SYMBOLS[i % len(_SYMBOLS)]
+    fields = {
+        "run_id": "run_stream",
+        "session_id": "s",
+        "intent_id": f"i{i}",
+        "symbol": symbol,
+        "event_type": "FILL",
+        "ts_sim": i // ts_step,
+        "request_id": None,
+        "client_order_id": f"order_{i:04d}",
+        "reason_code": None,
+        "payload": {
+            "fill_id": f"fill_{i}",
+            "side": "SELL" if i % 4 == 3 else "BUY",
+            "quantity": f"0.{(i % 7) + 1}",
+            # Constant buy price per symbol keeps WAC exact (no rounding drift).
+            "price": f"{100 + (i % len(_SYMBOLS)) + (i % 4 == 3)}.25",
+            "fee": "0.01",
+            "fee_currency": "EUR",
+        },
+    }
+    return {
+        "schema_version": "BETA_EXEC_V1",
+        "event_id": stable_id(kind="execution_event", fields=fields),
+        "ts_utc": "2026-01-01T00:00:00+00:00",
+        "reason_detail": None,
+        **fields,
+    }
+
+
+def _build_bundle(tmp_path: Path, ts_step: int = 1) -> Path:
+    run_dir = tmp_path / "run"
+    events_path = run_dir / "logs" / "execution" / "execution_events.jsonl"
+    events_path.parent.mkdir(parents=True)
+    with open(events_path, "w", encoding="utf-8", newline="\n") as f:
+        for i in range(120):
+            f.write(json.dumps(_mk_event(i, ts_step), sort_keys=True, separators=(",", ":")))
+            f.write("\n")
+    return build_replay_pack(
+        run_dir,
+        tmp_path / "out",
+        created_at_utc_override="2026-01-01T00:00:00+00:00",
+        include_outputs=True,
+    )
+
+
+@pytest.fixture()
+def bundle(tmp_path: Path) -> Path:
+    return _build_bundle(tmp_path)
+
+
+def _reference_positions(bundle_root: Path) -> dict:
+    events = list(load_replay_pack(bundle_root).execution_events())
+    return _replay_events(events).positions
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_stream_replay_matches_in_memory_replay(bundle: Path, workers: int):
+    res = stream_replay(bundle, check_outputs=True, workers=workers, batch_size=7)
+    assert res.positions == _reference_positions(bundle)
+    assert res.events_consumed == 120
+    assert res.fills_status == "PASS"
+    assert res.positions_status == "PASS"
+    assert replay_bundle(bundle, check_outputs=True) == 0
+    assert replay_bundle_streaming(bundle, check_outputs=True, workers=workers) == 0
+
+
+def test_stream_replay_decimal_backend(bundle: Path):
+    res = stream_replay(bundle, ledger_backend="decimal")
+    assert res.positions == _reference_positions(bundle)
+    assert res.accounts is None
+
+
+def test_checkpoint_resume_yields_identical_result(bundle: Path, tmp_path: Path):
+    ckpt = tmp_path / "ckpt" / "replay.json"
+    full = stream_replay(bundle, check_outputs=True, checkpoint_path=ckpt, checkpoint_every=50)
+    assert full.checkpoints_written == 2
+    # Only the digests of the current ts_sim group are checkpointed
+    assert len(json.loads(ckpt.read_text(encoding="utf-8"))["seen"]) == 1
+
+    resumed = stream_replay(
+        bundle, check_outputs=True, workers=2, checkpoint_path=ckpt, resume=True
+    )
+    assert resumed.resumed_from == 100
+    assert resumed.positions == full.positions
+    assert resumed.accounts == full.accounts
+    assert resumed.fills_status == "PASS"
+
+
+def test_dedup_window_spans_shared_ts_sim_groups(tmp_path: Path):
+    bundle = _build_bundle(tmp_path, ts_step=8)
+    ckpt = tmp_path / "ckpt" / "replay.json"
+    full = stream_replay(bundle, check_outputs=True, checkpoint_path=ckpt, checkpoint_every=45)
+    assert full.positions == _reference_positions(bundle)
+    assert full.fills_status == "PASS"
+
+    # 90 events consumed: 2 of the 8 events in the ts_sim=11 group
+    assert len(json.loads(ckpt.read_text(encoding="utf-8"))["seen"]) == 2
+    resumed = stream_replay(bundle, check_outputs=True, checkpoint_path=ckpt, resume=True)
+    assert resumed.resumed_from == 90
+    assert resumed.positions == full.positions
+
+
+def test_checkpoint_requires_fixed_point_backend(bundle: Path, tmp_path: Path):
+    with pytest.raises(ValueError):
+        stream_replay(bundle, ledger_backend="decimal", checkpoint_path=tmp_path / "c.json")
+
+
+def test_out_of_order_events_are_rejected(tmp_path: Path):
+    run_dir = tmp_path / "run"
+    events_path = run_dir / "logs" / "execution" / "execution_events.jsonl"
+    events_path.parent.mkdir(parents=True)
+    events_path.write_text(
+        "".join(json.dumps(_mk_event(i), sort_keys=True) + "\n" for i in range(3)),
+        encoding="utf-8",
+    )
+    root = build_replay_pack(
+        run_dir, tmp_path / "out", created_at_utc_override="2026-01-01T00:00:00+00:00"
+    )
+    p = root / "events" / "execution_events.jsonl"
+    lines = p.read_text(encoding="utf-8").splitlines(keepends=True)
+    p.write_text("".join(reversed(lines)), encoding="utf-8")
+    with pytest.raises(ContractViolationError):
+        stream_replay(root)
+
+
+def test_compare_report_is_computed_from_the_stream(
+    bundle: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    def _no_materialization(*args, **kwargs):
+        raise AssertionError("canonical bundles must not be materialized")
+
+    monkeypatch.setattr(compare_mod, "_materialized_invariants", _no_materialization)
+    code, report = generate_compare_report(
+        bundle,
+        check_outputs=True,
+        generated_at_utc="2026-01-01T00:00:00Z",
+        out_path=tmp_path / "streamed.json",
+    )
+    assert code == 0
+    assert report["replay"]["invariants"] == {"fills": "PASS", "positions": "PASS"}
+    monkeypatch.undo()
+
+    def _non_canonical(*args, **kwargs):
+        raise NonCanonicalOrderError("forced")
+
+    monkeypatch.setattr(compare_mod, "stream_replay", _non_canonical)
+    fallback_code, fallback = generate_compare_report(
+        bundle,
+        check_outputs=True,
+        generated_at_utc="2026-01-01T00:00:00Z",
+        out_path=tmp_path / "materialized.json",
+    )
+    assert (fallback_code, fallback) == (code, report)
+
+
+def test_incremental_fills_diff_matches_compare_diff():
+    expected = [normalize_beta_exec_v1_event(_mk_event(i)) for i in range(20)]
+    got = [dict(e) for e in expected if e["ts_sim"] not in (3, 9)]
+    got[5] = {**got[5], "payload": {**got[5]["payload"], "price": "1.00"}}
+    got[11] = {**got[11], "payload": {**got[11]["payload"], "price": "2.00"}}
+    got.append(normalize_beta_exec_v1_event(_mk_event(50)))
+
+    inc = IncrementalFillsDiff(iter(expected), sample_n=5)
+    for ev in got:
+        inc.add_got(ev)
+    inc.finish()
+    assert not inc.passed()
+    assert inc.diff() == _fills_diff(expected, got, sample_n=5)
+
+
+def test_assert_lf_only_file_chunked(tmp_path: Path):
+    ok = tmp_path / "ok.jsonl"
+    ok.write_bytes(b"a\n" * 10)
+    assert_lf_only_file(ok, label="ok", chunk_size=3)
+
+    crlf = tmp_path / "crlf.jsonl"
+    crlf.write_bytes(b"ab\r\ncd\n")
+    with pytest.raises(ContractViolationError):
+        assert_lf_only_file(crlf, label="crlf", chunk_size=3)
+
+    no_trailing = tmp_path / "nt.jsonl"
+    no_trailing.write_bytes(b"ab\ncd")
+    with pytest.raises(ContractViolationError):
+        assert_lf_only_file(no_trailing, label="nt", chunk_size=2)
@@ -0,0 +1,132 @@
+"""Parity tests for the array-backed cross-sectional panel primitives."""
+
+from __future__ import annotations
+
+import math
+import random
+
+import numpy as np
+import pytest
+
+from src.research.cross_sectional_futures_pairwise_lead_lag_spillover_v1_score_v0 import (
+    compute_future_log_return_v0,
+    compute_instrument_net_spillover_scores_all_epochs_v0,
+    compute_instrument_net_spillover_scores_v0,
+    compute_lagged_log_return_v0,
+    compute_panel_pairwise_spillover_scores_v0,
+    rank_instrument_net_spillover_scores_deterministic_v0,
+)
+from src.research.cross_sectional_panel_arrays_v0 import (
+    PanelArraysV0,
+    cross_sectional_rank_order_v0,
+    cross_sectional_zscore_v0,
+    future_log_returns_v0,
+    lagged_log_returns_v0,
+    rolling_correlation_v0,
+    rolling_lead_lag_beta_v0,
+)
+
+
+def _closes(seed: int, n_ids: int = 7, length: int = 60) -> dict[str, tuple[float, ...]]:
+    rng = random.Random(seed)
+    out: dict[str, tuple[float, ...]] = {}
+    for k in range(n_ids):
+        price = 100.0 + k
+        series = []
+        for _ in range(length - (k % 3) * 4):
+            price *= math.exp(rng.gauss(0.0, 0.02))
+            series.append(price)
+        out[f"SYM{k:02d}-PERP"] = tuple(series)
+    # Gaps and a BTC instrument, both excluded by the scalar path.
+    out["SYM01-PERP"] = out["SYM01-PERP"][:20] + (0.0, float("nan")) + out["SYM01-PERP"][22:]
+    out["BTC-PERP"] = tuple(50_000.0 + i for i in range(length))
+    return out
+
+
+def _none_to_nan(value: float | None) -> float:
+    return math.nan if value is None else value
+
+
+def test_lagged_and_future_returns_match_scalar_bitwise():
+    closes = _closes(1)
+    ids = sorted(closes)
+    panel = PanelArraysV0.from_sequences(closes, epoch_count=64)
+    lagged = lagged_log_returns_v0(panel, window=8, signal_lag_bars=1)
+    future = future_log_returns_v0(panel, forward_lag_bars=2)
+    for row, iid in enumerate(ids):
+        for t in range(64):
+            exp_lag = compute_lagged_log_return_v0(
+                closes[iid], lag_window_l=8, signal_lag_bars=1, epoch_index=t
+            )
+            exp_fut = compute_future_log_return_v0(closes[iid], forward_lag_bars=2, epoch_index=t)
+            np.testing.assert_array_equal(lagged[row, t], _none_to_nan(exp_lag))
+            np.testing.assert_array_equal(future[row, t], _none_to_nan(exp_fut))
+
+
+def test_truncated_panel_treats_offsets_past_epoch_count_as_missing():
+    closes = {"A": (1.0, 2.0, 3.0, 4.0, 5.0), "B": (1.0, 2.0)}
+    panel = PanelArraysV0.from_sequences(closes, epoch_count=3)
+    assert panel.lengths.tolist() == [3, 2]
+    future = future_log_returns_v0(panel, forward_lag_bars=1)
+    np.testing.assert_array_equal(future[0], [math.log(2.0), math.log(1.5), np.nan])
+    np.testing.assert_array_equal(future[1], [math.log(2.0), np.nan, np.nan])
+
+
+@pytest.mark.parametrize("seed", [3, 4])
+@pytest.mark.parametrize("truncate", [0, 12])
+def test_all_epoch_net_spillover_matches_per_epoch_scores(seed, truncate):
+    closes = _closes(seed)
+    # truncate > 0: series longer than epoch_count, forward returns read past the end
+    bar_count = max(len(v) for v in closes.values()) - truncate
+    all_epochs = compute_instrument_net_spillover_scores_all_epochs_v0(
+        closes,
+        lag_window_l=5,
+        signal_lag_bars=1,
+        forward_lag_bars=1,
+        epoch_count=bar_count,
+        epoch_chunk=7,
+    )
+    assert len(all_epochs) == bar_count
+    for t in range(bar_count):
+        pair_scores = compute_panel_pairwise_spillover_scores_v0(
+            closes, lag_window_l=5, signal_lag_bars=1, forward_lag_bars=1, epoch_index=t
+        )
+        if pair_scores is None:
+            assert all_epochs[t] is None
+            continue
+        expected = compute_instrument_net_spillover_scores_v0(pair_scores)
+        assert all_epochs[t] == expected
+        assert rank_instrument_net_spillover_scores_deterministic_v0(
+            all_epochs[t]
+        ) == rank_instrument_net_spillover_scores_deterministic_v0(expected)
+
+
+def test_all_epoch_net_spillover_small_universe_is_none():
+    closes = {f"S{i}": (1.0, 2.0, 3.0) for i in range(4)}
+    assert compute_instrument_net_spillover_scores_all_epochs_v0(
+        closes, lag_window_l=1, signal_lag_bars=0, forward_lag_bars=1
+    ) == (None, None, None)
+
+
+def test_rank_order_breaks_ties_by_instrument_id():
+    ids = ["C", "A", "B", "D"]
+    scores = np.array([[1.0, 2.0], [1.0, np.nan], [3.0, 2.0], [np.nan, 0.5]])
+    order, counts = cross_sectional_rank_order_v0(scores, ids)
+    assert [ids[i] for i in order[:, 0][: counts[0]]] == ["B", "A", "C"]
+    assert [ids[i] for i in order[:, 1][: counts[1]]] == ["B", "C", "D"]
+
+
+def test_zscore_and_rolling_statistics():
+    scores = np.array([[1.0, np.nan], [2.0, 4.0], [3.0, 4.0]])
+    z = cross_sectional_zscore_v0(scores)
+    np.testing.assert_allclose(z[:, 0], [-math.sqrt(1.5), 0.0, math.sqrt(1.5)])
+    assert np.isnan(z).sum() == 3  # NaN input + zero-variance epoch
+
+    rng = np.random.default_rng(0)
+    leader = rng.normal(size=(2, 50))
+    follower = np.roll(leader, 2, axis=1) * 3.0
+    beta = rolling_lead_lag_beta_v0(leader, follower, window=10, lag_bars=2)
+    np.testing.assert_allclose(beta[:, 11:], 3.0)
+    assert np.isnan(beta[:, :11]).all()
+    corr = rolling_correlation_v0(leader, leader[0], window=5)
+    np.testing.assert_allclose(corr[0, 4:], 1.0)
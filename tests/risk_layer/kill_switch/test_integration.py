@@ -81,6 +81,41 @@ class TestExecutionGateIntegration:
         with pytest.raises(TradingBlockedError):
             gate.execute_with_gate(mock_order)
 
+    def test_gate_blocks_on_persisted_state_reader(self, kill_switch, tmp_path):
+        """Gate with a state reader should block when the persisted state is KILLED."""
+        from src.ops.gates.kill_switch_state_reader import KillSwitchStateReader
+
+        state_file = tmp_path / "state.json"
+        state_file.write_text(json.dumps({"state": "ACTIVE"}), encoding="utf-8")
+        gate = ExecutionGate(kill_switch, state_reader=KillSwitchStateReader(str(state_file)))
+        assert gate.check_can_execute() is True
+
+        state_file.write_text(json.dumps({"state": "KILLED"}), encoding="utf-8")
+        assert gate.is_blocked() is True
+        assert "persisted" in gate.get_block_reason()
+        with pytest.raises(TradingBlockedError):
+            gate.check_can_execute()
+
+    def test_block_reason_checks_kill_switch_once(self, kill_switch, monkeypatch):
+        """get_block_reason should evaluate check_and_block exactly once."""
+        gate = ExecutionGate(kill_switch)
+        kill_switch.trigger("Test")
+        calls = []
+        original = kill_switch.check_and_block
+
+        def counting_check():
+            calls.append(1)
+            return original()
+
+        monkeypatch.setattr(kill_switch, "check_and_block", counting_check)
+        assert "triggered" in gate.get_block_reason()
+        assert len(calls) == 1
+
+        calls.clear()
+        monkeypatch.setattr(kill_switch, "check_and_block", lambda: calls.append(1) or False)
+        assert gate.get_block_reason() == "Not blocked"
+        assert len(calls) == 1
+
     def test_gate_as_context_manager(self, kill_switch):
         """Gate should work as context manager."""
         gate = ExecutionGate(kill_switch)
@@ -283,3 +283,145 @@ class TestPortfolioStrategyWithData:
         last_diff = abs(weights_over_time[-1]["BTC/EUR"] - weights_over_time[-1]["ETH/EUR"])
 
         assert last_diff > first_diff  # Gewichte divergieren
+
+
+def _ma_signals(df: pd.DataFrame, params: dict) -> pd.Series:
+    """Einfaches MA-Crossover-Signal für Backtest-Tests."""
+    fast = df["close"].rolling(params["fast_window"]).mean()
+    slow = df["close"].rolling(params["slow_window"]).mean()
+    return (fast > slow).astype(int)
+
+
+def _assert_portfolio_results_identical(loop, matrix) -> None:
+    pd.testing.assert_series_equal(loop.combined_equity, matrix.combined_equity, check_exact=True)
+    pd.testing.assert_frame_equal(
+        loop.target_weights_history, matrix.target_weights_history, check_exact=True
+    )
+    pd.testing.assert_frame_equal(
+        loop.actual_weights_history, matrix.actual_weights_history, check_exact=True
+    )
+    assert loop.symbol_equities.keys() == matrix.symbol_equities.keys()
+    for symbol, curve in loop.symbol_equities.items():
+        pd.testing.assert_series_equal(curve, matrix.symbol_equities[symbol], check_exact=True)
+        pd.testing.assert_frame_equal(
+            loop.trades_per_symbol[symbol], matrix.trades_per_symbol[symbol], check_exact=True
+        )
+    assert loop.portfolio_stats == matrix.portfolio_stats
+    assert loop.metadata == matrix.metadata
+
+
+class TestPortfolioMatrixSimulator:
+    """Parität Matrix-Simulator vs. Referenz-Schleife (run_portfolio_strategy_backtest)."""
+
+    @pytest.fixture
+    def data_dict(self):
+        return {
+            "BTC/EUR": create_test_ohlcv_data(n_bars=240, start_price=50000, seed=1),
+            "ETH/EUR": create_test_ohlcv_data(n_bars=240, start_price=3000, seed=2),
+            "LTC/EUR": create_test_ohlcv_data(n_bars=240, start_price=100, volatility=0.03, seed=3),
+        }
+
+    @pytest.mark.parametrize(
+        "config",
+        [
+            PortfolioConfig(enabled=True, name="equal_weight", max_single_weight=0.5),
+            PortfolioConfig(
+                enabled=True,
+                name="fixed_weights",
+                fixed_weights={"BTC/EUR": 0.5, "ETH/EUR": 0.3, "LTC/EUR": 0.2},
+            ),
+            PortfolioConfig(enabled=True, name="vol_target", vol_lookback=20),
+            PortfolioConfig(
+                enabled=True,
+                name="vol_target",
+                vol_lookback=10,
+                min_weight=0.3,
+                symbols=["LTC/EUR", "BTC/EUR", "ETH/EUR"],
+            ),
+        ],
+        ids=["equal_weight", "fixed_weights", "vol_target", "vol_target_constrained"],
+    )
+    @pytest.mark.parametrize("rebalance_interval", [1, 7])
+    def test_matrix_matches_loop(self, data_dict, config, rebalance_interval):
+        """Test: Matrix-Simulator liefert bitgleiche Ergebnisse wie die Schleife."""
+        from src.backtest.engine import run_portfolio_strategy_backtest
+
+        kwargs = dict(
+            data_dict=data_dict,
+            strategy_signal_fn=_ma_signals,
+            strategy_params={"fast_window": 5, "slow_window": 20},
+            portfolio_config=config,
+            fee_bps=10.0,
+            slippage_bps=5.0,
+            rebalance_interval=rebalance_interval,
+        )
+        loop = run_portfolio_strategy_backtest(simulator="loop", **kwargs)
+        matrix = run_portfolio_strategy_backtest(**kwargs)
+
+        _assert_portfolio_results_identical(loop, matrix)
+
+    def test_weight_matrix_matches_per_bar_weights(self, data_dict):
+        """Test: generate_target_weight_matrix == generate_target_weights je Bar."""
+        symbols = list(data_dict)
+        closes = np.column_stack([data_dict[s]["close"].to_numpy() for s in symbols])
+        config = PortfolioConfig(enabled=True, name="vol_target", vol_lookback=15)
+        strategy = make_portfolio_strategy(config)
+
+        columns, matrix = strategy.generate_target_weight_matrix(symbols, closes)
+
+        for bar in (0, 14, 15, 100, len(closes) - 1):
+            history = pd.DataFrame(closes[: bar + 1], columns=symbols).pct_change().dropna()
+            context = PortfolioContext(
+                timestamp=data_dict[symbols[0]].index[bar],
+                symbols=symbols,
+                prices=dict(zip(symbols, closes[bar].tolist())),
+                current_positions={s: 0.0 for s in symbols},
+                returns_history=history if bar >= config.vol_lookback else None,
+            )
+            expected = strategy.generate_target_weights(context)
+            got = {c: w for c, w in zip(columns, matrix[bar].tolist()) if not np.isnan(w)}
+            assert got == expected
+
+    def test_stateful_strategy_falls_back_to_per_bar_weights(self, data_dict, monkeypatch):
+        """Test: Strategien ohne Gewichtsmatrix (signalabhängig, Cash-Engpass) bleiben paritätisch."""
+        import src.portfolio as portfolio_pkg
+        from src.backtest.engine import run_portfolio_strategy_backtest
+
+        class SignalWeights:
+            name = "SignalWeights"
+
+            def generate_target_weights(self, context):
+                # > 100% Brutto-Exposure: spätere Käufe scheitern am Cash
+                return {s: 0.6 for s in context.symbols if context.get_signal(s) > 0}
+
+            def generate_target_weight_matrix(self, symbols, closes):
+                return None
+
+        monkeypatch.setattr(portfolio_pkg, "make_portfolio_strategy", lambda cfg: SignalWeights())
+        kwargs = dict(
+            data_dict=data_dict,
+            strategy_signal_fn=_ma_signals,
+            strategy_params={"fast_window": 3, "slow_window": 10},
+            portfolio_config=PortfolioConfig(enabled=True, name="equal_weight"),
+            fee_bps=20.0,
+            slippage_bps=10.0,
+            rebalance_interval=3,
+        )
+        loop = run_portfolio_strategy_backtest(simulator="loop", **kwargs)
+        matrix = run_portfolio_strategy_backtest(**kwargs)
+
+        assert loop.portfolio_stats["total_trades"] > 0
+        _assert_portfolio_results_identical(loop, matrix)
+
+    def test_invalid_simulator_raises(self, data_dict):
+        """Test: Unbekannter Simulator wird abgelehnt."""
+        from src.backtest.engine import run_portfolio_strategy_backtest
+
+        with pytest.raises(ValueError, match="simulator"):
+            run_portfolio_strategy_backtest(
+                data_dict=data_dict,
+                strategy_signal_fn=_ma_signals,
+                strategy_params={"fast_window": 5, "slow_window": 20},
+                portfolio_config=PortfolioConfig(enabled=True, name="equal_weight"),
+                simulator="numba",
+            )
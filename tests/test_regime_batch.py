@@ -0,0 +1,140 @@
+# tests/test_regime_batch.py
+"""
+Tests fuer die Batch-Regime-Engine (src/regime/batch.py)
+========================================================
+
+Paritaet zu den Einzel-Detectors, Panel-Ausrichtung und Indikator-Sharing.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.experiments.base import ParamSweep
+from src.experiments.regime_sweeps import (
+    build_regime_detector_configs,
+    get_regime_detector_sweeps,
+)
+from src.regime import (
+    REGIME_LABELS,
+    RegimeDetectorConfig,
+    detect_regimes_batch,
+    make_regime_detector,
+)
+from src.regime import batch as batch_mod
+
+
+def _ohlcv(n_bars: int, seed: int, start: str = "2024-01-01") -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    vol = np.where(np.arange(n_bars) % 150 < 75, 0.003, 0.02)
+    prices = 50000.0 * np.cumprod(1 + rng.normal(0.0002, vol))
+    return pd.DataFrame(
+        {
+            "high": prices * (1 + np.abs(rng.normal(0, 0.004, n_bars))),
+            "low": prices * (1 - np.abs(rng.normal(0, 0.004, n_bars))),
+            "close": prices,
+        },
+        index=pd.date_range(start=start, periods=n_bars, freq="1h"),
+    )
+
+
+def _configs() -> list:
+    vol = build_regime_detector_configs(
+        "volatility_breakout",
+        [
+            ParamSweep("regime_vol_window", [10, 20]),
+            ParamSweep("regime_lookback_window", [30, 50]),
+            ParamSweep("regime_vol_percentile_breakout", [0.7, 0.8]),
+        ],
+        base=RegimeDetectorConfig(min_history_bars=60, trending_ma_window=20),
+    )
+    rng = build_regime_detector_configs(
+        "range_compression",
+        [
+            ParamSweep("regime_range_compression_window", [10, 20]),
+            ParamSweep("regime_compression_threshold", [0.2, 0.35]),
+        ],
+        base=RegimeDetectorConfig(min_history_bars=60),
+    )
+    return vol + rng
+
+
+def test_batch_matches_single_detectors():
+    panel = {"BTC/EUR": _ohlcv(400, seed=1), "ETH/EUR": _ohlcv(400, seed=2)}
+    configs = _configs()
+
+    cube = detect_regimes_batch(panel, configs)
+
+    assert cube.shape == (len(configs), 2, 400)
+    for c, config in enumerate(configs):
+        detector = make_regime_detector(config)
+        for asset, df in panel.items():
+            expected = detector.detect_regimes(df)
+            pd.testing.assert_series_equal(cube.series(c, asset), expected)
+
+    # Mehrere Regime kommen tatsaechlich vor
+    assert len(np.unique(cube.labels)) >= 3
+
+
+def test_indicators_are_computed_once_per_parameter(monkeypatch):
+    calls = []
+    original = batch_mod.rolling_last_pct_rank
+
+    def counting(series, window, min_periods):
+        calls.append((window, min_periods))
+        return original(series, window=window, min_periods=min_periods)
+
+    monkeypatch.setattr(batch_mod, "rolling_last_pct_rank", counting)
+    configs = _configs()
+    detect_regimes_batch({"A": _ohlcv(200, seed=4)}, configs)
+
+    # vol: 2 vol_windows x 2 lookbacks, range: 2 windows x 1 lookback
+    assert len(calls) == 4 + 2 < len(configs)
+
+
+def test_panel_alignment_and_short_history():
+    long_df = _ohlcv(300, seed=5)
+    short_df = _ohlcv(50, seed=6, start="2024-01-05")
+    configs = [RegimeDetectorConfig(min_history_bars=60, lookback_window=30)]
+
+    cube = detect_regimes_batch({"long": long_df, "short": short_df}, configs)
+
+    assert cube.index.equals(long_df.index.union(short_df.index))
+    frame = cube.to_frame(0)
+    assert list(frame.columns) == ["long", "short"]
+    # zu wenig Historie -> komplett unknown
+    assert (frame["short"] == "unknown").all()
+    pd.testing.assert_series_equal(
+        cube.series(0, "long").loc[long_df.index],
+        make_regime_detector(
+            RegimeDetectorConfig(enabled=True, min_history_bars=60, lookback_window=30)
+        ).detect_regimes(long_df),
+    )
+
+    share = cube.regime_share()
+    assert set(REGIME_LABELS) <= set(share.columns)
+    np.testing.assert_allclose(share[list(REGIME_LABELS)].sum(axis=1), 1.0)
+
+
+def test_invalid_inputs_raise():
+    with pytest.raises(ValueError, match="high"):
+        detect_regimes_batch({"A": pd.DataFrame({"close": [1.0]})}, [RegimeDetectorConfig()])
+    with pytest.raises(ValueError, match="Unbekannter Regime-Detector"):
+        detect_regimes_batch(
+            {"A": _ohlcv(150, seed=7)},
+            [RegimeDetectorConfig(detector_name="nope", min_history_bars=10)],
+        )
+
+
+def test_build_regime_detector_configs_from_sweeps():
+    sweeps = get_regime_detector_sweeps("volatility_breakout", "coarse")
+    configs = build_regime_detector_configs("volatility_breakout", sweeps)
+
+    assert len(configs) == 27
+    assert all(c.enabled and c.detector_name == "volatility_breakout" for c in configs)
+    assert {c.vol_window for c in configs} == {10, 20, 30}
+
+    with pytest.raises(ValueError, match="Unbekannter Regime-Parameter"):
+        build_regime_detector_configs("vol", [ParamSweep("regime_nope", [1])])
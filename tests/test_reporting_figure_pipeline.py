@@ -0,0 +1,340 @@
+# tests/test_reporting_figure_pipeline.py
+"""
+Tests für src/reporting/figure_pipeline.py
+==========================================
+
+Testet gebündeltes, paralleles und gecachtes Figure-Rendering sowie die
+Anbindung an Backtest-Reports und Sweep-Plots.
+"""
+
+import pytest
+
+pytest.importorskip("matplotlib")
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.reporting import figure_pipeline as figure_pipeline_mod
+from src.reporting.backtest_report import build_backtest_report
+from src.reporting.figure_pipeline import (
+    FIGURE_MANIFEST_FILENAME,
+    FigurePipeline,
+    figure_digest,
+    render_figure,
+)
+from src.reporting.html_reports import (
+    HtmlReportBuilder,
+    plot_drawdown,
+    plot_equity_curve,
+    plot_metric_distribution,
+    plot_sweep_scatter,
+)
+from src.reporting.plots import save_histogram
+from src.reporting.sweep_visualization import (
+    generate_default_sweep_plots,
+    generate_sweep_plots_batch,
+)
+
+
+def _equity(n: int = 200, seed: int = 0) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    idx = pd.date_range("2024-01-01", periods=n, freq="h")
+    return pd.Series(10_000.0 * np.cumprod(1.0 + rng.normal(0.0, 0.002, n)), index=idx)
+
+
+def _sweep_df(seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    fast, slow = np.meshgrid([5, 10, 15], [20, 40, 60])
+    n = fast.size
+    return pd.DataFrame(
+        {
+            "param_fast_period": fast.ravel(),
+            "param_slow_period": slow.ravel(),
+            "metric_sharpe_ratio": rng.normal(1.0, 0.3, n),
+            "metric_max_drawdown": -rng.uniform(0.05, 0.3, n),
+        }
+    )
+
+
+def _broken_render(output_path, **kwargs):
+    raise RuntimeError("kaputt")
+
+
+class TestFigureDigest:
+    """Tests für figure_digest()."""
+
+    def test_digest_depends_on_data_and_renderer(self):
+        s = _equity()
+        base = figure_digest(save_histogram, {"values": s.tolist(), "title": "a"})
+
+        assert base == figure_digest(save_histogram, {"title": "a", "values": s.tolist()})
+        assert base != figure_digest(save_histogram, {"values": s.tolist(), "title": "b"})
+        assert base != figure_digest(render_figure, {"values": s.tolist(), "title": "a"})
+
+        series = figure_digest(save_histogram, {"values": s})
+        changed = s.copy()
+        changed.iloc[-1] += 1.0
+        assert series == figure_digest(save_histogram, {"values": s.copy()})
+        assert series != figure_digest(save_histogram, {"values": changed})
+
+    def test_digest_tracks_defaults_and_reporting_code(self, monkeypatch):
+        def render(output_path, dpi=100, *, title="a"):
+            return None
+
+        base = figure_digest(render, {})
+        render.__defaults__ = (150,)
+        with_dpi = figure_digest(render, {})
+        assert with_dpi != base
+        render.__kwdefaults__ = {"title": "b"}
+        assert figure_digest(render, {}) != with_dpi
+
+        # Änderungen an aufgerufenen Helfern (plots.py, DEFAULT_DPI) invalidieren den Digest
+        def patched_sources(plots_source):
+            monkeypatch.setattr(
+                figure_pipeline_mod,
+                "_source_digest",
+                lambda path: plots_source if path.endswith("plots.py") else "same",
+            )
+            figure_pipeline_mod.reporting_code_version.cache_clear()
+            return figure_digest(save_histogram, {"values": [1.0]})
+
+        try:
+            assert patched_sources("v1") == patched_sources("v1")
+            assert patched_sources("v1") != patched_sources("v2")
+        finally:
+            figure_pipeline_mod.reporting_code_version.cache_clear()
+
+
+class TestFigurePipeline:
+    """Tests für FigurePipeline."""
+
+    def test_render_figure_without_pipeline_renders_immediately(self, tmp_path):
+        path = render_figure(None, save_histogram, tmp_path / "h.png", values=[1.0, 2.0, 2.5])
+        assert path.is_file()
+
+    def test_cache_hit_on_second_build(self, tmp_path):
+        cache_dir = tmp_path / "cache"
+        values = _equity().tolist()
+
+        first = FigurePipeline(cache_dir=cache_dir)
+        first.submit(save_histogram, tmp_path / "a" / "h.png", values=values)
+        (result,) = first.run().values()
+        assert result.status == "rendered"
+
+        second = FigurePipeline(cache_dir=cache_dir)
+        second.submit(save_histogram, tmp_path / "b" / "h.png", values=values)
+        (result,) = second.run().values()
+        assert result.status == "cached"
+        assert (tmp_path / "b" / "h.png").read_bytes() == (tmp_path / "a" / "h.png").read_bytes()
+
+    def test_incremental_skips_unchanged_and_rerenders_changed(self, tmp_path):
+        def run(values):
+            pipeline = FigurePipeline(incremental=True)
+            pipeline.submit(save_histogram, tmp_path / "h.png", values=values, title="H")
+            pipeline.submit(save_histogram, tmp_path / "g.png", values=[1.0, 2.0], title="G")
+            return {p.name: r.status for p, r in pipeline.run().items()}
+
+        assert run([1.0, 2.0, 3.0]) == {"h.png": "rendered", "g.png": "rendered"}
+        assert (tmp_path / FIGURE_MANIFEST_FILENAME).is_file()
+        assert run([1.0, 2.0, 3.0]) == {"h.png": "unchanged", "g.png": "unchanged"}
+        assert run([1.0, 2.0, 4.0]) == {"h.png": "rendered", "g.png": "unchanged"}
+
+        (tmp_path / "g.png").unlink()
+        assert run([1.0, 2.0, 4.0]) == {"h.png": "unchanged", "g.png": "rendered"}
+
+    def test_failures_are_reported_not_raised(self, tmp_path):
+        pipeline = FigurePipeline(incremental=True)
+        pipeline.submit(_broken_render, tmp_path / "bad.png")
+        pipeline.submit(save_histogram, tmp_path / "ok.png", values=[1.0, 2.0])
+        results = pipeline.run()
+
+        bad, ok = results[tmp_path / "bad.png"], results[tmp_path / "ok.png"]
+        assert not bad.ok and isinstance(bad.error, RuntimeError)
+        assert ok.ok and (tmp_path / "ok.png").is_file()
+        assert pipeline.stats == {"failed": 1, "rendered": 1}
+        assert pipeline.pending == 0
+
+        pipeline.submit(_broken_render, tmp_path / "bad.png")
+        with pytest.raises(RuntimeError, match="kaputt"):
+            pipeline.run(raise_on_error=True)
+
+    def test_process_pool_matches_serial(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(figure_pipeline_mod.os, "cpu_count", lambda: 2)
+        outputs = {}
+        for workers in (1, 2):
+            pipeline = FigurePipeline(max_workers=workers)
+            for i in range(3):
+                pipeline.submit(
+                    save_histogram,
+                    tmp_path / f"w{workers}" / f"h{i}.png",
+                    values=_equity(seed=i).tolist(),
+                    title=f"H{i}",
+                )
+            results = pipeline.run()
+            assert all(r.status == "rendered" for r in results.values())
+            outputs[workers] = sorted(p.name for p in results)
+
+        assert outputs[1] == outputs[2]
+        for i in range(3):
+            assert (tmp_path / "w2" / f"h{i}.png").stat().st_size > 0
+
+
+class TestFigurePipelineIntegration:
+    """Backtest-Report und Sweep-Plots über die FigurePipeline."""
+
+    def test_backtest_report_defers_charts_until_run(self, tmp_path):
+        equity = _equity()
+        drawdown = equity / equity.cummax() - 1.0
+        pipeline = FigurePipeline(cache_dir=tmp_path / "cache")
+
+        report = build_backtest_report(
+            title="Deferred",
+            metrics={"total_return": 0.1},
+            equity_curve=equity,
+            drawdown_series=drawdown,
+            output_dir=tmp_path / "images",
+            figure_pipeline=pipeline,
+        )
+        assert "equity_curve.png" in report.to_markdown()
+        assert pipeline.pending == 2
+        assert not (tmp_path / "images" / "equity_curve.png").exists()
+
+        results = pipeline.run()
+        assert {p.name for p in results} == {"equity_curve.png", "drawdown.png"}
+        assert (tmp_path / "images" / "drawdown.png").is_file()
+
+        # Zweiter Report mit identischen Daten: alles aus dem Cache
+        again = FigurePipeline(cache_dir=tmp_path / "cache")
+        build_backtest_report(
+            title="Deferred",
+            metrics={"total_return": 0.1},
+            equity_curve=equity,
+            drawdown_series=drawdown,
+            output_dir=tmp_path / "images2",
+            figure_pipeline=again,
+        )
+        again.run()
+        assert again.stats == {"cached": 2}
+
+    def test_batch_matches_single_sweep_plots(self, tmp_path):
+        single = generate_default_sweep_plots(_sweep_df(), "s1", tmp_path / "single")
+        pipeline = FigurePipeline(incremental=True)
+        batch = generate_sweep_plots_batch(
+            {"s1": _sweep_df(), "s2": _sweep_df(seed=1)},
+            tmp_path / "batch",
+            figure_pipeline=pipeline,
+        )
+
+        assert set(batch) == {"s1", "s2"}
+        assert set(batch["s1"]) == set(single)
+        assert {p.name for p in batch["s1"].values()} == {p.name for p in single.values()}
+        assert all(p.parent == tmp_path / "batch" / "s2" for p in batch["s2"].values())
+        assert all(p.is_file() for plots in batch.values() for p in plots.values())
+        assert pipeline.stats["rendered"] == sum(len(p) for p in batch.values())
+
+        rerun = FigurePipeline(incremental=True)
+        generate_sweep_plots_batch(
+            {"s1": _sweep_df(), "s2": _sweep_df(seed=2)},
+            tmp_path / "batch",
+            figure_pipeline=rerun,
+        )
+        assert rerun.stats["unchanged"] == len(batch["s1"])
+        assert rerun.stats["rendered"] > 0
+
+    def test_html_report_plots_go_through_pipeline(self, tmp_path):
+        equity = _equity()
+        pipeline = FigurePipeline(cache_dir=tmp_path / "cache")
+        paths = [
+            plot_equity_curve(equity, output_path=tmp_path / "eq.png", figure_pipeline=pipeline),
+            plot_drawdown(equity, output_path=tmp_path / "dd.png", figure_pipeline=pipeline),
+            plot_metric_distribution(
+                [0.1, 0.4, 0.2], output_path=tmp_path / "dist.png", figure_pipeline=pipeline
+            ),
+            plot_sweep_scatter(
+                [1, 2, 3],
+                [0.3, 0.1, 0.2],
+                "fast",
+                "sharpe",
+                output_path=tmp_path / "scatter.png",
+                figure_pipeline=pipeline,
+            ),
+        ]
+        assert pipeline.pending == 4
+        assert not any(p.exists() for p in paths)
+
+        results = pipeline.run()
+        assert list(results) == paths
+        assert all(r.status == "rendered" and r.output_path.is_file() for r in results.values())
+
+        direct = plot_equity_curve(equity, output_path=tmp_path / "direct" / "eq.png")
+        assert direct is not None and direct.is_file()
+
+        again = FigurePipeline(cache_dir=tmp_path / "cache")
+        plot_drawdown(equity, output_path=tmp_path / "dd2.png", figure_pipeline=again)
+        again.run()
+        assert again.stats == {"cached": 1}
+
+    def test_html_sweep_report_defers_charts_until_run(self, tmp_path):
+        from src.analytics.explorer import ExperimentSummary, RankedExperiment, SweepOverview
+
+        runs = [
+            RankedExperiment(
+                summary=ExperimentSummary(
+                    experiment_id=f"deferred-run-{i:04d}-abcdef",
+                    run_type="sweep",
+                    run_name=f"run_{i}",
+                    metrics={"total_return": 0.1, "max_drawdown": -0.05},
+                    params={"fast_period": 5 + i},
+                ),
+                rank=i + 1,
+                sort_key="sharpe",
+                sort_value=v,
+            )
+            for i, v in enumerate([1.4, 1.1, 0.7])
+        ]
+        overview = SweepOverview(
+            sweep_name="deferred", strategy_key="ma_crossover", run_count=3, best_runs=runs
+        )
+        pipeline = FigurePipeline()
+        builder = HtmlReportBuilder(output_dir=tmp_path, figure_pipeline=pipeline)
+
+        report_path = builder.build_sweep_report(overview, runs, metric="sharpe")
+        chart = report_path.parent / "figures" / "sharpe_distribution.png"
+        assert "figures/sharpe_distribution.png" in report_path.read_text()
+        assert pipeline.pending == 1 and not chart.exists()
+
+        pipeline.run(raise_on_error=True)
+        assert chart.is_file()
+
+
+class TestSweepPlotsBatchScript:
+    """scripts/generate_sweep_plots_batch.py über generate_sweep_plots_batch."""
+
+    def test_batch_script_renders_all_sweeps_and_is_incremental(self, tmp_path):
+        from scripts.generate_sweep_plots_batch import main
+
+        inputs = []
+        for seed, name in enumerate(["alpha", "beta"]):
+            path = tmp_path / f"{name}.csv"
+            _sweep_df(seed=seed).to_csv(path, index=False)
+            inputs.append(str(path))
+        out = tmp_path / "images"
+
+        argv = ["--input", *inputs, "--output-dir", str(out), "--incremental"]
+        assert main(argv) == 0
+        first = {p: p.stat().st_mtime_ns for p in out.glob("*/*.png")}
+        assert {p.parent.name for p in first} == {"alpha", "beta"}
+
+        assert main(argv) == 0
+        assert {p: p.stat().st_mtime_ns for p in out.glob("*/*.png")} == first
+
+        assert main(["--input", str(tmp_path / "missing.csv"), "-o", str(out)]) == 1
+
+    def test_strategy_sweep_report_incremental_is_opt_in(self):
+        from scripts.generate_strategy_sweep_report import build_parser
+
+        base = ["--sweep-name", "x"]
+        assert build_parser().parse_args(base).incremental is False
+        assert build_parser().parse_args([*base, "--incremental"]).incremental is True
@@ -0,0 +1,120 @@
+"""Tests for rolling/expanding rank primitives (src.utils.rolling_stats)."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils.rolling_stats import (
+    expanding_fraction_at_or_above,
+    expanding_quantile,
+    expanding_rank,
+    rolling_fraction_below,
+    rolling_last_pct_rank,
+    rolling_quantile,
+    rolling_rank,
+)
+
+
+def _random_cases(seed: int, n_cases: int = 150):
+    """Small integer-valued series (many ties) with NaN and +/-inf."""
+    rng = np.random.default_rng(seed)
+    for _ in range(n_cases):
+        n = int(rng.integers(0, 40))
+        x = rng.integers(0, 5, n).astype(float)
+        mask = rng.random(n)
+        x[mask < 0.15] = np.nan
+        x[(mask >= 0.15) & (mask < 0.2)] = np.inf
+        x[(mask >= 0.2) & (mask < 0.22)] = -np.inf
+        window = int(rng.integers(1, 10))
+        min_periods = int(rng.integers(1, window + 1))
+        yield pd.Series(x, name="x"), window, min_periods
+
+
+def _assert_same(actual: pd.Series, expected: pd.Series) -> None:
+    np.testing.assert_array_equal(actual.to_numpy(), expected.to_numpy())
+    assert actual.index.equals(expected.index)
+
+
+class TestRollingRank:
+    """Tests for rolling_rank() and rolling_last_pct_rank()."""
+
+    @pytest.mark.parametrize("method", ["average", "min", "max"])
+    def test_matches_rolling_apply(self, method: str) -> None:
+        for s, window, min_periods in _random_cases(seed=1):
+            expected = s.rolling(window, min_periods=min_periods).apply(
+                lambda x: pd.Series(x).rank(method=method).iloc[-1], raw=True
+            )
+            _assert_same(rolling_rank(s, window, min_periods, method=method), expected)
+
+    def test_last_pct_rank_matches_rolling_apply(self) -> None:
+        for s, window, min_periods in _random_cases(seed=2):
+            expected = s.rolling(window, min_periods=min_periods).apply(
+                lambda x: pd.Series(x).rank(pct=True).iloc[-1] * 100, raw=True
+            )
+            actual = rolling_last_pct_rank(s, window, min_periods)
+            _assert_same(actual, expected)
+            assert actual.name == "x"
+
+    def test_min_periods_above_window_is_all_nan(self) -> None:
+        s = pd.Series([1.0, 2.0, 3.0])
+        assert rolling_rank(s, window=2, min_periods=3).isna().all()
+        assert rolling_fraction_below(s, window=2, min_periods=3).isna().all()
+
+    def test_empty_series(self) -> None:
+        s = pd.Series([], dtype=float)
+        assert rolling_last_pct_rank(s, 5, 1).empty
+        assert rolling_fraction_below(s, 5, 1).empty
+        assert expanding_fraction_at_or_above(s).empty
+
+
+class TestExpandingRank:
+    """Tests for expanding_rank()."""
+
+    def test_matches_expanding_apply(self) -> None:
+        for s, _, min_periods in _random_cases(seed=3):
+            expected = s.expanding(min_periods=min_periods).apply(
+                lambda x: pd.Series(x).rank(pct=True).iloc[-1], raw=True
+            )
+            _assert_same(expanding_rank(s, min_periods, pct=True), expected)
+
+
+class TestFractions:
+    """Tests for rolling_fraction_below() and expanding_fraction_at_or_above()."""
+
+    def test_fraction_below_matches_rolling_apply(self) -> None:
+        for s, window, min_periods in _random_cases(seed=4):
+            expected = s.rolling(window, min_periods=min_periods).apply(
+                lambda x: (x < x[-1]).mean(), raw=True
+            )
+            _assert_same(rolling_fraction_below(s, window, min_periods), expected)
+
+    def test_fraction_at_or_above_matches_expanding_apply(self) -> None:
+        for s, _, min_periods in _random_cases(seed=5):
+            expected = s.expanding(min_periods=min_periods).apply(
+                lambda x: (x[-1] <= x).mean(), raw=True
+            )
+            _assert_same(expanding_fraction_at_or_above(s, min_periods), expected)
+
+    def test_denominator_counts_nan_slots(self) -> None:
+        s = pd.Series([1.0, np.nan, 3.0, 2.0])
+        out = rolling_fraction_below(s, window=4, min_periods=1)
+        assert out.iloc[-1] == pytest.approx(1 / 4)
+
+
+class TestQuantile:
+    """Tests for rolling_quantile() and expanding_quantile()."""
+
+    @pytest.mark.parametrize("q", [0.0, 0.1, 0.5, 0.9, 1.0])
+    def test_matches_nanquantile(self, q: float) -> None:
+        rng = np.random.default_rng(6)
+        x = rng.normal(size=200)
+        x[rng.random(200) < 0.1] = np.nan
+        s = pd.Series(x)
+
+        expected = s.rolling(20, min_periods=5).apply(lambda w: np.nanquantile(w, q), raw=True)
+        np.testing.assert_allclose(rolling_quantile(s, 20, q, 5), expected, atol=1e-12)
+
+        expected = s.expanding(min_periods=5).apply(lambda w: np.nanquantile(w, q), raw=True)
+        np.testing.assert_allclose(expanding_quantile(s, q, 5), expected, atol=1e-12)
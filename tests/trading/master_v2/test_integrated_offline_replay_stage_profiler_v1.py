@@ -0,0 +1,152 @@
+"""Opt-in per-stage profiler for the integrated offline trading logic replay v1."""
+
+from __future__ import annotations
+
+import itertools
+
+import pytest
+
+from tests.trading.master_v2.test_integrated_offline_trading_logic_replay_v1 import (
+    _replay_input,
+    _run,
+)
+from trading.master_v2.integrated_offline_replay_stage_profiler_v1 import (
+    REPLAY_STAGES_V1,
+    ReplayStageProfilerV1,
+    active_integrated_offline_replay_stage_profiler_v1,
+    profile_integrated_offline_replay_v1,
+    replay_stage_lap_v1,
+)
+from trading.master_v2.integrated_offline_trading_logic_replay_v1 import (
+    run_integrated_offline_trading_logic_replay_v1,
+)
+
+
+_TICK_S = 2.0**-10  # exactly representable, so lap differences carry no rounding error
+
+
+def _ticking_clock(step: float = _TICK_S):
+    counter = itertools.count()
+    return lambda: next(counter) * step
+
+
+def test_disabled_by_default_and_checkpoints_are_noops() -> None:
+    assert active_integrated_offline_replay_stage_profiler_v1() is None
+    lap = replay_stage_lap_v1()
+    lap("input_guards")
+    assert _run().replay_pass is True
+
+
+def test_profiling_does_not_change_replay_outcome() -> None:
+    baseline = _run()
+    with profile_integrated_offline_replay_v1(record_cycles=4):
+        profiled = _run()
+    assert profiled.replay_pass == baseline.replay_pass
+    assert profiled.fail_reasons == baseline.fail_reasons
+    assert profiled.evidence == baseline.evidence
+
+
+def test_all_stages_recorded_in_chain_order() -> None:
+    with profile_integrated_offline_replay_v1(record_cycles=2) as profiler:
+        _run()
+        _run()
+    report = profiler.report()
+
+    assert report.cycles == 2
+    assert {s.stage for s in report.stages} == set(REPLAY_STAGES_V1) - {"typed_volatility_gate"}
+    assert all(s.calls == 2 for s in report.stages)
+    assert [s.total_seconds for s in report.stages] == sorted(
+        (s.total_seconds for s in report.stages), reverse=True
+    )
+    assert len(report.cycle_records) == 2
+    record = report.cycle_records[0]
+    assert record.trading_epoch == _replay_input().trading_epoch
+    assert list(record.stage_seconds) == [
+        s for s in REPLAY_STAGES_V1 if s != "typed_volatility_gate"
+    ]
+    assert report.unattributed_seconds >= 0.0
+
+
+def test_fail_closed_cycle_records_only_reached_stages() -> None:
+    with profile_integrated_offline_replay_v1() as profiler:
+        result = _run(instrument_id="BTC-SPOT")
+    assert result.replay_pass is False
+    report = profiler.report()
+    assert report.cycles == 1
+    assert [s.stage for s in report.stages] == ["input_guards"]
+
+
+def test_histogram_and_quantiles_with_deterministic_clock() -> None:
+    profiler = ReplayStageProfilerV1(
+        buckets=(0.0005, 0.001, 0.01), track_allocations=False, clock=_ticking_clock()
+    )
+    with profile_integrated_offline_replay_v1(profiler):
+        for _ in range(3):
+            _run()
+    report = profiler.report()
+
+    composition = report.stage("composition")
+    assert composition is not None
+    # Each checkpoint reads the clock twice, so every lap spans exactly one tick.
+    assert composition.calls == 3
+    assert composition.total_seconds == 3 * _TICK_S
+    assert composition.bucket_counts == (0, 3, 0, 0)
+    assert composition.quantile_seconds(0.99) == 0.001
+    # Cycle start, laps start, 11 checkpoints and cycle end: 24 ticks per cycle.
+    assert report.cycle_total_seconds == 3 * 24 * _TICK_S
+
+    payload = report.to_dict()
+    assert payload["cycles"] == 3
+    assert payload["stages"][0]["histogram"]["le"][-1] == "+Inf"
+    assert "composition" in report.render_text()
+
+    profiler.reset()
+    assert profiler.report().cycles == 0
+
+
+def test_nested_activation_restores_previous_profiler() -> None:
+    outer = ReplayStageProfilerV1()
+    with profile_integrated_offline_replay_v1(outer):
+        with profile_integrated_offline_replay_v1() as inner:
+            _run()
+        assert active_integrated_offline_replay_stage_profiler_v1() is outer
+        _run()
+    assert active_integrated_offline_replay_stage_profiler_v1() is None
+    assert inner.report().cycles == 1
+    assert outer.report().cycles == 1
+
+
+def test_invalid_configuration_rejected() -> None:
+    with pytest.raises(ValueError, match="strictly_ascending"):
+        ReplayStageProfilerV1(buckets=(0.01, 0.001))
+    with pytest.raises(ValueError, match="record_cycles"):
+        ReplayStageProfilerV1(record_cycles=-1)
+    with pytest.raises(ValueError, match="exclusive"):
+        with profile_integrated_offline_replay_v1(ReplayStageProfilerV1(), record_cycles=1):
+            pass
+
+
+def test_src_import_alias_shares_active_profiler() -> None:
+    from src.trading.master_v2 import integrated_offline_replay_stage_profiler_v1 as src_alias
+
+    with src_alias.profile_integrated_offline_replay_v1() as profiler:
+        run_integrated_offline_trading_logic_replay_v1(_replay_input())
+    assert profiler.report().cycles == 1
+
+
+def test_prometheus_export_observes_stage_histogram() -> None:
+    pytest.importorskip("prometheus_client")
+    from prometheus_client.core import REGISTRY
+
+    def _count() -> float:
+        return (
+            REGISTRY.get_sample_value(
+                "peaktrade_mv2_replay_stage_seconds_count", {"stage": "composition"}
+            )
+            or 0.0
+        )
+
+    before = _count()
+    with profile_integrated_offline_replay_v1(export_prometheus=True):
+        _run()
+    assert _count() == before + 1.0
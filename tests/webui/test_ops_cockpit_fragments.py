@@ -0,0 +1,190 @@
+"""Tests for the source-fingerprinted Ops Cockpit fragment cache and SSE stream."""
+
+import json
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi.testclient import TestClient
+
+from src.core import peak_config
+from src.webui.ops_cockpit import build_ops_cockpit_payload
+from src.webui.ops_cockpit_fragments import (
+    OPS_COCKPIT_FRAGMENTS,
+    FragmentCache,
+    format_sse_event,
+    iter_changed_fragments,
+)
+
+_CONFIG = """
+[environment]
+mode = "paper"
+enable_live_trading = {enabled}
+live_mode_armed = true
+live_dry_run_mode = false
+"""
+
+
+def _touch_later(path: Path) -> None:
+    ns = time.time_ns() + 2_000_000_000
+    os.utime(path, ns=(ns, ns))
+
+
+def _age(root: Path, seconds: float = 10.0) -> None:
+    """Move mtimes out of the racy window so fragments may be cached."""
+    ns = time.time_ns() - int(seconds * 1e9)
+    for path in [root, *root.rglob("*")]:
+        os.utime(path, ns=(ns, ns))
+
+
+@pytest.fixture(autouse=True)
+def _clear_fragments():
+    OPS_COCKPIT_FRAGMENTS.clear()
+    yield
+    OPS_COCKPIT_FRAGMENTS.clear()
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    (config_dir / "config.toml").write_text(_CONFIG.format(enabled="true"), encoding="utf-8")
+    (tmp_path / "data" / "kill_switch").mkdir(parents=True)
+    _age(tmp_path)
+    return tmp_path
+
+
+def test_fragment_cache_rebuilds_only_on_fingerprint_change() -> None:
+    cache = FragmentCache()
+    calls: list[int] = []
+
+    def build() -> dict:
+        calls.append(1)
+        return {"items": [1, 2]}
+
+    first = cache.get("docs", "k", (1,), build)
+    first["items"].append(3)  # callers receive copies
+    assert cache.get("docs", "k", (1,), build) == {"items": [1, 2]}
+    assert len(calls) == 1
+    cache.get("docs", "k", (2,), build)
+    assert len(calls) == 2
+    stats = cache.stats()["docs"]
+    assert (stats["hits"], stats["misses"]) == (1, 2)
+    assert stats["last_build_ms"] >= 0.0
+
+
+def test_payload_fragments_are_reused_until_sources_change(repo: Path) -> None:
+    config_path = repo / "config" / "config.toml"
+    with patch.object(peak_config, "load_config", wraps=peak_config.load_config) as load_config:
+        first = build_ops_cockpit_payload(repo_root=repo, config_path=config_path)
+        loads_after_first = load_config.call_count
+        second = build_ops_cockpit_payload(repo_root=repo, config_path=config_path)
+        assert load_config.call_count == loads_after_first
+
+    assert first["policy_state"] == second["policy_state"]
+    assert first["policy_state"]["action"] == "TRADE_READY"
+    stats = OPS_COCKPIT_FRAGMENTS.stats()
+    assert stats["config_gates"]["hits"] == 1
+    assert stats["truth_docs"]["hits"] == 1
+
+    config_path.write_text(_CONFIG.format(enabled="false"), encoding="utf-8")
+    _touch_later(config_path)
+    ks_path = repo / "data" / "kill_switch" / "state.json"
+    ks_path.write_text(json.dumps({"state": "KILLED"}), encoding="utf-8")
+    third = build_ops_cockpit_payload(repo_root=repo, config_path=config_path)
+    assert third["operator_state"]["enabled"] is False
+    assert third["operator_state"]["kill_switch_active"] is True
+    assert third["policy_state"]["action"] == "NO_TRADE"
+
+
+def test_kill_switch_same_size_rewrite_is_not_served_stale(repo: Path) -> None:
+    ks_path = repo / "data" / "kill_switch" / "state.json"
+    ks_path.write_text(json.dumps({"state": "ACTIVE"}), encoding="utf-8")
+    mtime_ns = ks_path.stat().st_mtime_ns
+    assert (
+        build_ops_cockpit_payload(repo_root=repo)["operator_state"]["kill_switch_active"] is False
+    )
+
+    # Same size, same mtime (coarse filesystem timestamps): still picked up
+    ks_path.write_text(json.dumps({"state": "KILLED"}), encoding="utf-8")
+    os.utime(ks_path, ns=(mtime_ns, mtime_ns))
+    assert build_ops_cockpit_payload(repo_root=repo)["operator_state"]["kill_switch_active"] is True
+
+
+def test_config_gates_racy_same_size_rewrite_is_not_cached(repo: Path) -> None:
+    config_path = repo / "config" / "config.toml"
+    config_path.write_text(_CONFIG.format(enabled="true"), encoding="utf-8")
+    mtime_ns = config_path.stat().st_mtime_ns
+    first = build_ops_cockpit_payload(repo_root=repo, config_path=config_path)
+    assert first["operator_state"]["enabled"] is True
+
+    # Same size, same mtime inside the racy window: must not be served from the cache
+    rewritten = _CONFIG.format(enabled="false").replace(
+        "live_dry_run_mode = false", "live_dry_run_mode = true"
+    )
+    assert len(rewritten) == config_path.stat().st_size
+    config_path.write_text(rewritten, encoding="utf-8")
+    os.utime(config_path, ns=(mtime_ns, mtime_ns))
+    second = build_ops_cockpit_payload(repo_root=repo, config_path=config_path)
+    assert second["operator_state"]["enabled"] is False
+    assert OPS_COCKPIT_FRAGMENTS.stats()["config_gates"]["hits"] == 0
+
+
+def test_session_registry_fragment_tracks_new_records(repo: Path) -> None:
+    sessions = repo / "reports" / "experiments" / "live_sessions"
+    sessions.mkdir(parents=True)
+    assert build_ops_cockpit_payload(repo_root=repo)["run_state"]["registry_session_count"] == 0
+    (sessions / "20240101T000000_live_session_s1.json").write_text(
+        json.dumps(
+            {
+                "session_id": "s1",
+                "run_type": "live_session_shadow",
+                "mode": "shadow",
+                "env_name": "test",
+                "symbol": "BTC/EUR",
+                "status": "started",
+                "started_at": "2024-01-01T00:00:00+00:00",
+                "config": {},
+                "metrics": {},
+            }
+        ),
+        encoding="utf-8",
+    )
+    run_state = build_ops_cockpit_payload(repo_root=repo)["run_state"]
+    assert run_state["registry_session_count"] == 1
+    assert run_state["session_active"] is True
+
+
+def test_iter_changed_fragments_and_sse_format() -> None:
+    sent: dict[str, str] = {}
+    assert dict(iter_changed_fragments({"a": 1, "b": [1]}, sent)) == {"a": 1, "b": [1]}
+    assert dict(iter_changed_fragments({"a": 1, "b": [2]}, sent)) == {"b": [2]}
+    assert dict(iter_changed_fragments({"a": 1}, sent)) == {"b": None}
+    assert format_sse_event("fragment", {"a": 1}) == 'event: fragment\ndata: {"a": 1}\n\n'
+
+
+def test_stream_and_fragment_stats_endpoints() -> None:
+    from src.webui.app import app
+
+    client = TestClient(app)
+    assert client.get("/api/ops-cockpit/stream?interval=0").status_code == 422
+    with client.stream("GET", "/api/ops-cockpit/stream?interval=0.5&max_updates=2") as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        body = "".join(response.iter_text())
+
+    frames = [f for f in body.split("\n\n") if f]
+    assert frames[0].startswith("event: fragment\ndata: ")
+    initial = json.loads(frames[0].split("data: ", 1)[1])
+    assert {"policy_state", "guard_state", "truth_state"} <= set(initial)
+    # The second update only carries keys whose JSON changed since the first.
+    if frames[1].startswith("event: fragment"):
+        assert "policy_state" not in json.loads(frames[1].split("data: ", 1)[1])
+
+    stats = client.get("/api/ops-cockpit/fragments").json()["fragments"]
+    assert stats["truth_docs"]["hits"] >= 1